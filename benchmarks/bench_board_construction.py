@@ -0,0 +1,41 @@
+"""Benchmark of the board construction with the shared geometry
+
+usage: python benchmarks/bench_board_construction.py [count]
+"""
+
+import os
+import sys
+import time
+
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reversi import BitBoard, PyBitBoard, PyListBoard  # noqa: E402
+from reversi.geometry import Geometry, get_geometry  # noqa: E402
+
+
+def measure(func, count):
+    """measure
+    """
+    start = time.perf_counter()
+    for _ in range(count):
+        func()
+
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+    print(f"count={count} [us/call]")
+    print(f"{'size':>4} {'Geometry()':>11} {'get_geometry':>13} {'PyListBoard':>12} {'PyBitBoard':>11} {'BitBoard':>9}")
+    for size in [4, 6, 8, 10, 16, 26]:
+        # Geometry()は共有しない場合(各ボードで作り直していた時と同等)の作成コスト
+        results = [
+            measure(lambda: Geometry(size), count // 10) * 10,
+            measure(lambda: get_geometry(size), count),
+            measure(lambda: PyListBoard(size), count),
+            measure(lambda: PyBitBoard(size), count),
+            measure(lambda: BitBoard(size), count),
+        ]
+        print(f"{size:>4} " + ' '.join(f"{result / count * 1e6:>{width}.2f}" for result, width in zip(results, [11, 13, 12, 11, 9])))
@@ -0,0 +1,45 @@
+"""Benchmark of the endgame solver (exact and win/loss/draw) on a fixed set of random endgame positions
+
+usage: python benchmarks/bench_endgame.py [seeds]
+"""
+
+import os
+import sys
+import time
+
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reversi.strategies import _EndGame  # noqa: E402
+from reversi.strategies.common import Measure  # noqa: E402
+from bench_transposition import make_board  # noqa: E402
+
+
+DISCS = (46, 48, 50, 52, 54, 56)
+
+
+def measure(color, board, role='best_match'):
+    """measure
+    """
+    strategy = _EndGame()
+    strategy.role = role
+    key = strategy.__class__.__name__ + str(os.getpid())
+    Measure.count[key] = 0
+    start = time.perf_counter()
+    best_move, scores = strategy.get_best_move(color, board, board.get_legal_moves(color), pid=key)
+    return best_move, scores[best_move], Measure.count[key], time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    seeds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f"{'empties':>7} {'seed':>5} {'move':>8} {'score':>6} {'nodes':>12} {'time[s]':>10} {'wld':>4} {'wld nodes':>12} {'time[s]':>10}")
+    total = [0, 0.0, 0, 0.0]
+    for discs in DISCS:
+        for seed in range(1, seeds + 1):
+            color, board = make_board(discs, seed)
+            move, score, nodes, elapsed = measure(color, board)
+            _, wld, wld_nodes, wld_elapsed = measure(color, board, 'wld')
+            for i, value in enumerate([nodes, elapsed, wld_nodes, wld_elapsed]):
+                total[i] += value
+            print(f"{64 - discs:>7} {seed:>5} {str(move):>8} {score:>6} {nodes:>12} {elapsed:>10.3f} {wld:>4} {wld_nodes:>12} {wld_elapsed:>10.3f}")
+    print(f"{'total':>7} {'':>5} {'':>8} {'':>6} {total[0]:>12} {total[1]:>10.3f} {'':>4} {total[2]:>12} {total[3]:>10.3f}")
@@ -0,0 +1,51 @@
+"""Benchmark of cold-start import time
+
+usage: python benchmarks/bench_import.py [repeat]
+"""
+
+import os
+import sys
+import json
+import subprocess
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TARGETS = {
+    'import reversi': 'import reversi',
+    'reversi.headless': 'import reversi.headless',
+    'BitBoard+AlphaBeta': 'from reversi import BitBoard; from reversi.strategies import AlphaBeta',
+    'headless game': (
+        'from reversi.headless import BitBoard, get_strategy, play; '
+        'play(get_strategy("Random")(), get_strategy("Greedy")(), BitBoard())'
+    ),
+}
+
+PROBE = '''
+import sys, time, json
+start = time.perf_counter()
+{}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'time': elapsed, 'modules': len(sys.modules), 'tkinter': 'tkinter' in sys.modules}}))
+'''
+
+
+def measure(code, repeat):
+    """measure
+    """
+    # 新しいプロセスで計測し、最速値を採用する
+    results = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', PROBE.format(code)], cwd=ROOT, capture_output=True, text=True, check=True).stdout
+        results.append(json.loads(out.strip().splitlines()[-1]))
+
+    return min(results, key=lambda r: r['time'])
+
+
+if __name__ == '__main__':
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    print(f"{'target':<20} {'time[ms]':>10} {'modules':>8} {'tkinter':>8}")
+    for name, code in TARGETS.items():
+        r = measure(code, repeat)
+        print(f"{name:<20} {r['time'] * 1000:>10.1f} {r['modules']:>8} {str(r['tkinter']):>8}")
@@ -0,0 +1,62 @@
+"""Benchmark of the Kogge-Stone move generation for PyBitBoard
+
+usage: python benchmarks/bench_kogge_stone.py [count] [seed]
+"""
+
+import os
+import sys
+import time
+import random
+
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reversi import PyBitBoard, MIN_BOARD_SIZE, MAX_BOARD_SIZE  # noqa: E402
+import reversi.BitBoardMethods.GetLegalMoves as GetLegalMoves  # noqa: E402
+
+
+def make_board(size, seed):
+    """make_board
+    """
+    # 盤面の半分程度まで打ち進めた盤面を作る
+    random.seed(seed)
+    board = PyBitBoard(size)
+    color = 'black'
+    while board._black_score + board._white_score < size * size // 2:
+        moves = board.get_legal_moves(color)
+        if not moves and not board.get_legal_moves('white' if color == 'black' else 'black'):
+            break
+        if moves:
+            board.put_disc(color, *random.choice(moves))
+        color = 'white' if color == 'black' else 'black'
+
+    return color, board
+
+
+def measure(board, color, count, kogge_stone):
+    """measure
+    """
+    # 切り替えの閾値を書き換えてどちらかの方法に固定する
+    GetLegalMoves.KOGGE_STONE_MIN_SIZE = 0 if kogge_stone else MAX_BOARD_SIZE + 1
+
+    start = time.perf_counter()
+    for _ in range(count):
+        board.get_legal_moves_bits(color)
+
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    legal_moves_min_size = GetLegalMoves.KOGGE_STONE_MIN_SIZE
+
+    print(f"count={count} seed={seed}")
+    print(f"{'size':>4} {'legal(linear)':>14} {'legal(ks)':>10} {'ratio':>6}")
+    for size in range(MIN_BOARD_SIZE, MAX_BOARD_SIZE + 1, 2):
+        color, board = make_board(size, seed)
+        linear = measure(board, color, count, False)
+        kogge_stone = measure(board, color, count, True)
+        print(f"{size:>4} {linear:>14.3f} {kogge_stone:>10.3f} {linear/kogge_stone:>6.2f}")
+
+    GetLegalMoves.KOGGE_STONE_MIN_SIZE = legal_moves_min_size
@@ -0,0 +1,50 @@
+"""Benchmark of Lazy-SMP search with a shared transposition table
+
+usage: python benchmarks/bench_lazysmp.py [discs] [seeds]
+"""
+
+import os
+import sys
+import time
+
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reversi.strategies import _NegaScout_, _EndGame_, IterativeDeepning_, LazySMP_, TranspositionTable  # noqa: E402
+from reversi.strategies.coordinator import Evaluator_TPW, Selector, Orderer_B  # noqa: E402
+from bench_transposition import make_board  # noqa: E402
+
+
+WORKERS = (1, 2, 4, 8)
+
+
+def measure(create, color, board, workers):
+    """measure
+    """
+    tt = TranspositionTable(size=0x100000, shared=True)
+    try:
+        strategy = LazySMP_(search=create(tt), workers=workers)
+        start = time.perf_counter()
+        move = strategy.next_move(color, board)
+        return move, time.perf_counter() - start
+    finally:
+        tt.close()
+
+
+if __name__ == '__main__':
+    discs = int(sys.argv[1]) if len(sys.argv) > 1 else 46
+    seeds = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    print(f"cpu_count={os.cpu_count()} discs={discs} seeds={seeds}")
+    print(f"{'strategy':<22} " + ' '.join(f"{str(w) + ' worker[s]':>12}" for w in WORKERS))
+    for name, create, position in [
+        ('EndGame', lambda tt: _EndGame_(tt=tt), discs),
+        ('NegaScout(depth=7)', lambda tt: _NegaScout_(depth=7, evaluator=Evaluator_TPW(), tt=tt), 20),
+        ('ID NegaScout(2-8)', lambda tt: IterativeDeepning_(depth=2, selector=Selector(), orderer=Orderer_B(), search=_NegaScout_(evaluator=Evaluator_TPW(), tt=tt), limit=8), 20),  # noqa: E501
+    ]:
+        elapsed = {workers: 0.0 for workers in WORKERS}
+        for seed in range(1, seeds + 1):
+            color, board = make_board(position, seed)
+            for workers in WORKERS:
+                elapsed[workers] += measure(create, color, board, workers)[1]
+        print(f"{name:<22} " + ' '.join(f"{elapsed[w]:>9.3f}[s]" for w in WORKERS))
+        print(f"{'  speedup':<22} " + ' '.join(f"{elapsed[1] / elapsed[w]:>11.2f}x" for w in WORKERS))
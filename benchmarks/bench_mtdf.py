@@ -0,0 +1,59 @@
+"""Benchmark of MTD(f) against NegaScout under IterativeDeepning
+
+usage: python benchmarks/bench_mtdf.py [depth] [matches]
+
+Every strategy deepens from depth 2 up to the given depth on each move, with
+the time limit lifted so that all of them finish the same iterations.
+"""
+
+import os
+import random
+import sys
+import time
+
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reversi.strategies import Timer, Measure, NsI_B_TPWE, MtdfI_B_TPWE, IterativeDeepning, AlphaBeta, NegaScout, MTDf, TranspositionTable, get_selfplay_positions, _AlphaBeta  # noqa: E402, E501
+from reversi.strategies.coordinator import Selector, Orderer_B, Evaluator_TPWE  # noqa: E402
+
+
+def measure(strategy, positions, depth):
+    """measure
+    """
+    # 対局中と同じように一手ごとに同じ戦略を使い続ける(置換表は引き継ぐ)
+    strategy.limit = depth
+    pid = Timer.get_pid(strategy.search)
+    nodes, times, moves = 0, [], []
+    for color, board in positions:
+        Measure.count[pid] = 0
+        start = time.perf_counter()
+        moves.append(strategy.next_move(color, board))
+        times.append(time.perf_counter() - start)
+        nodes += Measure.count[pid]
+
+    return nodes, times, moves
+
+
+if __name__ == '__main__':
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    matches = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    Timer.time_limit = 10000  # 同じ深さまで読ませる
+
+    random.seed(0)  # 毎回同じ局面で比べる
+    positions = get_selfplay_positions(_AlphaBeta(depth=2, evaluator=Evaluator_TPWE()), matches=matches, random_opening=8)
+    positions = [(color, board) for color, board in positions if board.get_legal_moves(color)]
+    strategies = [
+        ('NsI_B_TPWE', NsI_B_TPWE()),
+        ('NsI_B_TPWE+tt', IterativeDeepning(depth=2, selector=Selector(), orderer=Orderer_B(), search=NegaScout(evaluator=Evaluator_TPWE(), tt=TranspositionTable()))),  # noqa: E501
+        ('MtdfI_B_TPWE', MtdfI_B_TPWE()),
+        ('MtdfI(AlphaBeta)', IterativeDeepning(depth=2, selector=Selector(), orderer=Orderer_B(), search=MTDf(AlphaBeta(evaluator=Evaluator_TPWE())))),
+    ]
+    print(f"depth={depth} positions={len(positions)}")
+    print(f"{'strategy':<18} {'nodes':>12} {'nodes/move':>11} {'time[s]':>9} {'ave[ms]':>9} {'max[ms]':>9} {'same move':>10}")
+    for name, strategy in strategies:
+        nodes, times, moves = measure(strategy, positions, depth)
+        if name == 'NsI_B_TPWE':
+            base = moves
+        same = sum(a == b for a, b in zip(base, moves))
+        print(f"{name:<18} {nodes:>12} {nodes // len(positions):>11} {sum(times):>9.2f} {sum(times) / len(times) * 1000:>9.1f} {max(times) * 1000:>9.1f} {same:>6}/{len(positions)}")  # noqa: E501
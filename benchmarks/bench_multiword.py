@@ -0,0 +1,77 @@
+"""Benchmark of the multi-word Cython bitboard (board size 10 to 26)
+
+usage: python benchmarks/bench_multiword.py [size] [discs] [seed]
+"""
+
+import os
+import sys
+import time
+import random
+
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reversi import BitBoard, PyBitBoard  # noqa: E402
+from reversi.strategies import _AlphaBeta_, _NegaScout_, MonteCarlo  # noqa: E402
+from reversi.strategies.coordinator import Evaluator_TPW  # noqa: E402
+
+
+def make_board(board_class, size, discs, seed):
+    """make_board
+    """
+    # ランダムに打ち進めた盤面を作る
+    random.seed(seed)
+    board = board_class(size)
+    color = 'black'
+    while board._black_score + board._white_score < discs:
+        moves = board.get_legal_moves(color)
+        if moves:
+            board.put_disc(color, *random.choice(moves))
+        color = 'white' if color == 'black' else 'black'
+    if not board.get_legal_moves(color):
+        color = 'white' if color == 'black' else 'black'
+
+    return color, board
+
+
+def measure(strategy, color, board):
+    """measure
+    """
+    start = time.perf_counter()
+    move = strategy.next_move(color, board)
+
+    return move, time.perf_counter() - start
+
+
+def measure_moves(board, color, count=1000):
+    """measure_moves
+    """
+    # 合法手生成と着手/取り消しの繰り返し
+    start = time.perf_counter()
+    for _ in range(count):
+        for move in board.get_legal_moves(color):
+            board.put_disc(color, *move)
+            board.undo()
+
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    discs = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+
+    print(f"size={size} discs={discs} seed={seed}")
+    print(f"{'board':<20} {'strategy':<12} {'move':>8} {'time[s]':>10}")
+    for board_class in [PyBitBoard, BitBoard]:
+        color, board = make_board(board_class, size, discs, seed)
+        name = type(board).__name__
+        print(f"{name:<20} {'moves':<12} {'-':>8} {measure_moves(board, color):>10.3f}")
+        strategies = [
+            ('AlphaBeta', _AlphaBeta_(depth=3, evaluator=Evaluator_TPW())),
+            ('NegaScout', _NegaScout_(depth=3, evaluator=Evaluator_TPW())),
+            ('MonteCarlo', MonteCarlo(count=10, remain=size*size)),
+        ]
+        for strategy_name, strategy in strategies:
+            move, elapsed = measure(strategy, color, board)
+            print(f"{name:<20} {strategy_name:<12} {str(move):>8} {elapsed:>10.3f}")
@@ -0,0 +1,54 @@
+"""Benchmark of the killer-move and history orderers against Orderer_PCB
+
+usage: python benchmarks/bench_orderer.py [depth] [matches]
+
+The root moves are ordered by Orderer_PCB in every run, so only the interior
+ordering differs.
+"""
+
+import os
+import random
+import sys
+import time
+
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reversi.strategies import _AlphaBeta, _NegaScout, IterativeDeepning_, Measure, get_selfplay_positions  # noqa: E402
+from reversi.strategies.coordinator import Selector, Orderer_PCB, Orderer_K, Orderer_H, Orderer_KH, Evaluator_TPW  # noqa: E402
+
+
+def measure(search, orderer, positions, depth):
+    """measure
+    """
+    # 対局中と同じように一手ごとに同じ探索を使い続ける(キラー手と履歴は引き継ぐ)
+    iterative = IterativeDeepning_(depth=2, selector=Selector(), orderer=orderer, search=search, limit=depth)
+    pid = search.__class__.__name__ + str(os.getpid())
+    nodes, moves, start = 0, [], time.perf_counter()
+    for color, board in positions:
+        Measure.count[pid] = 0
+        moves.append(iterative.next_move(color, board))
+        nodes += Measure.count[pid]
+
+    return nodes, time.perf_counter() - start, moves
+
+
+if __name__ == '__main__':
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    matches = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    evaluator = Evaluator_TPW()
+
+    random.seed(0)  # 毎回同じ局面で比べる
+    positions = get_selfplay_positions(_AlphaBeta(depth=2, evaluator=evaluator), matches=matches, random_opening=8)
+    positions = [(color, board) for color, board in positions if board.get_legal_moves(color)]
+    print(f"depth={depth} positions={len(positions)}")
+    print(f"{'search':<12} {'orderer':<12} {'nodes':>12} {'time[s]':>10} {'same move':>10}")
+    for search in [_AlphaBeta, _NegaScout]:
+        name = search.__name__
+        base = measure(search(evaluator=evaluator), Orderer_PCB(), positions, depth)
+        print(f"{name:<12} {'Orderer_PCB':<12} {base[0]:>12} {base[1]:>10.2f}")
+        for orderer in [Orderer_K, Orderer_H, Orderer_KH]:
+            # ルートの並びは同じにして、途中の局面の並び替えの効果を比べる
+            result = measure(search(evaluator=evaluator, orderer=orderer()), Orderer_PCB(), positions, depth)
+            same = sum(a == b for a, b in zip(base[2], result[2]))
+            print(f"{name:<12} {orderer.__name__:<12} {result[0]:>12} {result[1]:>10.2f} {same:>6}/{len(positions)}")
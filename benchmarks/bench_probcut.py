@@ -0,0 +1,53 @@
+"""Benchmark of Multi-ProbCut for AlphaBeta and NegaScout
+
+usage: python benchmarks/bench_probcut.py [depth] [threshold] [matches]
+"""
+
+import os
+import sys
+import time
+
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reversi.strategies import _AlphaBeta, _AlphaBeta_, _NegaScout, ProbCut, Measure, get_selfplay_positions  # noqa: E402
+from reversi.strategies.coordinator import Evaluator_TPW  # noqa: E402
+
+
+def measure(search, positions, depth, pid):
+    """measure
+    """
+    nodes, moves, start = 0, [], time.perf_counter()
+    for color, board in positions:
+        Measure.count[pid] = 0
+        moves.append(search.get_best_move(color, board, board.get_legal_moves(color), depth, pid)[0])
+        nodes += Measure.count[pid]
+
+    return nodes, time.perf_counter() - start, moves
+
+
+if __name__ == '__main__':
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    threshold = float(sys.argv[2]) if len(sys.argv) > 2 else 1.5
+    matches = int(sys.argv[3]) if len(sys.argv) > 3 else 6
+    evaluator = Evaluator_TPW()
+
+    # 自己対戦の局面の半分でパラメータを求め、残りの局面で比べる
+    positions = get_selfplay_positions(_AlphaBeta_(depth=1, evaluator=evaluator), matches=matches, random_opening=8)
+    positions = [(color, board) for color, board in positions if board.get_legal_moves(color)]
+    pairs = {d: (d - 2,) if d < 6 else (d - 4, d - 2) for d in range(3, depth + 1)}
+    start = time.perf_counter()
+    probcut = ProbCut.calibrate(_NegaScout(evaluator=evaluator), positions[::2], pairs, threshold=threshold, stages=2, limit=5000)
+    print(f"calibrate: {len(positions[::2])} positions {time.perf_counter() - start:.2f}[s]")
+    for key, checks in sorted(probcut.params.items()):
+        print(' ', key, [tuple(round(value, 2) for value in check) for check in checks])
+
+    tests = positions[1::4]
+    print(f"depth={depth} threshold={threshold} positions={len(tests)}")
+    print(f"{'search':<12} {'nodes':>12} {'time[s]':>10} {'mpc nodes':>12} {'time[s]':>10} {'same move':>10}")
+    for search in [_AlphaBeta, _NegaScout]:
+        name = search.__name__
+        full = measure(search(depth=depth, evaluator=evaluator), tests, depth, name + '_full')
+        mpc = measure(search(depth=depth, evaluator=evaluator, probcut=probcut), tests, depth, name + '_mpc')
+        same = sum(a == b for a, b in zip(full[2], mpc[2]))
+        print(f"{name:<12} {full[0]:>12} {full[1]:>10.2f} {mpc[0]:>12} {mpc[1]:>10.2f} {same:>6}/{len(tests)}")
@@ -0,0 +1,60 @@
+"""Benchmark of the thread-pool root-split search
+
+usage: python benchmarks/bench_root_split.py [discs] [seed]
+"""
+
+import os
+import sys
+import time
+import random
+
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reversi import BitBoard  # noqa: E402
+from reversi.strategies import _EndGame_, _Blank_, MonteCarlo  # noqa: E402
+
+
+def make_board(discs, seed):
+    """make_board
+    """
+    # ランダムに打ち進めた盤面を作る
+    random.seed(seed)
+    board = BitBoard()
+    color = 'black'
+    while board._black_score + board._white_score < discs:
+        moves = board.get_legal_moves(color)
+        if moves:
+            board.put_disc(color, *random.choice(moves))
+        color = 'white' if color == 'black' else 'black'
+    if not board.get_legal_moves(color):
+        color = 'white' if color == 'black' else 'black'
+
+    return color, board
+
+
+def measure(strategy, color, board):
+    """measure
+    """
+    start = time.perf_counter()
+    move = strategy.next_move(color, board)
+
+    return move, time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    discs = int(sys.argv[1]) if len(sys.argv) > 1 else 44
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    color, board = make_board(discs, seed)
+
+    print(f"cpu={os.cpu_count()} discs={discs} seed={seed} color={color}")
+    print(f"{'strategy':<12} {'workers':>8} {'move':>8} {'time[s]':>10}")
+    for workers in sorted({1, 2, 4, os.cpu_count()}):
+        strategies = [
+            ('EndGame', _EndGame_(workers=workers)),
+            ('Blank', _Blank_(depth=6, workers=workers)),
+            ('MonteCarlo', MonteCarlo(count=1000, workers=workers)),
+        ]
+        for name, strategy in strategies:
+            move, elapsed = measure(strategy, color, board)
+            print(f"{name:<12} {workers:>8} {str(move):>8} {elapsed:>10.3f}")
@@ -0,0 +1,70 @@
+"""Benchmark of the transposition table shared by AlphaBeta, NegaScout and EndGame
+
+usage: python benchmarks/bench_transposition.py [discs] [seed]
+"""
+
+import os
+import sys
+import time
+import random
+
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reversi import BitBoard  # noqa: E402
+from reversi.strategies import _AlphaBeta_, _NegaScout_, _EndGame_, IterativeDeepning_, TranspositionTable  # noqa: E402
+from reversi.strategies.coordinator import Evaluator_TPW, Selector, Orderer_B  # noqa: E402
+
+
+def make_board(discs, seed):
+    """make_board
+    """
+    # ランダムに打ち進めた盤面を作る
+    random.seed(seed)
+    board = BitBoard()
+    color = 'black'
+    while board._black_score + board._white_score < discs:
+        moves = board.get_legal_moves(color)
+        if moves:
+            board.put_disc(color, *random.choice(moves))
+        color = 'white' if color == 'black' else 'black'
+    if not board.get_legal_moves(color):
+        color = 'white' if color == 'black' else 'black'
+
+    return color, board
+
+
+def measure(strategy, color, board):
+    """measure
+    """
+    start = time.perf_counter()
+    move = strategy.next_move(color, board)
+
+    return move, time.perf_counter() - start
+
+
+def iterative(search, limit):
+    """iterative
+    """
+    return IterativeDeepning_(depth=2, selector=Selector(), orderer=Orderer_B(), search=search, limit=limit)
+
+
+if __name__ == '__main__':
+    discs = int(sys.argv[1]) if len(sys.argv) > 1 else 46
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    color, board = make_board(discs, seed)
+    opening_color, opening = make_board(12, seed)
+
+    print(f"discs={discs} seed={seed} color={color}")
+    print(f"{'strategy':<22} {'table':>6} {'move':>8} {'time[s]':>10} {'hit rate':>9}")
+    for name, create, args in [
+        ('EndGame', lambda tt: _EndGame_(tt=tt), (color, board)),
+        ('AlphaBeta(depth=6)', lambda tt: _AlphaBeta_(depth=6, evaluator=Evaluator_TPW(), tt=tt), (opening_color, opening)),
+        ('NegaScout(depth=6)', lambda tt: _NegaScout_(depth=6, evaluator=Evaluator_TPW(), tt=tt), (opening_color, opening)),
+        ('ID AlphaBeta(2-6)', lambda tt: iterative(_AlphaBeta_(evaluator=Evaluator_TPW(), tt=tt), 6), (opening_color, opening)),
+        ('ID NegaScout(2-6)', lambda tt: iterative(_NegaScout_(evaluator=Evaluator_TPW(), tt=tt), 6), (opening_color, opening)),
+    ]:
+        for tt in [None, TranspositionTable()]:
+            move, elapsed = measure(create(tt), *args)
+            hit_rate = f"{tt.hit_rate:>9.2f}" if tt is not None else f"{'-':>9}"
+            print(f"{name:<22} {'on' if tt is not None else 'off':>6} {str(move):>8} {elapsed:>10.3f} {hit_rate}")
@@ -0,0 +1,45 @@
+"""Benchmark of the parallel (Young Brothers Wait) endgame search
+
+usage: python benchmarks/bench_ybwc.py [discs] [seeds]
+"""
+
+import os
+import sys
+import time
+
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reversi.strategies import _EndGame  # noqa: E402
+from reversi.strategies.common import Measure  # noqa: E402
+from bench_transposition import make_board  # noqa: E402
+
+
+WORKERS = (1, 2, 4, 8)
+
+
+def measure(color, board, workers):
+    """measure
+    """
+    endgame = _EndGame(workers=workers)
+    pid = endgame.__class__.__name__ + str(os.getpid())
+    Measure.count[pid] = 0
+    moves = board.get_legal_moves(color)
+    start = time.perf_counter()
+    best_move, scores = endgame.get_best_move(color, board, moves, pid=pid)
+    return best_move, scores[best_move], Measure.count[pid], time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    discs = int(sys.argv[1]) if len(sys.argv) > 1 else 46
+    seeds = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    print(f"cpu_count={os.cpu_count()} discs={discs}")
+    print(f"{'seed':>4} {'workers':>7} {'move':>8} {'score':>6} {'nodes':>10} {'time[s]':>8} {'speedup':>8}")
+    for seed in range(1, seeds + 1):
+        color, board = make_board(discs, seed)
+        serial = None
+        for workers in WORKERS:
+            best_move, score, nodes, elapsed = measure(color, board, workers)
+            serial = (best_move, score, elapsed) if serial is None else serial
+            same = '' if (best_move, score) == serial[:2] else ' (mismatch)'
+            print(f"{seed:>4} {workers:>7} {str(best_move):>8} {score:>6} {nodes:>10} {elapsed:>8.3f} {serial[2] / elapsed:>7.2f}x{same}")
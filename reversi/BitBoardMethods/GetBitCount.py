@@ -0,0 +1,26 @@
+"""GetBitCount.py
+"""
+
+
+# int.bit_count(Python3.10以降)が使える場合はそちらを使う
+if hasattr(int, 'bit_count'):
+    def popcount(bits):
+        """popcount
+
+               立っているビットの数を返す
+        """
+        return bits.bit_count()
+else:
+    def popcount(bits):
+        """popcount
+
+               立っているビットの数を返す
+        """
+        return bin(bits).count('1')
+
+
+def get_bit_count(size, bits):
+    """get_bit_count
+    """
+    # 盤面の範囲外のビットは数えない
+    return popcount(bits & ((1 << size * size) - 1))
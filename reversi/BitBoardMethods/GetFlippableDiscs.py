@@ -2,61 +2,51 @@
 """
 
 
+from reversi.BitBoardMethods.GetLegalMoves import get_moves
+
+
 def get_flippable_discs(color, size, black_bitboard, white_bitboard, x, y, mask):
     """
     指定座標のひっくり返せる石の場所をすべて返す
     """
-    ret = []
-    reversibles = 0
-    player, opponent = (black_bitboard, white_bitboard) if color == 'black' else (white_bitboard, black_bitboard)
-
     # 石を置く場所
     put = 1 << ((size*size-1)-(y*size+x))
 
-    # 8方向を順番にチェック
-    for direction in ('U', 'UR', 'R', 'BR', 'B', 'BL', 'L', 'UL'):
+    # 配列に変換
+    return get_moves(size, get_flippable_discs_num(color, size, black_bitboard, white_bitboard, put, mask))
+
+
+def get_flippable_discs_num(color, size, black_bitboard, white_bitboard, put, mask):
+    """
+    指定位置(ビット)のひっくり返せる石の場所をビットで返す
+    """
+    reversibles = 0
+    player, opponent = (black_bitboard, white_bitboard) if color == 'black' else (white_bitboard, black_bitboard)
+
+    # 左シフトの4方向(上、右上、左、左上)を順番にチェック
+    for shift_size, next_mask in ((size, mask.u), (size-1, mask.ur), (1, mask.l), (size+1, mask.ul)):
         tmp = 0
-        check = get_next_put(size, put, direction, mask)
+        check = (put << shift_size) & next_mask
 
         # 相手の石が存在する限り位置を記憶
         while check & opponent:
             tmp |= check
-            check = get_next_put(size, check, direction, mask)
+            check = (check << shift_size) & next_mask
 
         # 自分の石で囲まれている場合は結果を格納する
         if check & player:
             reversibles |= tmp
 
-    # 配列に変換
-    check = 1 << (size*size-1)
-    for y in range(size):
-        for x in range(size):
-            if reversibles & check:
-                ret += [(x, y)]
-            check >>= 1
+    # 右シフトの4方向(右、右下、下、左下)を順番にチェック
+    for shift_size, next_mask in ((1, mask.r), (size+1, mask.br), (size, mask.b), (size-1, mask.bl)):
+        tmp = 0
+        check = (put >> shift_size) & next_mask
 
-    return ret
+        while check & opponent:
+            tmp |= check
+            check = (check >> shift_size) & next_mask
 
+        if check & player:
+            reversibles |= tmp
 
-def get_next_put(size, put, direction, mask):
-    """
-    指定位置から指定方向に1マス分移動した場所を返す
-    """
-    if direction == 'U':     # 上
-        return (put << size) & mask.u
-    elif direction == 'UR':  # 右上
-        return (put << (size-1)) & mask.ur
-    elif direction == 'R':   # 右
-        return (put >> 1) & mask.r
-    elif direction == 'BR':  # 右下
-        return (put >> (size+1)) & mask.br
-    elif direction == 'B':   # 下
-        return (put >> size) & mask.b
-    elif direction == 'BL':  # 左下
-        return (put >> (size-1)) & mask.bl
-    elif direction == 'L':   # 左
-        return (put << 1) & mask.l
-    elif direction == 'UL':  # 左上
-        return (put << (size+1)) & mask.ul
-    else:
-        return 0
+    return reversibles
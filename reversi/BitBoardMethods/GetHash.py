@@ -0,0 +1,41 @@
+"""GetHash.py
+"""
+
+import random
+
+
+# Zobristハッシュ用の乱数(ビット位置ごと、プロセスをまたいでも同じ値になるよう固定の種で作成)
+_random = random.Random(0x5EED)
+ZOBRIST_BLACK = tuple(_random.getrandbits(64) for _ in range(26 * 26))
+ZOBRIST_WHITE = tuple(_random.getrandbits(64) for _ in range(26 * 26))
+ZOBRIST_SIDE = _random.getrandbits(64)  # 手番を区別する場合に使う
+ZOBRIST_FLIP = tuple(b ^ w for b, w in zip(ZOBRIST_BLACK, ZOBRIST_WHITE))  # 黒白が入れ替わる(ひっくり返る)場合
+del _random
+
+
+def get_hash(black, white):
+    """get_hash
+
+           黒と白のビットボードのZobristハッシュ(64bit)を返す
+           XORで合成できるため、着手前後の差分を渡せばハッシュの差分が得られる
+    """
+    ret = 0
+    # 黒と白の両方が変化する位置(着手の差分ではひっくり返った石)はまとめて計算する
+    flip = black & white
+    if flip:
+        black ^= flip
+        white ^= flip
+        while flip:
+            pos = flip.bit_length() - 1
+            ret ^= ZOBRIST_FLIP[pos]
+            flip ^= 1 << pos
+    while black:
+        pos = black.bit_length() - 1
+        ret ^= ZOBRIST_BLACK[pos]
+        black ^= 1 << pos
+    while white:
+        pos = white.bit_length() - 1
+        ret ^= ZOBRIST_WHITE[pos]
+        white ^= 1 << pos
+
+    return ret
@@ -1,6 +1,12 @@
 """GetLegalMoves.py
 """
 
+from reversi.geometry import get_geometry
+from reversi.BitBoardMethods.GetBitCount import get_bit_count  # noqa: F401
+
+
+KOGGE_STONE_MIN_SIZE = 10  # 倍々に伝播する方法(Kogge-Stone)を使うボードサイズ(benchmarks/bench_kogge_stone.pyでの逆転位置)
+
 
 def get_legal_moves(color, size, b, w, h, mask):
     """
@@ -9,14 +15,21 @@ def get_legal_moves(color, size, b, w, h, mask):
     legal_moves_bits = get_legal_moves_bits(color, size, b, w, h, mask)
 
     # 石が置ける場所を格納
+    return get_moves(size, legal_moves_bits)
+
+
+def get_moves(size, bits):
+    """
+    ビットの立っている位置を左上から順に座標のリストで返す
+    """
+    geometry = get_geometry(size)
+    coordinates = geometry.coordinates
+    bits &= geometry.all
     ret = []
-    check = 1 << (size * size - 1)
-    for y in range(size):
-        for x in range(size):
-            # 石が置ける場合
-            if legal_moves_bits & check:
-                ret += [(x, y)]
-            check >>= 1
+    while bits:
+        pos = bits.bit_length() - 1  # 一番左のONしているビット
+        ret += [coordinates[pos]]
+        bits ^= 1 << pos
 
     return ret
 
@@ -25,6 +38,9 @@ def get_legal_moves_bits(color, size, b, w, h, mask):
     """
     石が置ける場所をすべて返す
     """
+    if size >= KOGGE_STONE_MIN_SIZE:
+        return get_legal_moves_bits_kogge_stone(color, size, b, w, h, mask)
+
     # 前準備
     player, opponent = (b, w) if color == 'black' else (w, b)  # プレイヤーと相手を決定
     legal_moves_bits = 0                                       # 石が置ける場所
@@ -71,15 +87,53 @@ def get_legal_moves_rshift(size, mask, player, blank, shift_size):
     return blank & (tmp >> shift_size)
 
 
-def get_bit_count(size, bits):
-    """get_bit_count
+def get_legal_moves_bits_kogge_stone(color, size, b, w, h, mask):
+    """
+    石が置ける場所をすべて返す(相手の石の連なりを倍々のシフトで伝播する)
+    """
+    # 前準備
+    player, opponent = (b, w) if color == 'black' else (w, b)  # プレイヤーと相手を決定
+    legal_moves_bits = 0                                       # 石が置ける場所
+    horizontal = opponent & mask.h                             # 水平方向のチェック値
+    vertical = opponent & mask.v                               # 垂直方向のチェック値
+    diagonal = opponent & mask.d                               # 斜め方向のチェック値
+    blank = ~(player | opponent)                               # 空きマス位置
+    steps = (size-3).bit_length()                              # 相手の石の連なり(最大size-2個)を調べる回数
+
+    # 置ける場所を探す
+    for check, shift_size in ((horizontal, 1), (vertical, size), (diagonal, size+1), (diagonal, size-1)):
+        legal_moves_bits |= get_legal_moves_kogge_stone_lshift(check, player, blank, shift_size, steps)  # 左/上/左斜め上/右斜め上方向
+        legal_moves_bits |= get_legal_moves_kogge_stone_rshift(check, player, blank, shift_size, steps)  # 右/下/右斜め下/左斜め下方向
+
+    # 穴抜き
+    legal_moves_bits &= ~h
+
+    return legal_moves_bits
+
+
+def get_legal_moves_kogge_stone_lshift(mask, player, blank, shift_size, steps):
+    """
+    左シフトで石が置ける場所を取得(倍々に伝播)
+    """
+    tmp = mask & (player << shift_size)
+    shift, propagator = shift_size, mask
+    for _ in range(steps):
+        tmp |= propagator & (tmp << shift)
+        propagator &= propagator << shift
+        shift <<= 1
+
+    return blank & (tmp << shift_size)
+
+
+def get_legal_moves_kogge_stone_rshift(mask, player, blank, shift_size, steps):
+    """
+    右シフトで石が置ける場所を取得(倍々に伝播)
     """
-    count = 0
-    mask = 1 << ((size**2)-1)
-    for y in range(size):
-        for x in range(size):
-            if bits & mask:
-                count += 1
-            mask >>= 1
+    tmp = mask & (player >> shift_size)
+    shift, propagator = shift_size, mask
+    for _ in range(steps):
+        tmp |= propagator & (tmp >> shift)
+        propagator &= propagator >> shift
+        shift <<= 1
 
-    return count
+    return blank & (tmp >> shift_size)
@@ -1,6 +1,10 @@
 """PutDisc.py
 """
 
+from reversi.BitBoardMethods.GetFlippableDiscs import get_flippable_discs_num
+from reversi.BitBoardMethods.GetBitCount import popcount
+from reversi.BitBoardMethods.GetHash import get_hash
+
 
 def put_disc(board, color, x, y):
     """put_disc
@@ -11,27 +15,37 @@ def put_disc(board, color, x, y):
     if shift_size < 0 or shift_size > size**2-1:
         return 0
 
-    # 反転位置を整数に変換
-    flippable_discs = board.get_flippable_discs(color, x, y)
-    flippable_discs_num = 0
-    for tmp_x, tmp_y in flippable_discs:
-        flippable_discs_num |= 1 << ((size*size-1)-(tmp_y*size+tmp_x))
+    return put_disc_bits(board, color, 1 << shift_size)
+
+
+def put_disc_bits(board, color, put):
+    """put_disc_bits
+
+           指定位置(ビット)に石を置いて返せる場所をひっくり返し、取れた石のビット位置を返す
+    """
+    if not put:
+        return 0
+
+    # 反転位置を整数で取得
+    flippable_discs_num = get_flippable_discs_num(color, board.size, board._black_bitboard, board._white_bitboard, put, board._mask)
+    flippable_discs_count = popcount(flippable_discs_num)
 
     # 打つ前の状態を格納
     board.prev += [(board._black_bitboard, board._white_bitboard, board._black_score, board._white_score)]
 
     # 自分の石を置いて相手の石をひっくり返す
-    put = 1 << ((size*size-1)-(y*size+x))
     if color == 'black':
         board._black_bitboard ^= put | flippable_discs_num
         board._white_bitboard ^= flippable_discs_num
-        board._black_score += 1 + len(flippable_discs)
-        board._white_score -= len(flippable_discs)
+        board._black_score += 1 + flippable_discs_count
+        board._white_score -= flippable_discs_count
+        board._hash ^= get_hash(put | flippable_discs_num, flippable_discs_num)
     else:
         board._white_bitboard ^= put | flippable_discs_num
         board._black_bitboard ^= flippable_discs_num
-        board._black_score -= len(flippable_discs)
-        board._white_score += 1 + len(flippable_discs)
+        board._black_score -= flippable_discs_count
+        board._white_score += 1 + flippable_discs_count
+        board._hash ^= get_hash(flippable_discs_num, put | flippable_discs_num)
 
     board._flippable_discs_num = flippable_discs_num
 
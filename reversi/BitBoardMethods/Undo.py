@@ -1,8 +1,12 @@
 """Undo
 """
 
+from reversi.BitBoardMethods.GetHash import get_hash
+
 
 def undo(board):
     """undo
     """
+    black_bitboard, white_bitboard = board._black_bitboard, board._white_bitboard
     (board._black_bitboard, board._white_bitboard, board._black_score, board._white_score) = board.prev.pop()
+    board._hash ^= get_hash(black_bitboard ^ board._black_bitboard, white_bitboard ^ board._white_bitboard)
@@ -1,6 +1,8 @@
-from reversi.BitBoardMethods.GetLegalMoves import get_legal_moves, get_legal_moves_bits, get_bit_count
-from reversi.BitBoardMethods.GetFlippableDiscs import get_flippable_discs
-from reversi.BitBoardMethods.PutDisc import put_disc
+from reversi.BitBoardMethods.GetLegalMoves import get_legal_moves, get_legal_moves_bits, get_moves
+from reversi.BitBoardMethods.GetBitCount import popcount, get_bit_count
+from reversi.BitBoardMethods.GetHash import get_hash
+from reversi.BitBoardMethods.GetFlippableDiscs import get_flippable_discs, get_flippable_discs_num
+from reversi.BitBoardMethods.PutDisc import put_disc, put_disc_bits
 from reversi.BitBoardMethods.GetBoardInfo import get_board_info
 from reversi.BitBoardMethods.Undo import undo
 
@@ -8,9 +10,14 @@ from reversi.BitBoardMethods.Undo import undo
 __all__ = [
     'get_legal_moves',
     'get_legal_moves_bits',
+    'popcount',
     'get_bit_count',
+    'get_hash',
+    'get_moves',
     'get_flippable_discs',
+    'get_flippable_discs_num',
     'get_board_info',
     'undo',
     'put_disc',
+    'put_disc_bits',
 ]
@@ -1,20 +1,61 @@
-from .color import C
-from . import strategies
-from . import cy
-from .cy import ReversiMethods
-from .board import Board, BitBoard, PyListBoard, PyBitBoard, MIN_BOARD_SIZE, MAX_BOARD_SIZE
-from .move import Move, LOWER, UPPER
-from .variant import V
-from .player import Player
-from .display import ConsoleDisplay, NoneDisplay, WindowDisplay
-from .game import Game
-from .window import Window
-from .error_message import ErrorMessage
-from .recorder import Recorder
-from .app import Reversi, Reversic
-from .solver import Solver
-from .simulator import Simulator
-from . import genetic_algorithm
+import importlib
+
+
+# 公開名とその定義モジュール(初回アクセス時に読み込む、属性名がNoneの場合はモジュール自身)
+_LAZY_ATTRS = {
+    'ReversiMethods': ('.cy.ReversiMethods', None),
+    'Board': ('.board', 'Board'),
+    'BitBoard': ('.board', 'BitBoard'),
+    'PyListBoard': ('.board', 'PyListBoard'),
+    'PyBitBoard': ('.board', 'PyBitBoard'),
+    'MIN_BOARD_SIZE': ('.board', 'MIN_BOARD_SIZE'),
+    'MAX_BOARD_SIZE': ('.board', 'MAX_BOARD_SIZE'),
+    'Geometry': ('.geometry', 'Geometry'),
+    'get_geometry': ('.geometry', 'get_geometry'),
+    'Position': ('.position', 'Position'),
+    'C': ('.color', 'C'),
+    'Move': ('.move', 'Move'),
+    'LOWER': ('.move', 'LOWER'),
+    'UPPER': ('.move', 'UPPER'),
+    'V': ('.variant', 'V'),
+    'Player': ('.player', 'Player'),
+    'ConsoleDisplay': ('.display', 'ConsoleDisplay'),
+    'NoneDisplay': ('.display', 'NoneDisplay'),
+    'WindowDisplay': ('.display', 'WindowDisplay'),
+    'Game': ('.game', 'Game'),
+    'Window': ('.window', 'Window'),
+    'ErrorMessage': ('.error_message', 'ErrorMessage'),
+    'Reversi': ('.app', 'Reversi'),
+    'Reversic': ('.app', 'Reversic'),
+    'Recorder': ('.recorder', 'Recorder'),
+    'Solver': ('.solver', 'Solver'),
+    'Simulator': ('.simulator', 'Simulator'),
+}
+
+# 初回アクセス時に読み込むサブパッケージ/サブモジュール
+_LAZY_SUBMODULES = (
+    'cy',
+    'strategies',
+    'genetic_algorithm',
+    'headless',
+    'BitBoardMethods',
+)
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        module_name, attr = _LAZY_ATTRS[name]
+        module = importlib.import_module(module_name, __name__)
+        value = module if attr is None else getattr(module, attr)
+        globals()[name] = value
+        return value
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_LAZY_SUBMODULES))
 
 
 __all__ = [
@@ -26,6 +67,9 @@ __all__ = [
     'PyListBoard',
     'MIN_BOARD_SIZE',
     'MAX_BOARD_SIZE',
+    'Geometry',
+    'get_geometry',
+    'Position',
     'C',
     'Move',
     'LOWER',
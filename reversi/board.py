@@ -3,16 +3,18 @@
 
 import sys
 import abc
-from collections import namedtuple
+import copy
 
 from reversi.color import C as c
 from reversi.disc import D as d
 import reversi.cy as cy
 import reversi.BitBoardMethods as BitBoardMethods
+from reversi.geometry import get_geometry
 
 
 MIN_BOARD_SIZE = 4
 MAX_BOARD_SIZE = 26
+MULTIWORD_MIN_BOARD_SIZE = 10  # 64bitを超えるため複数ワードのビットボードを使うサイズ
 
 MAXSIZE64 = 2**63 - 1
 
@@ -54,11 +56,46 @@ class AbstractBoard(metaclass=abc.ABCMeta):
     def undo(self):
         pass
 
+    @property
+    def hash(self):
+        """hash
+
+               黒と白の石の配置のZobristハッシュ(64bit、手番は含まない)
+        """
+        return self._hash
+
     def move(self, color, move):
         """move
         """
         return self.put_disc(color, *move)
 
+    def put_disc_bits(self, color, move_bit):
+        """put_disc_bits
+
+               指定位置(ビット)に石を置いて返せる場所をひっくり返し、取れた石のビット位置を返す
+        """
+        size = self.size
+        y, x = divmod((size*size-1)-(move_bit.bit_length()-1), size)
+        return self.put_disc(color, x, y)
+
+    def copy(self):
+        """copy
+
+               同じ局面のボードを返す(打った手の履歴は持たない)
+        """
+        board = copy.deepcopy(self)
+        board.prev = []
+        return board
+
+    def child(self, color, move):
+        """child
+
+               指定した手を打った後の局面のボードを返す(自身は変更しない)
+        """
+        board = self.copy()
+        board.put_disc(color, *move)
+        return board
+
 
 class BoardSizeError(Exception):
     """BoardSizeError
@@ -73,8 +110,11 @@ def Board(size=8, hole=0x0, ini_black=None, ini_white=None, kind='BitBoard'):
 
 
 def BitBoard(size=8, hole=0x0, ini_black=None, ini_white=None):
-    if size == 8 and sys.maxsize == MAXSIZE64 and cy.IMPORTED:
-        return cy.ReversiMethods.CythonBitBoard(hole=hole, ini_black=ini_black, ini_white=ini_white)
+    if sys.maxsize == MAXSIZE64 and cy.IMPORTED:
+        if MIN_BOARD_SIZE <= size <= 8 and size % 2 == 0:
+            return cy.ReversiMethods.CythonBitBoard(size, hole=hole, ini_black=ini_black, ini_white=ini_white)
+        if MULTIWORD_MIN_BOARD_SIZE <= size <= MAX_BOARD_SIZE and size % 2 == 0:
+            return cy.ReversiMethods.CythonMultiBitBoard(size, hole=hole, ini_black=ini_black, ini_white=ini_white)
     return PyBitBoard(size, hole=hole, ini_black=ini_black, ini_white=ini_white)
 
 
@@ -87,6 +127,7 @@ class PyListBoard(AbstractBoard):
 
         self.prev = []    # 前回の手
         self.size = size  # ボードサイズ
+        self._geometry = get_geometry(size, hole)  # サイズと穴の配置ごとに共有する情報
 
         # 初期配置
         self._set_ini(size, ini_black, ini_white)
@@ -138,7 +179,7 @@ class PyListBoard(AbstractBoard):
         return not (MIN_BOARD_SIZE <= size <= MAX_BOARD_SIZE and size % 2 == 0)
 
     def __str__(self):
-        header = '   ' + ' '.join([chr(97 + i) for i in range(self.size)]) + '\n'
+        header = self._geometry.header
         body = ''
         for num, row in enumerate(self._board, 1):
             body += f'{num:2d}' + ''.join([value for value in row]) + '\n'
@@ -281,22 +322,44 @@ class PyListBoard(AbstractBoard):
             return 0
 
         flippable_discs = self.get_flippable_discs(color, x, y)  # ひっくり返せる場所を取得
+        is_blank = self._is_blank(x, y)
         self._board[y][x] = d[color]                             # 指定座標に石を置く
 
         # ひっくり返せる場所に石を置く
         for tmp_x, tmp_y, in flippable_discs:
             self._board[tmp_y][tmp_x] = d[color]
 
-        self.update_score()                                                                  # スコア更新
+        # スコアとハッシュの更新(空きマスへの着手は差分のみ)
+        flippable_discs_num = self._get_bit_pos(flippable_discs)
+        if is_blank:
+            self._add_diff(color, self._geometry.bits[y][x], flippable_discs_num, len(flippable_discs))
+        else:
+            self.update_score()
         self.prev += [{'color': color, 'x': x, 'y': y, 'flippable_discs': flippable_discs}]  # 打った手の記録
 
-        return self._get_bit_pos(flippable_discs)
+        return flippable_discs_num
 
     def update_score(self):
         """update_score
         """
         self._black_score = sum([row.count(d.black) for row in self._board])
         self._white_score = sum([row.count(d.white) for row in self._board])
+        black_bitboard, white_bitboard, _ = self.get_bitboard_info()
+        self._hash = BitBoardMethods.get_hash(black_bitboard, white_bitboard)
+
+    def _add_diff(self, color, put, flippable_discs_num, flippable_discs_count, sign=1):
+        """_add_diff
+
+               着手(sign=-1で取り消し)による石数とハッシュの差分を反映する
+        """
+        if color == c.black:
+            self._black_score += (1 + flippable_discs_count) * sign
+            self._white_score -= flippable_discs_count * sign
+            self._hash ^= BitBoardMethods.get_hash(put | flippable_discs_num, flippable_discs_num)
+        else:
+            self._black_score -= flippable_discs_count * sign
+            self._white_score += (1 + flippable_discs_count) * sign
+            self._hash ^= BitBoardMethods.get_hash(flippable_discs_num, put | flippable_discs_num)
 
     def _get_bit_pos(self, discs):
         """_get_bit_pos
@@ -304,13 +367,9 @@ class PyListBoard(AbstractBoard):
                discs配列の石が置いてあるビット位置を返す
         """
         ret = 0
-        size = self.size
-        mask = 1 << (size*size-1)
-        for y in range(self.size):
-            for x in range(self.size):
-                if (x, y) in discs:
-                    ret |= mask
-                mask >>= 1
+        bits = self._geometry.bits
+        for x, y in discs:
+            ret |= bits[y][x]
 
         return ret
 
@@ -358,15 +417,7 @@ class PyListBoard(AbstractBoard):
     def get_bit_count(self, bits):
         """get_bit_count
         """
-        count = 0
-        size = self.size
-        mask = 1 << ((size**2)-1)
-        for _ in range(size**2):
-            if bits & mask:
-                count += 1
-            mask >>= 1
-
-        return count
+        return BitBoardMethods.get_bit_count(self.size, bits)
 
     def get_bitboard_info(self):
         """get_bitboard_info
@@ -386,6 +437,17 @@ class PyListBoard(AbstractBoard):
 
         return black_bitboard, white_bitboard, hole_bitboard
 
+    def copy(self):
+        """copy
+
+               同じ局面のボードを返す(打った手の履歴は持たない)
+        """
+        board = PyListBoard.__new__(PyListBoard)
+        board.__dict__.update(self.__dict__)
+        board.prev = []
+        board._board = [row[:] for row in self._board]
+        return board
+
     def undo(self):
         """undo
         """
@@ -393,7 +455,8 @@ class PyListBoard(AbstractBoard):
         self._board[prev['y']][prev['x']] = d.blank     # 置いた石を取り除く
         for prev_x, prev_y in prev['flippable_discs']:  # ひっくり返された石を反転させる
             self._board[prev_y][prev_x] = d[c.next_color(prev['color'])]
-        self.update_score()
+        x, y, flippable_discs = prev['x'], prev['y'], prev['flippable_discs']
+        self._add_diff(prev['color'], self._geometry.bits[y][x], self._get_bit_pos(flippable_discs), len(flippable_discs), -1)
 
     def get_remain(self):
         """get_remain
@@ -420,21 +483,9 @@ class PyBitBoard(AbstractBoard):
         # 初期配置
         self._set_ini(size, ini_black, ini_white)
 
-        # 置ける場所の検出用マスク
-        BitMask = namedtuple('BitMask', 'h v d u ur r br b bl l ul')
-        self._mask = BitMask(
-            int(''.join((['0'] + ['1'] * (size-2) + ['0']) * size), 2),                                      # 水平方向のマスク値
-            int(''.join(['0'] * size + ['1'] * size * (size-2) + ['0'] * size), 2),                          # 垂直方向のマスク値
-            int(''.join(['0'] * size + (['0'] + (['1'] * (size-2)) + ['0']) * (size-2) + ['0'] * size), 2),  # 斜め方向のマスク値
-            int(''.join(['1'] * size * (size-1) + ['0'] * size), 2),                                         # 上方向のマスク値
-            int(''.join((['0'] + ['1'] * (size-1)) * (size-1) + ['0'] * size), 2),                           # 右上方向のマスク値
-            int(''.join((['0'] + ['1'] * (size-1)) * size), 2),                                              # 右方向のマスク値
-            int(''.join(['0'] * size + (['0'] + ['1'] * (size-1)) * (size-1)), 2),                           # 右下方向のマスク値
-            int(''.join(['0'] * size + ['1'] * size * (size-1)), 2),                                         # 下方向のマスク値
-            int(''.join(['0'] * size + (['1'] * (size-1) + ['0']) * (size-1)), 2),                           # 左下方向のマスク値
-            int(''.join((['1'] * (size-1) + ['0']) * size), 2),                                              # 左方向のマスク値
-            int(''.join((['1'] * (size-1) + ['0']) * (size-1) + ['0'] * size), 2)                            # 左上方向のマスク値
-        )
+        # 置ける場所の検出用マスク(サイズと穴の配置ごとに共有)
+        self._geometry = get_geometry(size, hole)
+        self._mask = self._geometry.mask
 
         # 穴をあける(サイズ8のみ
         self._hole_bitboard = hole
@@ -475,7 +526,7 @@ class PyBitBoard(AbstractBoard):
 
     def __str__(self):
         size = self.size
-        header = '   ' + ' '.join([chr(97 + i) for i in range(size)]) + '\n'
+        header = self._geometry.header
         board = [[d.blank for _ in range(size)] for _ in range(size)]
         mask = 1 << (size * size - 1)
         for y in range(size):
@@ -532,19 +583,22 @@ class PyBitBoard(AbstractBoard):
         """
         return BitBoardMethods.put_disc(self, color, x, y)
 
+    def put_disc_bits(self, color, move_bit):
+        """put_disc_bits
+
+               指定位置(ビット)に石を置いて返せる場所をひっくり返し、取れた石のビット位置を返す
+        """
+        return BitBoardMethods.put_disc_bits(self, color, move_bit)
+
     def update_score(self):
         """update_score
         """
-        self._black_score, self._white_score = 0, 0
+        # 黒と白が重なるマスは黒として数える
         size = self.size
-        mask = 1 << (size * size - 1)
-        for y in range(size):
-            for x in range(size):
-                if self._black_bitboard & mask:
-                    self._black_score += 1
-                elif self._white_bitboard & mask:
-                    self._white_score += 1
-                mask >>= 1
+        black = self._black_bitboard
+        self._black_score = BitBoardMethods.get_bit_count(size, black)
+        self._white_score = BitBoardMethods.get_bit_count(size, self._white_bitboard & ~black)
+        self._hash = BitBoardMethods.get_hash(self._black_bitboard, self._white_bitboard)
 
     def get_board_info(self):
         """get_board_info
@@ -588,6 +642,16 @@ class PyBitBoard(AbstractBoard):
         """
         return self._black_bitboard, self._white_bitboard, self._hole_bitboard
 
+    def copy(self):
+        """copy
+
+               同じ局面のボードを返す(打った手の履歴は持たない)
+        """
+        board = PyBitBoard.__new__(PyBitBoard)
+        board.__dict__.update(self.__dict__)
+        board.prev = []
+        return board
+
     def undo(self):
         """undo
         """
@@ -3,12 +3,18 @@
 
 import sys
 import time
-from collections import namedtuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-from libc.stdlib cimport rand
+from libc.stdlib cimport rand, malloc, calloc, free
+from libc.string cimport memcpy
 
 from reversi.strategies.common import Timer, Measure
 from reversi.recorder import Recorder
+from reversi.geometry import get_geometry
+from reversi.BitBoardMethods.GetBitCount import get_bit_count as _py_get_bit_count
+from reversi.BitBoardMethods.GetHash import get_hash as _py_get_hash, ZOBRIST_BLACK, ZOBRIST_WHITE, ZOBRIST_SIDE
+from reversi.strategies.common.transposition import get_ordered_moves
 
 
 DEF ENDGAME_BEST_MATCH = 0
@@ -16,9 +22,13 @@ DEF BLACK_MAX = 1
 DEF WHITE_MAX = 2
 DEF BLACK_SHORTEST = 3
 DEF WHITE_SHORTEST = 4
+DEF ENDGAME_WLD = 5  # 勝敗のみ(石差読みと同じ評価値を0前後の窓で探索する)
 
 DEF SHORTEST_REWARD = 10000
 
+DEF SEARCH_ENDGAME = 0
+DEF SEARCH_BLANK = 1
+
 DEF POSITIVE_INFINITY = 10000000
 DEF NEGATIVE_INFINITY = -10000000
 DEF MAX_POSSIBILITY = 40  # 着手可能数の最大(想定)
@@ -28,35 +38,284 @@ DEF TRANSPOSITION_TABLE_DEPTH = 3  # 置換表を有効にする残りの探索
 
 DEF MAXSIZE64 = 2**63 - 1
 
+DEF BLANK_TT_BITS = 16  # Blankの置換表のサイズ(2のべき乗)
+
+DEF TT_LOWER = 1  # 置換表の評価値の種類(TranspositionTableと同じ値)
+DEF TT_UPPER = 2
+DEF TT_EXACT = 3
+DEF TT_PROBES = 0
+DEF TT_HITS = 1
+DEF TT_CUTOFFS = 2
+DEF TT_STORES = 3
+DEF YBWC_SPLIT_PLIES = 4  # 終盤探索で弟の手を並列に探索する深さ(ルートからの手数)
+DEF YBWC_MIN_DEPTH = 10   # 並列に探索する残りの探索深さの下限
+DEF ENDGAME_TT_DEPTH = 8  # 終盤探索で置換表を使う残りの探索深さの下限(葉に近い局面は参照の方が高くつく)
+DEF ENDGAME_LAST_N = 4         # 終盤探索で専用の処理で解く残りの空きマス数
+DEF ENDGAME_FASTEST_FIRST = 7  # 終盤探索で相手の着手可能数が少ない順に並べる空きマス数の下限(以下は偶数理論で並べる)
+DEF PROBCUT_MAX_STAGES = 8   # ProbCutの進行度の分割数の上限(ProbCutと同じ値)
+DEF PROBCUT_MAX_DEPTH = 20   # ProbCutで枝刈りを試す残りの探索深さの上限
+DEF PROBCUT_MAX_CHECKS = 2   # ProbCutで1つの深さに試す浅い探索の数の上限
+DEF ORDERER_MAX_DEPTH = 64         # キラー手を覚える残りの探索深さの上限(Orderer_KHと同じ値)
+DEF ORDERER_MAX_SQUARES = 676      # 履歴を持つマスの数の上限(26 * 26)
+DEF ORDERER_KILLERS = 2            # 1つの深さで覚えるキラー手の数
+DEF ORDERER_KILLER_PRIORITY = 1 << 62  # キラー手の優先度(履歴より常に優先する)
+DEF IID_REDUCTION = 2  # 置換表の手がない局面で最善手を求める浅い探索の深さの減らし幅(多重反復深化)
+
 DEF MIN_BOARD_SIZE = 4
 DEF MAX_BOARD_SIZE = 26
 
+DEF SIZED_GEOMETRY_NUM = 4     # 1ワードに収まるサイズ8未満のジオメトリ数(8 / 2)
+
+DEF MULTI_MIN_BOARD_SIZE = 10  # 複数ワードのビットボードを使うサイズ
+DEF MULTI_MAX_WORDS = 11       # 26x26(676bit)を格納するワード数
+DEF MULTI_GEOMETRY_NUM = 14    # サイズ毎のジオメトリ数(MAX_BOARD_SIZE / 2 + 1)
+
+
+# 分岐予測のヒント(Cythonの生成コードで定義済みのマクロ)
+cdef extern from *:
+    bint likely(bint) nogil
+
+
+# 現在時刻(time.time()相当、GILなしで参照するため)
+cdef extern from *:
+    """
+    #ifdef _WIN32
+    #include <windows.h>
+    static double reversi_wall_time(void) {
+        FILETIME ft;
+        ULARGE_INTEGER t;
+        GetSystemTimeAsFileTime(&ft);
+        t.LowPart = ft.dwLowDateTime;
+        t.HighPart = ft.dwHighDateTime;
+        return (double)(t.QuadPart - 116444736000000000ULL) / 10000000.0;
+    }
+    #else
+    #include <sys/time.h>
+    static double reversi_wall_time(void) {
+        struct timeval tv;
+        gettimeofday(&tv, NULL);
+        return (double)tv.tv_sec + (double)tv.tv_usec / 1000000.0;
+    }
+    #endif
+    """
+    double reversi_wall_time() noexcept nogil
+
+
+# ビット数/最上位ビット位置(コンパイラがPOPCNT命令を対象にしている場合はハードウェア命令を使う)
+cdef extern from *:
+    """
+    #if defined(_MSC_VER) && defined(_M_X64)
+    #include <intrin.h>
+    #endif
+    static inline unsigned int reversi_popcount64(unsigned long long bits) {
+    #if (defined(__GNUC__) || defined(__clang__)) && (defined(__POPCNT__) || defined(__aarch64__))
+        return (unsigned int)__builtin_popcountll(bits);
+    #elif defined(_MSC_VER) && defined(_M_X64) && defined(__AVX__)
+        return (unsigned int)__popcnt64(bits);
+    #else
+        bits = bits - ((bits >> 1) & 0x5555555555555555ULL);
+        bits = (bits & 0x3333333333333333ULL) + ((bits >> 2) & 0x3333333333333333ULL);
+        bits = (bits + (bits >> 4)) & 0x0F0F0F0F0F0F0F0FULL;
+        return (unsigned int)((bits * 0x0101010101010101ULL) >> 56);
+    #endif
+    }
+    static inline unsigned int reversi_bit_length64(unsigned long long bits) {
+    #if defined(__GNUC__) || defined(__clang__)
+        return bits ? 64u - (unsigned int)__builtin_clzll(bits) : 0u;
+    #elif defined(_MSC_VER) && defined(_M_X64)
+        unsigned long index;
+        return _BitScanReverse64(&index, bits) ? (unsigned int)index + 1u : 0u;
+    #else
+        unsigned int length = 0;
+        while (bits) {
+            bits >>= 1;
+            length++;
+        }
+        return length;
+    #endif
+    }
+    """
+    unsigned int reversi_popcount64(unsigned long long bits) noexcept nogil
+    unsigned int reversi_bit_length64(unsigned long long bits) noexcept nogil
+
+
+# 置換表のエントリ
+ctypedef struct TTEntry:
+    unsigned long long b, w
+    signed int lower, upper
+    unsigned int color  # 手番+1(0は未使用)
+
+
+# 共有の置換表(TranspositionTableの配列を直接参照する、keysがNULLの場合は使わない)
+ctypedef struct TTView:
+    unsigned long long* keys
+    double* values
+    signed short* depths
+    unsigned char* bounds
+    signed short* moves
+    unsigned short* ages
+    unsigned long long* stats
+    unsigned long long mask
+    unsigned int min_depth
+    unsigned short age
+
+
+# 選択的探索(ProbCutのパラメータを進行度と深さで引ける形にしたもの、enabledが0の場合は使わない)
+ctypedef struct ProbCutView:
+    unsigned int enabled, stages, squares
+    unsigned int count[PROBCUT_MAX_STAGES][PROBCUT_MAX_DEPTH+1]
+    unsigned int shallow[PROBCUT_MAX_STAGES][PROBCUT_MAX_DEPTH+1][PROBCUT_MAX_CHECKS]
+    double a[PROBCUT_MAX_STAGES][PROBCUT_MAX_DEPTH+1][PROBCUT_MAX_CHECKS]
+    double b[PROBCUT_MAX_STAGES][PROBCUT_MAX_DEPTH+1][PROBCUT_MAX_CHECKS]
+    double margin[PROBCUT_MAX_STAGES][PROBCUT_MAX_DEPTH+1][PROBCUT_MAX_CHECKS]  # threshold * sigma
+
+
+# 途中の局面の手の並び替え(Orderer_KHの配列を直接参照する、enabledが0の場合は使わない)
+ctypedef struct OrderView:
+    unsigned int enabled, killer, history
+    signed short* killers            # [深さ][順位] = ビット位置
+    unsigned long long* histories    # [手番][ビット位置] = 履歴
+
+
+# サイズ8未満のビットボードのサイズごとの情報(左右、上下、左上/右下、右上/左下の順)
+ctypedef struct SizedGeometry:
+    unsigned int size, nbits, ready
+    unsigned int shifts[4]
+    unsigned long long masks[4]              # 合法手の検出用マスク
+    unsigned long long lmasks[4], rmasks[4]  # 左シフト/右シフトで1マス移動する時のマスク
+    unsigned long long full
+
+
+# 複数ワードのビットボード(Pythonのintの下位ワードから順に格納)
+ctypedef struct MultiBits:
+    unsigned long long w[MULTI_MAX_WORDS]
+
+
+# 複数ワードのビットボードのサイズごとの情報
+ctypedef struct MultiGeometry:
+    unsigned int size, nbits, nwords, ready
+    signed int shifts[8]
+    MultiBits masks[8]
+    MultiBits full
+
 
 cdef:
-    double timer_deadline
-    unsigned long long[64] legal_moves_bit_list, pbb, pwb, rec_pbb, rec_pwb
-    unsigned long long bb, wb, hb, fd, rec_bb, rec_wb, measure_count
-    unsigned long tx = 123456789, ty = 362436069, tz = 521288629, tw = 88675123
-    unsigned int[64] legal_moves_x, legal_moves_y, pbs, pws, rec_pbs, rec_pws
-    unsigned int rol, rec, rec_depth, bs, ws, max_depth, start_depth, tail, is_timer_enabled, timer_timeout
-    signed int[8][8] t_table= [[0, 0, 0, 0, 0, 0, 0, 0], [0, 0, 0, 0, 0, 0, 0, 0], [0, 0, 0, 0, 0, 0, 0, 0], [0, 0, 0, 0, 0, 0, 0, 0], [0, 0, 0, 0, 0, 0, 0, 0], [0, 0, 0, 0, 0, 0, 0, 0], [0, 0, 0, 0, 0, 0, 0, 0], [0, 0, 0, 0, 0, 0, 0, 0]]
-    # {{{ --- signed int[8][256] table_values= [ ---
-    signed int[8][256] table_values= [
-        [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
-    ]
-    # --- signed int[8][256] table_values= [ --- }}}
     signed int[256] edge_table8 = [0, 0, 0, 1, 0, 0, 0, 2, 0, 0, 0, 1, 0, 0, 0, 3, 0, 0, 0, 1, 0, 0, 0, 2, 0, 0, 0, 1, 0, 0, 0, 4, 0, 0, 0, 1, 0, 0, 0, 2, 0, 0, 0, 1, 0, 0, 0, 3, 0, 0, 0, 1, 0, 0, 0, 2, 0, 0, 0, 1, 0, 0, 0, 5, 0, 0, 0, 1, 0, 0, 0, 2, 0, 0, 0, 1, 0, 0, 0, 3, 0, 0, 0, 1, 0, 0, 0, 2, 0, 0, 0, 1, 0, 0, 0, 4, 0, 0, 0, 1, 0, 0, 0, 2, 0, 0, 0, 1, 0, 0, 0, 3, 0, 0, 0, 1, 0, 0, 0, 2, 0, 0, 0, 1, 0, 0, 0, 6, 0, 0, 0, 1, 0, 0, 0, 2, 0, 0, 0, 1, 0, 0, 0, 3, 0, 0, 0, 1, 0, 0, 0, 2, 0, 0, 0, 1, 0, 0, 0, 4, 0, 0, 0, 1, 0, 0, 0, 2, 0, 0, 0, 1, 0, 0, 0, 3, 0, 0, 0, 1, 0, 0, 0, 2, 0, 0, 0, 1, 0, 0, 0, 5, 1, 1, 1, 2, 1, 1, 1, 3, 1, 1, 1, 2, 1, 1, 1, 4, 1, 1, 1, 2, 1, 1, 1, 3, 1, 1, 1, 2, 1, 1, 1, 5, 2, 2, 2, 3, 2, 2, 2, 4, 2, 2, 2, 3, 2, 2, 2, 5, 3, 3, 3, 4, 3, 3, 3, 5, 4, 4, 4, 5, 5, 5, 6, 13]
-    signed int[64] montecarlo_scores
     signed int[8] directions_x = [-1, 0, 1, -1, 1, -1, 0, 1], directions_y = [-1, -1, -1, 0, 0, 1, 1, 1]
-    signed int rec_score, timer_timeout_value, taker_sign, corner, c, a1, a2, b1, b2, b3, wx, o1, o2, wp, ww, we, wb1, wb2, wb3
-    dict tp_table = {}  # Trans Position Table
+    unsigned long long[15] diagonal9_lines, diagonal7_lines  # サイズ8の左上/右下、右上/左下方向の各列
+    SizedGeometry[SIZED_GEOMETRY_NUM] sized_geometries
+    MultiGeometry[MULTI_GEOMETRY_NUM] multi_geometries
+
+
+# -------------------------------------------------- #
+# SearchContext
+cdef class SearchContext:
+    """SearchContext
+    """
+    cdef:
+        # ボード(サイズ8はgeoがNULL)
+        SizedGeometry* geo
+        unsigned long long bb, wb, hb, fd
+        unsigned int bs, ws, tail
+        unsigned long long[64] pbb, pwb
+        unsigned int[64] pbs, pws
+        # 合法手
+        unsigned long long[64] legal_moves_bit_list
+        unsigned int[64] legal_moves_x, legal_moves_y
+        # タイマー
+        double timer_deadline
+        unsigned int is_timer_enabled
+        signed int timer_timeout_value
+        # 探索
+        unsigned int rol, max_depth
+        signed int taker_sign
+        unsigned long long[4] quadrants  # 偶数理論で使う盤面の4分割
+        # 棋譜
+        unsigned int rec, rec_depth, start_depth
+        signed int rec_score
+        unsigned long long rec_bb, rec_wb
+        unsigned long long[64] rec_pbb, rec_pwb
+        unsigned int[64] rec_pbs, rec_pws
+        # 評価パラメータ(Blank)
+        signed int corner, c, a1, a2, b1, b2, b3, wx, o1, o2, wp, ww, we, wb1, wb2, wb3
+        signed int[8][8] t_table
+        signed int[8][256] table_values
+        # モンテカルロ(乱数の状態は手ごとに持つ)
+        signed int[64] montecarlo_scores
+        unsigned long tx, ty, tz, tw
+        unsigned long[64] mc_tx, mc_ty, mc_tz, mc_tw
+        # 置換表(Blank)
+        TTEntry* tt
+        # 置換表(共有)
+        TTView tv
+        object tt_owner
+        # 選択的探索
+        ProbCutView pc
+        # 手の並び替え
+        OrderView ov
+        object orderer_owner
+        unsigned int iid_depth  # 浅い探索で最善手を求める残りの探索深さの下限(0は使わない)
+        signed int node_best    # 直前に探索を終えた局面の最善手のビット位置
+    cdef readonly:
+        unsigned long long measure_count
+        unsigned int timer_timeout
+
+    def __cinit__(self):
+        self.max_depth = 64
+        self.tx = 123456789
+        self.ty = 362436069
+        self.tz = 521288629
+        self.tw = 88675123
+        self.tt = NULL
+        self.tv.keys = NULL
+        self.pc.enabled = 0
+        self.ov.enabled = 0
+        self.iid_depth = 0
+        self.geo = NULL
+
+    def __dealloc__(self):
+        free(self.tt)
+
+    cdef void clear_tt(self):
+        """clear_tt
+        """
+        free(self.tt)
+        self.tt = <TTEntry*>calloc(<size_t>1 << BLANK_TT_BITS, sizeof(TTEntry))
+        if self.tt == NULL:
+            raise MemoryError()
+
+    cdef SearchContext copy(self):
+        """copy
+        """
+        # 計測値以外の探索状態を複製する(並列探索の各ワーカー用、共有の置換表はロックなしで同じものを使う)
+        cdef SearchContext ctx = SearchContext()
+        ctx.geo = self.geo
+        ctx.bb, ctx.wb, ctx.hb, ctx.fd = self.bb, self.wb, self.hb, self.fd
+        ctx.bs, ctx.ws, ctx.tail = self.bs, self.ws, self.tail
+        memcpy(ctx.pbb, self.pbb, sizeof(self.pbb))
+        memcpy(ctx.pwb, self.pwb, sizeof(self.pwb))
+        memcpy(ctx.pbs, self.pbs, sizeof(self.pbs))
+        memcpy(ctx.pws, self.pws, sizeof(self.pws))
+        ctx.timer_deadline, ctx.is_timer_enabled, ctx.timer_timeout_value = self.timer_deadline, self.is_timer_enabled, self.timer_timeout_value
+        ctx.rol, ctx.max_depth, ctx.taker_sign = self.rol, self.max_depth, self.taker_sign
+        memcpy(ctx.quadrants, self.quadrants, sizeof(self.quadrants))
+        ctx.corner, ctx.c, ctx.a1, ctx.a2, ctx.b1, ctx.b2, ctx.b3, ctx.wx = self.corner, self.c, self.a1, self.a2, self.b1, self.b2, self.b3, self.wx
+        ctx.o1, ctx.o2, ctx.wp, ctx.ww, ctx.we, ctx.wb1, ctx.wb2, ctx.wb3 = self.o1, self.o2, self.wp, self.ww, self.we, self.wb1, self.wb2, self.wb3
+        memcpy(ctx.t_table, self.t_table, sizeof(self.t_table))
+        memcpy(ctx.table_values, self.table_values, sizeof(self.table_values))
+        memcpy(ctx.legal_moves_bit_list, self.legal_moves_bit_list, sizeof(self.legal_moves_bit_list))
+        memcpy(ctx.montecarlo_scores, self.montecarlo_scores, sizeof(self.montecarlo_scores))
+        memcpy(ctx.mc_tx, self.mc_tx, sizeof(self.mc_tx))
+        memcpy(ctx.mc_ty, self.mc_ty, sizeof(self.mc_ty))
+        memcpy(ctx.mc_tz, self.mc_tz, sizeof(self.mc_tz))
+        memcpy(ctx.mc_tw, self.mc_tw, sizeof(self.mc_tw))
+        if self.tt != NULL:
+            ctx.clear_tt()
+        ctx.tv, ctx.tt_owner = self.tv, self.tt_owner
+        ctx.pc = self.pc
+        ctx.ov, ctx.orderer_owner = self.ov, self.orderer_owner
+        ctx.iid_depth = self.iid_depth
+        return ctx
 
 
 # ================================================== #
@@ -64,99 +323,134 @@ cdef:
 
 # -------------------------------------------------- #
 # next_move
-def endgame_next_move(color, board, depth, pid, timer, measure, role):
+def endgame_next_move(color, board, depth, pid, timer, measure, role, workers=1, tt=None):
+    cdef SearchContext ctx = SearchContext()
     timer, measure = (False, False) if pid is None else (timer, measure)
-    return _next_move('endgame', color, board, depth, pid, timer, measure, role, None)
+    _set_tt(ctx, tt if role in ('best_match', 'wld') else None, ENDGAME_TT_DEPTH)
+    return _next_move(ctx, 'endgame', color, board, depth, pid, timer, measure, role, None, workers)
 
 
-def blank_next_move(color, board, params, depth, pid, timer, measure):
+def blank_next_move(color, board, params, depth, pid, timer, measure, workers=1):
     timer, measure = (False, False) if pid is None else (timer, measure)
-    return _next_move('blank', color, board, depth, pid, timer, measure, None, params)
+    return _next_move(SearchContext(), 'blank', color, board, depth, pid, timer, measure, None, params, workers)
 
 
-def alphabeta_next_move(color, board, param_min, param_max, depth, evaluator, pid, timer, measure):
+def alphabeta_next_move(color, board, param_min, param_max, depth, evaluator, pid, timer, measure, tt=None, probcut=None, orderer=None, iid=None):
+    cdef SearchContext ctx = SearchContext()
     timer, measure = (False, False) if pid is None else (timer, measure)
-    return _alphabeta_next_move(color, board, param_min, param_max, depth, evaluator, pid, timer, measure)
+    _set_tt(ctx, tt)
+    _set_probcut(ctx, probcut, board)
+    _set_orderer(ctx, orderer)
+    ctx.iid_depth = max(<unsigned int>iid, IID_REDUCTION + 1) if iid else <unsigned int>0
+    if isinstance(board, CythonMultiBitBoard):
+        return _multi_next_move(ctx, 'alphabeta', color, board, param_min, param_max, depth, evaluator, pid, timer, measure)
+    return _alphabeta_next_move(ctx, color, board, param_min, param_max, depth, evaluator, pid, timer, measure)
 
 
-def negascout_next_move(color, board, param_min, param_max, depth, evaluator, pid, timer, measure):
+def negascout_next_move(color, board, param_min, param_max, depth, evaluator, pid, timer, measure, tt=None, probcut=None, orderer=None, iid=None):
+    cdef SearchContext ctx = SearchContext()
     timer, measure = (False, False) if pid is None else (timer, measure)
-    return _negascout_next_move(color, board, param_min, param_max, depth, evaluator, pid, timer, measure)
+    _set_tt(ctx, tt)
+    _set_probcut(ctx, probcut, board)
+    _set_orderer(ctx, orderer)
+    ctx.iid_depth = max(<unsigned int>iid, IID_REDUCTION + 1) if iid else <unsigned int>0
+    if isinstance(board, CythonMultiBitBoard):
+        return _multi_next_move(ctx, 'negascout', color, board, param_min, param_max, depth, evaluator, pid, timer, measure)
+    return _negascout_next_move(ctx, color, board, param_min, param_max, depth, evaluator, pid, timer, measure)
 
 
-def montecarlo_next_move(color, board, count, pid, timer, measure):
+def montecarlo_next_move(color, board, count, pid, timer, measure, workers=1, seed=None):
     timer, measure = (False, False) if pid is None else (timer, measure)
-    return _montecarlo_next_move(color, board, count, pid, timer, measure)
+    seed = int(time.time()) if seed is None else seed
+    if isinstance(board, CythonMultiBitBoard):
+        return _multi_montecarlo_next_move(SearchContext(), color, board, count, pid, timer, measure, seed)
+    return _montecarlo_next_move(SearchContext(), color, board, count, pid, timer, measure, workers, seed)
 
 
 # -------------------------------------------------- #
 # get_best_move
-def endgame_get_best_move(color, board, moves, alpha, beta, depth, pid, timer, measure, role, recorder):
+def endgame_get_best_move(color, board, moves, alpha, beta, depth, pid, timer, measure, role, recorder, workers=1, tt=None):
+    cdef SearchContext ctx = SearchContext()
     timer, measure = (False, False) if pid is None else (timer, measure)
-    return _get_best_move_wrap('endgame', color, board, moves, alpha, beta, depth, pid, timer, measure, role, recorder, None)
+    _set_tt(ctx, tt if role in ('best_match', 'wld') else None, ENDGAME_TT_DEPTH)
+    return _get_best_move_wrap(ctx, 'endgame', color, board, moves, alpha, beta, depth, pid, timer, measure, role, recorder, None, workers)
 
 
-def blank_get_best_move(color, board, params, moves, alpha, beta, depth, pid, timer, measure):
+def blank_get_best_move(color, board, params, moves, alpha, beta, depth, pid, timer, measure, workers=1):
     timer, measure = (False, False) if pid is None else (timer, measure)
-    return _get_best_move_wrap('blank', color, board, moves, alpha, beta, depth, pid, timer, measure, None, 0, params)
+    return _get_best_move_wrap(SearchContext(), 'blank', color, board, moves, alpha, beta, depth, pid, timer, measure, None, 0, params, workers)
 
 
-def alphabeta_get_best_move(color, board, moves, alpha, beta, depth, evaluator, pid, timer, measure):
+def alphabeta_get_best_move(color, board, moves, alpha, beta, depth, evaluator, pid, timer, measure, tt=None, probcut=None, orderer=None, iid=None):
+    cdef SearchContext ctx = SearchContext()
     timer, measure = (False, False) if pid is None else (timer, measure)
-    return _alphabeta_get_best_move_wrap(color, board, moves, alpha, beta, depth, evaluator, pid, timer, measure)
+    _set_tt(ctx, tt)
+    _set_probcut(ctx, probcut, board)
+    _set_orderer(ctx, orderer)
+    ctx.iid_depth = max(<unsigned int>iid, IID_REDUCTION + 1) if iid else <unsigned int>0
+    if isinstance(board, CythonMultiBitBoard):
+        return _multi_get_best_move_wrap(ctx, 'alphabeta', color, board, moves, alpha, beta, depth, evaluator, pid, timer, measure)
+    return _alphabeta_get_best_move_wrap(ctx, color, board, moves, alpha, beta, depth, evaluator, pid, timer, measure)
 
 
-def negascout_get_best_move(color, board, moves, alpha, beta, depth, evaluator, pid, timer, measure):
+def negascout_get_best_move(color, board, moves, alpha, beta, depth, evaluator, pid, timer, measure, tt=None, probcut=None, orderer=None, iid=None):
+    cdef SearchContext ctx = SearchContext()
     timer, measure = (False, False) if pid is None else (timer, measure)
-    return _negascout_get_best_move_wrap(color, board, moves, alpha, beta, depth, evaluator, pid, timer, measure)
+    _set_tt(ctx, tt)
+    _set_probcut(ctx, probcut, board)
+    _set_orderer(ctx, orderer)
+    ctx.iid_depth = max(<unsigned int>iid, IID_REDUCTION + 1) if iid else <unsigned int>0
+    if isinstance(board, CythonMultiBitBoard):
+        return _multi_get_best_move_wrap(ctx, 'negascout', color, board, moves, alpha, beta, depth, evaluator, pid, timer, measure)
+    return _negascout_get_best_move_wrap(ctx, color, board, moves, alpha, beta, depth, evaluator, pid, timer, measure)
 
 
 # -------------------------------------------------- #
 # get_score
 def alphabeta_get_score(alphabeta, color, board, alpha, beta, depth, pid):
-    if board.size == 8 and sys.maxsize == MAXSIZE64 and hasattr(board, '_black_bitboard'):
+    if board.size == 8 and sys.maxsize == MAXSIZE64 and hasattr(board, '_black_bitboard') and alphabeta.tt is None and alphabeta.probcut is None and alphabeta.orderer is None and alphabeta.iid is None:
         return _alphabeta_get_score_size8_64bit(alphabeta, color, board, alpha, beta, depth, pid, 0, 0)
     return _alphabeta_get_score(alphabeta, color, board, alpha, beta, depth, pid, 0, 0)
 
 
 def alphabeta_get_score_measure(alphabeta, color, board, alpha, beta, depth, pid):
-    if board.size == 8 and sys.maxsize == MAXSIZE64 and hasattr(board, '_black_bitboard'):
+    if board.size == 8 and sys.maxsize == MAXSIZE64 and hasattr(board, '_black_bitboard') and alphabeta.tt is None and alphabeta.probcut is None and alphabeta.orderer is None and alphabeta.iid is None:
         return _alphabeta_get_score_size8_64bit(alphabeta, color, board, alpha, beta, depth, pid, 1, 0)
     return _alphabeta_get_score(alphabeta, color, board, alpha, beta, depth, pid, 1, 0)
 
 
 def alphabeta_get_score_timer(alphabeta, color, board, alpha, beta, depth, pid):
-    if board.size == 8 and sys.maxsize == MAXSIZE64 and hasattr(board, '_black_bitboard'):
+    if board.size == 8 and sys.maxsize == MAXSIZE64 and hasattr(board, '_black_bitboard') and alphabeta.tt is None and alphabeta.probcut is None and alphabeta.orderer is None and alphabeta.iid is None:
         return _alphabeta_get_score_size8_64bit(alphabeta, color, board, alpha, beta, depth, pid, 0, 1)
     return _alphabeta_get_score(alphabeta, color, board, alpha, beta, depth, pid, 0, 1)
 
 
 def alphabeta_get_score_measure_timer(alphabeta, color, board, alpha, beta, depth, pid):
-    if board.size == 8 and sys.maxsize == MAXSIZE64 and hasattr(board, '_black_bitboard'):
+    if board.size == 8 and sys.maxsize == MAXSIZE64 and hasattr(board, '_black_bitboard') and alphabeta.tt is None and alphabeta.probcut is None and alphabeta.orderer is None and alphabeta.iid is None:
         return _alphabeta_get_score_size8_64bit(alphabeta, color, board, alpha, beta, depth, pid, 1, 1)
     return _alphabeta_get_score(alphabeta, color, board, alpha, beta, depth, pid, 1, 1)
 
 
 def negascout_get_score(negascout, color, board, alpha, beta, depth, pid):
-    if board.size == 8 and sys.maxsize == MAXSIZE64 and hasattr(board, '_black_bitboard'):
+    if board.size == 8 and sys.maxsize == MAXSIZE64 and hasattr(board, '_black_bitboard') and negascout.tt is None and negascout.probcut is None and negascout.orderer is None and negascout.iid is None:
         return _negascout_get_score_size8_64bit(_negascout_get_score_size8_64bit, negascout, color, board, alpha, beta, depth, pid)
     return _negascout_get_score(_negascout_get_score, negascout, color, board, alpha, beta, depth, pid)
 
 
 def negascout_get_score_measure(negascout, color, board, alpha, beta, depth, pid):
-    if board.size == 8 and sys.maxsize == MAXSIZE64 and hasattr(board, '_black_bitboard'):
+    if board.size == 8 and sys.maxsize == MAXSIZE64 and hasattr(board, '_black_bitboard') and negascout.tt is None and negascout.probcut is None and negascout.orderer is None and negascout.iid is None:
         return _negascout_get_score_measure_size8_64bit(_negascout_get_score_measure_size8_64bit, negascout, color, board, alpha, beta, depth, pid)
     return _negascout_get_score_measure(_negascout_get_score_measure, negascout, color, board, alpha, beta, depth, pid)
 
 
 def negascout_get_score_timer(negascout, color, board, alpha, beta, depth, pid):
-    if board.size == 8 and sys.maxsize == MAXSIZE64 and hasattr(board, '_black_bitboard'):
+    if board.size == 8 and sys.maxsize == MAXSIZE64 and hasattr(board, '_black_bitboard') and negascout.tt is None and negascout.probcut is None and negascout.orderer is None and negascout.iid is None:
         return _negascout_get_score_timer_size8_64bit(_negascout_get_score_timer_size8_64bit, negascout, color, board, alpha, beta, depth, pid)
     return _negascout_get_score_timer(_negascout_get_score_timer, negascout, color, board, alpha, beta, depth, pid)
 
 
 def negascout_get_score_measure_timer(negascout, color, board, alpha, beta, depth, pid):
-    if board.size == 8 and sys.maxsize == MAXSIZE64 and hasattr(board, '_black_bitboard'):
+    if board.size == 8 and sys.maxsize == MAXSIZE64 and hasattr(board, '_black_bitboard') and negascout.tt is None and negascout.probcut is None and negascout.orderer is None and negascout.iid is None:
         return _negascout_get_score_measure_timer_size8_64bit(_negascout_get_score_measure_timer_size8_64bit, negascout, color, board, alpha, beta, depth, pid)
     return _negascout_get_score_measure_timer(_negascout_get_score_measure_timer, negascout, color, board, alpha, beta, depth, pid)
 
@@ -164,13 +458,15 @@ def negascout_get_score_measure_timer(negascout, color, board, alpha, beta, dept
 def table_get_score(table, board):
     if board.size == 8 and sys.maxsize == MAXSIZE64 and hasattr(board, '_black_bitboard'):
         return _table_get_score_size8_64bit(table, board)
+    if isinstance(board, CythonMultiBitBoard):
+        return _multi_table_get_score(table, board)
     return _table_get_score(table, board)
 
 
 # -------------------------------------------------- #
 # playout
 def playout(color, board, move):
-    return _board_playout(color, board, move)
+    return _board_playout(SearchContext(), color, board, move)
 
 
 # ================================================== #
@@ -178,270 +474,506 @@ def playout(color, board, move):
 
 # -------------------------------------------------- #
 # _next_move
-cdef inline tuple _next_move(str name, str color, board, int depth, str pid, int timer, int measure, str role, params):
-    global is_timer_enabled, timer_deadline, timer_timeout, timer_timeout_value, measure_count,legal_moves_bit_list, legal_moves_x, legal_moves_y, bb, wb, hb, bs, ws, max_depth, corner, c, a1, a2, b1, b2, b3, wx, o1, o2, wp, ww, we, wb1, wb2, wb3
+cdef inline tuple _next_move(SearchContext ctx, str name, str color, board, int depth, str pid, int timer, int measure, str role, params, unsigned int workers):
     cdef:
-        unsigned long long legal_moves, mask = 0x8000000000000000
-        unsigned int int_color = 0, x, y, index = 0
+        unsigned long long legal_moves, mask
+        unsigned int int_color = 0, x, y, index = 0, size
         signed int alpha = NEGATIVE_INFINITY, beta = POSITIVE_INFINITY
     # タイマーとメジャー準備
-    measure_count = 0
-    timer_timeout = <unsigned int>0
-    is_timer_enabled = timer
-    if is_timer_enabled and pid:
-        timer_deadline = Timer.deadline[pid]
-        timer_timeout_value = Timer.timeout_value[pid]
+    ctx.measure_count = 0
+    ctx.timer_timeout = <unsigned int>0
+    ctx.is_timer_enabled = timer
+    if ctx.is_timer_enabled and pid:
+        ctx.timer_deadline = Timer.deadline[pid]
+        ctx.timer_timeout_value = Timer.timeout_value[pid]
     if measure and pid:
         if pid not in Measure.count:
             Measure.count[pid] = <unsigned int>0
-        measure_count = Measure.count[pid]
+        ctx.measure_count = Measure.count[pid]
     # 次の手番
     if color == 'black':
         int_color = <unsigned int>1
     # ボード情報取得
-    bb, wb, hb = board.get_bitboard_info()
-    bs = board._black_score
-    ws = board._white_score
+    size = _set_geometry(ctx, board.size)
+    ctx.bb, ctx.wb, ctx.hb = board.get_bitboard_info()
+    ctx.bs = board._black_score
+    ctx.ws = board._white_score
     # By Strategies
-    max_depth = 64
+    ctx.max_depth = size * size
     if name == 'endgame':
         # 役割
-        beta = _set_role(role, beta)
+        beta = _set_role(ctx, role, beta)
         # 棋譜初期化(無効)
-        _init_recorder(<unsigned int>0, depth)
+        _init_recorder(ctx, <unsigned int>0, depth)
     elif name == 'blank':
+        if ctx.geo != NULL:
+            raise ValueError('blank supports only size 8!')
         # 評価パラメータ取得
-        corner = params[0]
-        c = params[1]
-        a1 = params[2]
-        a2 = params[3]
-        b1 = params[4]
-        b2 = params[5]
-        b3 = params[6]
-        wx = params[7]
-        o1 = params[8]
-        o2 = params[9]
-        wp = params[10]
-        ww = params[11]
-        we = params[12]
-        wb1 = params[13]
-        wb2 = params[14]
-        wb3 = params[15]
-        _set_t_table()
+        ctx.corner = params[0]
+        ctx.c = params[1]
+        ctx.a1 = params[2]
+        ctx.a2 = params[3]
+        ctx.b1 = params[4]
+        ctx.b2 = params[5]
+        ctx.b3 = params[6]
+        ctx.wx = params[7]
+        ctx.o1 = params[8]
+        ctx.o2 = params[9]
+        ctx.wp = params[10]
+        ctx.ww = params[11]
+        ctx.we = params[12]
+        ctx.wb1 = params[13]
+        ctx.wb2 = params[14]
+        ctx.wb3 = params[15]
+        _set_t_table(ctx)
     # 最大深さ調整
-    if depth > <int>(max_depth - (bs + ws)):
-        depth =  <int>max_depth - (bs + ws)
+    if depth > <int>(ctx.max_depth - (ctx.bs + ctx.ws)):
+        depth =  <int>ctx.max_depth - (ctx.bs + ctx.ws)
     # 最善手を取得
-    legal_moves = _get_legal_moves_bits(int_color, bb, wb, hb)
-    for y in range(8):
-        for x in range(8):
+    legal_moves = _ctx_get_legal_moves_bits(ctx, int_color, ctx.bb, ctx.wb)
+    mask = <unsigned long long>1 << (size * size - 1)
+    for y in range(size):
+        for x in range(size):
             if legal_moves & mask:
-                legal_moves_bit_list[index] = mask
-                legal_moves_x[index] = x
-                legal_moves_y[index] = y
+                ctx.legal_moves_bit_list[index] = mask
+                ctx.legal_moves_x[index] = x
+                ctx.legal_moves_y[index] = y
                 index += 1
             mask >>= 1
-    best_move, scores = _get_best_move(name, int_color, index, legal_moves_bit_list, legal_moves_x, legal_moves_y, alpha, beta, depth)
+    best_move, scores = _get_best_move(ctx, name, int_color, index, ctx.legal_moves_bit_list, ctx.legal_moves_x, ctx.legal_moves_y, alpha, beta, depth, workers)
     # タイマーとメジャー格納
     if measure and pid:
-        Measure.count[pid] = measure_count
-    if is_timer_enabled and pid and timer_timeout:
+        Measure.count[pid] = ctx.measure_count
+    if ctx.is_timer_enabled and pid and ctx.timer_timeout:
         Timer.timeout_flag[pid] = True  # タイムアウト発生
     return best_move
 
 
 # -------------------------------------------------- #
 # _get_best_move_wrap
-cdef inline _get_best_move_wrap(str name, str color, board, moves, signed int alpha, signed int beta, int depth, str pid, int timer, int measure, str role, int recorder, params):
-    global is_timer_enabled, timer_deadline, timer_timeout, timer_timeout_value, measure_count, bb, wb, hb, bs, ws, max_depth, rec, rec_depth, rec_bb, rec_wb, rec_pbb, rec_pbs, rec_pwb, rec_pws
+cdef inline _get_best_move_wrap(SearchContext ctx, str name, str color, board, moves, signed int alpha, signed int beta, int depth, str pid, int timer, int measure, str role, int recorder, params, unsigned int workers):
     cdef:
         unsigned long long[64] moves_bit_list
         unsigned long long put
         unsigned int[64] moves_x, moves_y
-        unsigned int x, y, i, index = 0, int_color = 0
+        unsigned int x, y, i, index = 0, int_color = 0, size
         signed int lshift
         list prev
     # タイマーとメジャー準備
-    measure_count = 0
-    timer_timeout = <unsigned int>0
-    is_timer_enabled = timer
-    if is_timer_enabled and pid:
-        timer_deadline = Timer.deadline[pid]
-        timer_timeout_value = Timer.timeout_value[pid]
+    ctx.measure_count = 0
+    ctx.timer_timeout = <unsigned int>0
+    ctx.is_timer_enabled = timer
+    if ctx.is_timer_enabled and pid:
+        ctx.timer_deadline = Timer.deadline[pid]
+        ctx.timer_timeout_value = Timer.timeout_value[pid]
     if measure and pid:
         if pid not in Measure.count:
             Measure.count[pid] = <unsigned int>0
-        measure_count = Measure.count[pid]
+        ctx.measure_count = Measure.count[pid]
     # 次の手番
     if color == 'black':
         int_color = <unsigned int>1
     # ボード情報取得
-    bb, wb, hb = board.get_bitboard_info()
-    bs = board._black_score
-    ws = board._white_score
+    size = _set_geometry(ctx, board.size)
+    ctx.bb, ctx.wb, ctx.hb = board.get_bitboard_info()
+    ctx.bs = board._black_score
+    ctx.ws = board._white_score
+    ctx.max_depth = size * size
     # 最大深さ調整
-    if depth > <int>(max_depth - (bs + ws)):
-        depth =  <int>max_depth - (bs + ws)
+    if depth > <int>(ctx.max_depth - (ctx.bs + ctx.ws)):
+        depth =  <int>ctx.max_depth - (ctx.bs + ctx.ws)
     # By Strategies
     if name == 'endgame':
         # 役割
-        beta = _set_role(role, beta)
+        beta = _set_role(ctx, role, beta)
         # 棋譜初期化(無効)
-        _init_recorder(<unsigned int>0, depth)
+        _init_recorder(ctx, <unsigned int>recorder, depth)
     elif name == 'blank':
+        if ctx.geo != NULL:
+            raise ValueError('blank supports only size 8!')
         # 評価パラメータ取得
-        corner = params[0]
-        c = params[1]
-        a1 = params[2]
-        a2 = params[3]
-        b1 = params[4]
-        b2 = params[5]
-        b3 = params[6]
-        wx = params[7]
-        o1 = params[8]
-        o2 = params[9]
-        wp = params[10]
-        ww = params[11]
-        we = params[12]
-        wb1 = params[13]
-        wb2 = params[14]
-        wb3 = params[15]
-        _set_t_table()
+        ctx.corner = params[0]
+        ctx.c = params[1]
+        ctx.a1 = params[2]
+        ctx.a2 = params[3]
+        ctx.b1 = params[4]
+        ctx.b2 = params[5]
+        ctx.b3 = params[6]
+        ctx.wx = params[7]
+        ctx.o1 = params[8]
+        ctx.o2 = params[9]
+        ctx.wp = params[10]
+        ctx.ww = params[11]
+        ctx.we = params[12]
+        ctx.wb1 = params[13]
+        ctx.wb2 = params[14]
+        ctx.wb3 = params[15]
+        _set_t_table(ctx)
     # 最善手を取得
     for x, y in moves:
-        lshift = (63-(y*8+x))
+        lshift = (size*size-1-(y*size+x))
         put = <unsigned long long>1 << lshift
         moves_bit_list[index] = put
         moves_x[index] = x
         moves_y[index] = y
         index += 1
-    best_move, scores = _get_best_move(name, int_color, index, moves_bit_list, moves_x, moves_y, alpha, beta, depth)
+    best_move, scores = _get_best_move(ctx, name, int_color, index, moves_bit_list, moves_x, moves_y, alpha, beta, depth, workers)
     # タイマーとメジャー格納
     if measure and pid:
-        Measure.count[pid] = measure_count
-    if is_timer_enabled and pid and timer_timeout:
+        Measure.count[pid] = ctx.measure_count
+    if ctx.is_timer_enabled and pid and ctx.timer_timeout:
         Timer.timeout_flag[pid] = True  # タイムアウト発生
-    if rec:
+    if ctx.rec:
         prev = []
-        for i in range(rec_depth):
-            prev += [(rec_pbb[i], rec_pwb[i], rec_pbs[i], rec_pws[i])]
-        return (best_move, scores, str(Recorder().get_record_by_custom(8, rec_bb, rec_wb, prev)))
+        for i in range(ctx.rec_depth):
+            prev += [(ctx.rec_pbb[i], ctx.rec_pwb[i], ctx.rec_pbs[i], ctx.rec_pws[i])]
+        return (best_move, scores, str(Recorder().get_record_by_custom(size, ctx.rec_bb, ctx.rec_wb, prev)))
     return (best_move, scores)
 
 
 # -------------------------------------------------- #
 # _get_best_move
-cdef inline _get_best_move(str name, unsigned int int_color, unsigned int index, unsigned long long[64] moves_bit_list, unsigned int[64] moves_x, unsigned int[64] moves_y, signed int alpha, signed int beta, int depth):
-    global timer_timeout, rol, tp_table
+cdef inline _get_best_move(SearchContext ctx, str name, unsigned int int_color, unsigned int index, unsigned long long[64] moves_bit_list, unsigned int[64] moves_x, unsigned int[64] moves_y, signed int alpha, signed int beta, int depth, unsigned int workers):
     cdef:
-        unsigned int int_color_next = 1, i, best = 64
+        unsigned int kind = SEARCH_ENDGAME, i, best = 64
         signed int score = alpha
-    scores, tp_table = {}, {}
-    # 手番
-    if int_color:
-        int_color_next = <unsigned int>0
-    # 各手のスコア取得
-    if name == 'endgame':
-        if rol == ENDGAME_BEST_MATCH:
-            for i in range(index):
-                _put_disc(int_color, moves_bit_list[i])
-                score = -_endgame_get_score(int_color_next, -beta, -alpha, depth-1, <unsigned int>0)
-                _undo()
-                scores[(moves_x[i], moves_y[i])] = score
-                if timer_timeout:
-                    if best == 64:
-                        best = i
-                    break
-                if score > alpha:  # 最善手を更新
-                    alpha = score
-                    best = i
-        else:
-            for i in range(index):
-                _put_disc(int_color, moves_bit_list[i])
-                score = _endgame_get_score_taker(int_color_next, alpha, beta, depth-1, <unsigned int>0)
-                _undo()
-                scores[(moves_x[i], moves_y[i])] = score
-                if timer_timeout:
-                    if best == 64:
-                        best = i
-                    break
-                if score > alpha:  # 最善手を更新
-                    alpha = score
-                    best = i
-    elif name == 'blank':
+    scores = {}
+    if name == 'blank':
+        kind = SEARCH_BLANK
         best = 0
-        for i in range(index):
-            _put_disc(int_color, moves_bit_list[i])
-            score = -_blank_get_score(int_color_next, -beta, -alpha, depth-1, <unsigned int>0)
-            _undo()
-            scores[(moves_x[i], moves_y[i])] = score
-            if timer_timeout:
-                break
-            if score > alpha:  # 最善手を更新
-                alpha = score
+        ctx.clear_tt()
+    # 勝敗のみ
+    if kind == SEARCH_ENDGAME and ctx.rol == ENDGAME_WLD:
+        return _get_best_move_wld(ctx, int_color, index, moves_bit_list, moves_x, moves_y, depth)
+    # 並列探索(石差読みは長男の手を探索してから弟の手を分割する)
+    if workers > 1 and index > 1 and not ctx.rec and kind == SEARCH_ENDGAME and ctx.rol == ENDGAME_BEST_MATCH:
+        return _get_best_move_ybwc(ctx, int_color, index, moves_bit_list, moves_x, moves_y, alpha, beta, depth, workers)
+    if workers > 1 and index > 1 and not ctx.rec:
+        return _get_best_move_parallel(ctx, kind, int_color, index, moves_bit_list, moves_x, moves_y, alpha, beta, depth, workers)
+    # 各手のスコア取得
+    for i in range(index):
+        with nogil:
+            score = _get_root_score(ctx, kind, int_color, moves_bit_list[i], alpha, beta, depth)
+        scores[(moves_x[i], moves_y[i])] = score
+        if ctx.timer_timeout:
+            if best == 64:
                 best = i
+            break
+        if score > alpha:  # 最善手を更新
+            alpha = score
+            best = i
+    return (moves_x[best], moves_y[best]), scores
+
+
+cdef inline _get_best_move_wld(SearchContext ctx, unsigned int int_color, unsigned int index, unsigned long long[64] moves_bit_list, unsigned int[64] moves_x, unsigned int[64] moves_y, int depth):
+    # 0前後のnull windowで今の最善より良いかだけを調べ、勝ち(1)/引き分け(0)/負け(-1)を返す(勝ちの手が見つかれば打ち切る)
+    cdef:
+        unsigned int i, best = 0
+        signed int score, edge, best_score = -1
+    scores = {}
+    for i in range(index):
+        edge = best_score
+        while edge < 1:
+            with nogil:
+                score = _get_root_score(ctx, SEARCH_ENDGAME, int_color, moves_bit_list[i], edge, edge + 1, depth)
+            if ctx.timer_timeout or score <= edge:
+                break
+            edge += 1
+        scores[(moves_x[i], moves_y[i])] = edge
+        if ctx.timer_timeout:
+            break
+        if edge > best_score:
+            best_score = edge
+            best = i
+            if best_score == 1:
+                break
+    return (moves_x[best], moves_y[best]), scores
+
+
+cdef inline _get_best_move_parallel(SearchContext ctx, unsigned int kind, unsigned int int_color, unsigned int index, unsigned long long[64] moves_bit_list, unsigned int[64] moves_x, unsigned int[64] moves_y, signed int alpha, signed int beta, int depth, unsigned int workers):
+    cdef:
+        unsigned int i, best = 0
+        signed int best_score = alpha
+        _RootSplit root_split = _RootSplit(ctx, kind, int_color, alpha, beta, depth)
+    scores = {}
+    # 各手をスレッドプールで探索する
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(root_split.search, [moves_bit_list[i] for i in range(index)]))
+    # 逐次探索と同じく、最大値の手のうち最初の手を選ぶ(タイムアウトした手は除く)
+    for i in range(index):
+        score, measure_count, timeout = results[i]
+        scores[(moves_x[i], moves_y[i])] = score
+        ctx.measure_count += measure_count
+        if timeout:
+            ctx.timer_timeout = <unsigned int>1
+        elif score > best_score:
+            best_score = score
+            best = i
+    return (moves_x[best], moves_y[best]), scores
+
+
+cdef class _RootSplit:
+    """_RootSplit
+    """
+    cdef:
+        SearchContext ctx
+        unsigned int kind, int_color
+        signed int alpha, beta
+        int depth
+        object lock
+
+    def __cinit__(self, SearchContext ctx, unsigned int kind, unsigned int int_color, signed int alpha, signed int beta, int depth):
+        self.ctx = ctx
+        self.kind = kind
+        self.int_color = int_color
+        self.alpha = alpha
+        self.beta = beta
+        self.depth = depth
+        self.lock = threading.Lock()
+
+    def search(self, unsigned long long move):
+        """search
+        """
+        cdef:
+            SearchContext ctx
+            signed int alpha, score
+        with self.lock:
+            ctx = self.ctx.copy()
+            alpha = self.alpha
+        # 同じ評価値の手を区別できるよう、その時点の最善値-1を下限として探索する
+        with nogil:
+            score = _get_root_score(ctx, self.kind, self.int_color, move, alpha - 1, self.beta, self.depth)
+        with self.lock:
+            if not ctx.timer_timeout and score > self.alpha:
+                self.alpha = score
+        return score, ctx.measure_count, ctx.timer_timeout
+
+
+cdef inline signed int _get_root_score(SearchContext ctx, unsigned int kind, unsigned int int_color, unsigned long long move, signed int alpha, signed int beta, int depth) noexcept nogil:
+    cdef:
+        unsigned int int_color_next = 0 if int_color else 1
+        signed int score
+    _put_disc(ctx, int_color, move)
+    if kind == SEARCH_BLANK:
+        score = -_blank_get_score(ctx, int_color_next, -beta, -alpha, depth-1, <unsigned int>0)
+    elif ctx.rol == ENDGAME_BEST_MATCH or ctx.rol == ENDGAME_WLD:
+        score = -_endgame_get_score(ctx, int_color_next, -beta, -alpha, depth-1, <unsigned int>0)
+    else:
+        score = _endgame_get_score_taker(ctx, int_color_next, alpha, beta, depth-1, <unsigned int>0)
+    _undo(ctx)
+    return score
+
+
+cdef inline _get_best_move_ybwc(SearchContext ctx, unsigned int int_color, unsigned int index, unsigned long long[64] moves_bit_list, unsigned int[64] moves_x, unsigned int[64] moves_y, signed int alpha, signed int beta, int depth, unsigned int workers):
+    cdef:
+        unsigned int i, best = 0, int_color_next = 0 if int_color else 1
+        signed int score, best_score = alpha
+        list order = _get_fastest_first(ctx, int_color, [moves_bit_list[i] for i in range(index)])
+        list moves = [moves_bit_list[i] for i in range(index)]
+        _YoungBrothers brothers
+    scores = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # 長男の手(分割しながら探索)
+        _put_disc(ctx, int_color, order[0])
+        score = -_endgame_ybwc(ctx, int_color_next, -beta, -alpha, depth-1, YBWC_SPLIT_PLIES-1, executor)
+        _undo(ctx)
+        results = {order[0]: (score, 0, ctx.timer_timeout)}
+        # 弟の手(長男の評価値を下限に並列で探索)
+        if not ctx.timer_timeout:
+            brothers = _YoungBrothers(ctx, int_color, score if score > alpha else alpha, beta, depth, 1)
+            results.update(zip(order[1:], executor.map(brothers.search, order[1:])))
+    # 逐次探索と同じく、元の順番で最大値の手のうち最初の手を選ぶ(タイムアウトした手は除く)
+    for i in range(index):
+        score, measure_count, timeout = results[moves[i]]
+        scores[(moves_x[i], moves_y[i])] = score
+        ctx.measure_count += measure_count
+        if timeout:
+            ctx.timer_timeout = <unsigned int>1
+        elif score > best_score:
+            best_score = score
+            best = i
     return (moves_x[best], moves_y[best]), scores
 
 
+cdef _endgame_ybwc(SearchContext ctx, unsigned int int_color, signed int alpha, signed int beta, int depth, int split, executor):
+    # Young Brothers Wait(長男の手の評価値が出てから弟の手を並列に探索する)
+    cdef:
+        unsigned int int_color_next = 0 if int_color else 1
+        signed int score
+        list order
+        _YoungBrothers brothers
+    if split <= 0 or depth < YBWC_MIN_DEPTH:
+        with nogil:
+            score = _endgame_get_score(ctx, int_color, alpha, beta, depth, <unsigned int>0)
+        return score
+    order = _get_fastest_first(ctx, int_color, _get_move_bits(_ctx_get_legal_moves_bits(ctx, int_color, ctx.bb, ctx.wb)))
+    if len(order) < 2:  # パスや一手のみの場合は分割しない
+        with nogil:
+            score = _endgame_get_score(ctx, int_color, alpha, beta, depth, <unsigned int>0)
+        return score
+    # 長男の手
+    _put_disc(ctx, int_color, order[0])
+    score = -_endgame_ybwc(ctx, int_color_next, -beta, -alpha, depth-1, split-1, executor)
+    _undo(ctx)
+    if score > alpha:
+        alpha = score
+    if alpha >= beta or ctx.timer_timeout:
+        return alpha
+    # 弟の手
+    brothers = _YoungBrothers(ctx, int_color, alpha, beta, depth, 0)
+    for score, measure_count, timeout in executor.map(brothers.search, order[1:]):
+        ctx.measure_count += measure_count
+        if timeout:
+            ctx.timer_timeout = <unsigned int>1
+    return brothers.alpha
+
+
+cdef inline list _get_move_bits(unsigned long long legal_moves_bits):
+    cdef:
+        unsigned long long move
+        list moves = []
+    while legal_moves_bits:
+        move = legal_moves_bits & (~legal_moves_bits+1)
+        moves.append(move)
+        legal_moves_bits ^= move
+    return moves
+
+
+cdef inline list _get_fastest_first(SearchContext ctx, unsigned int int_color, list moves):
+    # 相手の着手可能数が少ない手から順に並べる
+    cdef:
+        unsigned int int_color_next = 0 if int_color else 1
+        unsigned long long move
+        list keys = []
+    for move in moves:
+        _put_disc(ctx, int_color, move)
+        keys.append(_popcount(_ctx_get_legal_moves_bits(ctx, int_color_next, ctx.bb, ctx.wb)))
+        _undo(ctx)
+    return [move for _, move in sorted(zip(keys, moves), key=lambda item: item[0])]
+
+
+cdef class _YoungBrothers:
+    """_YoungBrothers
+    """
+    cdef:
+        SearchContext ctx
+        unsigned int int_color, root, cutoff
+        signed int alpha, beta
+        int depth
+        object lock
+
+    def __cinit__(self, SearchContext ctx, unsigned int int_color, signed int alpha, signed int beta, int depth, unsigned int root):
+        self.ctx = ctx.copy()
+        self.int_color = int_color
+        self.alpha = alpha
+        self.beta = beta
+        self.depth = depth
+        self.root = root  # ルートでは同じ評価値の手を区別する
+        self.cutoff = 0
+        self.lock = threading.Lock()
+
+    def search(self, unsigned long long move):
+        """search
+        """
+        cdef:
+            SearchContext ctx
+            signed int alpha, score
+        with self.lock:
+            if self.cutoff:  # 他の弟の手で枝刈りされた場合は探索しない
+                return NEGATIVE_INFINITY, 0, 0
+            ctx = self.ctx.copy()
+            alpha = self.alpha - 1 if self.root else self.alpha
+        with nogil:
+            score = _get_root_score(ctx, SEARCH_ENDGAME, self.int_color, move, alpha, self.beta, self.depth)
+        with self.lock:
+            if not ctx.timer_timeout and score > self.alpha:
+                self.alpha = score
+                if score >= self.beta:
+                    self.cutoff = 1
+        return score, ctx.measure_count, ctx.timer_timeout
+
+
 # -------------------------------------------------- #
 # EndGame Methods
-cdef inline void _init_recorder(unsigned int recorder, unsigned int  depth):
-    global rec, rec_score, rec_depth, start_depth, rec_bb, rec_wb, rec_pbb, rec_pwb, rec_pbs, rec_pws
+cdef inline void _init_recorder(SearchContext ctx, unsigned int recorder, unsigned int  depth):
     cdef:
         unsigned int i
-    rec = recorder
-    rec_score = <signed int>0
-    rec_depth = <unsigned int>0
-    rec_bb = <unsigned long long>0
-    rec_wb = <unsigned long long>0
+    ctx.rec = recorder
+    ctx.rec_score = <signed int>0
+    ctx.rec_depth = <unsigned int>0
+    ctx.rec_bb = <unsigned long long>0
+    ctx.rec_wb = <unsigned long long>0
     for i in range(64):
-        rec_pbb[i] = <unsigned long long>0
-        rec_pwb[i] = <unsigned long long>0
-        rec_pbs[i] = <unsigned int>0
-        rec_pws[i] = <unsigned int>0
-    start_depth = depth
-
-
-cdef inline signed int _set_role(str role, signed int beta):
-    global rol, hb, max_depth, taker_sign
-    rol = ENDGAME_BEST_MATCH
-    max_depth = <unsigned int>64 - <unsigned int>_popcount(hb)
-    if role != 'best_match':
+        ctx.rec_pbb[i] = <unsigned long long>0
+        ctx.rec_pwb[i] = <unsigned long long>0
+        ctx.rec_pbs[i] = <unsigned int>0
+        ctx.rec_pws[i] = <unsigned int>0
+    ctx.start_depth = depth
+
+
+cdef inline signed int _set_role(SearchContext ctx, str role, signed int beta):
+    ctx.rol = ENDGAME_BEST_MATCH
+    ctx.max_depth = (ctx.geo.nbits if ctx.geo != NULL else <unsigned int>64) - <unsigned int>_popcount(ctx.hb)
+    _set_quadrants(ctx, ctx.geo.size if ctx.geo != NULL else <unsigned int>8)
+    if role == 'wld':
+        ctx.rol = ENDGAME_WLD
+    elif role != 'best_match':
         # TODO : MUCH_TAKER:確定石の場所を記憶し、相手が確定石に置く手を後回しにする
         if role == 'black_max':
-            beta = <signed int>max_depth
-            rol = BLACK_MAX
-            taker_sign = <signed int>1
+            beta = <signed int>ctx.max_depth
+            ctx.rol = BLACK_MAX
+            ctx.taker_sign = <signed int>1
         elif role == 'white_max':
-            beta = <signed int>max_depth
-            rol = WHITE_MAX
-            taker_sign = <signed int>-1
+            beta = <signed int>ctx.max_depth
+            ctx.rol = WHITE_MAX
+            ctx.taker_sign = <signed int>-1
         elif role == 'black_shortest':
             beta = <signed int>SHORTEST_REWARD * 64
-            rol = BLACK_SHORTEST
-            taker_sign = <signed int>1
+            ctx.rol = BLACK_SHORTEST
+            ctx.taker_sign = <signed int>1
         elif role == 'white_shortest':
             beta = <signed int>SHORTEST_REWARD * 64
-            rol = WHITE_SHORTEST
-            taker_sign = <signed int>-1
+            ctx.rol = WHITE_SHORTEST
+            ctx.taker_sign = <signed int>-1
     return beta
 
 
-cdef inline signed int _endgame_get_score(unsigned int int_color, signed int alpha, signed int beta, unsigned int depth, unsigned int pas):
-    global timer_timeout, measure_count, bb, wb, bs, ws, pbb, pwb, pbs, pws, fd, tail, is_timer_enabled, max_depth
+cdef inline void _set_quadrants(SearchContext ctx, unsigned int size):
+    # 盤面を縦横に2分割した4つの領域のマスク
     cdef:
-        unsigned long long legal_moves_bits, move, count
-        unsigned int i, is_game_end = 0, int_color_next = 1, x, y
-        signed int timeout, score, sign = -1
+        unsigned int x, y, half = size // 2
+    for x in range(4):
+        ctx.quadrants[x] = <unsigned long long>0
+    for y in range(size):
+        for x in range(size):
+            ctx.quadrants[(y // half) * 2 + x // half] |= <unsigned long long>1 << (size * size - 1 - (y * size + x))
+
+
+cdef inline signed int _endgame_get_score(SearchContext ctx, unsigned int int_color, signed int alpha, signed int beta, unsigned int depth, unsigned int pas) noexcept nogil:
+    cdef:
+        unsigned long long legal_moves_bits, move, count, key = 0, first = 0, player = ctx.wb, opponent = ctx.bb
+        unsigned long long[64] moves
+        signed int[64] possibilities
+        unsigned int i, n = 0, is_game_end = 0, int_color_next = 1, x, y, use_tt = 0, empties = ctx.max_depth - (ctx.bs + ctx.ws)
+        signed int timeout, score, sign = -1, best = -1, alpha_ini = alpha, beta_ini = beta
+        double tt_alpha, tt_beta, tt_value
     # タイムアウト判定
-    if is_timer_enabled:
-        timeout = check_timeout()
+    if ctx.is_timer_enabled:
+        timeout = check_timeout(ctx)
         if timeout:
             return timeout
+    if int_color:
+        player = ctx.bb
+        opponent = ctx.wb
+    # 残り数マスは専用の処理で解く
+    if 0 < empties <= ENDGAME_LAST_N and depth >= empties:
+        if empties == 1:
+            return _endgame_last1(ctx, player, opponent, _get_empties(ctx))
+        return _endgame_last_n(ctx, player, opponent, _get_empties(ctx), empties, alpha, beta, pas)
     # 探索ノード数カウント
-    measure_count += 1
+    ctx.measure_count += 1
     # 合法手を取得
-    legal_moves_bits = _get_legal_moves_bits(int_color, bb, wb, hb)
+    legal_moves_bits = _ctx_get_legal_moves_bits(ctx, int_color, ctx.bb, ctx.wb)
     # 前回パス and 打てる場所なし の場合ゲーム終了
     if pas and not legal_moves_bits:
         is_game_end = <unsigned int>1
@@ -449,133 +981,279 @@ cdef inline signed int _endgame_get_score(unsigned int int_color, signed int alp
     if not depth or is_game_end:
         if int_color:
             sign = <signed int>1
-        return <signed int>((<signed int>bs - <signed int>ws) * <signed int>sign)
+        return <signed int>((<signed int>ctx.bs - <signed int>ctx.ws) * <signed int>sign)
     # 次の手番
     if int_color:
         int_color_next = <unsigned int>0
     # パスの場合
     if not legal_moves_bits:
-        return -_endgame_get_score(int_color_next, -beta, -alpha, depth, <unsigned int>1)
-    # 最終1手
-    if bs + ws == <unsigned int>(max_depth - 1):
-        measure_count += 1
-        count = _popcount(_get_flippable_discs_num(int_color, bb, wb, legal_moves_bits))
-        if rol == ENDGAME_BEST_MATCH:
-            if int_color:
-                return <signed int>(<signed int>bs - <signed int>ws + <signed int>(1 + count*2))
-            else:
-                return <signed int>-(<signed int>bs - <signed int>ws - <signed int>(1 + count*2))
+        return -_endgame_get_score(ctx, int_color_next, -beta, -alpha, depth, <unsigned int>1)
+    # 確定石による枝刈り(相手の確定石の分だけ最終石差の上限が下がる)
+    if ctx.geo == NULL and <signed int>ctx.max_depth - 2 * <signed int>_popcount(opponent) <= alpha:
+        if <signed int>ctx.max_depth - 2 * <signed int>_popcount(_get_stable_discs(opponent, ctx.bb | ctx.wb | ctx.hb, ctx.hb)) <= alpha:
+            return alpha
+    # 置換表を参照
+    if ctx.tv.keys != NULL and depth >= ctx.tv.min_depth:
+        use_tt = <unsigned int>1
+        key = _tt_key_64bit(ctx.bb, ctx.wb, int_color)
+        tt_alpha, tt_beta = alpha, beta
+        if _ttv_probe(&ctx.tv, key, depth, &tt_alpha, &tt_beta, &tt_value, &best):
+            return <signed int>tt_value
+        alpha, beta = <signed int>tt_alpha, <signed int>tt_beta
+        if best >= 0:
+            first = legal_moves_bits & (<unsigned long long>1 << best)
+    # 手の並び替え(空きマスが多い場合は相手の着手可能数が少ない順、少ない場合は偶数理論の順)
+    if empties > ENDGAME_FASTEST_FIRST:
+        while legal_moves_bits:
+            move = legal_moves_bits & (~legal_moves_bits+1)  # 一番右のONしているビットのみ取り出す
+            legal_moves_bits ^= move
+            _put_disc(ctx, int_color, move)
+            possibilities[n] = -<signed int>_popcount(_ctx_get_legal_moves_bits(ctx, int_color_next, ctx.bb, ctx.wb))
+            _undo(ctx)
+            moves[n] = move
+            n += 1
+        _sort_moves_by_possibility(n, moves, possibilities)
+    else:
+        n = _get_parity_moves(ctx, legal_moves_bits, moves)
+    # 置換表の最善手を先に調べる
+    if first:
+        _move_to_front(n, moves, first)
     # 評価値を算出
-    while (legal_moves_bits):
-        move = legal_moves_bits & (~legal_moves_bits+1)  # 一番右のONしているビットのみ取り出す
-        _put_disc(int_color, move)
-        score = -_endgame_get_score(int_color_next, -beta, -alpha, depth-1, <unsigned int>0)
-        _undo()
-        legal_moves_bits ^= move  # 一番右のONしているビットをOFFする
+    for i in range(n):
+        move = moves[i]
+        _put_disc(ctx, int_color, move)
+        score = -_endgame_get_score(ctx, int_color_next, -beta, -alpha, depth-1, <unsigned int>0)
+        _undo(ctx)
         if score > alpha:
             alpha = score
-        if timer_timeout:
+            best = <signed int>reversi_bit_length64(move) - 1
+        if ctx.timer_timeout:
             return alpha
         if alpha >= beta:  # 枝刈り
-            return alpha
+            break
+    # 置換表に格納
+    if use_tt:
+        _ttv_store(&ctx.tv, key, depth, alpha, alpha_ini, beta_ini, best)
+    return alpha
+
+
+cdef inline unsigned long long _get_empties(SearchContext ctx) noexcept nogil:
+    # 空きマス(穴を除く)
+    if ctx.geo == NULL:
+        return ~(ctx.bb | ctx.wb | ctx.hb)
+    return ~(ctx.bb | ctx.wb | ctx.hb) & ctx.geo.full
+
+
+cdef inline unsigned int _get_parity_moves(SearchContext ctx, unsigned long long bits, unsigned long long* moves) noexcept nogil:
+    # 偶数理論(空きマスが奇数個の領域の手を先にする)で並べ、手の数を返す
+    cdef:
+        unsigned long long odd = 0, region, move, empties = _get_empties(ctx)
+        unsigned int i, n = 0
+    for i in range(4):
+        region = empties & ctx.quadrants[i]
+        if _popcount(region) & 1:
+            odd |= region
+    for i in range(2):
+        region = bits & odd if i == 0 else bits & ~odd
+        while region:
+            move = region & (~region+1)
+            region ^= move
+            moves[n] = move
+            n += 1
+    return n
+
+
+cdef inline signed int _endgame_last1(SearchContext ctx, unsigned long long player, unsigned long long opponent, unsigned long long empty) noexcept nogil:
+    # 残り1マス(手番側から見た最終石差、打てない場合は相手が打つ)
+    cdef:
+        signed int score = <signed int>_popcount(player) - <signed int>_popcount(opponent)
+        unsigned long long flippable_discs
+    ctx.measure_count += 1
+    flippable_discs = _ctx_get_flippable_discs_num(ctx, <unsigned int>1, player, opponent, empty)
+    if flippable_discs:
+        return score + 1 + 2 * <signed int>_popcount(flippable_discs)
+    flippable_discs = _ctx_get_flippable_discs_num(ctx, <unsigned int>1, opponent, player, empty)
+    if flippable_discs:
+        return score - 1 - 2 * <signed int>_popcount(flippable_discs)
+    return score
+
+
+cdef signed int _endgame_last_n(SearchContext ctx, unsigned long long player, unsigned long long opponent, unsigned long long empties, unsigned int n, signed int alpha, signed int beta, unsigned int pas) noexcept nogil:
+    # 残り2～4マス(盤面を複製せず空きマスだけを調べる、偶数理論の順)
+    cdef:
+        unsigned long long odd = 0, region, move, flippable_discs
+        unsigned int i, moved = 0
+        signed int score
+    ctx.measure_count += 1
+    for i in range(4):
+        region = empties & ctx.quadrants[i]
+        if _popcount(region) & 1:
+            odd |= region
+    for i in range(2):
+        region = odd if i == 0 else empties & ~odd
+        while region:
+            move = region & (~region+1)
+            region ^= move
+            flippable_discs = _ctx_get_flippable_discs_num(ctx, <unsigned int>1, player, opponent, move)
+            if not flippable_discs:
+                continue
+            moved = 1
+            if n == 2:
+                score = -_endgame_last1(ctx, opponent ^ flippable_discs, player | flippable_discs | move, empties ^ move)
+            else:
+                score = -_endgame_last_n(ctx, opponent ^ flippable_discs, player | flippable_discs | move, empties ^ move, n-1, -beta, -alpha, <unsigned int>0)
+            if score > alpha:
+                alpha = score
+                if alpha >= beta:  # 枝刈り
+                    return alpha
+    if not moved:
+        # 前回パスの場合はゲーム終了
+        if pas:
+            return <signed int>_popcount(player) - <signed int>_popcount(opponent)
+        return -_endgame_last_n(ctx, opponent, player, empties, n, -beta, -alpha, <unsigned int>1)
     return alpha
 
 
-cdef inline signed int _endgame_get_score_taker(unsigned int int_color, signed int alpha, signed int beta, unsigned int depth, unsigned int pas):
-    global timer_timeout, measure_count, bb, wb, bs, ws, pbb, pwb, pbs, pws, fd, tail, is_timer_enabled, rol, taker_sign, max_depth
+cdef void _init_diagonal_lines() noexcept nogil:
+    cdef:
+        unsigned int x, y
+        unsigned long long bit
+    for y in range(8):
+        for x in range(8):
+            bit = <unsigned long long>1 << (63 - (y * 8 + x))
+            diagonal9_lines[x + 7 - y] |= bit
+            diagonal7_lines[x + y] |= bit
+
+
+_init_diagonal_lines()
+
+
+cdef inline unsigned long long _get_stable_discs(unsigned long long discs, unsigned long long filled, unsigned long long holes) noexcept nogil:
+    # サイズ8の確定石(4方向それぞれで、列が埋まっているか片側の隣が盤外/穴/確定石であれば返せない)
+    cdef:
+        unsigned long long full_h = 0, full_v, full_d9 = 0, full_d7 = 0, stable = 0, prev, t
+        unsigned int i
+    for i in range(8):
+        if (filled >> (i * 8)) & 0xFF == 0xFF:
+            full_h |= <unsigned long long>0xFF << (i * 8)
+    full_v = filled & (filled >> 32)
+    full_v &= full_v >> 16
+    full_v &= full_v >> 8
+    full_v = (full_v & 0xFF) * <unsigned long long>0x0101010101010101
+    for i in range(15):
+        if filled & diagonal9_lines[i] == diagonal9_lines[i]:
+            full_d9 |= diagonal9_lines[i]
+        if filled & diagonal7_lines[i] == diagonal7_lines[i]:
+            full_d7 |= diagonal7_lines[i]
+    # 盤外に接する方向
+    full_h |= <unsigned long long>0x8181818181818181
+    full_v |= <unsigned long long>0xFF000000000000FF
+    full_d9 |= <unsigned long long>0xFF818181818181FF
+    full_d7 |= <unsigned long long>0xFF818181818181FF
+    while True:
+        prev = stable
+        t = stable | holes
+        stable = discs & (full_h | ((t >> 1) & <unsigned long long>0x7F7F7F7F7F7F7F7F) | ((t << 1) & <unsigned long long>0xFEFEFEFEFEFEFEFE))
+        stable &= full_v | (t >> 8) | (t << 8)
+        stable &= full_d9 | ((t >> 9) & <unsigned long long>0x7F7F7F7F7F7F7F7F) | ((t << 9) & <unsigned long long>0xFEFEFEFEFEFEFEFE)
+        stable &= full_d7 | ((t >> 7) & <unsigned long long>0xFEFEFEFEFEFEFEFE) | ((t << 7) & <unsigned long long>0x7F7F7F7F7F7F7F7F)
+        if stable == prev:
+            return stable
+
+
+cdef inline signed int _endgame_get_score_taker(SearchContext ctx, unsigned int int_color, signed int alpha, signed int beta, unsigned int depth, unsigned int pas) noexcept nogil:
     cdef:
         unsigned long long legal_moves_bits, move, count
         unsigned int i, is_game_end = 0, int_color_next = 1, x, y, reward
         signed int timeout, score, sign = -1
     # タイムアウト判定
-    if is_timer_enabled:
-        timeout = check_timeout()
+    if ctx.is_timer_enabled:
+        timeout = check_timeout(ctx)
         if timeout:
             return timeout
     # 探索ノード数カウント
-    measure_count += 1
+    ctx.measure_count += 1
     # 合法手を取得
-    legal_moves_bits = _get_legal_moves_bits(int_color, bb, wb, hb)
+    legal_moves_bits = _ctx_get_legal_moves_bits(ctx, int_color, ctx.bb, ctx.wb)
     # 前回パス and 打てる場所なし の場合ゲーム終了
     if pas and not legal_moves_bits:
         is_game_end = <unsigned int>1
     # 最大深さに到達 or ゲーム終了
     if not depth or is_game_end:
-        if rol == BLACK_SHORTEST or rol == WHITE_SHORTEST:
-            if is_game_end and <signed int>(bs * taker_sign) > <signed int>(ws * taker_sign):
-                reward = (max_depth - (bs + ws)) * SHORTEST_REWARD
-                if reward > SHORTEST_REWARD:
-                    score = <signed int>((<signed int>bs - <signed int>ws) * taker_sign + <signed int>reward)
+        if ctx.rol == BLACK_SHORTEST or ctx.rol == WHITE_SHORTEST:
+            if is_game_end and <signed int>(ctx.bs * ctx.taker_sign) > <signed int>(ctx.ws * ctx.taker_sign):
+                reward = (ctx.max_depth - (ctx.bs + ctx.ws)) * SHORTEST_REWARD
+                if reward > SHORTEST_REWARD:  # 空きマスが2つ以上残る勝ちのみ(solver.pyのSHORTEST_MIN_BLANKSと同じ条件)
+                    score = <signed int>((<signed int>ctx.bs - <signed int>ctx.ws) * ctx.taker_sign + <signed int>reward)
                     #print(depth, score, hex(bs), hex(ws))
-                    _save_record(score, depth)
+                    _save_record(ctx, score, depth)
                     return score
-        return <signed int>(<signed int>bs - <signed int>ws) * taker_sign
+        return <signed int>(<signed int>ctx.bs - <signed int>ctx.ws) * ctx.taker_sign
     # 次の手番
     if int_color:
         int_color_next = <unsigned int>0
     # パスの場合
     if not legal_moves_bits:
-        return _endgame_get_score_taker(int_color_next, alpha, beta, depth, <unsigned int>1)
+        return _endgame_get_score_taker(ctx, int_color_next, alpha, beta, depth, <unsigned int>1)
     # 最終1手
-    if bs + ws == <unsigned int>(max_depth - 1):
-        measure_count += 1
-        count = _popcount(_get_flippable_discs_num(int_color, bb, wb, legal_moves_bits))
+    if ctx.bs + ctx.ws == <unsigned int>(ctx.max_depth - 1):
+        ctx.measure_count += 1
+        count = _popcount(_ctx_get_flippable_discs_num(ctx, int_color, ctx.bb, ctx.wb, legal_moves_bits))
         if int_color:
-            return <signed int>(<signed int>bs - <signed int>ws + <signed int>(1 + count*2)) * taker_sign
+            return <signed int>(<signed int>ctx.bs - <signed int>ctx.ws + <signed int>(1 + count*2)) * ctx.taker_sign
         else:
-            return <signed int>(<signed int>bs - <signed int>ws - <signed int>(1 + count*2)) * taker_sign
+            return <signed int>(<signed int>ctx.bs - <signed int>ctx.ws - <signed int>(1 + count*2)) * ctx.taker_sign
     # 評価値を算出
     while (legal_moves_bits):
         move = legal_moves_bits & (~legal_moves_bits+1)  # 一番右のONしているビットのみ取り出す
-        _put_disc(int_color, move)
-        score = _endgame_get_score_taker(int_color_next, alpha, beta, depth-1, <unsigned int>0)
-        _undo()
+        _put_disc(ctx, int_color, move)
+        score = _endgame_get_score_taker(ctx, int_color_next, alpha, beta, depth-1, <unsigned int>0)
+        _undo(ctx)
         legal_moves_bits ^= move  # 一番右のONしているビットをOFFする
         if score > alpha:
             alpha = score
-        if timer_timeout:
+        if ctx.timer_timeout:
             return alpha
         if alpha >= beta:  # 枝刈り
             return alpha
     return alpha
 
 
-cdef inline void _save_record(signed int score, unsigned int depth):
-    global rec, rec_score, rec_depth, start_depth, rec_bb, rec_wb, rec_pbb, rec_pwb, rec_pbs, rec_pws, bb, wb, pbb, pwb, pbs, pws
-    if rec and (score > rec_score):
-        rec_depth = start_depth - depth
-        rec_score = score
-        rec_bb = bb
-        rec_wb = wb
-        for i in range(rec_depth):
-            rec_pbb[i] = pbb[i]
-            rec_pwb[i] = pwb[i]
-            rec_pbs[i] = pbs[i]
-            rec_pws[i] = pws[i]
+cdef inline void _save_record(SearchContext ctx, signed int score, unsigned int depth) noexcept nogil:
+    if ctx.rec and (score > ctx.rec_score):
+        ctx.rec_depth = ctx.start_depth - depth
+        ctx.rec_score = score
+        ctx.rec_bb = ctx.bb
+        ctx.rec_wb = ctx.wb
+        for i in range(ctx.rec_depth):
+            ctx.rec_pbb[i] = ctx.pbb[i]
+            ctx.rec_pwb[i] = ctx.pwb[i]
+            ctx.rec_pbs[i] = ctx.pbs[i]
+            ctx.rec_pws[i] = ctx.pws[i]
 
 
 # -------------------------------------------------- #
 # Blank Methods
-cdef inline signed int _blank_get_score(unsigned int int_color, signed int alpha, signed int beta, unsigned int depth, unsigned int pas):
-    global timer_timeout, measure_count, bb, wb, hb, bs, ws, pbb, pwb, pbs, pws, fd, tail, tp_table, is_timer_enabled
+cdef inline signed int _blank_get_score(SearchContext ctx, unsigned int int_color, signed int alpha, signed int beta, unsigned int depth, unsigned int pas) noexcept nogil:
     cdef:
         unsigned long long[64] next_moves_list
         unsigned long long legal_moves_b_bits, legal_moves_w_bits, legal_moves_bits, move, flippable_discs_num, b, w, bits, t_, rt, r_, rb, b_, lb, l_, lt, bf_t_ = 0, bf_rt = 0, bf_r_ = 0, bf_rb = 0, bf_b_ = 0, bf_lb = 0, bf_l_ = 0, bf_lt = 0, player, opponent, blank, horizontal, vertical, diagonal, tmp_h, tmp_v, tmp_d1, tmp_d2, legal_moves_bits_opponent, bits_count
         unsigned int i, int_color_next = 1, count = 0
         signed int[64] possibilities
         signed int null_window, timeout, sign = -1, score, upper, lower, score_max = NEGATIVE_INFINITY, alpha_ini = alpha
+        TTEntry* entry
     # タイムアウト判定
-    if is_timer_enabled:
-        timeout = check_timeout()
+    if ctx.is_timer_enabled:
+        timeout = check_timeout(ctx)
         if timeout:
             return timeout
     # 探索ノード数カウント
-    measure_count += 1
+    ctx.measure_count += 1
     # 置換表に結果が存在する場合、その値を返す
-    key = (bb, wb, int_color)
+    entry = &ctx.tt[_tt_index(ctx.bb, ctx.wb, int_color)]
     if depth >= TRANSPOSITION_TABLE_DEPTH:
-        if key in tp_table:
-            lower, upper = tp_table[key]
+        if entry.color == int_color + 1 and entry.b == ctx.bb and entry.w == ctx.wb:
+            lower, upper = entry.lower, entry.upper
             if upper <= alpha:
                 return upper
             if lower >= beta:
@@ -588,10 +1266,10 @@ cdef inline signed int _blank_get_score(unsigned int int_color, signed int alpha
                 beta = upper
     # 合法手を取得
     # {{{ -- _get_legal_moves_bits(int_color, bb, wb, hb) --
-    player, opponent = wb, bb
+    player, opponent = ctx.wb, ctx.bb
     if int_color:
-        player, opponent = bb, wb
-    blank = ~(player | opponent | hb)
+        player, opponent = ctx.bb, ctx.wb
+    blank = ~(player | opponent | ctx.hb)
     horizontal = opponent & <unsigned long long>0x7E7E7E7E7E7E7E7E  # horizontal mask value
     vertical = opponent & <unsigned long long>0x00FFFFFFFFFFFF00    # vertical mask value
     diagonal = opponent & <unsigned long long>0x007E7E7E7E7E7E00    # diagonal mask value
@@ -634,20 +1312,20 @@ cdef inline signed int _blank_get_score(unsigned int int_color, signed int alpha
         # 前回もパスの場合ゲーム終了
         if pas:
             # {{{ --- return _evaluate(int_color, <signed int>0, <signed int>0) * sign ---
-            score = bs - ws
+            score = ctx.bs - ctx.ws
             if score > 0:    # 黒が勝った
-                score += ww
+                score += ctx.ww
             elif score < 0:  # 白が勝った
-                score -= ww
+                score -= ctx.ww
             return score * sign
             # --- return _evaluate(int_color, <signed int>0, <signed int>0) * sign --- }}}
-        return -_blank_get_score(int_color_next, -beta, -alpha, depth, <unsigned int>1)
+        return -_blank_get_score(ctx, int_color_next, -beta, -alpha, depth, <unsigned int>1)
     # 最大深さに到達
     if not depth:
         # 相手の着手可能数を取得
         # {{{ -- _get_legal_moves_bits(<unsigned int>0 if int_color else <unsigned int>1, bb, wb, hb) --
         player, opponent = opponent, player  # reversed for opponent
-        blank = ~(player | opponent | hb)
+        blank = ~(player | opponent | ctx.hb)
         horizontal = opponent & <unsigned long long>0x7E7E7E7E7E7E7E7E  # horizontal mask value
         vertical = opponent & <unsigned long long>0x00FFFFFFFFFFFF00    # vertical mask value
         diagonal = opponent & <unsigned long long>0x007E7E7E7E7E7E00    # diagonal mask value
@@ -711,21 +1389,21 @@ cdef inline signed int _blank_get_score(unsigned int int_color, signed int alpha
         # {{{ --- return _evaluate(int_color, <signed int>legal_moves_b_bits, <signed int>legal_moves_w_bits) * sign ---
         # 勝敗が決まっている場合
         if not legal_moves_b_bits and not legal_moves_w_bits:
-            score = bs - ws
+            score = ctx.bs - ctx.ws
             if score > 0:    # 黒が勝った
-                score += ww
+                score += ctx.ww
             elif score < 0:  # 白が勝った
-                score -= ww
+                score -= ctx.ww
             return score * sign
         # 勝敗が決まっていない場合
-        score = _get_t() + _get_p(<signed int>legal_moves_b_bits, <signed int>legal_moves_w_bits) + _get_e() + _get_b()
+        score = _get_t(ctx) + _get_p(ctx, <signed int>legal_moves_b_bits, <signed int>legal_moves_w_bits) + _get_e(ctx) + _get_b(ctx)
         return score * sign
         # --- return _evaluate(int_color, <signed int>legal_moves_b_bits, <signed int>legal_moves_w_bits) * sign --- }}}
     # 合法手と着手可能数の格納
     while (legal_moves_bits):
         move = legal_moves_bits & (~legal_moves_bits+1)  # 一番右のONしているビットのみ取り出す
         next_moves_list[count] = move
-        b, w = bb, wb
+        b, w = ctx.bb, ctx.wb
         # ひっくり返せる石を取得
         # {{{ -- _get_flippable_discs_num --
         flippable_discs_num = 0
@@ -791,7 +1469,7 @@ cdef inline signed int _blank_get_score(unsigned int int_color, signed int alpha
         player, opponent = w, b
         if int_color:
             player, opponent = b, w
-        blank = ~(player | opponent | hb)
+        blank = ~(player | opponent | ctx.hb)
         horizontal = opponent & <unsigned long long>0x7E7E7E7E7E7E7E7E  # horizontal mask value
         vertical = opponent & <unsigned long long>0x00FFFFFFFFFFFF00    # vertical mask value
         diagonal = opponent & <unsigned long long>0x007E7E7E7E7E7E00    # diagonal mask value
@@ -846,9 +1524,9 @@ cdef inline signed int _blank_get_score(unsigned int int_color, signed int alpha
         flippable_discs_num = 0
         bf_t_, bf_rt, bf_r_, bf_rb, bf_b_, bf_lb, bf_l_, bf_lt = 0, 0, 0, 0, 0, 0, 0, 0
         move = next_moves_list[i]
-        player, opponent = wb, bb
+        player, opponent = ctx.wb, ctx.bb
         if int_color:
-            player, opponent = bb, wb
+            player, opponent = ctx.bb, ctx.wb
         t_ = <unsigned long long>0xFFFFFFFFFFFFFF00 & (move << <unsigned int>8)  # top
         rt = <unsigned long long>0x7F7F7F7F7F7F7F00 & (move << <unsigned int>7)  # right-top
         r_ = <unsigned long long>0x7F7F7F7F7F7F7F7F & (move >> <unsigned int>1)  # right
@@ -898,10 +1576,10 @@ cdef inline signed int _blank_get_score(unsigned int int_color, signed int alpha
             flippable_discs_num |= bf_l_
         if lt & player:
             flippable_discs_num |= bf_lt
-        fd = flippable_discs_num
+        ctx.fd = flippable_discs_num
         # -- _get_flippable_discs_num -- }}}
         # {{{ -- _popcount --
-        bits = fd
+        bits = ctx.fd
         bits = bits - ((bits >> <unsigned int>1) & <unsigned long long>0x5555555555555555)
         bits = (bits & <unsigned long long>0x3333333333333333) + ((bits >> <unsigned int>2) & <unsigned long long>0x3333333333333333)
         bits = (bits + (bits >> <unsigned int>4)) & <unsigned long long>0x0F0F0F0F0F0F0F0F
@@ -910,34 +1588,34 @@ cdef inline signed int _blank_get_score(unsigned int int_color, signed int alpha
         bits_count = (bits + (bits >> <unsigned int>32)) & <unsigned long long>0x000000000000007F
         # -- _popcount -- }}}
         # 打つ前の状態を格納
-        pbb[tail] = bb
-        pwb[tail] = wb
-        pbs[tail] = bs
-        pws[tail] = ws
-        tail += 1
+        ctx.pbb[ctx.tail] = ctx.bb
+        ctx.pwb[ctx.tail] = ctx.wb
+        ctx.pbs[ctx.tail] = ctx.bs
+        ctx.pws[ctx.tail] = ctx.ws
+        ctx.tail += 1
         # 自分の石を置いて相手の石をひっくり返す
         if int_color:
-            bb ^= move | fd
-            wb ^= fd
-            bs += <unsigned int>1 + <unsigned int>bits_count
-            ws -= <unsigned int>bits_count
+            ctx.bb ^= move | ctx.fd
+            ctx.wb ^= ctx.fd
+            ctx.bs += <unsigned int>1 + <unsigned int>bits_count
+            ctx.ws -= <unsigned int>bits_count
         else:
-            wb ^= move | fd
-            bb ^= fd
-            bs -= <unsigned int>bits_count
-            ws += <unsigned int>1 + <unsigned int>bits_count
+            ctx.wb ^= move | ctx.fd
+            ctx.bb ^= ctx.fd
+            ctx.bs -= <unsigned int>bits_count
+            ctx.ws += <unsigned int>1 + <unsigned int>bits_count
         # --- _put_disc(int_color, next_moves_list[i]) --- }}}
         # Null Window Search
         null_window = beta if not i else alpha + 1
-        score = -_blank_get_score(int_color_next, -null_window, -alpha, depth-1, <unsigned int>0)
+        score = -_blank_get_score(ctx, int_color_next, -null_window, -alpha, depth-1, <unsigned int>0)
         if alpha < score:
             if i and score <= null_window:
-                score = -_blank_get_score(int_color_next, -beta, -score, depth-1, <unsigned int>0)
+                score = -_blank_get_score(ctx, int_color_next, -beta, -score, depth-1, <unsigned int>0)
             alpha = score
         # 手を戻す
-        _undo()
+        _undo(ctx)
         # タイムアウト判定
-        if timer_timeout:
+        if ctx.timer_timeout:
             return alpha
         # 最大値の更新
         if alpha > score_max:
@@ -945,18 +1623,31 @@ cdef inline signed int _blank_get_score(unsigned int int_color, signed int alpha
         # beta cut
         if score_max >= beta:
             if depth >= TRANSPOSITION_TABLE_DEPTH:
-                tp_table[key] = (score_max, POSITIVE_INFINITY)
+                _tt_store(entry, ctx.bb, ctx.wb, int_color, score_max, POSITIVE_INFINITY)
             return score_max
     if depth >= TRANSPOSITION_TABLE_DEPTH:
         # 置換表に結果を格納
         if score_max > alpha_ini:
-            tp_table[key] = (score_max, score_max)
+            _tt_store(entry, ctx.bb, ctx.wb, int_color, score_max, score_max)
         else:
-            tp_table[key] = (NEGATIVE_INFINITY, score_max)
+            _tt_store(entry, ctx.bb, ctx.wb, int_color, NEGATIVE_INFINITY, score_max)
     return score_max
 
 
-cdef inline void _sort_moves_by_possibility(unsigned int count, unsigned long long[64] next_moves_list, signed int[64] possibilities):
+cdef inline unsigned int _tt_index(unsigned long long b, unsigned long long w, unsigned int int_color) noexcept nogil:
+    return <unsigned int>(((b * <unsigned long long>0x9E3779B97F4A7C15) ^ (w * <unsigned long long>0xC2B2AE3D27D4EB4F) ^ int_color) >> (64 - BLANK_TT_BITS))
+
+
+cdef inline void _tt_store(TTEntry* entry, unsigned long long b, unsigned long long w, unsigned int int_color, signed int lower, signed int upper) noexcept nogil:
+    # 常に上書きする
+    entry.b = b
+    entry.w = w
+    entry.color = int_color + 1
+    entry.lower = lower
+    entry.upper = upper
+
+
+cdef inline void _sort_moves_by_possibility(unsigned int count, unsigned long long[64] next_moves_list, signed int[64] possibilities) noexcept nogil:
     if count >= 2:
         if count <= BUCKET_SIZE:
             _bucket_sort(count, next_moves_list, possibilities)
@@ -964,7 +1655,7 @@ cdef inline void _sort_moves_by_possibility(unsigned int count, unsigned long lo
             _merge_sort(count, next_moves_list, possibilities)
 
 
-cdef inline void _bucket_sort(unsigned int count, unsigned long long[64] next_moves_list, signed int[64] possibilities):
+cdef inline void _bucket_sort(unsigned int count, unsigned long long[64] next_moves_list, signed int[64] possibilities) noexcept nogil:
     cdef:
         unsigned long long[POSSIBILITY_RANGE*BUCKET_SIZE] bucket
         unsigned int[POSSIBILITY_RANGE] possibility_count
@@ -986,7 +1677,7 @@ cdef inline void _bucket_sort(unsigned int count, unsigned long long[64] next_mo
             k -= 1
 
 
-cdef inline void _merge_sort(unsigned int count, unsigned long long[64] next_moves_list, signed int[64] possibilities):
+cdef inline void _merge_sort(unsigned int count, unsigned long long[64] next_moves_list, signed int[64] possibilities) noexcept nogil:
     cdef:
         unsigned long long[32] array_move1, array_move2
         unsigned int len1, len2, i
@@ -1005,7 +1696,7 @@ cdef inline void _merge_sort(unsigned int count, unsigned long long[64] next_mov
         _merge(len1, len2, array_move1, array_p1, array_move2, array_p2, next_moves_list, possibilities)
 
 
-cdef inline void _merge(unsigned int len1, unsigned int len2, unsigned long long[32] array_move1, signed int[32] array_p1, unsigned long long[32] array_move2, signed int[32] array_p2, unsigned long long[64] next_moves_list, signed int[64] possibilities):
+cdef inline void _merge(unsigned int len1, unsigned int len2, unsigned long long[32] array_move1, signed int[32] array_p1, unsigned long long[32] array_move2, signed int[32] array_p2, unsigned long long[64] next_moves_list, signed int[64] possibilities) noexcept nogil:
     cdef:
         unsigned int i = 0, j = 0
     while i < len1 or j < len2:
@@ -1019,75 +1710,74 @@ cdef inline void _merge(unsigned int len1, unsigned int len2, unsigned long long
             j += 1
 
 
-cdef inline signed int _set_t_table():
-    global t_table, corner, c, a1, a2, b1, b2, b3, wx, o1, o2
+cdef inline signed int _set_t_table(SearchContext ctx):
     cdef:
         unsigned int row, col, bit8, mask
         signed int value
-    t_table[0][0] = corner
-    t_table[0][1] = c
-    t_table[0][2] = a2
-    t_table[0][3] = b3
-    t_table[0][4] = b3
-    t_table[0][5] = a2
-    t_table[0][6] = c
-    t_table[0][7] = corner
-    t_table[1][0] = c
-    t_table[1][1] = wx
-    t_table[1][2] = o1
-    t_table[1][3] = o2
-    t_table[1][4] = o2
-    t_table[1][5] = o1
-    t_table[1][6] = wx
-    t_table[1][7] = c
-    t_table[2][0] = a2
-    t_table[2][1] = o1
-    t_table[2][2] = a1
-    t_table[2][3] = b2
-    t_table[2][4] = b2
-    t_table[2][5] = a1
-    t_table[2][6] = o1
-    t_table[2][7] = a2
-    t_table[3][0] = b3
-    t_table[3][1] = o2
-    t_table[3][2] = b2
-    t_table[3][3] = b1
-    t_table[3][4] = b1
-    t_table[3][5] = b2
-    t_table[3][6] = o2
-    t_table[3][7] = b3
-    t_table[4][0] = b3
-    t_table[4][1] = o2
-    t_table[4][2] = b2
-    t_table[4][3] = b1
-    t_table[4][4] = b1
-    t_table[4][5] = b2
-    t_table[4][6] = o2
-    t_table[4][7] = b3
-    t_table[5][0] = a2
-    t_table[5][1] = o1
-    t_table[5][2] = a1
-    t_table[5][3] = b2
-    t_table[5][4] = b2
-    t_table[5][5] = a1
-    t_table[5][6] = o1
-    t_table[5][7] = a2
-    t_table[6][0] = c
-    t_table[6][1] = wx
-    t_table[6][2] = o1
-    t_table[6][3] = o2
-    t_table[6][4] = o2
-    t_table[6][5] = o1
-    t_table[6][6] = wx
-    t_table[6][7] = c
-    t_table[7][0] = corner
-    t_table[7][1] = c
-    t_table[7][2] = a2
-    t_table[7][3] = b3
-    t_table[7][4] = b3
-    t_table[7][5] = a2
-    t_table[7][6] = c
-    t_table[7][7] = corner
+    ctx.t_table[0][0] = ctx.corner
+    ctx.t_table[0][1] = ctx.c
+    ctx.t_table[0][2] = ctx.a2
+    ctx.t_table[0][3] = ctx.b3
+    ctx.t_table[0][4] = ctx.b3
+    ctx.t_table[0][5] = ctx.a2
+    ctx.t_table[0][6] = ctx.c
+    ctx.t_table[0][7] = ctx.corner
+    ctx.t_table[1][0] = ctx.c
+    ctx.t_table[1][1] = ctx.wx
+    ctx.t_table[1][2] = ctx.o1
+    ctx.t_table[1][3] = ctx.o2
+    ctx.t_table[1][4] = ctx.o2
+    ctx.t_table[1][5] = ctx.o1
+    ctx.t_table[1][6] = ctx.wx
+    ctx.t_table[1][7] = ctx.c
+    ctx.t_table[2][0] = ctx.a2
+    ctx.t_table[2][1] = ctx.o1
+    ctx.t_table[2][2] = ctx.a1
+    ctx.t_table[2][3] = ctx.b2
+    ctx.t_table[2][4] = ctx.b2
+    ctx.t_table[2][5] = ctx.a1
+    ctx.t_table[2][6] = ctx.o1
+    ctx.t_table[2][7] = ctx.a2
+    ctx.t_table[3][0] = ctx.b3
+    ctx.t_table[3][1] = ctx.o2
+    ctx.t_table[3][2] = ctx.b2
+    ctx.t_table[3][3] = ctx.b1
+    ctx.t_table[3][4] = ctx.b1
+    ctx.t_table[3][5] = ctx.b2
+    ctx.t_table[3][6] = ctx.o2
+    ctx.t_table[3][7] = ctx.b3
+    ctx.t_table[4][0] = ctx.b3
+    ctx.t_table[4][1] = ctx.o2
+    ctx.t_table[4][2] = ctx.b2
+    ctx.t_table[4][3] = ctx.b1
+    ctx.t_table[4][4] = ctx.b1
+    ctx.t_table[4][5] = ctx.b2
+    ctx.t_table[4][6] = ctx.o2
+    ctx.t_table[4][7] = ctx.b3
+    ctx.t_table[5][0] = ctx.a2
+    ctx.t_table[5][1] = ctx.o1
+    ctx.t_table[5][2] = ctx.a1
+    ctx.t_table[5][3] = ctx.b2
+    ctx.t_table[5][4] = ctx.b2
+    ctx.t_table[5][5] = ctx.a1
+    ctx.t_table[5][6] = ctx.o1
+    ctx.t_table[5][7] = ctx.a2
+    ctx.t_table[6][0] = ctx.c
+    ctx.t_table[6][1] = ctx.wx
+    ctx.t_table[6][2] = ctx.o1
+    ctx.t_table[6][3] = ctx.o2
+    ctx.t_table[6][4] = ctx.o2
+    ctx.t_table[6][5] = ctx.o1
+    ctx.t_table[6][6] = ctx.wx
+    ctx.t_table[6][7] = ctx.c
+    ctx.t_table[7][0] = ctx.corner
+    ctx.t_table[7][1] = ctx.c
+    ctx.t_table[7][2] = ctx.a2
+    ctx.t_table[7][3] = ctx.b3
+    ctx.t_table[7][4] = ctx.b3
+    ctx.t_table[7][5] = ctx.a2
+    ctx.t_table[7][6] = ctx.c
+    ctx.t_table[7][7] = ctx.corner
     # 事前計算
     for row in range(8):
         for bit8 in range(256):
@@ -1095,39 +1785,36 @@ cdef inline signed int _set_t_table():
             mask = <unsigned int>1 << 7
             for col in range(8):
                 if mask & bit8:
-                    value += t_table[row][col]
+                    value += ctx.t_table[row][col]
                 mask >>= 1
-            table_values[row][bit8] = value
+            ctx.table_values[row][bit8] = value
 
 
-cdef inline signed int _get_t():
+cdef inline signed int _get_t(SearchContext ctx) noexcept nogil:
     """テーブルによる評価値"""
-    global bb, wb, table_values
     cdef:
         unsigned long long mask = 0x00000000000000FF, tb, tw
         unsigned int row, shift
         signed int score = 0
     for row in range(8):
         shift = (7 - row) * 8
-        tb = (bb >> shift) & mask
-        tw = (wb >> shift) & mask
-        score += table_values[row][tb] - table_values[row][tw]
+        tb = (ctx.bb >> shift) & mask
+        tw = (ctx.wb >> shift) & mask
+        score += ctx.table_values[row][tb] - ctx.table_values[row][tw]
     return score
 
 
-cdef inline signed int _get_p(signed int pos_b, signed int pos_w):
+cdef inline signed int _get_p(SearchContext ctx, signed int pos_b, signed int pos_w) noexcept nogil:
     """着手可能数による評価値"""
-    global wp
-    return (pos_b - pos_w) * wp
+    return (pos_b - pos_w) * ctx.wp
 
 
-cdef inline signed int _get_e():
+cdef inline signed int _get_e(SearchContext ctx) noexcept nogil:
     """辺の確定石による評価値"""
-    global bb, wb, we
     cdef:
         unsigned long long all_bitboard, bit_pos, lt, rt, lb, rb, b_t, w_t, b_b, w_b, b_l, w_l, b_r, w_r
         signed int score = 0
-    all_bitboard = bb | wb
+    all_bitboard = ctx.bb | ctx.wb
     bit_pos = <unsigned long long>0x8000000000000000
     lt = <unsigned long long>0x8000000000000000
     rt = <unsigned long long>0x0100000000000000
@@ -1138,97 +1825,96 @@ cdef inline signed int _get_e():
         # 上辺
         b_t, w_t = 0, 0
         if (lt | rt) & all_bitboard:
-            b_t = (<unsigned long long>0xFF00000000000000 & bb) >> 56
-            w_t = (<unsigned long long>0xFF00000000000000 & wb) >> 56
+            b_t = (<unsigned long long>0xFF00000000000000 & ctx.bb) >> 56
+            w_t = (<unsigned long long>0xFF00000000000000 & ctx.wb) >> 56
         # 下辺
-        b_b = <unsigned long long>0x00000000000000FF & bb
-        w_b = <unsigned long long>0x00000000000000FF & wb
+        b_b = <unsigned long long>0x00000000000000FF & ctx.bb
+        w_b = <unsigned long long>0x00000000000000FF & ctx.wb
         # 左辺
         b_l, w_l = 0, 0
-        if (lt | lb) & bb:
-            if bb & <unsigned long long>0x8000000000000000:
+        if (lt | lb) & ctx.bb:
+            if ctx.bb & <unsigned long long>0x8000000000000000:
                 b_l += <unsigned long long>0x0000000000000080
-            if bb & <unsigned long long>0x0080000000000000:
+            if ctx.bb & <unsigned long long>0x0080000000000000:
                 b_l += <unsigned long long>0x0000000000000040
-            if bb & <unsigned long long>0x0000800000000000:
+            if ctx.bb & <unsigned long long>0x0000800000000000:
                 b_l += <unsigned long long>0x0000000000000020
-            if bb & <unsigned long long>0x0000008000000000:
+            if ctx.bb & <unsigned long long>0x0000008000000000:
                 b_l += <unsigned long long>0x0000000000000010
-            if bb & <unsigned long long>0x0000000080000000:
+            if ctx.bb & <unsigned long long>0x0000000080000000:
                 b_l += <unsigned long long>0x0000000000000008
-            if bb & <unsigned long long>0x0000000000800000:
+            if ctx.bb & <unsigned long long>0x0000000000800000:
                 b_l += <unsigned long long>0x0000000000000004
-            if bb & <unsigned long long>0x0000000000008000:
+            if ctx.bb & <unsigned long long>0x0000000000008000:
                 b_l += <unsigned long long>0x0000000000000002
-            if bb & <unsigned long long>0x0000000000000080:
+            if ctx.bb & <unsigned long long>0x0000000000000080:
                 b_l += <unsigned long long>0x0000000000000001
-        if (lt | lb) & wb:
-            if wb & <unsigned long long>0x8000000000000000:
+        if (lt | lb) & ctx.wb:
+            if ctx.wb & <unsigned long long>0x8000000000000000:
                 w_l += <unsigned long long>0x0000000000000080
-            if wb & <unsigned long long>0x0080000000000000:
+            if ctx.wb & <unsigned long long>0x0080000000000000:
                 w_l += <unsigned long long>0x0000000000000040
-            if wb & <unsigned long long>0x0000800000000000:
+            if ctx.wb & <unsigned long long>0x0000800000000000:
                 w_l += <unsigned long long>0x0000000000000020
-            if wb & <unsigned long long>0x0000008000000000:
+            if ctx.wb & <unsigned long long>0x0000008000000000:
                 w_l += <unsigned long long>0x0000000000000010
-            if wb & <unsigned long long>0x0000000080000000:
+            if ctx.wb & <unsigned long long>0x0000000080000000:
                 w_l += <unsigned long long>0x0000000000000008
-            if wb & <unsigned long long>0x0000000000800000:
+            if ctx.wb & <unsigned long long>0x0000000000800000:
                 w_l += <unsigned long long>0x0000000000000004
-            if wb & <unsigned long long>0x0000000000008000:
+            if ctx.wb & <unsigned long long>0x0000000000008000:
                 w_l += <unsigned long long>0x0000000000000002
-            if wb & <unsigned long long>0x0000000000000080:
+            if ctx.wb & <unsigned long long>0x0000000000000080:
                 w_l += <unsigned long long>0x0000000000000001
         # 右辺
         b_r, w_r = 0, 0
-        if (rt | rb) & bb:
-            if bb & <unsigned long long>0x0100000000000000:
+        if (rt | rb) & ctx.bb:
+            if ctx.bb & <unsigned long long>0x0100000000000000:
                 b_r += <unsigned long long>0x0000000000000080
-            if bb & <unsigned long long>0x0001000000000000:
+            if ctx.bb & <unsigned long long>0x0001000000000000:
                 b_r += <unsigned long long>0x0000000000000040
-            if bb & <unsigned long long>0x0000010000000000:
+            if ctx.bb & <unsigned long long>0x0000010000000000:
                 b_r += <unsigned long long>0x0000000000000020
-            if bb & <unsigned long long>0x0000000100000000:
+            if ctx.bb & <unsigned long long>0x0000000100000000:
                 b_r += <unsigned long long>0x0000000000000010
-            if bb & <unsigned long long>0x0000000001000000:
+            if ctx.bb & <unsigned long long>0x0000000001000000:
                 b_r += <unsigned long long>0x0000000000000008
-            if bb & <unsigned long long>0x0000000000010000:
+            if ctx.bb & <unsigned long long>0x0000000000010000:
                 b_r += <unsigned long long>0x0000000000000004
-            if bb & <unsigned long long>0x0000000000000100:
+            if ctx.bb & <unsigned long long>0x0000000000000100:
                 b_r += <unsigned long long>0x0000000000000002
-            if bb & <unsigned long long>0x0000000000000001:
+            if ctx.bb & <unsigned long long>0x0000000000000001:
                 b_r += <unsigned long long>0x0000000000000001
-        if (rt | rb) & wb:
-            if wb & <unsigned long long>0x0100000000000000:
+        if (rt | rb) & ctx.wb:
+            if ctx.wb & <unsigned long long>0x0100000000000000:
                 w_r += <unsigned long long>0x0000000000000080
-            if wb & <unsigned long long>0x0001000000000000:
+            if ctx.wb & <unsigned long long>0x0001000000000000:
                 w_r += <unsigned long long>0x0000000000000040
-            if wb & <unsigned long long>0x0000010000000000:
+            if ctx.wb & <unsigned long long>0x0000010000000000:
                 w_r += <unsigned long long>0x0000000000000020
-            if wb & <unsigned long long>0x0000000100000000:
+            if ctx.wb & <unsigned long long>0x0000000100000000:
                 w_r += <unsigned long long>0x0000000000000010
-            if wb & <unsigned long long>0x0000000001000000:
+            if ctx.wb & <unsigned long long>0x0000000001000000:
                 w_r += <unsigned long long>0x0000000000000008
-            if wb & <unsigned long long>0x0000000000010000:
+            if ctx.wb & <unsigned long long>0x0000000000010000:
                 w_r += <unsigned long long>0x0000000000000004
-            if wb & <unsigned long long>0x0000000000000100:
+            if ctx.wb & <unsigned long long>0x0000000000000100:
                 w_r += <unsigned long long>0x0000000000000002
-            if wb & <unsigned long long>0x0000000000000001:
+            if ctx.wb & <unsigned long long>0x0000000000000001:
                 w_r += <unsigned long long>0x0000000000000001
-        score = ((edge_table8[b_t] - edge_table8[w_t]) + (edge_table8[b_b] - edge_table8[w_b]) + (edge_table8[b_l] - edge_table8[w_l]) + (edge_table8[b_r] - edge_table8[w_r])) * we
+        score = ((edge_table8[b_t] - edge_table8[w_t]) + (edge_table8[b_b] - edge_table8[w_b]) + (edge_table8[b_l] - edge_table8[w_l]) + (edge_table8[b_r] - edge_table8[w_r])) * ctx.we
     return score
 
 
-cdef inline signed int _get_b():
+cdef inline signed int _get_b(SearchContext ctx) noexcept nogil:
     """空きマスのパターンによる評価値"""
-    global bb, wb, wb1, wb2, wb3
     cdef:
         unsigned long long[8] blanks
         unsigned long long blackwhite, blank, horizontal, vertical, diagonal, l_blank, r_blank, t_blank, b_blank, lt_blank, rt_blank, lb_blank, rb_blank, lt_x, rt_x, lb_x, rb_x, lt_r, lt_b, rt_l, rt_b, lb_t, lb_r, rb_t, rb_l, bits
         unsigned int i
         signed int score = 0, lt_r_sign = 1, lt_b_sign = 1, rt_l_sign = 1, rt_b_sign = 1, lb_t_sign = 1, lb_r_sign = 1, rb_t_sign = 1, rb_l_sign = 1
-    black = bb
-    white = wb
+    black = ctx.bb
+    white = ctx.wb
     blackwhite = black | white
     horizontal = blackwhite & <unsigned long long>0x7E7E7E7E7E7E7E7E  # 左右チェック用マスク
     vertical = blackwhite & <unsigned long long>0x00FFFFFFFFFFFF00    # 上下チェック用マスク
@@ -1282,32 +1968,32 @@ cdef inline signed int _get_b():
             bits = bits + (bits >> <unsigned int>16)
             score -= <signed int>(bits + (bits >> <unsigned int>32)) & <unsigned long long>0x000000000000007F
             # -- _popcount -- }}}
-    score *= wb1
+    score *= ctx.wb1
     # wb2の計算
     lt_x = lt_blank & <unsigned long long>0x0040000000000000  # 左上のX打ち
     if lt_x:
         if lt_x & black:
-            score += wb2
+            score += ctx.wb2
         else:
-            score -= wb2
+            score -= ctx.wb2
     rt_x = rt_blank & <unsigned long long>0x0002000000000000  # 右上のX打ち
     if rt_x:
         if rt_x & black:
-            score += wb2
+            score += ctx.wb2
         else:
-            score -= wb2
+            score -= ctx.wb2
     lb_x = lb_blank & <unsigned long long>0x0000000000004000  # 左下のX打ち
     if lb_x:
         if lb_x & black:
-            score += wb2
+            score += ctx.wb2
         else:
-            score -= wb2
+            score -= ctx.wb2
     rb_x = rb_blank & <unsigned long long>0x0000000000000200  # 右下のX打ち
     if rb_x:
         if rb_x & black:
-            score += wb2
+            score += ctx.wb2
         else:
-            score -= wb2
+            score -= ctx.wb2
     # wb3の計算
     lt_r = l_blank & <unsigned long long>0x4000000000000000
     lt_b = t_blank & <unsigned long long>0x0080000000000000
@@ -1336,31 +2022,264 @@ cdef inline signed int _get_b():
     for i in range(1, 5):
         lt_r >>= 1
         if lt_r & blank:
-            score += wb3 * lt_r_sign
+            score += ctx.wb3 * lt_r_sign
         lt_b >>= 8
         if lt_b & blank:
-            score += wb3 * lt_b_sign
+            score += ctx.wb3 * lt_b_sign
         rt_l <<= 1
         if rt_l & blank:
-            score += wb3 * rt_l_sign
+            score += ctx.wb3 * rt_l_sign
         rt_b >>= 8
         if rt_b & blank:
-            score += wb3 * rt_b_sign
+            score += ctx.wb3 * rt_b_sign
         lb_t <<= 8
         if lb_t & blank:
-            score += wb3 * lb_t_sign
+            score += ctx.wb3 * lb_t_sign
         lb_r >>= 1
         if lb_r & blank:
-            score += wb3 * lb_r_sign
+            score += ctx.wb3 * lb_r_sign
         rb_t <<= 8
         if rb_t & blank:
-            score += wb3 * rb_t_sign
+            score += ctx.wb3 * rb_t_sign
         rb_l <<= 1
         if rb_l & blank:
-            score += wb3 * rb_l_sign
+            score += ctx.wb3 * rb_l_sign
     return score
 
 
+# -------------------------------------------------- #
+# Zobrist Hash Methods
+# ビット位置ごとの乱数(BitBoardMethods.GetHashと同じ値を使う)
+cdef unsigned long long _zobrist_black[MULTI_MAX_WORDS * 64]
+cdef unsigned long long _zobrist_white[MULTI_MAX_WORDS * 64]
+for _i in range(len(ZOBRIST_BLACK)):
+    _zobrist_black[_i] = ZOBRIST_BLACK[_i]
+    _zobrist_white[_i] = ZOBRIST_WHITE[_i]
+
+
+cdef inline unsigned long long _get_hash_word(unsigned long long bits, unsigned long long* table) noexcept nogil:
+    cdef:
+        unsigned long long ret = 0
+        unsigned int index
+    while bits:
+        index = reversi_bit_length64(bits) - 1
+        ret ^= table[index]
+        bits ^= <unsigned long long>1 << index
+    return ret
+
+
+cdef inline unsigned long long _get_hash_64bit(unsigned long long b, unsigned long long w) noexcept nogil:
+    return _get_hash_word(b, _zobrist_black) ^ _get_hash_word(w, _zobrist_white)
+
+
+# -------------------------------------------------- #
+# Transposition Table Methods
+cdef unsigned long long _zobrist_side = ZOBRIST_SIDE
+
+
+cdef inline int _set_tt(SearchContext ctx, tt, unsigned int min_depth=0) except -1:
+    cdef:
+        unsigned long long[::1] keys, stats
+        double[::1] values
+        signed short[::1] depths, moves
+        unsigned char[::1] bounds
+        unsigned short[::1] ages
+    # 探索中は置換表の配列を直接参照する(探索が終わるまで置換表を保持する)
+    ctx.tt_owner = tt
+    if tt is None:
+        ctx.tv.keys = NULL
+        return 0
+    keys, values, depths, bounds, moves, ages, stats = tt.keys, tt.values, tt.depths, tt.bounds, tt.moves, tt.ages, tt.stats
+    ctx.tv.keys = &keys[0]
+    ctx.tv.values = &values[0]
+    ctx.tv.depths = &depths[0]
+    ctx.tv.bounds = &bounds[0]
+    ctx.tv.moves = &moves[0]
+    ctx.tv.ages = &ages[0]
+    ctx.tv.stats = &stats[0]
+    ctx.tv.mask = <unsigned long long>tt.size - 1
+    ctx.tv.min_depth = max(<unsigned int>tt.min_depth, min_depth)
+    ctx.tv.age = tt.age
+    return 0
+
+
+cdef inline int _set_orderer(SearchContext ctx, orderer) except -1:
+    cdef:
+        signed short[::1] killers
+        unsigned long long[::1] histories
+    # 探索中はOrderer_KHの配列を直接参照する(探索が終わるまで保持する)
+    ctx.orderer_owner = orderer
+    if orderer is None:
+        ctx.ov.enabled = <unsigned int>0
+        return 0
+    killers, histories = orderer.killers, orderer.histories
+    ctx.ov.killers = &killers[0]
+    ctx.ov.histories = &histories[0]
+    ctx.ov.killer = <unsigned int>1 if orderer.killer else <unsigned int>0
+    ctx.ov.history = <unsigned int>1 if orderer.history else <unsigned int>0
+    ctx.ov.enabled = <unsigned int>1
+    return 0
+
+
+cdef inline int _set_probcut(SearchContext ctx, probcut, board) except -1:
+    cdef:
+        unsigned int stage, depth, i
+    # 探索中はProbCutのパラメータを配列で引く
+    if probcut is None:
+        ctx.pc.enabled = <unsigned int>0
+        return 0
+    ctx.pc.enabled = <unsigned int>1
+    ctx.pc.stages = probcut.stages
+    ctx.pc.squares = board.size * board.size - bin(board.get_bitboard_info()[2]).count('1')
+    for stage in range(PROBCUT_MAX_STAGES):
+        for depth in range(PROBCUT_MAX_DEPTH+1):
+            checks = probcut.get_checks(stage, depth)
+            ctx.pc.count[stage][depth] = len(checks)
+            for i, (shallow, a, b, margin) in enumerate(checks):
+                ctx.pc.shallow[stage][depth][i] = shallow
+                ctx.pc.a[stage][depth][i] = a
+                ctx.pc.b[stage][depth][i] = b
+                ctx.pc.margin[stage][depth][i] = margin
+    return 0
+
+
+cdef inline unsigned long long _order_priority(OrderView* ov, unsigned int int_color, unsigned int depth, signed int pos) noexcept nogil:
+    # 手(ビット位置)の優先度(キラー手 > 履歴の大きい手)
+    cdef:
+        unsigned long long priority = 0
+        unsigned int i
+    if ov.history:
+        priority = ov.histories[int_color * ORDERER_MAX_SQUARES + pos]
+    if ov.killer and depth < ORDERER_MAX_DEPTH:
+        for i in range(ORDERER_KILLERS):
+            if ov.killers[depth * ORDERER_KILLERS + i] == pos:
+                priority |= <unsigned long long>ORDERER_KILLER_PRIORITY >> i
+                break
+    return priority
+
+
+cdef inline void _order_update(OrderView* ov, unsigned int int_color, unsigned int depth, signed int pos) noexcept nogil:
+    # beta cutを起こした手(ビット位置)を覚える
+    cdef:
+        unsigned int i, index = depth * ORDERER_KILLERS
+    if ov.killer and depth < ORDERER_MAX_DEPTH and ov.killers[index] != pos:
+        for i in range(ORDERER_KILLERS - 1, 0, -1):
+            ov.killers[index + i] = ov.killers[index + i - 1]
+        ov.killers[index] = <signed short>pos
+    if ov.history:
+        ov.histories[int_color * ORDERER_MAX_SQUARES + pos] += depth * depth
+
+
+cdef inline unsigned long long _order_pop(OrderView* ov, unsigned int int_color, unsigned int depth, unsigned long long bits) noexcept nogil:
+    # 優先度の最も高い手を返す(同じ優先度は右のビットから)
+    cdef:
+        unsigned long long move, best = 0, priority, best_priority = 0
+    while bits:
+        move = bits & (~bits+1)
+        priority = _order_priority(ov, int_color, depth, <signed int>reversi_bit_length64(move) - 1)
+        if not best or priority > best_priority:
+            best = move
+            best_priority = priority
+        bits ^= move
+    return best
+
+
+cdef inline void _order_move_killers(OrderView* ov, unsigned int depth, unsigned int count, unsigned long long* next_moves_list) noexcept nogil:
+    # キラー手を先頭に移す(他の手の順序は保つ)
+    cdef:
+        unsigned int i
+        signed int pos
+    if not ov.killer or depth >= ORDERER_MAX_DEPTH:
+        return
+    for i in range(ORDERER_KILLERS - 1, -1, -1):
+        pos = ov.killers[depth * ORDERER_KILLERS + i]
+        if pos >= 0:
+            _move_to_front(count, next_moves_list, <unsigned long long>1 << pos)
+
+
+cdef inline unsigned int _probcut_window(ProbCutView* pc, unsigned int discs, unsigned int depth, unsigned int i, double alpha, double beta, unsigned int* shallow, double* lower, double* upper) noexcept nogil:
+    # i番目の浅い探索の深さと、深い探索の結果が窓の外と予測できる浅い探索の評価値の境界を求める(ない場合は0を返す)
+    cdef:
+        unsigned int stage
+    if not pc.enabled or depth > PROBCUT_MAX_DEPTH:
+        return 0
+    stage = discs * pc.stages // (pc.squares + 1)
+    if i >= pc.count[stage][depth]:
+        return 0
+    shallow[0] = pc.shallow[stage][depth][i]
+    lower[0] = (alpha - pc.margin[stage][depth][i] - pc.b[stage][depth][i]) / pc.a[stage][depth][i]
+    upper[0] = (beta + pc.margin[stage][depth][i] - pc.b[stage][depth][i]) / pc.a[stage][depth][i]
+    return 1
+
+
+cdef inline unsigned long long _tt_key_64bit(unsigned long long b, unsigned long long w, unsigned int int_color) noexcept nogil:
+    # 白番の場合は手番の乱数を加える(TranspositionTable.get_keyと同じ値)
+    if int_color:
+        return _get_hash_64bit(b, w)
+    return _get_hash_64bit(b, w) ^ _zobrist_side
+
+
+cdef inline unsigned long long _tt_entry_check(double value, signed short depth, unsigned char bound, signed short move) noexcept nogil:
+    # エントリの内容から検査用の値を作る(get_entry_checkと同じ値)
+    return (<unsigned long long*>&value)[0] ^ <unsigned long long>(<unsigned short>depth) << 48 ^ <unsigned long long>bound << 40 ^ <unsigned long long>(<unsigned short>move) << 16
+
+
+cdef inline unsigned int _ttv_probe(TTView* tv, unsigned long long key, unsigned int depth, double* alpha, double* beta, double* value, signed int* move) noexcept nogil:
+    # 探索を省略できる場合は1を返す(省略できない場合はalpha/betaを格納済みの範囲で狭める)
+    # 他のプロセスが書き込み中のエントリはキーが一致しないため、読み出した内容のみを使う
+    cdef:
+        unsigned long long index = key & tv.mask
+        unsigned char bound = tv.bounds[index]
+        signed short entry_depth, entry_move
+        double v
+    tv.stats[TT_PROBES] += 1
+    move[0] = -1
+    if not bound:
+        return 0
+    v, entry_depth, entry_move = tv.values[index], tv.depths[index], tv.moves[index]
+    if tv.keys[index] ^ _tt_entry_check(v, entry_depth, bound, entry_move) != key:
+        return 0
+    tv.stats[TT_HITS] += 1
+    move[0] = entry_move
+    if <unsigned int>entry_depth < depth:
+        return 0
+    if bound == TT_EXACT or (bound == TT_LOWER and v >= beta[0]) or (bound == TT_UPPER and v <= alpha[0]):
+        tv.stats[TT_CUTOFFS] += 1
+        value[0] = v
+        return 1
+    if bound == TT_LOWER:
+        if v > alpha[0]:
+            alpha[0] = v
+    elif v < beta[0]:
+        beta[0] = v
+    return 0
+
+
+cdef inline void _ttv_store(TTView* tv, unsigned long long key, unsigned int depth, double value, double alpha, double beta, signed int move) noexcept nogil:
+    # 同じ世代のより深い結果は残す
+    cdef:
+        unsigned long long index = key & tv.mask
+        unsigned char bound = tv.bounds[index]
+        signed short entry_move = tv.moves[index]
+    if bound and tv.ages[index] == tv.age and <unsigned int>tv.depths[index] > depth:
+        return
+    if move < 0 and bound and tv.keys[index] ^ _tt_entry_check(tv.values[index], tv.depths[index], bound, entry_move) == key:
+        move = entry_move
+    if value <= alpha:
+        bound = TT_UPPER
+    elif value >= beta:
+        bound = TT_LOWER
+    else:
+        bound = TT_EXACT
+    tv.values[index] = value
+    tv.depths[index] = <signed short>depth
+    tv.bounds[index] = bound
+    tv.moves[index] = <signed short>move
+    tv.ages[index] = tv.age
+    tv.keys[index] = key ^ _tt_entry_check(value, <signed short>depth, bound, <signed short>move)  # キーは最後に書き込む
+    tv.stats[TT_STORES] += 1
+
+
 # -------------------------------------------------- #
 # Search Common Methods
 cdef inline measure(pid):
@@ -1379,19 +2298,33 @@ cdef inline signed int timer(pid):
 
 
 cdef inline unsigned long long _put_disc_board_size8_64bit(board, unsigned int color, unsigned int x, unsigned int y):
+    return _put_disc_board_64bit(board, NULL, color, x, y)
+
+
+cdef inline unsigned long long _put_disc_board_64bit(board, SizedGeometry* g, unsigned int color, unsigned int x, unsigned int y):
     cdef:
-        unsigned long long put, black_bitboard, white_bitboard, flippable_discs_num, flippable_discs_count
-        unsigned int black_score, white_score
         signed int shift_size
     # 配置位置を整数に変換
-    shift_size = (63-(y*8+x))
-    put = <unsigned long long>1 << shift_size
+    if g == NULL:
+        shift_size = (63-(y*8+x))
+    else:
+        shift_size = (g.nbits-1-(y*g.size+x))
+    return _put_disc_board_bits_64bit(board, g, color, <unsigned long long>1 << shift_size)
+
+
+cdef inline unsigned long long _put_disc_board_bits_64bit(board, SizedGeometry* g, unsigned int color, unsigned long long put):
+    cdef:
+        unsigned long long black_bitboard, white_bitboard, flippable_discs_num, flippable_discs_count, hash_diff
+        unsigned int black_score, white_score
     # ひっくり返せる石を取得
     black_bitboard = board._black_bitboard
     white_bitboard = board._white_bitboard
     black_score = board._black_score
     white_score = board._white_score
-    flippable_discs_num = _get_flippable_discs_num(color, black_bitboard, white_bitboard, put)
+    if g == NULL:
+        flippable_discs_num = _get_flippable_discs_num(color, black_bitboard, white_bitboard, put)
+    else:
+        flippable_discs_num = _sized_get_flippable_discs_num(g, color, black_bitboard, white_bitboard, put)
     flippable_discs_count = _popcount(flippable_discs_num)
     # 打つ前の状態を格納
     board.prev += [(black_bitboard, white_bitboard, black_score, white_score)]
@@ -1401,21 +2334,35 @@ cdef inline unsigned long long _put_disc_board_size8_64bit(board, unsigned int c
         white_bitboard ^= flippable_discs_num
         black_score += <unsigned int>1 + <unsigned int>flippable_discs_count
         white_score -= <unsigned int>flippable_discs_count
+        hash_diff = _get_hash_64bit(put | flippable_discs_num, flippable_discs_num)
     else:
         white_bitboard ^= put | flippable_discs_num
         black_bitboard ^= flippable_discs_num
         black_score -= <unsigned int>flippable_discs_count
         white_score += <unsigned int>1 + <unsigned int>flippable_discs_count
+        hash_diff = _get_hash_64bit(flippable_discs_num, put | flippable_discs_num)
     board._black_bitboard = black_bitboard
     board._white_bitboard = white_bitboard
     board._black_score = black_score
     board._white_score = white_score
     board._flippable_discs_num = flippable_discs_num
+    _add_hash_board(board, hash_diff)
     return flippable_discs_num
 
 
+cdef inline void _add_hash_board(board, unsigned long long hash_diff):
+    # ボードのハッシュに差分を反映する(CythonBitBoardは型付きの属性を直接更新)
+    if type(board) is CythonBitBoard:
+        (<CythonBitBoard>board)._hash ^= hash_diff
+    else:
+        board._hash ^= hash_diff
+
+
 cdef inline _undo_board(board):
+    cdef:
+        unsigned long long black_bitboard = board._black_bitboard, white_bitboard = board._white_bitboard
     (board._black_bitboard, board._white_bitboard, board._black_score, board._white_score) = board.prev.pop()
+    _add_hash_board(board, _get_hash_64bit(black_bitboard ^ <unsigned long long>board._black_bitboard, white_bitboard ^ <unsigned long long>board._white_bitboard))
 
 
 # -------------------------------------------------- #
@@ -1443,27 +2390,54 @@ cdef _alphabeta_get_score(alphabeta, color, board, alpha, beta, unsigned int dep
     next_color = 'white' if color == 'black' else 'black'
     if not legal_moves_bits:
         return -_alphabeta_get_score(alphabeta, next_color, board, -beta, -alpha, depth, pid, m, t)
-    # 評価値を算出
+    # 置換表を参照
     cdef:
-        unsigned int skip
+        signed int best = -1
+    tt, key = alphabeta.tt, None
+    if tt is not None and depth >= <unsigned int>tt.min_depth:
+        key, alpha_ini, beta_ini = tt.get_key(board, color), alpha, beta
+        score, alpha, beta, best = tt.lookup(key, depth, alpha, beta)
+        if score is not None:
+            return score
+    # 浅い探索の結果から深い探索の結果を予測して枝刈り(Multi-ProbCut)
+    if alphabeta.probcut is not None:
+        for shallow, lower, upper in alphabeta.probcut.get_windows(board, depth, alpha, beta):
+            if upper is not None and _alphabeta_get_score(alphabeta, color, board, upper - 1, upper, shallow, pid, m, t) >= upper:
+                return beta
+            if lower is not None and _alphabeta_get_score(alphabeta, color, board, lower, lower + 1, shallow, pid, m, t) <= lower:
+                return alpha
+            if Timer.is_timeout(pid):
+                return alpha
+    # 置換表の手がない場合は浅い探索で最善手を求める(多重反復深化)
+    if alphabeta.iid and depth >= max(<unsigned int>alphabeta.iid, IID_REDUCTION + 1) and not (best >= 0 and legal_moves_bits >> best & 1):
+        alphabeta._node_best = -1
+        _alphabeta_get_score(alphabeta, color, board, alpha, beta, depth - IID_REDUCTION, pid, m, t)
+        if Timer.is_timeout(pid):
+            return alpha
+        best = alphabeta._node_best
+    # 評価値を算出(置換表の最善手、キラー手や履歴の大きい手を先に調べる)
     size = board.size
-    mask = 1 << ((size**2)-1)
-    for y in range(size):
-        skip = <unsigned int>0
-        for x in range(size):
-            if legal_moves_bits & mask:
-                board.put_disc(color, x, y)
-                score = -_alphabeta_get_score(alphabeta, next_color, board, -beta, -alpha, depth-1, pid, m, t)
-                board.undo()
-                if Timer.is_timeout(pid):
-                    return alpha
-                alpha = max(alpha, score)  # 最大値を選択
-                if alpha >= beta:  # 枝刈り
-                    skip = <unsigned int>1
-                    break
-            mask >>= 1
-        if skip:
-            break
+    orderer = alphabeta.orderer
+    next_moves = get_ordered_moves(legal_moves_bits, size, best)
+    if orderer is not None:
+        next_moves = orderer.sort_moves(color, depth, next_moves, size, best)
+    for x, y in next_moves:
+        board.put_disc(color, x, y)
+        score = -_alphabeta_get_score(alphabeta, next_color, board, -beta, -alpha, depth-1, pid, m, t)
+        board.undo()
+        if Timer.is_timeout(pid):
+            return alpha
+        if score > alpha:  # 最大値を選択
+            alpha = score
+            best = size * size - 1 - (y * size + x)
+        if alpha >= beta:  # 枝刈り
+            if orderer is not None:
+                orderer.update(color, depth, best)  # beta cutを起こした手を覚える
+            break
+    # 置換表に格納
+    if key is not None:
+        tt.store(key, depth, alpha, alpha_ini, beta_ini, best)
+    alphabeta._node_best = best
     return alpha
 
 
@@ -1520,60 +2494,61 @@ cdef double _alphabeta_get_score_size8_64bit(alphabeta, color, board, double alp
     return alpha
 
 
-cdef inline tuple _alphabeta_next_move(str color, board, signed int param_min, signed int param_max, int depth, evaluator, str pid, int timer, int measure):
-    global timer_deadline, timer_timeout, timer_timeout_value, measure_count, legal_moves_bit_list, legal_moves_x, legal_moves_y
+cdef inline tuple _alphabeta_next_move(SearchContext ctx, str color, board, signed int param_min, signed int param_max, int depth, evaluator, str pid, int timer, int measure):
     cdef:
         double alpha = param_min, beta = param_max
-        unsigned long long b, w, h, legal_moves, mask = 0x8000000000000000
-        unsigned int int_color = 0, x, y, index = 0
-    measure_count = 0
-    timer_timeout = <unsigned int>0
+        unsigned long long legal_moves, mask
+        unsigned int int_color = 0, x, y, index = 0, size
+    ctx.measure_count = 0
+    ctx.timer_timeout = <unsigned int>0
     if timer and pid:
-        timer_deadline = Timer.deadline[pid]
-        timer_timeout_value = Timer.timeout_value[pid]
+        ctx.timer_deadline = Timer.deadline[pid]
+        ctx.timer_timeout_value = Timer.timeout_value[pid]
     if measure and pid:
         if pid not in Measure.count:
             Measure.count[pid] = 0
-        measure_count = Measure.count[pid]
+        ctx.measure_count = Measure.count[pid]
     if color == 'black':
         int_color = <unsigned int>1
-    b, w, h = board.get_bitboard_info()
-    legal_moves = _get_legal_moves_bits(int_color, b, w, h)
-    for y in range(8):
-        for x in range(8):
+    size = _set_geometry(ctx, board.size)
+    ctx.bb, ctx.wb, ctx.hb = board.get_bitboard_info()
+    legal_moves = _ctx_get_legal_moves_bits(ctx, int_color, ctx.bb, ctx.wb)
+    mask = <unsigned long long>1 << (size * size - 1)
+    for y in range(size):
+        for x in range(size):
             if legal_moves & mask:
-                legal_moves_bit_list[index] = mask
-                legal_moves_x[index] = x
-                legal_moves_y[index] = y
+                ctx.legal_moves_bit_list[index] = mask
+                ctx.legal_moves_x[index] = x
+                ctx.legal_moves_y[index] = y
                 index += 1
             mask >>= 1
-    best_move, _ = _alphabeta_get_best_move(int_color, board, index, legal_moves_bit_list, legal_moves_x, legal_moves_y, alpha, beta, depth, evaluator, timer)
+    best_move, _ = _alphabeta_get_best_move(ctx, int_color, board, index, ctx.legal_moves_bit_list, ctx.legal_moves_x, ctx.legal_moves_y, alpha, beta, depth, evaluator, timer)
     if measure and pid:
-        Measure.count[pid] = measure_count
-    if timer and pid and timer_timeout:
+        Measure.count[pid] = ctx.measure_count
+    if timer and pid and ctx.timer_timeout:
         Timer.timeout_flag[pid] = True  # タイムアウト発生
     return best_move
 
 
-cdef inline _alphabeta_get_best_move_wrap(str color, board, moves, double alpha, double beta, int depth, evaluator, str pid, int timer, int measure):
-    global timer_deadline, timer_timeout, timer_timeout_value, measure_count
+cdef inline _alphabeta_get_best_move_wrap(SearchContext ctx, str color, board, moves, double alpha, double beta, int depth, evaluator, str pid, int timer, int measure):
     cdef:
         unsigned long long[64] moves_bit_list
         unsigned long long put
         unsigned int[64] moves_x, moves_y
-        unsigned int x, y, index = 0, int_color = 0
+        unsigned int x, y, index = 0, int_color = 0, size
         signed int lshift
-    measure_count = 0
-    timer_timeout = <unsigned int>0
+    ctx.measure_count = 0
+    ctx.timer_timeout = <unsigned int>0
     if timer and pid:
-        timer_deadline = Timer.deadline[pid]
-        timer_timeout_value = Timer.timeout_value[pid]
+        ctx.timer_deadline = Timer.deadline[pid]
+        ctx.timer_timeout_value = Timer.timeout_value[pid]
     if measure and pid:
         if pid not in Measure.count:
             Measure.count[pid] = 0
-        measure_count = Measure.count[pid]
+        ctx.measure_count = Measure.count[pid]
+    size = _set_geometry(ctx, board.size)
     for x, y in moves:
-        lshift = (63-(y*8+x))
+        lshift = (size*size-1-(y*size+x))
         put = <unsigned long long>1 << lshift
         moves_bit_list[index] = put
         moves_x[index] = x
@@ -1581,16 +2556,15 @@ cdef inline _alphabeta_get_best_move_wrap(str color, board, moves, double alpha,
         index += 1
     if color == 'black':
         int_color = <unsigned int>1
-    best_move, scores = _alphabeta_get_best_move(int_color, board, index, moves_bit_list, moves_x, moves_y, alpha, beta, depth, evaluator, timer)
+    best_move, scores = _alphabeta_get_best_move(ctx, int_color, board, index, moves_bit_list, moves_x, moves_y, alpha, beta, depth, evaluator, timer)
     if measure and pid:
-        Measure.count[pid] = measure_count
-    if timer and pid and timer_timeout:
+        Measure.count[pid] = ctx.measure_count
+    if timer and pid and ctx.timer_timeout:
         Timer.timeout_flag[pid] = True  # タイムアウト発生
     return (best_move, scores)
 
 
-cdef inline _alphabeta_get_best_move(unsigned int int_color, board, unsigned int index, unsigned long long[64] moves_bit_list, unsigned int[64] moves_x, unsigned int[64] moves_y, double alpha, double beta, int depth, evaluator, int timer):
-    global timer_timeout, bb, wb, hb, bs, ws
+cdef inline _alphabeta_get_best_move(SearchContext ctx, unsigned int int_color, board, unsigned int index, unsigned long long[64] moves_bit_list, unsigned int[64] moves_x, unsigned int[64] moves_y, double alpha, double beta, int depth, evaluator, int timer):
     cdef:
         double score = alpha
         unsigned int int_color_next = 1, i, best = 64
@@ -1599,53 +2573,56 @@ cdef inline _alphabeta_get_best_move(unsigned int int_color, board, unsigned int
     if int_color:
         int_color_next = <unsigned int>0
     # ボード情報取得
-    bb, wb, hb = board.get_bitboard_info()
-    bs = board._black_score
-    ws = board._white_score
+    ctx.bb, ctx.wb, ctx.hb = board.get_bitboard_info()
+    ctx.bs = board._black_score
+    ctx.ws = board._white_score
     # ボード情報退避
-    board_bb = bb
-    board_wb = wb
-    board_bs = bs
-    board_ws = ws
+    board_bb = ctx.bb
+    board_wb = ctx.wb
+    board_bs = ctx.bs
+    board_ws = ctx.ws
     board_prev = [(item[0], item[1], item[2], item[3]) for item in board.prev]
     # 各手のスコア取得
     for i in range(index):
-        _put_disc(int_color, moves_bit_list[i])
-        score = -_alphabeta_get_score_evaluator(int_color_next, board, -beta, -alpha, depth-1, evaluator, timer, <unsigned int>0)
-        _undo()
+        _put_disc(ctx, int_color, moves_bit_list[i])
+        score = -_alphabeta_get_score_evaluator(ctx, int_color_next, board, -beta, -alpha, depth-1, evaluator, timer, <unsigned int>0)
+        _undo(ctx)
         scores[(moves_x[i], moves_y[i])] = score
-        if timer_timeout:  # タイムアウト判定
+        if ctx.timer_timeout:  # タイムアウト判定
             if best == 64:
                 best = i
             break
         if score > alpha:  # 最善手を更新
             alpha = score
             best = i
+        if alpha >= beta:  # 探索窓の上限を超えた
+            break
     # ボードを元に戻す
     board._black_bitboard = board_bb
     board._white_bitboard = board_wb
     board._black_score = board_bs
     board._white_score = board_ws
     board.prev = [(item[0], item[1], item[2], item[3]) for item in board_prev]
+    if best == 64:  # 探索窓の下限を超える手がなかった
+        return None, scores
     return (moves_x[best], moves_y[best]), scores
 
 
-cdef inline double _alphabeta_get_score_evaluator(unsigned int int_color, board, double alpha, double beta, unsigned int depth, evaluator, int t, unsigned int pas):
-    global timer_timeout, measure_count, bb, wb, hb, bs, ws, pbb, pwb, pbs, pws, fd, tail
+cdef inline double _alphabeta_get_score_evaluator(SearchContext ctx, unsigned int int_color, board, double alpha, double beta, unsigned int depth, evaluator, int t, unsigned int pas):
     cdef:
-        double score
-        unsigned long long legal_moves_b_bits, legal_moves_w_bits, legal_moves_bits, move
-        unsigned int i, is_game_end = 0, int_color_next = 1, x, y
-        signed int timeout, sign = -1
+        double score, lower, upper, alpha_ini = alpha, beta_ini = beta
+        unsigned long long legal_moves_b_bits, legal_moves_w_bits, legal_moves_bits, move, key = 0, first = 0
+        unsigned int i, is_game_end = 0, int_color_next = 1, x, y, use_tt = 0, shallow
+        signed int timeout, sign = -1, best = -1
     # タイムアウト判定
     if t:
-        timeout = check_timeout()
+        timeout = check_timeout(ctx)
         if timeout:
             return timeout
     # 探索ノード数カウント
-    measure_count += 1
+    ctx.measure_count += 1
     # 合法手を取得
-    legal_moves_bits = _get_legal_moves_bits(int_color, bb, wb, hb)
+    legal_moves_bits = _ctx_get_legal_moves_bits(ctx, int_color, ctx.bb, ctx.wb)
     # 前回パス and 打てる場所なし の場合ゲーム終了
     if pas and not legal_moves_bits:
         is_game_end = <unsigned int>1
@@ -1653,41 +2630,80 @@ cdef inline double _alphabeta_get_score_evaluator(unsigned int int_color, board,
     if not depth or is_game_end:
         if int_color:
             legal_moves_b_bits = legal_moves_bits
-            legal_moves_w_bits = _get_legal_moves_bits(<unsigned int>0, bb, wb, hb)
+            legal_moves_w_bits = _ctx_get_legal_moves_bits(ctx, <unsigned int>0, ctx.bb, ctx.wb)
             sign = <signed int>1
             str_color = 'black'
         else:
-            legal_moves_b_bits = _get_legal_moves_bits(<unsigned int>1, bb, wb, hb)
+            legal_moves_b_bits = _ctx_get_legal_moves_bits(ctx, <unsigned int>1, ctx.bb, ctx.wb)
             legal_moves_w_bits = legal_moves_bits
             str_color = 'white'
-        board._black_bitboard = bb
-        board._white_bitboard = wb
-        board._black_score = bs
-        board._white_score = ws
-        board._flippable_discs_num = fd
+        board._black_bitboard = ctx.bb
+        board._white_bitboard = ctx.wb
+        board._black_score = ctx.bs
+        board._white_score = ctx.ws
+        board._flippable_discs_num = ctx.fd
         board.prev = []
-        for i in range(tail):
-            board.prev += [(pbb[i], pwb[i], pbs[i], pws[i])]
+        for i in range(ctx.tail):
+            board.prev += [(ctx.pbb[i], ctx.pwb[i], ctx.pbs[i], ctx.pws[i])]
         return evaluator.evaluate(str_color, board, _popcount(legal_moves_b_bits), _popcount(legal_moves_w_bits)) * sign
     # 次の手番
     if int_color:
         int_color_next = <unsigned int>0
     # パスの場合
     if not legal_moves_bits:
-        return -_alphabeta_get_score_evaluator(int_color_next, board, -beta, -alpha, depth, evaluator, t, <unsigned int>1)
-    # 評価値を算出
+        return -_alphabeta_get_score_evaluator(ctx, int_color_next, board, -beta, -alpha, depth, evaluator, t, <unsigned int>1)
+    # 置換表を参照
+    if ctx.tv.keys != NULL and depth >= ctx.tv.min_depth:
+        use_tt = <unsigned int>1
+        key = _tt_key_64bit(ctx.bb, ctx.wb, int_color)
+        if _ttv_probe(&ctx.tv, key, depth, &alpha, &beta, &score, &best):
+            return score
+        if best >= 0:
+            first = legal_moves_bits & (<unsigned long long>1 << best)
+    # 浅い探索の結果から深い探索の結果を予測して枝刈り(Multi-ProbCut)
+    i = 0
+    while _probcut_window(&ctx.pc, ctx.bs + ctx.ws, depth, i, alpha, beta, &shallow, &lower, &upper):
+        if beta < POSITIVE_INFINITY and _alphabeta_get_score_evaluator(ctx, int_color, board, upper - 1, upper, shallow, evaluator, t, <unsigned int>0) >= upper:
+            return beta
+        if alpha > NEGATIVE_INFINITY and _alphabeta_get_score_evaluator(ctx, int_color, board, lower, lower + 1, shallow, evaluator, t, <unsigned int>0) <= lower:
+            return alpha
+        if ctx.timer_timeout:
+            return alpha
+        i += 1
+    # 置換表の手がない場合は浅い探索で最善手を求める(多重反復深化)
+    if not first and ctx.iid_depth and depth >= ctx.iid_depth:
+        ctx.node_best = -1
+        _alphabeta_get_score_evaluator(ctx, int_color, board, alpha, beta, depth - IID_REDUCTION, evaluator, t, <unsigned int>0)
+        if ctx.timer_timeout:
+            return alpha
+        if ctx.node_best >= 0:
+            first = legal_moves_bits & (<unsigned long long>1 << ctx.node_best)
+    # 評価値を算出(置換表の最善手、キラー手や履歴の大きい手を先に調べる)
     while (legal_moves_bits):
-        move = legal_moves_bits & (~legal_moves_bits+1)  # 一番右のONしているビットのみ取り出す
-        _put_disc(int_color, move)
-        score = -_alphabeta_get_score_evaluator(int_color_next, board, -beta, -alpha, depth-1, evaluator, t, <unsigned int>0)
-        _undo()
-        legal_moves_bits ^= move  # 一番右のONしているビットをOFFする
+        if first:
+            move = first
+            first = 0
+        elif ctx.ov.enabled:
+            move = _order_pop(&ctx.ov, int_color, depth, legal_moves_bits)
+        else:
+            move = legal_moves_bits & (~legal_moves_bits+1)  # 一番右のONしているビットのみ取り出す
+        _put_disc(ctx, int_color, move)
+        score = -_alphabeta_get_score_evaluator(ctx, int_color_next, board, -beta, -alpha, depth-1, evaluator, t, <unsigned int>0)
+        _undo(ctx)
+        legal_moves_bits ^= move  # 調べた手をOFFする
         if score > alpha:
             alpha = score
-        if timer_timeout:
+            best = <signed int>reversi_bit_length64(move) - 1
+        if ctx.timer_timeout:
             return alpha
         if alpha >= beta:  # 枝刈り
-            return alpha
+            if ctx.ov.enabled:
+                _order_update(&ctx.ov, int_color, depth, best)  # beta cutを起こした手を覚える
+            break
+    # 置換表に格納
+    if use_tt:
+        _ttv_store(&ctx.tv, key, depth, alpha, alpha_ini, beta_ini, best)
+    ctx.node_best = best
     return alpha
 
 
@@ -1708,6 +2724,24 @@ cdef _negascout_get_score(func, negascout, color, board, alpha, beta, unsigned i
     next_color = 'white' if color == 'black' else 'black'
     if not legal_moves_bits:
         return -func(func, negascout, next_color, board, -beta, -alpha, depth, pid=pid)
+    # 置換表を参照
+    cdef:
+        signed int best = -1
+    tt, key = negascout.tt, None
+    if tt is not None and depth >= <unsigned int>tt.min_depth:
+        key, alpha_ini, beta_ini = tt.get_key(board, color), alpha, beta
+        score, alpha, beta, best = tt.lookup(key, depth, alpha, beta)
+        if score is not None:
+            return score
+    # 浅い探索の結果から深い探索の結果を予測して枝刈り(Multi-ProbCut)
+    if negascout.probcut is not None:
+        for shallow, lower, upper in negascout.probcut.get_windows(board, depth, alpha, beta):
+            if upper is not None and func(func, negascout, color, board, upper - 1, upper, shallow, pid) >= upper:
+                return beta
+            if lower is not None and func(func, negascout, color, board, lower, lower + 1, shallow, pid) <= lower:
+                return alpha
+            if Timer.is_timeout(pid):
+                return alpha
     # 着手可能数に応じて手を並び替え
     tmp = []
     size = board.size
@@ -1722,6 +2756,23 @@ cdef _negascout_get_score(func, negascout, color, board, alpha, beta, unsigned i
                 board.undo()
             mask >>= 1
     next_moves = [i[0] for i in sorted(tmp, reverse=True, key=lambda x:x[1])]
+    # キラー手を先に調べる(着手可能数の順の方が良いため履歴は使わない)
+    orderer = negascout.orderer
+    if orderer is not None:
+        next_moves = orderer.move_killers(depth, next_moves, size)
+    # 置換表の手がない場合は浅い探索で最善手を求める(多重反復深化)
+    if negascout.iid and depth >= max(<unsigned int>negascout.iid, IID_REDUCTION + 1) and not (best >= 0 and legal_moves_bits >> best & 1):
+        negascout._node_best = -1
+        func(func, negascout, color, board, alpha, beta, depth - IID_REDUCTION, pid)
+        if Timer.is_timeout(pid):
+            return alpha
+        best = negascout._node_best
+    # 置換表の最善手を先に調べる
+    nbits = size * size
+    if best >= 0 and legal_moves_bits >> best & 1:
+        first = ((nbits - 1 - best) % size, (nbits - 1 - best) // size)
+        next_moves.remove(first)
+        next_moves.insert(0, first)
     # NegaScout法
     cdef:
         unsigned int index = 0
@@ -1740,10 +2791,17 @@ cdef _negascout_get_score(func, negascout, color, board, alpha, beta, unsigned i
                         return alpha
                 else:
                     alpha = tmp
+                best = nbits - 1 - (move[1] * size + move[0])
             null_window = alpha + 1
+            if alpha >= beta and orderer is not None and not Timer.is_timeout(pid):
+                orderer.update(color, depth, best)  # beta cutを起こした手を覚える
         else:
             break
         index += <unsigned int>1
+    # 置換表に格納
+    if key is not None and not Timer.is_timeout(pid):
+        tt.store(key, depth, alpha, alpha_ini, beta_ini, best)
+    negascout._node_best = best
     return alpha
 
 
@@ -1916,87 +2974,88 @@ cdef inline _negascout_merge(unsigned int len1, unsigned int len2, unsigned int
             j += 1
 
 
-cdef inline tuple _negascout_next_move(str color, board, signed int param_min, signed int param_max, int depth, evaluator, str pid, int timer, int measure):
-    global timer_deadline, timer_timeout, timer_timeout_value, measure_count
+cdef inline tuple _negascout_next_move(SearchContext ctx, str color, board, signed int param_min, signed int param_max, int depth, evaluator, str pid, int timer, int measure):
     cdef:
         double alpha = param_min, beta = param_max
         unsigned int int_color = 0
-    measure_count = 0
-    timer_timeout = <unsigned int>0
+    ctx.measure_count = 0
+    ctx.timer_timeout = <unsigned int>0
     if timer and pid:
-        timer_deadline = Timer.deadline[pid]
-        timer_timeout_value = Timer.timeout_value[pid]
+        ctx.timer_deadline = Timer.deadline[pid]
+        ctx.timer_timeout_value = Timer.timeout_value[pid]
     if measure and pid:
         if pid not in Measure.count:
             Measure.count[pid] = 0
-        measure_count = Measure.count[pid]
+        ctx.measure_count = Measure.count[pid]
     if color == 'black':
         int_color = <unsigned int>1
+    _set_geometry(ctx, board.size)
     moves = board.get_legal_moves(color)  # 手の候補
-    best_move, _ = _negascout_get_best_move(int_color, board, moves, alpha, beta, depth, evaluator, timer)
+    best_move, _ = _negascout_get_best_move(ctx, int_color, board, moves, alpha, beta, depth, evaluator, timer)
     if measure and pid:
-        Measure.count[pid] = measure_count
-    if timer and pid and timer_timeout:
+        Measure.count[pid] = ctx.measure_count
+    if timer and pid and ctx.timer_timeout:
         Timer.timeout_flag[pid] = True  # タイムアウト発生
     return best_move
 
 
-cdef inline _negascout_get_best_move_wrap(str color, board, moves, double alpha, double beta, int depth, evaluator, str pid, int timer, int measure):
-    global timer_deadline, timer_timeout, timer_timeout_value, measure_count
+cdef inline _negascout_get_best_move_wrap(SearchContext ctx, str color, board, moves, double alpha, double beta, int depth, evaluator, str pid, int timer, int measure):
     cdef:
         unsigned int int_color = 0
-    measure_count = 0
-    timer_timeout = <unsigned int>0
+    ctx.measure_count = 0
+    ctx.timer_timeout = <unsigned int>0
     if timer and pid:
-        timer_deadline = Timer.deadline[pid]
-        timer_timeout_value = Timer.timeout_value[pid]
+        ctx.timer_deadline = Timer.deadline[pid]
+        ctx.timer_timeout_value = Timer.timeout_value[pid]
     if measure and pid:
         if pid not in Measure.count:
             Measure.count[pid] = 0
-        measure_count = Measure.count[pid]
+        ctx.measure_count = Measure.count[pid]
     if color == 'black':
         int_color = <unsigned int>1
-    best_move, scores = _negascout_get_best_move(int_color, board, moves, alpha, beta, depth, evaluator, timer)
+    _set_geometry(ctx, board.size)
+    best_move, scores = _negascout_get_best_move(ctx, int_color, board, moves, alpha, beta, depth, evaluator, timer)
     if measure and pid:
-        Measure.count[pid] = measure_count
-    if timer and pid and timer_timeout:
+        Measure.count[pid] = ctx.measure_count
+    if timer and pid and ctx.timer_timeout:
         Timer.timeout_flag[pid] = True  # タイムアウト発生
     return (best_move, scores)
 
 
-cdef inline _negascout_get_best_move(unsigned int int_color, board, moves, double alpha, double beta, int depth, evaluator, int timer):
-    global timer_timeout, bb, wb, hb, bs, ws
+cdef inline _negascout_get_best_move(SearchContext ctx, unsigned int int_color, board, moves, double alpha, double beta, int depth, evaluator, int timer):
     cdef:
         double score = alpha
         unsigned long long board_bb, board_wb
-        unsigned int int_color_next = 1, board_bs, board_ws
+        unsigned int int_color_next = 1, board_bs, board_ws, size = board.size
     scores = {}
     # 手番
     if int_color:
         int_color_next = <unsigned int>0
     # ボード情報取得
-    bb, wb, hb = board.get_bitboard_info()
-    bs = board._black_score
-    ws = board._white_score
+    ctx.bb, ctx.wb, ctx.hb = board.get_bitboard_info()
+    ctx.bs = board._black_score
+    ctx.ws = board._white_score
     # ボード情報退避
-    board_bb = bb
-    board_wb = wb
-    board_bs = bs
-    board_ws = ws
+    board_bb = ctx.bb
+    board_wb = ctx.wb
+    board_bs = ctx.bs
+    board_ws = ctx.ws
     board_prev = [(item[0], item[1], item[2], item[3]) for item in board.prev]
     # 各手のスコア取得
     best_move = None
     for move in moves:
-        _put_disc(int_color, <unsigned long long>1 << (63-(move[1]*8+move[0])))
-        score = -_negascout_get_score_board(int_color_next, board, -beta, -alpha, depth-1, evaluator, timer, <unsigned int>0)
-        _undo()
+        _put_disc(ctx, int_color, <unsigned long long>1 << (size*size-1-(move[1]*size+move[0])))
+        score = -_negascout_get_score_board(ctx, int_color_next, board, -beta, -alpha, depth-1, evaluator, timer, <unsigned int>0)
+        _undo(ctx)
         scores[move] = score
-        if timer_timeout:  # タイムアウト判定
+        if ctx.timer_timeout:  # タイムアウト判定
             best_move = move if best_move is None else best_move
             break
         if score > alpha:  # 最善手を更新
             alpha = score
             best_move = move
+        if alpha >= beta:  # 探索窓の上限を超えた
+            break
     # ボードを元に戻す
     board._black_bitboard = board_bb
     board._white_bitboard = board_wb
@@ -2006,24 +3065,23 @@ cdef inline _negascout_get_best_move(unsigned int int_color, board, moves, doubl
     return best_move, scores
 
 
-cdef inline double _negascout_get_score_board(unsigned int int_color, board, double alpha, double beta, unsigned int depth, evaluator, int t, unsigned int pas):
-    global timer_timeout, measure_count, bb, wb, hb, bs, ws, pbb, pwb, pbs, pws, fd, tail
+cdef inline double _negascout_get_score_board(SearchContext ctx, unsigned int int_color, board, double alpha, double beta, unsigned int depth, evaluator, int t, unsigned int pas):
     cdef:
-        double score, tmp, null_window
+        double score, tmp, null_window, lower, upper, alpha_ini = alpha, beta_ini = beta
         unsigned long long[64] next_moves_list
-        unsigned long long legal_moves_b_bits, legal_moves_w_bits, legal_moves_bits, move
-        unsigned int i, is_game_end = 0, int_color_next = 1, count = 0, index = 0
+        unsigned long long legal_moves_b_bits, legal_moves_w_bits, legal_moves_bits, move, key = 0
+        unsigned int i, is_game_end = 0, int_color_next = 1, count = 0, index = 0, use_tt = 0, shallow
         signed int[64] possibilities
-        signed int timeout, sign = -1
+        signed int timeout, sign = -1, best = -1
     # タイムアウト判定
     if t:
-        timeout = check_timeout()
+        timeout = check_timeout(ctx)
         if timeout:
             return timeout
     # 探索ノード数カウント
-    measure_count += 1
+    ctx.measure_count += 1
     # 合法手を取得
-    legal_moves_bits = _get_legal_moves_bits(int_color, bb, wb, hb)
+    legal_moves_bits = _ctx_get_legal_moves_bits(ctx, int_color, ctx.bb, ctx.wb)
     # 前回パス and 打てる場所なし の場合ゲーム終了
     if pas and not legal_moves_bits:
         is_game_end = <unsigned int>1
@@ -2031,21 +3089,21 @@ cdef inline double _negascout_get_score_board(unsigned int int_color, board, dou
     if not depth or is_game_end:
         if int_color:
             legal_moves_b_bits = legal_moves_bits
-            legal_moves_w_bits = _get_legal_moves_bits(<unsigned int>0, bb, wb, hb)
+            legal_moves_w_bits = _ctx_get_legal_moves_bits(ctx, <unsigned int>0, ctx.bb, ctx.wb)
             sign = <signed int>1
             str_color = 'black'
         else:
-            legal_moves_b_bits = _get_legal_moves_bits(<unsigned int>1, bb, wb, hb)
+            legal_moves_b_bits = _ctx_get_legal_moves_bits(ctx, <unsigned int>1, ctx.bb, ctx.wb)
             legal_moves_w_bits = legal_moves_bits
             str_color = 'white'
-        board._black_bitboard = bb
-        board._white_bitboard = wb
-        board._black_score = bs
-        board._white_score = ws
-        board._flippable_discs_num = fd
+        board._black_bitboard = ctx.bb
+        board._white_bitboard = ctx.wb
+        board._black_score = ctx.bs
+        board._white_score = ctx.ws
+        board._flippable_discs_num = ctx.fd
         board.prev = []
-        for i in range(tail):
-            board.prev += [(pbb[i], pwb[i], pbs[i], pws[i])]
+        for i in range(ctx.tail):
+            board.prev += [(ctx.pbb[i], ctx.pwb[i], ctx.pbs[i], ctx.pws[i])]
         return evaluator.evaluate(str_color, board, _popcount(legal_moves_b_bits), _popcount(legal_moves_w_bits)) * sign
     # 次の手番
     if int_color:
@@ -2053,45 +3111,93 @@ cdef inline double _negascout_get_score_board(unsigned int int_color, board, dou
         int_color_next = <unsigned int>0
     # パスの場合
     if not legal_moves_bits:
-        return -_negascout_get_score_board(int_color_next, board, -beta, -alpha, depth, evaluator, t, <unsigned int>1)
+        return -_negascout_get_score_board(ctx, int_color_next, board, -beta, -alpha, depth, evaluator, t, <unsigned int>1)
+    # 置換表を参照
+    if ctx.tv.keys != NULL and depth >= ctx.tv.min_depth:
+        use_tt = <unsigned int>1
+        key = _tt_key_64bit(ctx.bb, ctx.wb, int_color)
+        if _ttv_probe(&ctx.tv, key, depth, &alpha, &beta, &score, &best):
+            return score
+    # 浅い探索の結果から深い探索の結果を予測して枝刈り(Multi-ProbCut)
+    i = 0
+    while _probcut_window(&ctx.pc, ctx.bs + ctx.ws, depth, i, alpha, beta, &shallow, &lower, &upper):
+        if beta < POSITIVE_INFINITY and _negascout_get_score_board(ctx, int_color, board, upper - 1, upper, shallow, evaluator, t, <unsigned int>0) >= upper:
+            return beta
+        if alpha > NEGATIVE_INFINITY and _negascout_get_score_board(ctx, int_color, board, lower, lower + 1, shallow, evaluator, t, <unsigned int>0) <= lower:
+            return alpha
+        if ctx.timer_timeout:
+            return alpha
+        i += 1
     # 着手可能数に応じて手を並び替え
     while (legal_moves_bits):
         move = legal_moves_bits & (~legal_moves_bits+1)  # 一番右のONしているビットのみ取り出す
         next_moves_list[count] = move
-        possibilities[count] = _negascout_get_possibility(int_color, bb, wb, move, sign)
+        possibilities[count] = _negascout_get_possibility(ctx, int_color, ctx.bb, ctx.wb, move, sign)
         count += 1
         legal_moves_bits ^= move  # 一番右のONしているビットをOFFする
     _sort_moves_by_possibility(count, next_moves_list, possibilities)
+    # キラー手を先に調べる(着手可能数の順の方が良いため履歴は使わない)
+    if ctx.ov.enabled:
+        _order_move_killers(&ctx.ov, depth, count, next_moves_list)
+    # 置換表の手がない場合は浅い探索で最善手を求める(多重反復深化)
+    if best < 0 and ctx.iid_depth and depth >= ctx.iid_depth:
+        ctx.node_best = -1
+        _negascout_get_score_board(ctx, int_color, board, alpha, beta, depth - IID_REDUCTION, evaluator, t, <unsigned int>0)
+        if ctx.timer_timeout:
+            return alpha
+        best = ctx.node_best
+    # 置換表の最善手を先に調べる
+    if best >= 0:
+        _move_to_front(count, next_moves_list, <unsigned long long>1 << best)
     # 次の手の探索
     null_window = beta
     for i in range(count):
         if alpha < beta:
-            _put_disc(int_color, next_moves_list[i])
-            tmp = -_negascout_get_score_board(int_color_next, board, -null_window, -alpha, depth-1, evaluator, t, <unsigned int>0)
-            _undo()
+            _put_disc(ctx, int_color, next_moves_list[i])
+            tmp = -_negascout_get_score_board(ctx, int_color_next, board, -null_window, -alpha, depth-1, evaluator, t, <unsigned int>0)
+            _undo(ctx)
             if alpha < tmp:
                 if tmp <= null_window and index:
-                    _put_disc(int_color, next_moves_list[i])
-                    alpha = -_negascout_get_score_board(int_color_next, board, -beta, -tmp, depth-1, evaluator, t, <unsigned int>0)
-                    _undo()
-                    if timer_timeout:
+                    _put_disc(ctx, int_color, next_moves_list[i])
+                    alpha = -_negascout_get_score_board(ctx, int_color_next, board, -beta, -tmp, depth-1, evaluator, t, <unsigned int>0)
+                    _undo(ctx)
+                    if ctx.timer_timeout:
                         return alpha
                 else:
                     alpha = tmp
+                best = <signed int>reversi_bit_length64(next_moves_list[i]) - 1
             null_window = alpha + 1
+            if alpha >= beta and ctx.ov.enabled and not ctx.timer_timeout:
+                _order_update(&ctx.ov, int_color, depth, best)  # beta cutを起こした手を覚える
         else:
-            return alpha
+            break
         index += <unsigned int>1
+    # 置換表に格納
+    if use_tt and not ctx.timer_timeout:
+        _ttv_store(&ctx.tv, key, depth, alpha, alpha_ini, beta_ini, best)
+    ctx.node_best = best
     return alpha
 
 
-cdef inline signed int _negascout_get_possibility(unsigned int int_color, unsigned long long b, unsigned long long w, unsigned long long move, signed int sign):
-    global hb
+cdef inline void _move_to_front(unsigned int count, unsigned long long* next_moves_list, unsigned long long move) noexcept nogil:
+    # 指定の手を先頭に移す(他の手の順序は保つ)
+    cdef:
+        unsigned int i
+    for i in range(count):
+        if next_moves_list[i] == move:
+            while i:
+                next_moves_list[i] = next_moves_list[i-1]
+                i -= 1
+            next_moves_list[0] = move
+            return
+
+
+cdef inline signed int _negascout_get_possibility(SearchContext ctx, unsigned int int_color, unsigned long long b, unsigned long long w, unsigned long long move, signed int sign):
     cdef:
         unsigned long long flippable_discs_num
         signed int pb, pw
     # ひっくり返せる石を取得
-    flippable_discs_num = _get_flippable_discs_num(int_color, b, w, move)
+    flippable_discs_num = _ctx_get_flippable_discs_num(ctx, int_color, b, w, move)
     # 自分の石を置いて相手の石をひっくり返す
     if int_color:
         b ^= move | flippable_discs_num
@@ -2099,8 +3205,8 @@ cdef inline signed int _negascout_get_possibility(unsigned int int_color, unsign
     else:
         w ^= move | flippable_discs_num
         b ^= flippable_discs_num
-    pb = <signed int>_popcount(_get_legal_moves_bits(<unsigned int>1, b, w, hb))
-    pw = <signed int>_popcount(_get_legal_moves_bits(<unsigned int>0, b, w, hb))
+    pb = <signed int>_popcount(_ctx_get_legal_moves_bits(ctx, <unsigned int>1, b, w))
+    pw = <signed int>_popcount(_ctx_get_legal_moves_bits(ctx, <unsigned int>0, b, w))
     return (pb - pw) * sign
 
 
@@ -2138,77 +3244,110 @@ cdef inline signed int _table_get_score(table, board):
 
 # -------------------------------------------------- #
 # MonteCarlo Methods
-cdef inline tuple _montecarlo_next_move(str color, board, unsigned int count, str pid, int timer, int measure):
-    global timer_deadline, timer_timeout, timer_timeout_value, measure_count, legal_moves_bit_list, montecarlo_scores, bb, wb, hb, bs, ws
+cdef inline tuple _montecarlo_next_move(SearchContext ctx, str color, board, unsigned int count, str pid, int timer, int measure, unsigned int workers, unsigned long seed):
     cdef:
-        unsigned long long b, w, h, legal_moves, mask = 0x8000000000000000
-        unsigned int tbs, tws, int_color = 0, i, x, y, index = 0
+        unsigned long long legal_moves, mask
+        unsigned int int_color = 0, i, x, y, index = 0, n, size
         signed int max_score
-    measure_count = 0
-    timer_timeout = <unsigned int>0
+        SearchContext worker
+    ctx.measure_count = 0
+    ctx.timer_timeout = <unsigned int>0
+    ctx.is_timer_enabled = timer
     if timer and pid:
-        timer_deadline = Timer.deadline[pid]
-        timer_timeout_value = Timer.timeout_value[pid]
+        ctx.timer_deadline = Timer.deadline[pid]
+        ctx.timer_timeout_value = Timer.timeout_value[pid]
     if measure and pid:
         if pid not in Measure.count:
             Measure.count[pid] = 0
-        measure_count = Measure.count[pid]
+        ctx.measure_count = Measure.count[pid]
     if color == 'black':
         int_color = <unsigned int>1
-    b, w, h = board.get_bitboard_info()
-    tbs = board._black_score
-    tws = board._white_score
-    legal_moves = _get_legal_moves_bits(int_color, b, w, h)
-    for y in range(8):
-        for x in range(8):
+    size = _set_geometry(ctx, board.size)
+    ctx.bb, ctx.wb, ctx.hb = board.get_bitboard_info()
+    ctx.bs = board._black_score
+    ctx.ws = board._white_score
+    legal_moves = _ctx_get_legal_moves_bits(ctx, int_color, ctx.bb, ctx.wb)
+    mask = <unsigned long long>1 << (size * size - 1)
+    for y in range(size):
+        for x in range(size):
             if legal_moves & mask:
-                legal_moves_bit_list[index] = mask
-                legal_moves_x[index] = x
-                legal_moves_y[index] = y
-                montecarlo_scores[index] = 0
+                ctx.legal_moves_bit_list[index] = mask
+                ctx.legal_moves_x[index] = x
+                ctx.legal_moves_y[index] = y
+                ctx.montecarlo_scores[index] = 0
+                # seed(手ごとに乱数列を分け、並列でも逐次と同じ結果にする)
+                init_rand(ctx, seed + index)
+                ctx.mc_tx[index], ctx.mc_ty[index], ctx.mc_tz[index], ctx.mc_tw[index] = ctx.tx, ctx.ty, ctx.tz, ctx.tw
                 index += 1
             mask >>= 1
-    # seed
-    init_rand(<unsigned long>time.time())
-    for j in range(count):
+    if workers > 1 and index > 1:
+        # 手をスレッドプールのワーカーに振り分ける
+        n = min(workers, index)
+        workers_ctx = [ctx.copy() for _ in range(n)]
+        with ThreadPoolExecutor(max_workers=n) as executor:
+            list(executor.map(_montecarlo_worker, workers_ctx, [int_color] * n, range(n), [n] * n, [index] * n, [count] * n))
         for i in range(index):
-            # ボード情報取得
-            bb, wb, hb = b, w, h
-            bs = tbs
-            ws = tws
-            montecarlo_scores[i] += _playout(int_color, legal_moves_bit_list[i])
-            # 探索ノード数カウント
-            measure_count += 1
-        if timer and check_timeout():
-            break
-    max_score = montecarlo_scores[0]
-    best_move = (legal_moves_x[0], legal_moves_y[0])
+            worker = workers_ctx[i % n]
+            ctx.montecarlo_scores[i] = worker.montecarlo_scores[i]
+        for worker in workers_ctx:
+            ctx.measure_count += worker.measure_count
+            if worker.timer_timeout:
+                ctx.timer_timeout = <unsigned int>1
+    else:
+        with nogil:
+            _montecarlo_playouts(ctx, int_color, 0, 1, index, count)
+    max_score = ctx.montecarlo_scores[0]
+    best_move = (ctx.legal_moves_x[0], ctx.legal_moves_y[0])
     for i in range(index):
-        if montecarlo_scores[i] > max_score:
-            max_score = montecarlo_scores[i]
-            best_move = (legal_moves_x[i], legal_moves_y[i])
+        if ctx.montecarlo_scores[i] > max_score:
+            max_score = ctx.montecarlo_scores[i]
+            best_move = (ctx.legal_moves_x[i], ctx.legal_moves_y[i])
     if measure and pid:
-        Measure.count[pid] = measure_count
-    if timer and pid and timer_timeout:
+        Measure.count[pid] = ctx.measure_count
+    if timer and pid and ctx.timer_timeout:
         Timer.timeout_flag[pid] = True  # タイムアウト発生
     return best_move
 
 
-cdef inline signed int _playout(unsigned int int_color, unsigned long long move_bit):
-    global bb, wb, hb, bs, ws
+def _montecarlo_worker(SearchContext ctx, unsigned int int_color, unsigned int start, unsigned int step, unsigned int index, unsigned int count):
+    with nogil:
+        _montecarlo_playouts(ctx, int_color, start, step, index, count)
+
+
+cdef inline void _montecarlo_playouts(SearchContext ctx, unsigned int int_color, unsigned int start, unsigned int step, unsigned int index, unsigned int count) noexcept nogil:
+    cdef:
+        unsigned long long b = ctx.bb, w = ctx.wb
+        unsigned int tbs = ctx.bs, tws = ctx.ws, i, j
+    for j in range(count):
+        i = start
+        while i < index:
+            # ボード情報と、この手の乱数の状態を復元
+            ctx.bb, ctx.wb, ctx.bs, ctx.ws = b, w, tbs, tws
+            ctx.tx, ctx.ty, ctx.tz, ctx.tw = ctx.mc_tx[i], ctx.mc_ty[i], ctx.mc_tz[i], ctx.mc_tw[i]
+            ctx.montecarlo_scores[i] += _playout(ctx, int_color, ctx.legal_moves_bit_list[i])
+            ctx.mc_tx[i], ctx.mc_ty[i], ctx.mc_tz[i], ctx.mc_tw[i] = ctx.tx, ctx.ty, ctx.tz, ctx.tw
+            # 探索ノード数カウント
+            ctx.measure_count += 1
+            i += step
+        if ctx.is_timer_enabled and check_timeout(ctx):
+            break
+    ctx.bb, ctx.wb, ctx.bs, ctx.ws = b, w, tbs, tws
+
+
+cdef inline signed int _playout(SearchContext ctx, unsigned int int_color, unsigned long long move_bit) noexcept nogil:
     cdef:
         unsigned long long random_put, legal_moves_bits, count
         unsigned int turn, x, y, pass_count = 0, random_index
         signed int ret
     # 1手打つ
-    _put_disc_no_prev(int_color, move_bit)
+    _put_disc_no_prev(ctx, int_color, move_bit)
     # 決着までランダムに打つ
     turn = int_color
     while True:
         # 次の手番
         turn = <unsigned int>0 if turn else <unsigned int>1
         # 合法手を取得
-        legal_moves_bits = _get_legal_moves_bits(turn, bb, wb, hb)
+        legal_moves_bits = _ctx_get_legal_moves_bits(ctx, turn, ctx.bb, ctx.wb)
         # 打てる場所なし
         if not legal_moves_bits:
             pass_count += 1
@@ -2219,44 +3358,43 @@ cdef inline signed int _playout(unsigned int int_color, unsigned long long move_
             pass_count = 0
             # ランダムに手を選ぶ
             count = _popcount(legal_moves_bits)
-            random_index = rand_int() % count + 1
+            random_index = rand_int(ctx) % count + 1
             for _ in range(random_index):
                 random_put = legal_moves_bits & (~legal_moves_bits+1)  # 一番右のONしているビットのみ取り出す
                 legal_moves_bits ^= random_put                         # 一番右のONしているビットをOFFする
             # 1手打つ
-            _put_disc_no_prev(turn, random_put)
+            _put_disc_no_prev(ctx, turn, random_put)
     # 結果を返す
     ret = -2
-    if (int_color and bs > ws) or (not int_color and ws > bs):
+    if (int_color and ctx.bs > ctx.ws) or (not int_color and ctx.ws > ctx.bs):
         ret = 2
-    elif bs == ws:
+    elif ctx.bs == ctx.ws:
         ret = 1
     return ret
 
 
-cdef inline signed int _board_playout(str color, board, move):
-    global bb, wb, hb, bs, ws
+cdef inline signed int _board_playout(SearchContext ctx, str color, board, move):
     cdef:
         unsigned long long random_put, legal_moves_bits
         unsigned int int_color = 0, turn, x, y, pass_count = 0, random_index
         signed int ret
     # ボード情報取得
-    bb, wb, hb = board.get_bitboard_info()
-    bs = board._black_score
-    ws = board._white_score
+    ctx.bb, ctx.wb, ctx.hb = board.get_bitboard_info()
+    ctx.bs = board._black_score
+    ctx.ws = board._white_score
     # 手番
     if color == 'black':
         int_color = <unsigned int>1
     # 1手打つ
     x, y = move
-    _put_disc_no_prev(int_color, <unsigned long long>1 << (63-(y*8+x)))
+    _put_disc_no_prev(ctx, int_color, <unsigned long long>1 << (63-(y*8+x)))
     # 決着までランダムに打つ
     turn = int_color
     while True:
         # 次の手番
         turn = <unsigned int>0 if turn else <unsigned int>1
         # 合法手を取得
-        legal_moves_bits = _get_legal_moves_bits(turn, bb, wb, hb)
+        legal_moves_bits = _get_legal_moves_bits(turn, ctx.bb, ctx.wb, ctx.hb)
         # 打てる場所なし
         if not legal_moves_bits:
             pass_count += 1
@@ -2272,19 +3410,19 @@ cdef inline signed int _board_playout(str color, board, move):
                 random_put = legal_moves_bits & (~legal_moves_bits+1)  # 一番右のONしているビットのみ取り出す
                 legal_moves_bits ^= random_put                         # 一番右のONしているビットをOFFする
             # 1手打つ
-            _put_disc_no_prev(turn, random_put)
+            _put_disc_no_prev(ctx, turn, random_put)
     # 結果を返す
     ret = -2
-    if (int_color and bs > ws) or (not int_color and ws > bs):
+    if (int_color and ctx.bs > ctx.ws) or (not int_color and ctx.ws > ctx.bs):
         ret = 2
-    elif bs == ws:
+    elif ctx.bs == ctx.ws:
         ret = 1
     return ret
 
 
 # -------------------------------------------------- #
 # BitBoard Methods
-cdef inline unsigned long long _get_legal_moves_bits(unsigned int int_color, unsigned long long b, unsigned long long w, unsigned long long h):
+cdef inline unsigned long long _get_legal_moves_bits(unsigned int int_color, unsigned long long b, unsigned long long w, unsigned long long h) noexcept nogil:
     cdef:
         unsigned long long player = w, opponent = b
     if int_color:
@@ -2327,64 +3465,57 @@ cdef inline unsigned long long _get_legal_moves_bits(unsigned int int_color, uns
     return blank & ((tmp_h << 1) | (tmp_h >> 1) | (tmp_v << 8) | (tmp_v >> 8) | (tmp_d1 << 9) | (tmp_d1 >> 9) | (tmp_d2 << 7) | (tmp_d2 >> 7))
 
 
-cdef inline unsigned long long _popcount(unsigned long long bits):
-    bits = bits - ((bits >> <unsigned int>1) & <unsigned long long>0x5555555555555555)
-    bits = (bits & <unsigned long long>0x3333333333333333) + ((bits >> <unsigned int>2) & <unsigned long long>0x3333333333333333)
-    bits = (bits + (bits >> <unsigned int>4)) & <unsigned long long>0x0F0F0F0F0F0F0F0F
-    bits = bits + (bits >> <unsigned int>8)
-    bits = bits + (bits >> <unsigned int>16)
-    return (bits + (bits >> <unsigned int>32)) & <unsigned long long>0x000000000000007F
+cdef inline unsigned long long _popcount(unsigned long long bits) noexcept nogil:
+    return reversi_popcount64(bits)
 
 
-cdef inline void _put_disc(unsigned int int_color, unsigned long long move):
-    global bb, wb, bs, ws, pbb, pwb, pbs, pws, fd, tail
+cdef inline void _put_disc(SearchContext ctx, unsigned int int_color, unsigned long long move) noexcept nogil:
     cdef:
         unsigned long long count
         signed int lshift
     # ひっくり返せる石を取得
-    fd = _get_flippable_discs_num(int_color, bb, wb, move)
-    count = _popcount(fd)
+    ctx.fd = _ctx_get_flippable_discs_num(ctx, int_color, ctx.bb, ctx.wb, move)
+    count = _popcount(ctx.fd)
     # 打つ前の状態を格納
-    pbb[tail] = bb
-    pwb[tail] = wb
-    pbs[tail] = bs
-    pws[tail] = ws
-    tail += 1
+    ctx.pbb[ctx.tail] = ctx.bb
+    ctx.pwb[ctx.tail] = ctx.wb
+    ctx.pbs[ctx.tail] = ctx.bs
+    ctx.pws[ctx.tail] = ctx.ws
+    ctx.tail += 1
     # 自分の石を置いて相手の石をひっくり返す
     if int_color:
-        bb ^= move | fd
-        wb ^= fd
-        bs += <unsigned int>1 + <unsigned int>count
-        ws -= <unsigned int>count
+        ctx.bb ^= move | ctx.fd
+        ctx.wb ^= ctx.fd
+        ctx.bs += <unsigned int>1 + <unsigned int>count
+        ctx.ws -= <unsigned int>count
     else:
-        wb ^= move | fd
-        bb ^= fd
-        bs -= <unsigned int>count
-        ws += <unsigned int>1 + <unsigned int>count
+        ctx.wb ^= move | ctx.fd
+        ctx.bb ^= ctx.fd
+        ctx.bs -= <unsigned int>count
+        ctx.ws += <unsigned int>1 + <unsigned int>count
 
 
-cdef inline void _put_disc_no_prev(unsigned int int_color, unsigned long long move):
-    global bb, wb, bs, ws, fd
+cdef inline void _put_disc_no_prev(SearchContext ctx, unsigned int int_color, unsigned long long move) noexcept nogil:
     cdef:
         unsigned long long count
         signed int lshift
     # ひっくり返せる石を取得
-    fd = _get_flippable_discs_num(int_color, bb, wb, move)
-    count = _popcount(fd)
+    ctx.fd = _ctx_get_flippable_discs_num(ctx, int_color, ctx.bb, ctx.wb, move)
+    count = _popcount(ctx.fd)
     # 自分の石を置いて相手の石をひっくり返す
     if int_color:
-        bb ^= move | fd
-        wb ^= fd
-        bs += <unsigned int>1 + <unsigned int>count
-        ws -= <unsigned int>count
+        ctx.bb ^= move | ctx.fd
+        ctx.wb ^= ctx.fd
+        ctx.bs += <unsigned int>1 + <unsigned int>count
+        ctx.ws -= <unsigned int>count
     else:
-        wb ^= move | fd
-        bb ^= fd
-        bs -= <unsigned int>count
-        ws += <unsigned int>1 + <unsigned int>count
+        ctx.wb ^= move | ctx.fd
+        ctx.bb ^= ctx.fd
+        ctx.bs -= <unsigned int>count
+        ctx.ws += <unsigned int>1 + <unsigned int>count
 
 
-cdef inline unsigned long long _get_flippable_discs_num(unsigned int int_color, unsigned long long b, unsigned long long w, unsigned long long move):
+cdef inline unsigned long long _get_flippable_discs_num(unsigned int int_color, unsigned long long b, unsigned long long w, unsigned long long move) noexcept nogil:
     cdef:
         unsigned long long t_, rt, r_, rb, b_, lb, l_, lt, m_t_, m_rt, m_r_, m_rb, m_b_, m_lb, m_l_, m_lt, player = w, opponent = b, flippable_discs_num = 0
         unsigned int x, other = 0
@@ -2646,58 +3777,169 @@ cdef inline unsigned long long _get_flippable_discs_num(unsigned int int_color,
     return flippable_discs_num
 
 
-cdef inline void _undo():
-    global bb, wb, bs, ws, pbb, pwb, pbs, pws, tail
-    tail -= 1
-    bb = pbb[tail]
-    wb = pwb[tail]
-    bs = pbs[tail]
-    ws = pws[tail]
+cdef inline void _undo(SearchContext ctx) noexcept nogil:
+    ctx.tail -= 1
+    ctx.bb = ctx.pbb[ctx.tail]
+    ctx.wb = ctx.pwb[ctx.tail]
+    ctx.bs = ctx.pbs[ctx.tail]
+    ctx.ws = ctx.pws[ctx.tail]
+
+
+# -------------------------------------------------- #
+# SizedBitBoard Methods
+cdef _get_bitmask(signed int size):
+    # 置ける場所の検出用マスク(サイズごとのGeometryで共有)
+    return get_geometry(size).mask
+
+
+cdef SizedGeometry* _get_sized_geometry(signed int size) except NULL:
+    # サイズ8未満(1ワードに収まる)のシフト量とマスクを作成して使い回す
+    cdef:
+        SizedGeometry* g
+    if not (MIN_BOARD_SIZE <= size < 8 and size % 2 == 0):
+        raise ValueError(str(size) + ' is invalid size!')
+    g = &sized_geometries[size // 2]
+    if not g.ready:
+        mask = _get_bitmask(size)
+        g.size = size
+        g.nbits = size * size
+        g.full = (<unsigned long long>1 << g.nbits) - 1
+        shifts = [1, size, size+1, size-1]
+        masks = [mask.h, mask.v, mask.d, mask.d]
+        lmasks = [mask.l, mask.u, mask.ul, mask.ur]
+        rmasks = [mask.r, mask.b, mask.br, mask.bl]
+        for i in range(4):
+            g.shifts[i] = shifts[i]
+            g.masks[i] = masks[i]
+            g.lmasks[i] = lmasks[i]
+            g.rmasks[i] = rmasks[i]
+        g.ready = 1
+    return g
+
+
+cdef inline unsigned int _set_geometry(SearchContext ctx, unsigned int size) except 0:
+    # ボードサイズに応じたジオメトリを設定する(サイズ8は専用の処理を使うためNULL)
+    ctx.geo = NULL
+    if size != 8:
+        ctx.geo = _get_sized_geometry(size)
+    return size
+
+
+cdef inline unsigned long long _ctx_get_legal_moves_bits(SearchContext ctx, unsigned int int_color, unsigned long long b, unsigned long long w) noexcept nogil:
+    if likely(ctx.geo == NULL):
+        return _get_legal_moves_bits(int_color, b, w, ctx.hb)
+    return _sized_get_legal_moves_bits(ctx.geo, int_color, b, w, ctx.hb)
+
+
+cdef inline unsigned long long _ctx_get_flippable_discs_num(SearchContext ctx, unsigned int int_color, unsigned long long b, unsigned long long w, unsigned long long move) noexcept nogil:
+    if likely(ctx.geo == NULL):
+        return _get_flippable_discs_num(int_color, b, w, move)
+    return _sized_get_flippable_discs_num(ctx.geo, int_color, b, w, move)
+
+
+cdef unsigned long long _sized_get_legal_moves_bits(SizedGeometry* g, unsigned int int_color, unsigned long long b, unsigned long long w, unsigned long long h) noexcept nogil:
+    cdef:
+        unsigned long long player = w, opponent = b, blank, mask, tmp_l, tmp_r, legal_moves_bits = 0
+        unsigned int d, i, shift
+    if int_color:
+        player = b
+        opponent = w
+    blank = ~(player | opponent | h) & g.full
+    # 方向ごとに、相手の石が続く先の空きマスを求める(左右同時)
+    for d in range(4):
+        shift = g.shifts[d]
+        mask = opponent & g.masks[d]
+        tmp_l = mask & (player << shift)
+        tmp_r = mask & (player >> shift)
+        for i in range(g.size - 3):
+            tmp_l |= mask & (tmp_l << shift)
+            tmp_r |= mask & (tmp_r >> shift)
+        legal_moves_bits |= (tmp_l << shift) | (tmp_r >> shift)
+    return blank & legal_moves_bits
+
+
+cdef unsigned long long _sized_get_flippable_discs_num(SizedGeometry* g, unsigned int int_color, unsigned long long b, unsigned long long w, unsigned long long move) noexcept nogil:
+    cdef:
+        unsigned long long player = w, opponent = b, flippable_discs_num = 0, tmp, check
+        unsigned int d, shift
+    if int_color:
+        player = b
+        opponent = w
+    for d in range(4):
+        shift = g.shifts[d]
+        # 左シフト方向
+        tmp = 0
+        check = (move << shift) & g.lmasks[d]
+        while check & opponent:
+            tmp |= check
+            check = (check << shift) & g.lmasks[d]
+        if check & player:
+            flippable_discs_num |= tmp
+        # 右シフト方向
+        tmp = 0
+        check = (move >> shift) & g.rmasks[d]
+        while check & opponent:
+            tmp |= check
+            check = (check >> shift) & g.rmasks[d]
+        if check & player:
+            flippable_discs_num |= tmp
+    return flippable_discs_num
+
+
+cdef inline list _get_moves_64bit(unsigned long long bits, unsigned int size):
+    cdef:
+        unsigned int last = size * size - 1, index
+    # 盤面外のビットを除き、最上位ビット(座標順で先頭)から取り出す
+    bits &= ((<unsigned long long>1 << last) << 1) - 1
+    ret = []
+    while bits:
+        index = reversi_bit_length64(bits) - 1
+        bits ^= <unsigned long long>1 << index
+        ret += [((last - index) % size, (last - index) // size)]
+    return ret
 
 
 # -------------------------------------------------- #
 # Timeout Methods
-cdef inline signed int check_timeout():
-    global timer_deadline, timer_timeout, timer_timeout_value
-    if time.time() > timer_deadline:
-        timer_timeout = <unsigned int>1
-        return timer_timeout_value
+cdef inline signed int check_timeout(SearchContext ctx) noexcept nogil:
+    if reversi_wall_time() > ctx.timer_deadline:
+        ctx.timer_timeout = <unsigned int>1
+        return ctx.timer_timeout_value
     return <signed int>0
 
 
 # -------------------------------------------------- #
 # rand_int Methods
-cdef unsigned long set_s(unsigned long s):
+cdef unsigned long set_s(unsigned long s) noexcept nogil:
     s = (s * 1812433253) + 1
     s ^= s << 13
     s ^= s >> 17
     return s
 
 
-cdef init_rand(unsigned long s):
+cdef void init_rand(SearchContext ctx, unsigned long s) noexcept nogil:
     while True:
         s = set_s(s)
-        tx = 123464980 ^ s
+        ctx.tx = <unsigned long>123464980 ^ s
         s = set_s(s)
-        ty = 3447902351 ^ s
+        ctx.ty = <unsigned long>3447902351 ^ s
         s = set_s(s)
-        tz = 2859490775 ^ s
+        ctx.tz = <unsigned long>2859490775 ^ s
         s = set_s(s)
-        tw = 47621719 ^ s
-        if not ((tx == 0) and (ty == 0) and (tz == 0) and (tw == 0)):
+        ctx.tw = <unsigned long>47621719 ^ s
+        if not ((ctx.tx == 0) and (ctx.ty == 0) and (ctx.tz == 0) and (ctx.tw == 0)):
             break
 
 
-cdef unsigned long rand_int():
-    global tx, ty, tz, tw
+cdef unsigned long rand_int(SearchContext ctx) noexcept nogil:
     cdef:
         unsigned long tt
-    tt = tx ^ (tx << 11)
-    tx = ty
-    ty = tz
-    tz = tw
-    tw = (tw ^ (tw >> 19)) ^ (tt ^ (tt>>8))
-    return tw
+    tt = ctx.tx ^ (ctx.tx << 11)
+    ctx.tx = ctx.ty
+    ctx.ty = ctx.tz
+    ctx.tz = ctx.tw
+    ctx.tw = (ctx.tw ^ (ctx.tw >> 19)) ^ (tt ^ (tt>>8))
+    return ctx.tw
 
 
 # =========================================== #
@@ -3186,17 +4428,7 @@ def undo(board):
 
 
 cdef inline _get_legal_moves_size8_64bit(str color, unsigned long long b, unsigned long long w, unsigned long long h):
-    cdef:
-        unsigned long long legal_moves, mask = 0x8000000000000000
-        unsigned int x, y
-    legal_moves = _get_legal_moves_bits(color == 'black', b, w, h)
-    ret = []
-    for y in range(8):
-        for x in range(8):
-            if legal_moves & mask:
-                ret += [(x, y)]
-            mask >>= 1
-    return ret
+    return _get_moves_64bit(_get_legal_moves_bits(color == 'black', b, w, h), <unsigned int>8)
 
 
 cdef _get_legal_moves(color, size, b, w, h, mask):
@@ -3250,14 +4482,7 @@ cdef _get_legal_moves_rshift(size, mask, player, blank, shift_size):
 
 
 cdef _get_bit_count(size, bits):
-    count = 0
-    mask = 1 << ((size**2)-1)
-    for y in range(size):
-        for x in range(size):
-            if bits & mask:
-                count += 1
-            mask >>= 1
-    return count
+    return _py_get_bit_count(size, bits)
 
 
 cdef inline _get_flippable_discs_size8_64bit(unsigned int color, unsigned long long black_bitboard, unsigned long long white_bitboard, unsigned int x, unsigned int y):
@@ -3427,11 +4652,13 @@ cdef inline _put_disc_board_sizable(size, board, color, unsigned int x, unsigned
         board._white_bitboard ^= flippable_discs_num
         board._black_score += 1 + len(flippable_discs)
         board._white_score -= len(flippable_discs)
+        board._hash ^= _py_get_hash(put | flippable_discs_num, flippable_discs_num)
     else:
         board._white_bitboard ^= put | flippable_discs_num
         board._black_bitboard ^= flippable_discs_num
         board._black_score -= len(flippable_discs)
         board._white_score += 1 + len(flippable_discs)
+        board._hash ^= _py_get_hash(flippable_discs_num, put | flippable_discs_num)
     board._flippable_discs_num = flippable_discs_num
     return flippable_discs_num
 
@@ -3502,16 +4729,18 @@ cdef _get_board_info_sizable(size, b, w):
 
 cdef class CythonBitBoard():
     cdef readonly size
-    cdef public _black_score, _white_score, prev, _green_bitboard, _black_bitboard, _white_bitboard, _hole_bitboard, _ini_green, _ini_black, _ini_white, _mask, _flippable_discs_num
+    cdef public _black_score, _white_score, prev, _green_bitboard, _black_bitboard, _white_bitboard, _hole_bitboard, _ini_green, _ini_black, _ini_white, _mask, _geometry, _flippable_discs_num
+    cdef public unsigned long long _hash
 
-    def __init__(self, hole=0x0, ini_black=None, ini_white=None):
-        self.size = 8
+    def __init__(self, size=8, hole=0x0, ini_black=None, ini_white=None):
+        if size != 8:
+            _get_sized_geometry(size)  # サイズ8未満(1ワードに収まる)のみ対応
+        self.size = size
         self.prev = []
         self._green_bitboard = 0
         self._black_bitboard = 0
         self._white_bitboard = 0
         # 初期配置
-        size = self.size
         center = size // 2
         self._ini_black = 1 << ((size*size-1)-(size*(center-1)+center))
         self._ini_black |= 1 << ((size*size-1)-(size*center+(center-1)))
@@ -3527,37 +4756,27 @@ cdef class CythonBitBoard():
         self._green_bitboard |= self._ini_green
         self._black_bitboard |= self._ini_black
         self._white_bitboard |= self._ini_white
+        # 置ける場所の検出用マスク(サイズと穴の配置ごとに共有)
+        self._geometry = get_geometry(size, hole)
+        self._mask = self._geometry.mask
+        # 穴をあける(サイズ8のみ)
         self._hole_bitboard = hole
-        # 置ける場所の検出用マスク
-        BitMask = namedtuple('BitMask', 'h v d u ur r br b bl l ul')
-        self._mask = BitMask(
-            int(''.join((['0'] + ['1'] * (size-2) + ['0']) * size), 2),                                      # 水平方向のマスク値
-            int(''.join(['0'] * size + ['1'] * size * (size-2) + ['0'] * size), 2),                          # 垂直方向のマスク値
-            int(''.join(['0'] * size + (['0'] + (['1'] * (size-2)) + ['0']) * (size-2) + ['0'] * size), 2),  # 斜め方向のマスク値
-            int(''.join(['1'] * size * (size-1) + ['0'] * size), 2),                                         # 上方向のマスク値
-            int(''.join((['0'] + ['1'] * (size-1)) * (size-1) + ['0'] * size), 2),                           # 右上方向のマスク値
-            int(''.join((['0'] + ['1'] * (size-1)) * size), 2),                                              # 右方向のマスク値
-            int(''.join(['0'] * size + (['0'] + ['1'] * (size-1)) * (size-1)), 2),                           # 右下方向のマスク値
-            int(''.join(['0'] * size + ['1'] * size * (size-1)), 2),                                         # 下方向のマスク値
-            int(''.join(['0'] * size + (['1'] * (size-1) + ['0']) * (size-1)), 2),                           # 左下方向のマスク値
-            int(''.join((['1'] * (size-1) + ['0']) * size), 2),                                              # 左方向のマスク値
-            int(''.join((['1'] * (size-1) + ['0']) * (size-1) + ['0'] * size), 2)                            # 左上方向のマスク値
-        )
-        # 穴をあける
-        self._green_bitboard &= ~self._hole_bitboard
-        self._black_bitboard &= ~self._hole_bitboard
-        self._white_bitboard &= ~self._hole_bitboard
+        if size == 8:
+            self._green_bitboard &= ~self._hole_bitboard
+            self._black_bitboard &= ~self._hole_bitboard
+            self._white_bitboard &= ~self._hole_bitboard
         self.update_score()
 
     def _is_invalid_size(self, size):
         return not(MIN_BOARD_SIZE <= size <= MAX_BOARD_SIZE and size % 2 == 0)
 
     def __str__(self):
-        header = '   ' + ' '.join([chr(97 + i) for i in range(8)]) + '\n'
-        board = [['□' for _ in range(8)] for _ in range(8)]
-        mask = 1 << 63
-        for y in range(8):
-            for x in range(8):
+        size = self.size
+        header = self._geometry.header
+        board = [['□' for _ in range(size)] for _ in range(size)]
+        mask = 1 << (size * size - 1)
+        for y in range(size):
+            for x in range(size):
                 if self._hole_bitboard & mask:
                     board[y][x] = '　'
                 elif self._black_bitboard & mask:
@@ -3573,30 +4792,82 @@ cdef class CythonBitBoard():
         return header + body
 
     def get_legal_moves(self, str color):
-        return _get_legal_moves_size8_64bit(color, self._black_bitboard, self._white_bitboard, self._hole_bitboard)
+        if self.size == 8:
+            return _get_legal_moves_size8_64bit(color, self._black_bitboard, self._white_bitboard, self._hole_bitboard)
+        size = self.size
+        return _get_moves_64bit(_sized_get_legal_moves_bits(_get_sized_geometry(size), color == 'black', self._black_bitboard, self._white_bitboard, self._hole_bitboard), size)
 
     def get_legal_moves_bits(self, str color):
-        return _get_legal_moves_bits(color == 'black', self._black_bitboard, self._white_bitboard, self._hole_bitboard)
+        if self.size == 8:
+            return _get_legal_moves_bits(color == 'black', self._black_bitboard, self._white_bitboard, self._hole_bitboard)
+        return _sized_get_legal_moves_bits(_get_sized_geometry(self.size), color == 'black', self._black_bitboard, self._white_bitboard, self._hole_bitboard)
 
     def get_flippable_discs(self, str color, x, y):
-        return _get_flippable_discs_size8_64bit(color == 'black', self._black_bitboard, self._white_bitboard, x, y)
+        if self.size == 8:
+            return _get_flippable_discs_size8_64bit(color == 'black', self._black_bitboard, self._white_bitboard, x, y)
+        size = self.size
+        put = <unsigned long long>1 << <unsigned int>(size*size-1-(y*size+x))
+        return _get_moves_64bit(_sized_get_flippable_discs_num(_get_sized_geometry(size), color == 'black', self._black_bitboard, self._white_bitboard, put), size)
 
     def put_disc(self, str color, x, y):
-        return _put_disc_board_size8_64bit(self, color == 'black', x, y)
+        if self.size == 8:
+            return _put_disc_board_size8_64bit(self, color == 'black', x, y)
+        size = self.size
+        shift_size = ((size*size-1)-(y*size+x))
+        if shift_size < 0 or shift_size > size**2-1:
+            return 0
+        return _put_disc_board_64bit(self, _get_sized_geometry(size), color == 'black', x, y)
+
+    def move(self, color, move):
+        return self.put_disc(color, *move)
+
+    def copy(self):
+        # 同じ局面のボードを返す(打った手の履歴は持たない)
+        cdef CythonBitBoard board = CythonBitBoard.__new__(CythonBitBoard)
+        board.size = self.size
+        board.prev = []
+        board._green_bitboard = self._green_bitboard
+        board._black_bitboard = self._black_bitboard
+        board._white_bitboard = self._white_bitboard
+        board._hole_bitboard = self._hole_bitboard
+        board._ini_green = self._ini_green
+        board._ini_black = self._ini_black
+        board._ini_white = self._ini_white
+        board._mask = self._mask
+        board._geometry = self._geometry
+        board._flippable_discs_num = self._flippable_discs_num
+        board._black_score = self._black_score
+        board._white_score = self._white_score
+        board._hash = self._hash
+        return board
+
+    def child(self, str color, move):
+        # 指定した手を打った後の局面のボードを返す(自身は変更しない)
+        board = self.copy()
+        board.put_disc(color, *move)
+        return board
+
+    def put_disc_bits(self, str color, unsigned long long move_bit):
+        if not move_bit:
+            return 0
+        if self.size == 8:
+            return _put_disc_board_bits_64bit(self, NULL, color == 'black', move_bit)
+        return _put_disc_board_bits_64bit(self, _get_sized_geometry(self.size), color == 'black', move_bit)
 
     def update_score(self):
-        self._black_score, self._white_score = 0, 0
-        mask = 1 << 63
-        for y in range(8):
-            for x in range(8):
-                if self._black_bitboard & mask:
-                    self._black_score += 1
-                elif self._white_bitboard & mask:
-                    self._white_score += 1
-                mask >>= 1
+        self._black_score = _popcount(self._black_bitboard)
+        self._white_score = _popcount(self._white_bitboard)
+        self._hash = _get_hash_64bit(self._black_bitboard, self._white_bitboard)
+
+    @property
+    def hash(self):
+        # 黒と白の石の配置のZobristハッシュ(64bit、手番は含まない)
+        return self._hash
 
     def get_board_info(self):
-        return _get_board_info_size8_64bit(self._black_bitboard, self._white_bitboard)
+        if self.size == 8:
+            return _get_board_info_size8_64bit(self._black_bitboard, self._white_bitboard)
+        return _get_board_info_sizable(self.size, self._black_bitboard, self._white_bitboard)
 
     def get_board_line_info(self, player, black='*', white='O', hole='_', empty='-'):
         board_line_info = ''
@@ -3630,7 +4901,10 @@ cdef class CythonBitBoard():
         return self._black_bitboard, self._white_bitboard, self._hole_bitboard
 
     def undo(self):
+        cdef:
+            unsigned long long black_bitboard = self._black_bitboard, white_bitboard = self._white_bitboard
         (self._black_bitboard, self._white_bitboard, self._black_score, self._white_score) = self.prev.pop()
+        self._hash ^= _get_hash_64bit(black_bitboard ^ <unsigned long long>self._black_bitboard, white_bitboard ^ <unsigned long long>self._white_bitboard)
 
     def get_remain(self):
         size = self.size
@@ -3642,3 +4916,948 @@ cdef class CythonBitBoard():
         white = self._white_bitboard
         not_blank = hole | green | black | white
         return remain - self.get_bit_count(not_blank)
+
+
+# -------------------------------------------------- #
+# MultiBitBoard Methods
+cdef MultiGeometry* _get_multi_geometry(signed int size, mask) except NULL:
+    cdef:
+        MultiGeometry* g = &multi_geometries[size // 2]
+        unsigned int i
+    if not g.ready:
+        g.size = size
+        g.nbits = size * size
+        g.nwords = (g.nbits + 63) // 64
+        # シフト量と、シフト時にはみ出しを防ぐマスク(左右、上下、斜め x2)
+        shifts = [1, -1, size, -size, size+1, -(size+1), size-1, -(size-1)]
+        masks = [mask.h, mask.h, mask.v, mask.v, mask.d, mask.d, mask.d, mask.d]
+        for i in range(8):
+            g.shifts[i] = shifts[i]
+            _multi_from_int(&g.masks[i], masks[i], g.nwords)
+        _multi_from_int(&g.full, (1 << <object>g.nbits) - 1, g.nwords)
+        g.ready = 1
+    return g
+
+
+cdef int _multi_from_int(MultiBits* bits, value, unsigned int nwords) except -1:
+    cdef:
+        unsigned int k
+    for k in range(MULTI_MAX_WORDS):
+        if k < nwords:
+            bits.w[k] = value & 0xFFFFFFFFFFFFFFFF
+            value >>= 64
+        else:
+            bits.w[k] = 0
+    return 0
+
+
+cdef object _multi_to_int(MultiBits* bits, unsigned int nwords):
+    cdef:
+        unsigned int k = nwords
+    ret = 0
+    while k:
+        k -= 1
+        ret = (ret << 64) | bits.w[k]
+    return ret
+
+
+cdef inline unsigned long long _multi_test(MultiBits* bits, signed int pos) noexcept nogil:
+    return (bits.w[pos >> 6] >> (pos & 63)) & <unsigned long long>1
+
+
+cdef inline unsigned int _multi_popcount(MultiBits* bits, unsigned int nwords) noexcept nogil:
+    cdef:
+        unsigned int k, count = 0
+    for k in range(nwords):
+        count += <unsigned int>_popcount(bits.w[k])
+    return count
+
+
+cdef inline signed int _multi_pop(MultiBits* bits, unsigned int nwords) noexcept nogil:
+    # 一番右のONしているビットの位置を返してOFFする(なければ-1)
+    cdef:
+        unsigned long long low
+        unsigned int k
+    for k in range(nwords):
+        if bits.w[k]:
+            low = bits.w[k] & (~bits.w[k] + 1)
+            bits.w[k] ^= low
+            return <signed int>(k * 64 + _popcount(low - 1))
+    return -1
+
+
+cdef inline signed int _multi_order_pop(OrderView* ov, unsigned int int_color, unsigned int depth, MultiBits* bits, unsigned int nwords) noexcept nogil:
+    # 優先度の最も高いビットの位置を返してOFFする(同じ優先度は右のビットから、なければ-1)
+    cdef:
+        unsigned long long word, low, priority, best_priority = 0
+        unsigned int k
+        signed int pos, best = -1
+    for k in range(nwords):
+        word = bits.w[k]
+        while word:
+            low = word & (~word + 1)
+            pos = <signed int>(k * 64 + _popcount(low - 1))
+            priority = _order_priority(ov, int_color, depth, pos)
+            if best < 0 or priority > best_priority:
+                best = pos
+                best_priority = priority
+            word ^= low
+    if best >= 0:
+        bits.w[best >> 6] ^= <unsigned long long>1 << (best & 63)
+    return best
+
+
+cdef inline void _multi_order_move_killers(OrderView* ov, unsigned int depth, unsigned int count, signed int* next_moves) noexcept nogil:
+    # キラー手を先頭に移す(他の手の順序は保つ)
+    cdef:
+        unsigned int i, j, k
+        signed int pos
+    if not ov.killer or depth >= ORDERER_MAX_DEPTH:
+        return
+    for k in range(ORDERER_KILLERS - 1, -1, -1):
+        pos = ov.killers[depth * ORDERER_KILLERS + k]
+        if pos < 0:
+            continue
+        for i in range(count):
+            if next_moves[i] == pos:
+                for j in range(i, 0, -1):
+                    next_moves[j] = next_moves[j-1]
+                next_moves[0] = pos
+                break
+
+
+cdef inline void _multi_shift(MultiBits* dst, MultiBits* src, signed int shift, unsigned int nwords) noexcept nogil:
+    # 正の値で左シフト、負の値で右シフト(ワード間の桁あふれを繰り越す)
+    cdef:
+        unsigned int k, s, r
+    if shift > 0:
+        s = <unsigned int>shift
+        r = 64 - s
+        k = nwords - 1
+        while k:
+            dst.w[k] = (src.w[k] << s) | (src.w[k-1] >> r)
+            k -= 1
+        dst.w[0] = src.w[0] << s
+    else:
+        s = <unsigned int>(-shift)
+        r = 64 - s
+        for k in range(nwords - 1):
+            dst.w[k] = (src.w[k] >> s) | (src.w[k+1] << r)
+        dst.w[nwords-1] = src.w[nwords-1] >> s
+
+
+cdef inline void _multi_get_legal_moves_bits(MultiGeometry* g, unsigned int int_color, MultiBits* b, MultiBits* w, MultiBits* h, MultiBits* legal_moves) noexcept nogil:
+    cdef:
+        MultiBits* player = w
+        MultiBits* opponent = b
+        MultiBits blank, mask, tmp, shifted
+        unsigned int n = g.nwords, d, k
+        unsigned long long grown
+    if int_color:
+        player = b
+        opponent = w
+    for k in range(n):
+        blank.w[k] = ~(player.w[k] | opponent.w[k] | h.w[k]) & g.full.w[k]
+        legal_moves.w[k] = 0
+    # 方向ごとに相手の石が続く限り伸ばし、その先の空きマスを置ける場所とする
+    for d in range(8):
+        for k in range(n):
+            mask.w[k] = opponent.w[k] & g.masks[d].w[k]
+        _multi_shift(&tmp, player, g.shifts[d], n)
+        grown = 0
+        for k in range(n):
+            tmp.w[k] &= mask.w[k]
+            grown |= tmp.w[k]
+        while grown:
+            _multi_shift(&shifted, &tmp, g.shifts[d], n)
+            grown = 0
+            for k in range(n):
+                shifted.w[k] &= mask.w[k] & ~tmp.w[k]
+                tmp.w[k] |= shifted.w[k]
+                grown |= shifted.w[k]
+        _multi_shift(&shifted, &tmp, g.shifts[d], n)
+        for k in range(n):
+            legal_moves.w[k] |= blank.w[k] & shifted.w[k]
+
+
+cdef inline void _multi_get_flippable_discs(MultiGeometry* g, unsigned int int_color, MultiBits* b, MultiBits* w, signed int x, signed int y, MultiBits* flippable_discs) noexcept nogil:
+    cdef:
+        MultiBits* player = w
+        MultiBits* opponent = b
+        signed int size = g.size, last = g.nbits - 1, dx, dy, cx, cy, count, pos
+        unsigned int d, k
+    if int_color:
+        player = b
+        opponent = w
+    for k in range(g.nwords):
+        flippable_discs.w[k] = 0
+    # 8方向を順番にチェック
+    for d in range(8):
+        dx = directions_x[d]
+        dy = directions_y[d]
+        cx = x + dx
+        cy = y + dy
+        count = 0
+        # 相手の石が存在する限り進める
+        while 0 <= cx < size and 0 <= cy < size and _multi_test(opponent, last - (cy * size + cx)):
+            cx += dx
+            cy += dy
+            count += 1
+        # 自分の石で囲まれている場合は間の石を返す
+        if count and 0 <= cx < size and 0 <= cy < size and _multi_test(player, last - (cy * size + cx)):
+            while count:
+                cx -= dx
+                cy -= dy
+                count -= 1
+                pos = last - (cy * size + cx)
+                flippable_discs.w[pos >> 6] |= <unsigned long long>1 << (pos & 63)
+
+
+cdef inline void _multi_put_disc(CythonMultiBitBoard board, unsigned int int_color, signed int pos) noexcept nogil:
+    cdef:
+        MultiGeometry* g = board.geo
+        MultiBits* player = &board.wb
+        MultiBits* opponent = &board.bb
+        signed int index = g.nbits - 1 - pos, count = 0
+        unsigned int k
+    if int_color:
+        player = &board.bb
+        opponent = &board.wb
+    # 自分の石を置いて相手の石をひっくり返す
+    _multi_get_flippable_discs(g, int_color, &board.bb, &board.wb, index % g.size, index // g.size, &board.fd)
+    for k in range(g.nwords):
+        count += <signed int>_popcount(board.fd.w[k])
+        player.w[k] ^= board.fd.w[k]
+        opponent.w[k] ^= board.fd.w[k]
+    player.w[pos >> 6] ^= <unsigned long long>1 << (pos & 63)
+    if int_color:
+        board._black_score += 1 + count
+        board._white_score -= count
+    else:
+        board._black_score -= count
+        board._white_score += 1 + count
+
+
+cdef inline unsigned long long _multi_get_hash(MultiBits* b, MultiBits* w, unsigned int nwords) noexcept nogil:
+    cdef:
+        unsigned long long ret = 0
+        unsigned int k
+    for k in range(nwords):
+        ret ^= _get_hash_word(b.w[k], &_zobrist_black[k * 64]) ^ _get_hash_word(w.w[k], &_zobrist_white[k * 64])
+    return ret
+
+
+cdef inline unsigned long long _tt_key_multi(MultiBits* b, MultiBits* w, unsigned int int_color, unsigned int nwords) noexcept nogil:
+    # 白番の場合は手番の乱数を加える(TranspositionTable.get_keyと同じ値)
+    if int_color:
+        return _multi_get_hash(b, w, nwords)
+    return _multi_get_hash(b, w, nwords) ^ _zobrist_side
+
+
+cdef inline void _multi_add_hash(CythonMultiBitBoard board, unsigned int int_color, signed int pos) noexcept nogil:
+    # 着手(_multi_put_disc)によるハッシュの差分を反映する
+    cdef MultiBits put = board.fd
+    put.w[pos >> 6] ^= <unsigned long long>1 << (pos & 63)
+    if int_color:
+        board._hash ^= _multi_get_hash(&put, &board.fd, board.geo.nwords)
+    else:
+        board._hash ^= _multi_get_hash(&board.fd, &put, board.geo.nwords)
+
+
+cdef _multi_get_moves(MultiGeometry* g, MultiBits* bits):
+    cdef:
+        signed int pos = g.nbits - 1
+        unsigned int x, y
+    ret = []
+    for y in range(g.size):
+        for x in range(g.size):
+            if _multi_test(bits, pos):
+                ret += [(x, y)]
+            pos -= 1
+    return ret
+
+
+cdef class CythonMultiBitBoard():
+    """CythonMultiBitBoard
+    """
+    cdef readonly size
+    cdef public int _black_score, _white_score
+    cdef public unsigned long long _hash
+    cdef public prev, _green_bitboard, _ini_green, _ini_black, _ini_white, _mask, _geometry
+    cdef:
+        MultiGeometry* geo
+        MultiBits bb, wb, hb, fd
+
+    def __init__(self, size=10, hole=0x0, ini_black=None, ini_white=None):
+        if self._is_invalid_size(size) or size < MULTI_MIN_BOARD_SIZE:
+            raise ValueError(str(size) + ' is invalid size!')
+        self.size = size
+        self.prev = []
+        self._geometry = get_geometry(size, hole)
+        self._mask = self._geometry.mask
+        self.geo = _get_multi_geometry(size, self._mask)
+        # 初期配置
+        center = size // 2
+        self._ini_black = 1 << ((size*size-1)-(size*(center-1)+center))
+        self._ini_black |= 1 << ((size*size-1)-(size*center+(center-1)))
+        self._ini_white = 1 << ((size*size-1)-(size*(center-1)+(center-1)))
+        self._ini_white |= 1 << ((size*size-1)-(size*center+center))
+        if ini_black is not None:
+            self._ini_black = ini_black
+        if ini_white is not None:
+            self._ini_white = ini_white
+        self._ini_green = self._ini_black & self._ini_white
+        self._ini_black &= ~self._ini_green
+        self._ini_white &= ~self._ini_green
+        self._green_bitboard = self._ini_green
+        self._black_bitboard = self._ini_black
+        self._white_bitboard = self._ini_white
+        self._hole_bitboard = hole  # 穴はサイズ8のみ(PyBitBoardと同様に石は取り除かない)
+        self._flippable_discs_num = 0
+        self.update_score()
+
+    def __reduce__(self):
+        return (CythonMultiBitBoard, (self.size, self._hole_bitboard), self.__getstate__())
+
+    def __getstate__(self):
+        return (self._black_bitboard, self._white_bitboard, self._hole_bitboard, self._flippable_discs_num, self._black_score, self._white_score, self.prev, self._green_bitboard, self._ini_green, self._ini_black, self._ini_white)  # noqa: E501
+
+    def __setstate__(self, state):
+        (self._black_bitboard, self._white_bitboard, self._hole_bitboard, self._flippable_discs_num, self._black_score, self._white_score, self.prev, self._green_bitboard, self._ini_green, self._ini_black, self._ini_white) = state  # noqa: E501
+        self._hash = _multi_get_hash(&self.bb, &self.wb, self.geo.nwords)
+
+    cdef CythonMultiBitBoard _copy(self):
+        # 探索用の複製(打った手の履歴は持たない)
+        cdef CythonMultiBitBoard board = CythonMultiBitBoard.__new__(CythonMultiBitBoard)
+        board.size = self.size
+        board.prev = []
+        board._mask = self._mask
+        board._geometry = self._geometry
+        board._green_bitboard = self._green_bitboard
+        board._ini_green = self._ini_green
+        board._ini_black = self._ini_black
+        board._ini_white = self._ini_white
+        board.geo = self.geo
+        board.bb = self.bb
+        board.wb = self.wb
+        board.hb = self.hb
+        board.fd = self.fd
+        board._black_score = self._black_score
+        board._white_score = self._white_score
+        board._hash = self._hash
+        return board
+
+    cdef int _set_bits(self, MultiBits* bits, value) except -1:
+        cdef:
+            unsigned int k
+        _multi_from_int(bits, value, self.geo.nwords)
+        for k in range(self.geo.nwords):
+            bits.w[k] &= self.geo.full.w[k]
+        return 0
+
+    @property
+    def _black_bitboard(self):
+        return _multi_to_int(&self.bb, self.geo.nwords)
+
+    @_black_bitboard.setter
+    def _black_bitboard(self, value):
+        self._set_bits(&self.bb, value)
+
+    @property
+    def _white_bitboard(self):
+        return _multi_to_int(&self.wb, self.geo.nwords)
+
+    @_white_bitboard.setter
+    def _white_bitboard(self, value):
+        self._set_bits(&self.wb, value)
+
+    @property
+    def _hole_bitboard(self):
+        return _multi_to_int(&self.hb, self.geo.nwords)
+
+    @_hole_bitboard.setter
+    def _hole_bitboard(self, value):
+        self._set_bits(&self.hb, value)
+
+    @property
+    def _flippable_discs_num(self):
+        return _multi_to_int(&self.fd, self.geo.nwords)
+
+    @_flippable_discs_num.setter
+    def _flippable_discs_num(self, value):
+        self._set_bits(&self.fd, value)
+
+    def _is_invalid_size(self, size):
+        return not(MIN_BOARD_SIZE <= size <= MAX_BOARD_SIZE and size % 2 == 0)
+
+    def __str__(self):
+        cdef:
+            MultiBits gb
+            signed int pos = self.geo.nbits - 1
+            unsigned int x, y, size = self.geo.size
+        self._set_bits(&gb, self._green_bitboard)
+        header = self._geometry.header
+        board = [['□' for _ in range(size)] for _ in range(size)]
+        for y in range(size):
+            for x in range(size):
+                if _multi_test(&self.hb, pos):
+                    board[y][x] = '　'
+                elif _multi_test(&self.bb, pos):
+                    board[y][x] = '〇'
+                elif _multi_test(&self.wb, pos):
+                    board[y][x] = '●'
+                elif _multi_test(&gb, pos):
+                    board[y][x] = '◎'
+                pos -= 1
+        body = ''
+        for num, row in enumerate(board, 1):
+            body += f'{num:2d}' + ''.join([value for value in row]) + '\n'
+        return header + body
+
+    def get_legal_moves(self, str color):
+        cdef:
+            MultiBits legal_moves
+        _multi_get_legal_moves_bits(self.geo, color == 'black', &self.bb, &self.wb, &self.hb, &legal_moves)
+        return _multi_get_moves(self.geo, &legal_moves)
+
+    def get_legal_moves_bits(self, str color):
+        cdef:
+            MultiBits legal_moves
+        _multi_get_legal_moves_bits(self.geo, color == 'black', &self.bb, &self.wb, &self.hb, &legal_moves)
+        return _multi_to_int(&legal_moves, self.geo.nwords)
+
+    def get_flippable_discs(self, str color, x, y):
+        cdef:
+            MultiBits flippable_discs
+        _multi_get_flippable_discs(self.geo, color == 'black', &self.bb, &self.wb, x, y, &flippable_discs)
+        return _multi_get_moves(self.geo, &flippable_discs)
+
+    def put_disc(self, str color, x, y):
+        size = self.size
+        if not (0 <= x < size and 0 <= y < size):
+            return 0
+        # 打つ前の状態を格納
+        self.prev += [(self._black_bitboard, self._white_bitboard, self._black_score, self._white_score)]
+        _multi_put_disc(self, color == 'black', (size*size-1)-(y*size+x))
+        _multi_add_hash(self, color == 'black', (size*size-1)-(y*size+x))
+        return self._flippable_discs_num
+
+    def move(self, color, move):
+        return self.put_disc(color, *move)
+
+    def copy(self):
+        # 同じ局面のボードを返す(打った手の履歴は持たない)
+        return self._copy()
+
+    def child(self, str color, move):
+        # 指定した手を打った後の局面のボードを返す(自身は変更しない)
+        board = self._copy()
+        board.put_disc(color, *move)
+        return board
+
+    def put_disc_bits(self, str color, move_bit):
+        pos = move_bit.bit_length() - 1
+        if not (0 <= pos < self.geo.nbits):
+            return 0
+        # 打つ前の状態を格納
+        self.prev += [(self._black_bitboard, self._white_bitboard, self._black_score, self._white_score)]
+        _multi_put_disc(self, color == 'black', pos)
+        _multi_add_hash(self, color == 'black', pos)
+        return self._flippable_discs_num
+
+    def update_score(self):
+        self._black_score = _multi_popcount(&self.bb, self.geo.nwords)
+        self._white_score = _multi_popcount(&self.wb, self.geo.nwords)
+        self._hash = _multi_get_hash(&self.bb, &self.wb, self.geo.nwords)
+
+    @property
+    def hash(self):
+        # 黒と白の石の配置のZobristハッシュ(64bit、手番は含まない)
+        return self._hash
+
+    def get_board_info(self):
+        cdef:
+            signed int pos = self.geo.nbits - 1
+            unsigned int x, y
+        board_info = []
+        for y in range(self.geo.size):
+            tmp = []
+            for x in range(self.geo.size):
+                if _multi_test(&self.bb, pos):
+                    tmp += [1]
+                elif _multi_test(&self.wb, pos):
+                    tmp += [-1]
+                else:
+                    tmp += [0]
+                pos -= 1
+            board_info += [tmp]
+        return board_info
+
+    def get_board_line_info(self, player, black='*', white='O', hole='_', empty='-'):
+        cdef:
+            signed int pos = self.geo.nbits - 1
+            unsigned int x, y
+        board_line_info = ''
+        # board
+        for y in range(self.geo.size):
+            for x in range(self.geo.size):
+                if _multi_test(&self.bb, pos):
+                    board_line_info += black
+                elif _multi_test(&self.wb, pos):
+                    board_line_info += white
+                elif _multi_test(&self.hb, pos):
+                    board_line_info += hole
+                else:
+                    board_line_info += empty
+                pos -= 1
+        # player
+        if player == 'black':
+            board_line_info += black
+        elif player == 'white':
+            board_line_info += white
+        else:
+            board_line_info += empty
+        return board_line_info
+
+    def get_bit_count(self, bits):
+        cdef:
+            MultiBits tmp
+        self._set_bits(&tmp, bits)
+        return _multi_popcount(&tmp, self.geo.nwords)
+
+    def get_bitboard_info(self):
+        return self._black_bitboard, self._white_bitboard, self._hole_bitboard
+
+    def undo(self):
+        cdef:
+            MultiBits bb = self.bb, wb = self.wb
+            unsigned int k
+        (self._black_bitboard, self._white_bitboard, self._black_score, self._white_score) = self.prev.pop()
+        for k in range(self.geo.nwords):
+            bb.w[k] ^= self.bb.w[k]
+            wb.w[k] ^= self.wb.w[k]
+        self._hash ^= _multi_get_hash(&bb, &wb, self.geo.nwords)
+
+    def get_remain(self):
+        size = self.size
+        return size * size - self.get_bit_count(self._hole_bitboard | self._green_bitboard | self._black_bitboard | self._white_bitboard)
+
+
+cdef inline void _start_search(SearchContext ctx, str pid, int timer, int measure):
+    ctx.measure_count = 0
+    ctx.timer_timeout = <unsigned int>0
+    ctx.is_timer_enabled = timer
+    if timer and pid:
+        ctx.timer_deadline = Timer.deadline[pid]
+        ctx.timer_timeout_value = Timer.timeout_value[pid]
+    if measure and pid:
+        if pid not in Measure.count:
+            Measure.count[pid] = 0
+        ctx.measure_count = Measure.count[pid]
+
+
+cdef inline void _end_search(SearchContext ctx, str pid, int timer, int measure):
+    if measure and pid:
+        Measure.count[pid] = ctx.measure_count
+    if timer and pid and ctx.timer_timeout:
+        Timer.timeout_flag[pid] = True  # タイムアウト発生
+
+
+cdef inline _multi_next_move(SearchContext ctx, str name, str color, CythonMultiBitBoard board, double alpha, double beta, int depth, evaluator, str pid, int timer, int measure):
+    _start_search(ctx, pid, timer, measure)
+    moves = board.get_legal_moves(color)  # 手の候補
+    best_move, _ = _multi_get_best_move(ctx, name, color == 'black', board, moves, alpha, beta, depth, evaluator, timer)
+    _end_search(ctx, pid, timer, measure)
+    return best_move
+
+
+cdef inline tuple _multi_get_best_move_wrap(SearchContext ctx, str name, str color, CythonMultiBitBoard board, moves, double alpha, double beta, int depth, evaluator, str pid, int timer, int measure):
+    _start_search(ctx, pid, timer, measure)
+    best_move, scores = _multi_get_best_move(ctx, name, color == 'black', board, moves, alpha, beta, depth, evaluator, timer)
+    _end_search(ctx, pid, timer, measure)
+    return (best_move, scores)
+
+
+cdef inline tuple _multi_get_best_move(SearchContext ctx, str name, unsigned int int_color, CythonMultiBitBoard board, moves, double alpha, double beta, int depth, evaluator, int timer):
+    cdef:
+        CythonMultiBitBoard search = board._copy()  # 評価関数には探索用の複製を渡す
+        MultiBits bb = search.bb, wb = search.wb, fd = search.fd
+        signed int bs = search._black_score, ws = search._white_score, last = search.geo.nbits - 1, size = search.geo.size, x, y
+        unsigned int int_color_next = <unsigned int>0 if int_color else <unsigned int>1, negascout = name == 'negascout'
+        double score
+    scores = {}
+    best_move = None
+    # 各手のスコア取得
+    for move in moves:
+        x, y = move
+        _multi_put_disc(search, int_color, last - (y * size + x))
+        if negascout:
+            score = -_multi_negascout_get_score(ctx, int_color_next, search, -beta, -alpha, depth-1, evaluator, timer, <unsigned int>0)
+        else:
+            score = -_multi_alphabeta_get_score(ctx, int_color_next, search, -beta, -alpha, depth-1, evaluator, timer, <unsigned int>0)
+        search.bb = bb
+        search.wb = wb
+        search.fd = fd
+        search._black_score = bs
+        search._white_score = ws
+        scores[move] = score
+        if ctx.timer_timeout:  # タイムアウト判定
+            best_move = move if best_move is None else best_move
+            break
+        if score > alpha:  # 最善手を更新
+            alpha = score
+            best_move = move
+        if alpha >= beta:  # 探索窓の上限を超えた
+            break
+    return best_move, scores
+
+
+cdef inline double _multi_evaluate(unsigned int int_color, CythonMultiBitBoard board, MultiBits* legal_moves, evaluator):
+    cdef:
+        MultiBits other
+        unsigned int n = board.geo.nwords
+    _multi_get_legal_moves_bits(board.geo, <unsigned int>0 if int_color else <unsigned int>1, &board.bb, &board.wb, &board.hb, &other)
+    if int_color:
+        return evaluator.evaluate('black', board, _multi_popcount(legal_moves, n), _multi_popcount(&other, n))
+    return -evaluator.evaluate('white', board, _multi_popcount(&other, n), _multi_popcount(legal_moves, n))
+
+
+cdef double _multi_alphabeta_get_score(SearchContext ctx, unsigned int int_color, CythonMultiBitBoard board, double alpha, double beta, unsigned int depth, evaluator, int t, unsigned int pas):
+    cdef:
+        MultiGeometry* g = board.geo
+        MultiBits legal_moves, bb, wb, fd
+        unsigned long long key = 0
+        unsigned int int_color_next = <unsigned int>0 if int_color else <unsigned int>1, use_tt = 0, i, shallow
+        signed int bs, ws, pos, timeout, best = -1
+        double score, lower, upper, alpha_ini = alpha, beta_ini = beta
+    # タイムアウト判定
+    if t:
+        timeout = check_timeout(ctx)
+        if timeout:
+            return timeout
+    # 探索ノード数カウント
+    ctx.measure_count += 1
+    # 合法手を取得
+    _multi_get_legal_moves_bits(g, int_color, &board.bb, &board.wb, &board.hb, &legal_moves)
+    # 最大深さに到達 or ゲーム終了(前回パス and 打てる場所なし)
+    if not depth or (pas and not _multi_popcount(&legal_moves, g.nwords)):
+        return _multi_evaluate(int_color, board, &legal_moves, evaluator)
+    # パスの場合
+    if not _multi_popcount(&legal_moves, g.nwords):
+        return -_multi_alphabeta_get_score(ctx, int_color_next, board, -beta, -alpha, depth, evaluator, t, <unsigned int>1)
+    # 置換表を参照
+    if ctx.tv.keys != NULL and depth >= ctx.tv.min_depth:
+        use_tt = <unsigned int>1
+        key = _tt_key_multi(&board.bb, &board.wb, int_color, g.nwords)
+        if _ttv_probe(&ctx.tv, key, depth, &alpha, &beta, &score, &best):
+            return score
+    # 浅い探索の結果から深い探索の結果を予測して枝刈り(Multi-ProbCut)
+    i = 0
+    while _probcut_window(&ctx.pc, <unsigned int>(board._black_score + board._white_score), depth, i, alpha, beta, &shallow, &lower, &upper):
+        if beta < POSITIVE_INFINITY and _multi_alphabeta_get_score(ctx, int_color, board, upper - 1, upper, shallow, evaluator, t, <unsigned int>0) >= upper:
+            return beta
+        if alpha > NEGATIVE_INFINITY and _multi_alphabeta_get_score(ctx, int_color, board, lower, lower + 1, shallow, evaluator, t, <unsigned int>0) <= lower:
+            return alpha
+        if ctx.timer_timeout:
+            return alpha
+        i += 1
+    # 評価値を算出(置換表の最善手を先に調べる)
+    bb = board.bb
+    wb = board.wb
+    fd = board.fd
+    bs = board._black_score
+    ws = board._white_score
+    if best < 0 and ctx.iid_depth and depth >= ctx.iid_depth:
+        # 置換表の手がない場合は浅い探索で最善手を求める(多重反復深化)
+        ctx.node_best = -1
+        _multi_alphabeta_get_score(ctx, int_color, board, alpha, beta, depth - IID_REDUCTION, evaluator, t, <unsigned int>0)
+        if ctx.timer_timeout:
+            return alpha
+        best = ctx.node_best
+    if best >= 0 and _multi_test(&legal_moves, best):
+        pos = best
+        legal_moves.w[pos >> 6] ^= <unsigned long long>1 << (pos & 63)
+    elif ctx.ov.enabled:
+        pos = _multi_order_pop(&ctx.ov, int_color, depth, &legal_moves, g.nwords)  # キラー手や履歴の大きい手を先に調べる
+    else:
+        pos = _multi_pop(&legal_moves, g.nwords)
+    while pos >= 0:
+        _multi_put_disc(board, int_color, pos)
+        score = -_multi_alphabeta_get_score(ctx, int_color_next, board, -beta, -alpha, depth-1, evaluator, t, <unsigned int>0)
+        board.bb = bb
+        board.wb = wb
+        board.fd = fd
+        board._black_score = bs
+        board._white_score = ws
+        if score > alpha:
+            alpha = score
+            best = pos
+        if ctx.timer_timeout:
+            return alpha
+        if alpha >= beta:  # 枝刈り
+            if ctx.ov.enabled:
+                _order_update(&ctx.ov, int_color, depth, best)  # beta cutを起こした手を覚える
+            break
+        if ctx.ov.enabled:
+            pos = _multi_order_pop(&ctx.ov, int_color, depth, &legal_moves, g.nwords)
+        else:
+            pos = _multi_pop(&legal_moves, g.nwords)
+    # 置換表に格納
+    if use_tt:
+        _ttv_store(&ctx.tv, key, depth, alpha, alpha_ini, beta_ini, best)
+    ctx.node_best = best
+    return alpha
+
+
+cdef double _multi_negascout_get_score(SearchContext ctx, unsigned int int_color, CythonMultiBitBoard board, double alpha, double beta, unsigned int depth, evaluator, int t, unsigned int pas):
+    cdef:
+        MultiGeometry* g = board.geo
+        MultiBits legal_moves, moves_b, moves_w, bb, wb, fd
+        unsigned long long key = 0
+        unsigned int int_color_next = <unsigned int>0 if int_color else <unsigned int>1, i, j, count = 0, index = 0, use_tt = 0, shallow
+        signed int[MAX_BOARD_SIZE*MAX_BOARD_SIZE] next_moves, possibilities
+        signed int bs, ws, pos, timeout, sign = -1, best = -1
+        double tmp, null_window, score, lower, upper, alpha_ini = alpha, beta_ini = beta
+    # タイムアウト判定
+    if t:
+        timeout = check_timeout(ctx)
+        if timeout:
+            return timeout
+    # 探索ノード数カウント
+    ctx.measure_count += 1
+    # 合法手を取得
+    _multi_get_legal_moves_bits(g, int_color, &board.bb, &board.wb, &board.hb, &legal_moves)
+    # 最大深さに到達 or ゲーム終了(前回パス and 打てる場所なし)
+    if not depth or (pas and not _multi_popcount(&legal_moves, g.nwords)):
+        return _multi_evaluate(int_color, board, &legal_moves, evaluator)
+    # パスの場合
+    if not _multi_popcount(&legal_moves, g.nwords):
+        return -_multi_negascout_get_score(ctx, int_color_next, board, -beta, -alpha, depth, evaluator, t, <unsigned int>1)
+    # 置換表を参照
+    if ctx.tv.keys != NULL and depth >= ctx.tv.min_depth:
+        use_tt = <unsigned int>1
+        key = _tt_key_multi(&board.bb, &board.wb, int_color, g.nwords)
+        if _ttv_probe(&ctx.tv, key, depth, &alpha, &beta, &score, &best):
+            return score
+    # 浅い探索の結果から深い探索の結果を予測して枝刈り(Multi-ProbCut)
+    i = 0
+    while _probcut_window(&ctx.pc, <unsigned int>(board._black_score + board._white_score), depth, i, alpha, beta, &shallow, &lower, &upper):
+        if beta < POSITIVE_INFINITY and _multi_negascout_get_score(ctx, int_color, board, upper - 1, upper, shallow, evaluator, t, <unsigned int>0) >= upper:
+            return beta
+        if alpha > NEGATIVE_INFINITY and _multi_negascout_get_score(ctx, int_color, board, lower, lower + 1, shallow, evaluator, t, <unsigned int>0) <= lower:
+            return alpha
+        if ctx.timer_timeout:
+            return alpha
+        i += 1
+    # 着手可能数に応じて手を並び替え
+    if int_color:
+        sign = <signed int>1
+    bb = board.bb
+    wb = board.wb
+    fd = board.fd
+    bs = board._black_score
+    ws = board._white_score
+    pos = _multi_pop(&legal_moves, g.nwords)
+    while pos >= 0:
+        _multi_put_disc(board, int_color, pos)
+        next_moves[count] = pos
+        _multi_get_legal_moves_bits(g, <unsigned int>1, &board.bb, &board.wb, &board.hb, &moves_b)
+        _multi_get_legal_moves_bits(g, <unsigned int>0, &board.bb, &board.wb, &board.hb, &moves_w)
+        possibilities[count] = (<signed int>_multi_popcount(&moves_b, g.nwords) - <signed int>_multi_popcount(&moves_w, g.nwords)) * sign
+        board.bb = bb
+        board.wb = wb
+        board._black_score = bs
+        board._white_score = ws
+        count += 1
+        pos = _multi_pop(&legal_moves, g.nwords)
+    board.fd = fd
+    _multi_sort_moves_by_possibility(count, next_moves, possibilities)
+    # キラー手を先に調べる(着手可能数の順の方が良いため履歴は使わない)
+    if ctx.ov.enabled:
+        _multi_order_move_killers(&ctx.ov, depth, count, next_moves)
+    # 置換表の手がない場合は浅い探索で最善手を求める(多重反復深化)
+    if best < 0 and ctx.iid_depth and depth >= ctx.iid_depth:
+        ctx.node_best = -1
+        _multi_negascout_get_score(ctx, int_color, board, alpha, beta, depth - IID_REDUCTION, evaluator, t, <unsigned int>0)
+        if ctx.timer_timeout:
+            return alpha
+        best = ctx.node_best
+    # 置換表の最善手を先に調べる
+    if best >= 0:
+        for i in range(count):
+            if next_moves[i] == best:
+                for j in range(i, 0, -1):
+                    next_moves[j] = next_moves[j-1]
+                next_moves[0] = best
+                break
+    # 次の手の探索
+    null_window = beta
+    for i in range(count):
+        if alpha < beta:
+            _multi_put_disc(board, int_color, next_moves[i])
+            tmp = -_multi_negascout_get_score(ctx, int_color_next, board, -null_window, -alpha, depth-1, evaluator, t, <unsigned int>0)
+            board.bb = bb
+            board.wb = wb
+            board.fd = fd
+            board._black_score = bs
+            board._white_score = ws
+            if alpha < tmp:
+                if tmp <= null_window and index:
+                    _multi_put_disc(board, int_color, next_moves[i])
+                    alpha = -_multi_negascout_get_score(ctx, int_color_next, board, -beta, -tmp, depth-1, evaluator, t, <unsigned int>0)
+                    board.bb = bb
+                    board.wb = wb
+                    board.fd = fd
+                    board._black_score = bs
+                    board._white_score = ws
+                    if ctx.timer_timeout:
+                        return alpha
+                else:
+                    alpha = tmp
+                best = next_moves[i]
+            null_window = alpha + 1
+            if alpha >= beta and ctx.ov.enabled and not ctx.timer_timeout:
+                _order_update(&ctx.ov, int_color, depth, best)  # beta cutを起こした手を覚える
+        else:
+            break
+        index += <unsigned int>1
+    # 置換表に格納
+    if use_tt and not ctx.timer_timeout:
+        _ttv_store(&ctx.tv, key, depth, alpha, alpha_ini, beta_ini, best)
+    ctx.node_best = best
+    return alpha
+
+
+cdef inline void _multi_sort_moves_by_possibility(unsigned int count, signed int* next_moves, signed int* possibilities) noexcept nogil:
+    # 着手可能数の降順に並べる(同じ値は元の順序を保つ)
+    cdef:
+        unsigned int i, j
+        signed int move, possibility
+    for i in range(1, count):
+        move = next_moves[i]
+        possibility = possibilities[i]
+        j = i
+        while j and possibilities[j-1] < possibility:
+            next_moves[j] = next_moves[j-1]
+            possibilities[j] = possibilities[j-1]
+            j -= 1
+        next_moves[j] = move
+        possibilities[j] = possibility
+
+
+cdef inline signed int _multi_table_get_score(table, CythonMultiBitBoard board):
+    cdef:
+        signed int pos = board.geo.nbits - 1, score = 0
+        unsigned int x, y
+    for y in range(board.geo.size):
+        row = table[y]
+        for x in range(board.geo.size):
+            if _multi_test(&board.bb, pos):
+                score += <signed int>row[x]
+            elif _multi_test(&board.wb, pos):
+                score -= <signed int>row[x]
+            pos -= 1
+    return score
+
+
+cdef inline _multi_montecarlo_next_move(SearchContext ctx, str color, CythonMultiBitBoard board, unsigned int count, str pid, int timer, int measure, unsigned long seed):
+    cdef:
+        CythonMultiBitBoard search = board._copy()
+        unsigned int int_color = color == 'black', index, i
+        signed int last = board.geo.nbits - 1, size = board.geo.size, x, y, max_score
+        signed int* positions
+        signed int* scores
+        unsigned long* rand_states
+    _start_search(ctx, pid, timer, measure)
+    moves = board.get_legal_moves(color)
+    index = len(moves)
+    if not index:
+        return None
+    positions = <signed int*>malloc(index * sizeof(signed int))
+    scores = <signed int*>calloc(index, sizeof(signed int))
+    rand_states = <unsigned long*>malloc(4 * index * sizeof(unsigned long))
+    try:
+        if positions == NULL or scores == NULL or rand_states == NULL:
+            raise MemoryError()
+        for i in range(index):
+            x, y = moves[i]
+            positions[i] = last - (y * size + x)
+            # seed(手ごとに乱数列を分ける)
+            init_rand(ctx, seed + i)
+            rand_states[4*i], rand_states[4*i+1], rand_states[4*i+2], rand_states[4*i+3] = ctx.tx, ctx.ty, ctx.tz, ctx.tw
+        with nogil:
+            _multi_montecarlo_playouts(ctx, search, int_color, index, count, positions, scores, rand_states)
+        max_score = scores[0]
+        best_move = moves[0]
+        for i in range(index):
+            if scores[i] > max_score:
+                max_score = scores[i]
+                best_move = moves[i]
+    finally:
+        free(positions)
+        free(scores)
+        free(rand_states)
+    _end_search(ctx, pid, timer, measure)
+    return best_move
+
+
+cdef inline void _multi_montecarlo_playouts(SearchContext ctx, CythonMultiBitBoard board, unsigned int int_color, unsigned int index, unsigned int count, signed int* positions, signed int* scores, unsigned long* rand_states) noexcept nogil:
+    cdef:
+        MultiBits bb = board.bb, wb = board.wb
+        signed int bs = board._black_score, ws = board._white_score
+        unsigned int i, j
+    for j in range(count):
+        for i in range(index):
+            # ボード情報と、この手の乱数の状態を復元
+            board.bb = bb
+            board.wb = wb
+            board._black_score = bs
+            board._white_score = ws
+            ctx.tx, ctx.ty, ctx.tz, ctx.tw = rand_states[4*i], rand_states[4*i+1], rand_states[4*i+2], rand_states[4*i+3]
+            scores[i] += _multi_playout(ctx, board, int_color, positions[i])
+            rand_states[4*i], rand_states[4*i+1], rand_states[4*i+2], rand_states[4*i+3] = ctx.tx, ctx.ty, ctx.tz, ctx.tw
+            # 探索ノード数カウント
+            ctx.measure_count += 1
+        if ctx.is_timer_enabled and check_timeout(ctx):
+            break
+    board.bb = bb
+    board.wb = wb
+    board._black_score = bs
+    board._white_score = ws
+
+
+cdef inline signed int _multi_playout(SearchContext ctx, CythonMultiBitBoard board, unsigned int int_color, signed int pos) noexcept nogil:
+    cdef:
+        MultiBits legal_moves
+        unsigned int turn = int_color, pass_count = 0, count, random_index, n = board.geo.nwords
+        signed int ret, random_put = pos
+    # 1手打つ
+    _multi_put_disc(board, int_color, pos)
+    # 決着までランダムに打つ
+    while True:
+        # 次の手番
+        turn = <unsigned int>0 if turn else <unsigned int>1
+        # 合法手を取得
+        _multi_get_legal_moves_bits(board.geo, turn, &board.bb, &board.wb, &board.hb, &legal_moves)
+        count = _multi_popcount(&legal_moves, n)
+        # 打てる場所なし
+        if not count:
+            pass_count += 1
+            if pass_count == 2:
+                break
+        # 打てる場所あり
+        else:
+            pass_count = 0
+            # ランダムに手を選ぶ
+            random_index = rand_int(ctx) % count + 1
+            for _ in range(random_index):
+                random_put = _multi_pop(&legal_moves, n)
+            # 1手打つ
+            _multi_put_disc(board, turn, random_put)
+    # 結果を返す
+    ret = -2
+    if (int_color and board._black_score > board._white_score) or (not int_color and board._white_score > board._black_score):
+        ret = 2
+    elif board._black_score == board._white_score:
+        ret = 1
+    return ret
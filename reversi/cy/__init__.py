@@ -1,19 +1,106 @@
 import os
-import pyximport
-pyximport.install()
+import sys
 
 
 IMPORTED = False
+ERROR = None
+
+
+def _import_reversi_methods():
+    """ReversiMethods import
+    """
+    from reversi.cy import prebuilt
+
+    # 1. ビルド済みの拡張モジュール(setup.py/build.bat/build.shでビルドしたもの、pyxが変わった後の古いものは使わない)
+    if prebuilt.is_inplace_current():
+        try:
+            from reversi.cy import ReversiMethods
+            return ReversiMethods
+        except ImportError:
+            pass
+
+    # 2. キャッシュ済みの拡張モジュール(Pythonのバージョンごと)
+    try:
+        return prebuilt.load_cached()
+    except ImportError:
+        if 'REVERSI_CY_NO_BUILD' in os.environ:
+            raise
+
+    # 3. キャッシュへビルドして読み込む(失敗した場合はpyximportでpyxを直接ビルドする)
+    try:
+        prebuilt.build()
+        return prebuilt.load_cached()
+    except Exception:
+        return prebuilt.load_pyximport()
+
+
+def get_status():
+    """get_status
+    """
+    # 実際に使用されるボードの実装(サイズの範囲ごと)と、Cythonモジュールの読み込み元を返す
+    from reversi.board import BitBoard, MIN_BOARD_SIZE, MAX_BOARD_SIZE
+    from reversi.cy import prebuilt
+
+    path, source = None, None
+    if IMPORTED:
+        path = os.path.abspath(sys.modules['reversi.cy.ReversiMethods'].__file__)
+        if os.path.dirname(path) == os.path.dirname(prebuilt.PYX_PATH):
+            source = 'inplace'
+        elif path == prebuilt.get_cached_path():
+            source = 'cache'
+        else:
+            source = 'pyximport'
+
+    return {
+        'imported': IMPORTED,
+        'source': source,
+        'path': path,
+        'bitboard': _get_bitboard_ranges(BitBoard, MIN_BOARD_SIZE, MAX_BOARD_SIZE),
+        'error': ERROR,
+        'python': sys.implementation.cache_tag,
+    }
+
+
+def _get_bitboard_ranges(bitboard, min_size, max_size):
+    """_get_bitboard_ranges
+    """
+    # 同じボードの実装が続くサイズをまとめて{'4-8': 'CythonBitBoard', '10-26': 'CythonMultiBitBoard'}の形で返す
+    ranges, start, name = {}, min_size, None
+    for size in range(min_size, max_size + 1, 2):
+        size_name = type(bitboard(size)).__name__
+        if name is not None and size_name != name:
+            ranges[f'{start}-{size - 2}'] = name
+            start = size
+        name = size_name
+    ranges[f'{start}-{max_size}'] = name
+
+    return ranges
+
+
+def is_multiword_bitboard(board):
+    """is_multiword_bitboard
+    """
+    # 複数ワードのCythonビットボード(サイズ10以上)の場合True
+    return IMPORTED and isinstance(board, CythonMultiBitBoard)
+
+
+def is_cython_bitboard(board):
+    """is_cython_bitboard
+    """
+    # Cythonのビットボード(CythonBitBoard/CythonMultiBitBoard)の場合True
+    return IMPORTED and isinstance(board, (CythonBitBoard, CythonMultiBitBoard))
 
 
 try:
     if 'FORCE_CYTHONMETHODS_IMPORT_ERROR' in os.environ:
         if os.environ['FORCE_CYTHONMETHODS_IMPORT_ERROR'] == 'RAISE':
-            raise ImportError
-    from reversi.cy.ReversiMethods import get_legal_moves, get_legal_moves_bits, get_bit_count, get_flippable_discs, put_disc, get_board_info, undo, CythonBitBoard  # noqa: E501
+            raise ImportError('FORCE_CYTHONMETHODS_IMPORT_ERROR')
+    _import_reversi_methods()
+    from reversi.cy.ReversiMethods import get_legal_moves, get_legal_moves_bits, get_bit_count, get_flippable_discs, put_disc, get_board_info, undo, CythonBitBoard, CythonMultiBitBoard  # noqa: E501
     IMPORTED = True
 
-except ImportError:
+except ImportError as e:
+    ERROR = str(e)
     if 'FORCE_CYTHONMETHODS_IMPORT_ERROR' not in os.environ:
         raise ImportError("failed to import Cython ReversiMethods")
 
@@ -27,4 +114,8 @@ __all__ = [
     'undo',
     'put_disc',
     'CythonBitBoard',
+    'CythonMultiBitBoard',
+    'get_status',
+    'is_multiword_bitboard',
+    'is_cython_bitboard',
 ]
@@ -0,0 +1,15 @@
+"""Build ReversiMethods into the cache and report the active board implementation
+
+usage: python -m reversi.cy [--force]
+"""
+
+import sys
+
+from reversi.cy import get_status
+from reversi.cy.prebuilt import build
+
+
+if __name__ == '__main__':
+    print('build   :', build(force='--force' in sys.argv[1:]))
+    for key, value in get_status().items():
+        print(f'{key:<8}:', value)
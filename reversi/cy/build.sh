@@ -0,0 +1,7 @@
+#!/bin/sh
+# build *.so (Linux)
+# usage: ./build.sh [python3.x ...]
+cd "$(dirname "$0")"
+for python in ${@:-python3}; do
+    "$python" setup.py build_ext --inplace || exit 1
+done
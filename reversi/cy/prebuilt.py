@@ -0,0 +1,149 @@
+"""Prebuilt ReversiMethods
+"""
+
+import os
+import sys
+import shutil
+import hashlib
+import tempfile
+import sysconfig
+import importlib.util
+from importlib.machinery import EXTENSION_SUFFIXES
+
+
+MODULE_NAME = 'reversi.cy.ReversiMethods'
+PYX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ReversiMethods.pyx')
+DIGEST_NAME = 'ReversiMethods.digest'  # その場でビルドした拡張モジュールの元のpyxのハッシュを記録するファイル
+
+
+def get_source_digest():
+    """get_source_digest
+    """
+    with open(PYX_PATH, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def write_inplace_digest(directory=None):
+    """write_inplace_digest
+    """
+    # その場でビルドした拡張モジュールの隣にpyxのハッシュを記録する(setup.pyでビルド後に呼ぶ)
+    directory = os.path.dirname(PYX_PATH) if directory is None else directory
+    path = os.path.join(directory, DIGEST_NAME)
+    with open(path, 'w') as f:
+        f.write(get_source_digest() + '\n')
+
+    return path
+
+
+def is_inplace_current(directory=None):
+    """is_inplace_current
+    """
+    # その場でビルドした拡張モジュールが現在のpyxからビルドされたものの場合True(記録がない場合は古いものとみなす)
+    directory = os.path.dirname(PYX_PATH) if directory is None else directory
+    try:
+        with open(os.path.join(directory, DIGEST_NAME)) as f:
+            return f.read().strip() == get_source_digest()
+    except OSError:
+        return False
+
+
+def get_cache_dir():
+    """get_cache_dir
+    """
+    # REVERSI_CY_CACHE_DIR > XDG_CACHE_HOME > ~/.cache の順で決定する
+    base = os.environ.get('REVERSI_CY_CACHE_DIR')
+    if not base:
+        base = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'reversi', 'cy')
+
+    # Pythonのバージョン、プラットフォーム、pyxの内容ごとに分ける
+    key = '-'.join([sys.implementation.cache_tag, sysconfig.get_platform(), get_source_digest()])
+
+    return os.path.join(base, key)
+
+
+def prune_cache(cache_dir):
+    """prune_cache
+    """
+    # 同じPythonのバージョンとプラットフォームで、pyxの内容が異なる古いキャッシュを削除する
+    base, key = os.path.split(cache_dir)
+    prefix = key[:-len(get_source_digest())]
+    for name in os.listdir(base):
+        if name != key and name.startswith(prefix) and len(name) == len(key):
+            shutil.rmtree(os.path.join(base, name), ignore_errors=True)
+
+
+def get_cached_path():
+    """get_cached_path
+    """
+    return os.path.join(get_cache_dir(), 'ReversiMethods' + EXTENSION_SUFFIXES[0])
+
+
+def load_cached():
+    """load_cached
+    """
+    path = get_cached_path()
+    if not os.path.isfile(path):
+        raise ImportError(f"no prebuilt ReversiMethods in cache: {path}")
+
+    return load_module(path)
+
+
+def load_pyximport():
+    """load_pyximport
+    """
+    # pyximportでpyxを直接ビルドして読み込む(その場に置かれた古い拡張モジュールを読まないため、importは使わない)
+    import pyximport
+
+    pyximport.uninstall(*pyximport.install())  # ビルドの設定だけを使い、importの仕組みには加えない
+
+    try:
+        path = pyximport.pyximport.build_module(MODULE_NAME, PYX_PATH, pyxbuild_dir=os.path.join(os.path.expanduser('~'), '.pyxbld'))
+    except Exception as e:
+        raise ImportError(f"failed to build ReversiMethods with pyximport: {e}") from e
+
+    return load_module(path)
+
+
+def load_module(path):
+    """load_module
+    """
+    spec = importlib.util.spec_from_file_location(MODULE_NAME, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[MODULE_NAME] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[MODULE_NAME]
+        raise
+
+    # 通常のimportと同様に親パッケージの属性にも設定する
+    parent, _, name = MODULE_NAME.rpartition('.')
+    setattr(sys.modules[parent], name, module)
+
+    return module
+
+
+def build(force=False):
+    """build
+    """
+    path = get_cached_path()
+    if os.path.isfile(path) and not force:
+        return path
+
+    import pyximport.pyxbuild as pyxbuild
+    from setuptools import Extension
+
+    # 一時ディレクトリでビルドした後に置き換える(並行ビルド時も不完全なファイルを読まないため)
+    cache_dir = os.path.dirname(path)
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(dir=cache_dir)
+    try:
+        so_path = pyxbuild.pyx_to_dll(PYX_PATH, Extension(MODULE_NAME, [PYX_PATH]), force_rebuild=1, build_in_temp=True, pyxbuild_dir=tmp_dir)
+        tmp_path = os.path.join(tmp_dir, os.path.basename(path))
+        shutil.copyfile(so_path, tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    prune_cache(cache_dir)
+
+    return path
@@ -1,7 +1,18 @@
-from distutils.core import setup
-from distutils.extension import Extension
+from setuptools import setup, Extension
 from Cython.Distutils import build_ext
 
+from prebuilt import write_inplace_digest
+
+
+class build_ext_digest(build_ext):
+    """build_ext + digest
+    """
+    def run(self):
+        super().run()
+        if self.inplace:
+            write_inplace_digest()  # 古いビルド済みモジュールと区別するため元のpyxのハッシュを記録する
+
+
 # Cythonized Methods
 module_names = [
     'ReversiMethods',
@@ -13,6 +24,6 @@ for name in module_names:
 
 setup(
     name='cython_reversi_methods',
-    cmdclass={'build_ext': build_ext},
+    cmdclass={'build_ext': build_ext_digest},
     ext_modules=ext_modules
 )
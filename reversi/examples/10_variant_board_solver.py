@@ -14,6 +14,8 @@ DO_BEST = True
 DO_MAX = True
 DO_SHORTEST = True
 VERIFY_RECORD = True
+WORKERS = os.cpu_count() or 1  # 終盤探索を並列に行うスレッド数
+SAVE_TRANSPOSITION_TABLE = False  # 最善手の探索結果をファイルに残し、次回の解析で引き継ぐ
 
 RANDOM_MATCH = 10000
 CONTROLL = {
@@ -218,7 +220,8 @@ if __name__ == '__main__':
             print('skip Pioneer')
             continue
 
-        solver = Solver(name, size, first, hole, ini_black, ini_white)
+        tt_path = './transposition_' + name + '.tt' if SAVE_TRANSPOSITION_TABLE else None
+        solver = Solver(name, size, first, hole, ini_black, ini_white, tt_path=tt_path, workers=WORKERS)
 
         squares = solver.squares
         blanks = solver.blanks
@@ -0,0 +1,87 @@
+"""Geometry
+"""
+
+from collections import namedtuple
+
+
+# 置ける場所の検出用マスク
+BitMask = namedtuple('BitMask', 'h v d u ur r br b bl l ul')
+
+
+class Geometry:
+    """Geometry
+
+           ボードサイズと穴の配置ごとに変わらない情報(ボード間で共有するため変更しないこと)
+    """
+    __slots__ = ('size', 'hole', 'all', 'playable', 'mask', 'bits', 'coordinates', 'corner', 'edge', 'labels', 'header')
+
+    def __init__(self, size, hole=0x0):
+        nbits = size * size
+        self.size = size
+        self.hole = hole
+        self.all = (1 << nbits) - 1          # 盤面全体
+        self.playable = self.all & ~hole     # 穴以外
+        self.mask = _get_bitmask(size)
+
+        # 座標(x, y) -> ビット、ビット位置 -> 座標(x, y)
+        self.bits = tuple(tuple(1 << (nbits - 1 - (y * size + x)) for x in range(size)) for y in range(size))
+        self.coordinates = tuple(((nbits - 1 - i) % size, (nbits - 1 - i) // size) for i in range(nbits))
+
+        # 四隅と辺(四隅を含む)
+        last = size - 1
+        self.corner = self.bits[0][0] | self.bits[0][last] | self.bits[last][0] | self.bits[last][last]
+        self.edge = self.all & ~self.mask.d
+
+        # 列のラベルと表示用の見出し
+        self.labels = tuple(chr(97 + i) for i in range(size))
+        self.header = '   ' + ' '.join(self.labels) + '\n'
+
+    def __reduce__(self):
+        # 復元時も共有のものを参照する
+        return (get_geometry, (self.size, self.hole))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+_bitmasks = {}
+_geometries = {}
+
+
+def _get_bitmask(size):
+    """_get_bitmask
+
+           置ける場所の検出用マスク(サイズごとに作成して使い回す)
+    """
+    if size not in _bitmasks:
+        _bitmasks[size] = BitMask(
+            int(''.join((['0'] + ['1'] * (size-2) + ['0']) * size), 2),                                      # 水平方向のマスク値
+            int(''.join(['0'] * size + ['1'] * size * (size-2) + ['0'] * size), 2),                          # 垂直方向のマスク値
+            int(''.join(['0'] * size + (['0'] + (['1'] * (size-2)) + ['0']) * (size-2) + ['0'] * size), 2),  # 斜め方向のマスク値
+            int(''.join(['1'] * size * (size-1) + ['0'] * size), 2),                                         # 上方向のマスク値
+            int(''.join((['0'] + ['1'] * (size-1)) * (size-1) + ['0'] * size), 2),                           # 右上方向のマスク値
+            int(''.join((['0'] + ['1'] * (size-1)) * size), 2),                                              # 右方向のマスク値
+            int(''.join(['0'] * size + (['0'] + ['1'] * (size-1)) * (size-1)), 2),                           # 右下方向のマスク値
+            int(''.join(['0'] * size + ['1'] * size * (size-1)), 2),                                         # 下方向のマスク値
+            int(''.join(['0'] * size + (['1'] * (size-1) + ['0']) * (size-1)), 2),                           # 左下方向のマスク値
+            int(''.join((['1'] * (size-1) + ['0']) * size), 2),                                              # 左方向のマスク値
+            int(''.join((['1'] * (size-1) + ['0']) * (size-1) + ['0'] * size), 2)                            # 左上方向のマスク値
+        )
+
+    return _bitmasks[size]
+
+
+def get_geometry(size, hole=0x0):
+    """get_geometry
+
+           サイズと穴の配置に対応するGeometryを返す(初回のみ作成し、以降は同じものを返す)
+    """
+    key = (size, hole)
+    geometry = _geometries.get(key)
+    if geometry is None:
+        geometry = _geometries[key] = Geometry(size, hole)
+
+    return geometry
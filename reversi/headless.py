@@ -0,0 +1,57 @@
+"""Headless
+"""
+
+import importlib
+
+from reversi.color import C
+from reversi.board import Board, BitBoard, PyListBoard, PyBitBoard, MIN_BOARD_SIZE, MAX_BOARD_SIZE
+from reversi.move import Move, LOWER, UPPER
+from reversi.variant import V
+from reversi.player import Player
+from reversi.display import ConsoleDisplay, NoneDisplay
+from reversi.game import Game
+from reversi.recorder import Recorder
+
+
+def get_strategy(name):
+    """get_strategy
+    """
+    # 戦略の定義モジュールのみを読み込む(GUI関連のモジュールは読み込まない)
+    return getattr(importlib.import_module('reversi.strategies'), name)
+
+
+def play(black, white, board=None, display=None):
+    """play
+    """
+    # GUIを使わずに1ゲームを実行し、結果を返す
+    game = Game(
+        Player(C.black, black.__class__.__name__, black),
+        Player(C.white, white.__class__.__name__, white),
+        board if board is not None else BitBoard(),
+        display if display is not None else NoneDisplay(),
+    )
+    game.play()
+
+    return game.result
+
+
+__all__ = [
+    'C',
+    'Board',
+    'BitBoard',
+    'PyListBoard',
+    'PyBitBoard',
+    'MIN_BOARD_SIZE',
+    'MAX_BOARD_SIZE',
+    'Move',
+    'LOWER',
+    'UPPER',
+    'V',
+    'Player',
+    'ConsoleDisplay',
+    'NoneDisplay',
+    'Game',
+    'Recorder',
+    'get_strategy',
+    'play',
+]
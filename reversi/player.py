@@ -2,6 +2,7 @@
 """
 
 from reversi.disc import D as d
+from reversi.BitBoardMethods import get_moves
 
 
 class Player:
@@ -26,10 +27,4 @@ class Player:
 
         # bits to array
         self.captures.clear()
-        size = board.size
-        mask = 1 << (size*size-1)
-        for y in range(size):
-            for x in range(size):
-                if captures & mask:
-                    self.captures += [(x, y)]
-                mask >>= 1
+        self.captures += get_moves(board.size, captures)
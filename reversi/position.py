@@ -0,0 +1,130 @@
+"""Position
+"""
+
+from reversi.color import C as c
+
+
+# 盤面の対称変換(座標(x, y)の変換先、lastはsize-1)
+TRANSFORMS = {
+    'identity': lambda x, y, last: (x, y),
+    'rotate90': lambda x, y, last: (last - y, x),              # 時計回りに90度
+    'rotate180': lambda x, y, last: (last - x, last - y),
+    'rotate270': lambda x, y, last: (y, last - x),
+    'flip_horizontal': lambda x, y, last: (last - x, y),       # 左右反転
+    'flip_vertical': lambda x, y, last: (x, last - y),         # 上下反転
+    'transpose': lambda x, y, last: (y, x),                    # 左上-右下の対角線で反転
+    'anti_transpose': lambda x, y, last: (last - y, last - x),  # 右上-左下の対角線で反転
+}
+
+# ビット列(左上から順の'0'/'1'の文字列)の並べ替えによる対称変換
+_TRANSFORM_STRINGS = {
+    'identity': lambda s, size: s,
+    'rotate90': lambda s, size: ''.join(s[x::size][::-1] for x in range(size)),
+    'rotate180': lambda s, size: s[::-1],
+    'rotate270': lambda s, size: ''.join(s[x::size] for x in range(size-1, -1, -1)),
+    'flip_horizontal': lambda s, size: ''.join(s[i:i+size][::-1] for i in range(0, size * size, size)),
+    'flip_vertical': lambda s, size: ''.join(s[i:i+size] for i in range(size * (size-1), -1, -size)),
+    'transpose': lambda s, size: ''.join(s[x::size] for x in range(size)),
+    'anti_transpose': lambda s, size: ''.join(s[x::size][::-1] for x in range(size-1, -1, -1)),
+}
+
+
+def transform_bits(bits, size, name):
+    """transform_bits
+
+           ビットボードを対称変換する
+    """
+    if not bits:
+        return 0
+    nbits = size * size
+    return int(_TRANSFORM_STRINGS[name](format(bits, '0' + str(nbits) + 'b'), size), 2)
+
+
+def transform_move(x, y, size, name):
+    """transform_move
+
+           座標を対称変換する
+    """
+    return TRANSFORMS[name](x, y, size - 1)
+
+
+class Position:
+    """Position
+
+           盤面と手番を表す変更不可の値(辞書のキーやプロセス間の受け渡しに使う)
+    """
+    __slots__ = ('black', 'white', 'hole', 'color', 'size', '_hash')
+
+    def __init__(self, black, white, hole=0x0, color=c.black, size=8):
+        setattr_ = object.__setattr__
+        setattr_(self, 'black', black)
+        setattr_(self, 'white', white)
+        setattr_(self, 'hole', hole)
+        setattr_(self, 'color', color)
+        setattr_(self, 'size', size)
+        setattr_(self, '_hash', hash((black, white, hole, color, size)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Position is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('Position is immutable')
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, Position):
+            return NotImplemented
+        return (self._hash == other._hash and self.black == other.black and self.white == other.white
+                and self.hole == other.hole and self.color == other.color and self.size == other.size)
+
+    def __reduce__(self):
+        return (Position, (self.black, self.white, self.hole, self.color, self.size))
+
+    def __repr__(self):
+        return f'Position(black={self.black:#x}, white={self.white:#x}, hole={self.hole:#x}, color={self.color!r}, size={self.size})'
+
+    @classmethod
+    def from_board(cls, board, color=c.black):
+        """from_board
+
+               ボードと手番からPositionを作る
+        """
+        black, white, hole = board.get_bitboard_info()
+        return cls(black, white, hole, color, board.size)
+
+    def to_board(self, board_class=None):
+        """to_board
+
+               Positionと同じ局面のボードを作る(board_class省略時はBitBoard)
+        """
+        if board_class is None:
+            from reversi.board import BitBoard
+            board_class = BitBoard
+        return board_class(self.size, hole=self.hole, ini_black=self.black, ini_white=self.white)
+
+    def transform(self, name):
+        """transform
+
+               対称変換したPositionを返す(nameはTRANSFORMSのキー)
+        """
+        size = self.size
+        return Position(transform_bits(self.black, size, name), transform_bits(self.white, size, name), transform_bits(self.hole, size, name), self.color, size)
+
+    def symmetries(self):
+        """symmetries
+
+               8通りの対称変換を{変換名: Position}で返す
+        """
+        return {name: self.transform(name) for name in TRANSFORMS}
+
+    def canonical(self):
+        """canonical
+
+               対称な局面の中で代表となるPositionとその変換名を返す
+        """
+        name, position = min(self.symmetries().items(), key=lambda item: (item[1].black, item[1].white, item[1].hole))
+        return position, name
@@ -49,13 +49,8 @@ class Recorder:
         return ''.join(record)
 
     def popcount(self, size, bits):
-        count = 0
-        mask = 1 << ((size**2)-1)
-        for _ in range(size**2):
-            if bits & mask:
-                count += 1
-            mask >>= 1
-        return count
+        from reversi.BitBoardMethods import get_bit_count
+        return get_bit_count(size, bits)
 
     def _get_move_bit(self, size, bb_pre, wb_pre, bb_now, wb_now):
         all_pre = bb_pre | wb_pre
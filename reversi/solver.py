@@ -7,13 +7,22 @@ import shutil
 
 from reversi import BitBoard, Game, Player, Recorder
 from reversi import C as c
-from reversi.strategies import Random, _EndGame_
+from reversi.strategies import Random, _EndGame_, TranspositionTable, ProofNumberSearch
+
+
+SHORTEST_MIN_BLANKS = 2  # 最短勝ちとみなす終局時の空きマスの下限(ReversiMethods.pyxの終盤探索で最短勝ちの報酬を与える条件と同じ)
 
 
 class Solver:
     """ボード解析ツール"""
-    def __init__(self, name=None, size=None, first=None, hole=None, ini_black=None, ini_white=None, board=None):
+    def __init__(self, name=None, size=None, first=None, hole=None, ini_black=None, ini_white=None, board=None, tt_path=None, tt_size=0x400000, workers=1, backend='endgame', pn_size=0x100000, pn_nodes=None):  # noqa: E501
         self.name = name
+        self.tt_path = tt_path  # 最善手の探索結果を残す置換表ファイル(中断後や同じ盤面の再解析で引き継ぐ)
+        self.tt_size = tt_size  # 置換表ファイルのエントリ数
+        self.workers = workers  # 終盤探索を並列に行うスレッド数
+        self.backend = backend  # 勝敗と最短勝ちの探索方法('endgame':終盤探索, 'dfpn':証明数探索)
+        self.pn_size = pn_size  # 証明数探索の局面表のエントリ数
+        self.pn_nodes = pn_nodes  # 証明数探索で1回の証明に調べる局面数の上限(Noneの場合は無制限)
         self.size = size
         self.first = first
         self.hole = hole
@@ -109,11 +118,16 @@ class Solver:
         return result
 
     def get_best_match_winner(self):
-        black = Player(c.black, 'black', _EndGame_(depth=64))
-        white = Player(c.white, 'white', _EndGame_(depth=64))
+        tt = TranspositionTable(size=self.tt_size, path=self.tt_path) if self.tt_path else None
+        black = Player(c.black, 'black', _EndGame_(depth=64, workers=self.workers, tt=tt))
+        white = Player(c.white, 'white', _EndGame_(depth=64, workers=self.workers, tt=tt))
         self.board = BitBoard(size=self.size, hole=self.hole, ini_black=self.ini_black, ini_white=self.ini_white)
         game = Game(black, white, self.board, color=self.first)
-        game.play()
+        try:
+            game.play()
+        finally:
+            if tt is not None:
+                tt.close()
         winlose = 'draw'
         if game.result.winlose == Game.BLACK_WIN:
             winlose = 'black'
@@ -126,6 +140,43 @@ class Solver:
         print('           record :', record)
         return winlose, score, record
 
+    def get_wld_winner(self):
+        # 石差は求めず、最善を尽くした場合の勝敗だけを求める
+        tt = TranspositionTable(size=self.tt_size, path=self.tt_path) if self.tt_path else None
+        self.board = BitBoard(size=self.size, hole=self.hole, ini_black=self.ini_black, ini_white=self.ini_white)
+        color, score = self.first, self.board._black_score - self.board._white_score
+        moves = self.board.get_legal_moves(color)
+        if not moves:
+            color = c.white if color == c.black else c.black
+            moves = self.board.get_legal_moves(color)
+        try:
+            if moves and self.backend == 'dfpn':
+                # 黒の勝ちと白の勝ちを順に証明する(どちらかが分からない場合は勝敗不明)
+                pns = ProofNumberSearch(table_size=self.pn_size, max_nodes=self.pn_nodes)
+                black_win = pns.prove(color, self.board, c.black)
+                white_win = pns.prove(color, self.board, c.white) if black_win is False else False
+                if black_win is None or white_win is None:
+                    score = None
+                else:
+                    score = 1 if black_win else -1 if white_win else 0
+            elif moves:
+                if tt is not None:
+                    tt.new_search(self.board)
+                _, scores = _EndGame_(depth=64, role='wld', tt=tt).get_best_move(color, self.board, moves)
+                score = max(scores.values()) if color == c.black else -max(scores.values())
+        finally:
+            if tt is not None:
+                tt.close()
+        winlose = 'draw'
+        if score is None:
+            winlose = 'unknown'
+        elif score > 0:
+            winlose = 'black'
+        elif score < 0:
+            winlose = 'white'
+        print('wld winner :', winlose)
+        return winlose
+
     def get_max_winner(self):
         ret = []
         roles = ['black_max', 'white_max']
@@ -134,8 +185,8 @@ class Solver:
             print()
             print(now.strftime('%Y/%m/%d %H:%M:%S'))
 
-            black = Player(c.black, 'black', _EndGame_(depth=64, role=role))
-            white = Player(c.white, 'white', _EndGame_(depth=64, role=role))
+            black = Player(c.black, 'black', _EndGame_(depth=64, role=role, workers=self.workers))
+            white = Player(c.white, 'white', _EndGame_(depth=64, role=role, workers=self.workers))
             self.board = BitBoard(size=self.size, hole=self.hole, ini_black=self.ini_black, ini_white=self.ini_white)
             game = Game(black, white, self.board, color=self.first)
 
@@ -172,12 +223,23 @@ class Solver:
             # shotest move check
             depth, max_depth = 0, limit_depth
             move_count, record = '"?"', "?"
-            for d in range(1, max_depth + 1):
-                moves = self.board.get_legal_moves(self.first)
-                _, scores, record = _EndGame_(role=role).get_best_record(self.first, self.board, moves, depth=d)
-                if len([s for s in scores.values() if s > 10000]):
+            if self.backend == 'dfpn':
+                # 両者とも攻め方の勝ちを目指す手順を、手数の上限を増やしながら証明数探索で探す
+                attacker = c.black if role == 'black_shortest' else c.white
+                d, moves = ProofNumberSearch(table_size=self.pn_size).get_shortest_win(self.first, self.board, attacker, max_depth, cooperative=True)
+                if d is not None and self.blanks - d >= SHORTEST_MIN_BLANKS:  # 終盤探索と同じく空きマスが残る勝ちのみ
                     depth = d
-                    break
+                    board = BitBoard(size=self.size, hole=self.hole, ini_black=self.ini_black, ini_white=self.ini_white)
+                    for color, move in moves:
+                        board.put_disc(color, *move)
+                    record = str(Recorder(board))
+            else:
+                for d in range(1, max_depth + 1):
+                    moves = self.board.get_legal_moves(self.first)
+                    _, scores, record = _EndGame_(role=role).get_best_record(self.first, self.board, moves, depth=d)
+                    if len([s for s in scores.values() if s > 10000]):
+                        depth = d
+                        break
 
             if depth:
                 move_count = len(record) // 2
@@ -4,6 +4,10 @@
 import time
 
 from reversi.strategies.common import Timer, Measure
+from reversi.strategies.common.transposition import get_ordered_moves
+
+
+IID_REDUCTION = 2  # 置換表の手がない局面で最善手を求める浅い探索の深さの減らし幅(多重反復深化)
 
 
 def get_score(alphabeta, color, board, alpha, beta, depth, pid):
@@ -72,29 +76,60 @@ def _get_score(func, alphabeta, color, board, alpha, beta, depth, pid):
     if not legal_moves_bits:
         return -func(func, alphabeta, next_color, board, -beta, -alpha, depth, pid)
 
-    # 評価値を算出
+    # 置換表を参照
+    tt, key, best = alphabeta.tt, None, -1
+    if tt is not None and depth >= tt.min_depth:
+        key, alpha_ini, beta_ini = tt.get_key(board, color), alpha, beta
+        score, alpha, beta, best = tt.lookup(key, depth, alpha, beta)
+        if score is not None:
+            return score
+
+    # 浅い探索の結果から深い探索の結果を予測して枝刈り(Multi-ProbCut)
+    if alphabeta.probcut is not None:
+        for shallow, lower, upper in alphabeta.probcut.get_windows(board, depth, alpha, beta):
+            if upper is not None and func(func, alphabeta, color, board, upper - 1, upper, shallow, pid) >= upper:
+                return beta
+            if lower is not None and func(func, alphabeta, color, board, lower, lower + 1, shallow, pid) <= lower:
+                return alpha
+            if Timer.is_timeout(pid):
+                return alpha
+
+    # 置換表の手がない場合は浅い探索で最善手を求める(多重反復深化)
+    if alphabeta.iid and depth >= max(alphabeta.iid, IID_REDUCTION + 1) and not (best >= 0 and legal_moves_bits >> best & 1):
+        alphabeta._node_best = -1
+        func(func, alphabeta, color, board, alpha, beta, depth - IID_REDUCTION, pid)
+        if Timer.is_timeout(pid):
+            return alpha
+        best = alphabeta._node_best
+
+    # 評価値を算出(置換表の最善手を先に調べる)
     size = board.size
-    mask = 1 << ((size**2)-1)
-    for y in range(size):
-        skip = False
-        for x in range(size):
-            if legal_moves_bits & mask:
-                board.put_disc(color, x, y)
-                score = -func(func, alphabeta, next_color, board, -beta, -alpha, depth-1, pid)
-                board.undo()
-
-                if Timer.is_timeout(pid):
-                    return alpha
-
-                alpha = max(alpha, score)  # 最大値を選択
-                if alpha >= beta:  # 枝刈り
-                    skip = True
-                    break
-            mask >>= 1
-
-        if skip:
+    nbits = size * size
+    orderer = alphabeta.orderer
+    next_moves = get_ordered_moves(legal_moves_bits, size, best)
+    if orderer is not None:
+        next_moves = orderer.sort_moves(color, depth, next_moves, size, best)  # キラー手や履歴の大きい手を先に調べる
+    for x, y in next_moves:
+        board.put_disc(color, x, y)
+        score = -func(func, alphabeta, next_color, board, -beta, -alpha, depth-1, pid)
+        board.undo()
+
+        if Timer.is_timeout(pid):
+            return alpha
+
+        if score > alpha:  # 最大値を選択
+            alpha = score
+            best = nbits - 1 - (y * size + x)
+        if alpha >= beta:  # 枝刈り
+            if orderer is not None:
+                orderer.update(color, depth, best)  # beta cutを起こした手を覚える
             break
 
+    # 置換表に格納
+    if key is not None:
+        tt.store(key, depth, alpha, alpha_ini, beta_ini, best)
+    alphabeta._node_best = best
+
     return alpha
 
 
@@ -6,6 +6,9 @@ import time
 from reversi.strategies.common import Timer, Measure
 
 
+IID_REDUCTION = 2  # 置換表の手がない局面で最善手を求める浅い探索の深さの減らし幅(多重反復深化)
+
+
 def get_score(negascout, color, board, alpha, beta, depth, pid):
     """get_score
     """
@@ -73,6 +76,24 @@ def _get_score(func, negascout, color, board, alpha, beta, depth, pid):
     if not legal_moves_bits:
         return -func(func, negascout, next_color, board, -beta, -alpha, depth, pid=pid)
 
+    # 置換表を参照
+    tt, key, best = negascout.tt, None, -1
+    if tt is not None and depth >= tt.min_depth:
+        key, alpha_ini, beta_ini = tt.get_key(board, color), alpha, beta
+        score, alpha, beta, best = tt.lookup(key, depth, alpha, beta)
+        if score is not None:
+            return score
+
+    # 浅い探索の結果から深い探索の結果を予測して枝刈り(Multi-ProbCut)
+    if negascout.probcut is not None:
+        for shallow, lower, upper in negascout.probcut.get_windows(board, depth, alpha, beta):
+            if upper is not None and func(func, negascout, color, board, upper - 1, upper, shallow, pid) >= upper:
+                return beta
+            if lower is not None and func(func, negascout, color, board, lower, lower + 1, shallow, pid) <= lower:
+                return alpha
+            if Timer.is_timeout(pid):
+                return alpha
+
     # 着手可能数に応じて手を並び替え
     tmp = []
     size = board.size
@@ -89,6 +110,26 @@ def _get_score(func, negascout, color, board, alpha, beta, depth, pid):
 
     next_moves = [i[0] for i in sorted(tmp, reverse=True, key=lambda x: x[1])]
 
+    # キラー手を先に調べる(着手可能数の順の方が良いため履歴は使わない)
+    orderer = negascout.orderer
+    if orderer is not None:
+        next_moves = orderer.move_killers(depth, next_moves, size)
+
+    # 置換表の手がない場合は浅い探索で最善手を求める(多重反復深化)
+    if negascout.iid and depth >= max(negascout.iid, IID_REDUCTION + 1) and not (best >= 0 and legal_moves_bits >> best & 1):
+        negascout._node_best = -1
+        func(func, negascout, color, board, alpha, beta, depth - IID_REDUCTION, pid=pid)
+        if Timer.is_timeout(pid):
+            return alpha
+        best = negascout._node_best
+
+    # 置換表の最善手を先に調べる
+    nbits = size * size
+    if best >= 0 and legal_moves_bits >> best & 1:
+        first = ((nbits - 1 - best) % size, (nbits - 1 - best) // size)
+        next_moves.remove(first)
+        next_moves.insert(0, first)
+
     # NegaScout法
     tmp, null_window, index = None, beta, 0
     for move in next_moves:
@@ -107,13 +148,21 @@ def _get_score(func, negascout, color, board, alpha, beta, depth, pid):
                         return alpha
                 else:
                     alpha = tmp
+                best = nbits - 1 - (move[1] * size + move[0])
 
             null_window = alpha + 1
+            if alpha >= beta and orderer is not None and not Timer.is_timeout(pid):
+                orderer.update(color, depth, best)  # beta cutを起こした手を覚える
         else:
             break
 
         index += 1
 
+    # 置換表に格納
+    if key is not None and not Timer.is_timeout(pid):
+        tt.store(key, depth, alpha, alpha_ini, beta_ini, best)
+    negascout._node_best = best
+
     return alpha
 
 
@@ -1,29 +1,67 @@
-from ..strategies.common import CPU_TIME, Timer, Measure, AbstractStrategy, AbstractScorer, AbstractEvaluator, AbstractOrderer, AbstractSelector
-from ..strategies.user import ConsoleUserInput, WindowUserInput
-from ..strategies.easy import Random, Greedy, Unselfish, SlowStarter
-from ..strategies.table import Table
-from ..strategies.montecarlo import MonteCarlo
-from ..strategies.mcts import Mcts, Node
-from ..strategies.minmax import _MinMax_, MinMax
-from ..strategies.negamax import _NegaMax_, _NegaMax, NegaMax_, NegaMax
-from ..strategies.alphabeta import _AlphaBeta_, _AlphaBeta, AlphaBeta_, AlphaBeta, _AlphaBetaN_, _AlphaBetaN, AlphaBetaN_, AlphaBetaN  # noqa: E501
-from ..strategies.blank import _Blank_, _Blank, Blank_, Blank
-from ..strategies.endgame import _EndGame_, _EndGame, EndGame_, EndGame
-from ..strategies.negascout import _NegaScout_, _NegaScout, NegaScout_, NegaScout
-from ..strategies.switch import _Switch_, Switch
-from ..strategies.joseki import _Joseki_, _Usagi_, Usagi, _Tora_, Tora, _Ushi_, Ushi, _Nezumi_, Nezumi, _Neko_, Neko, _Hitsuji_, Hitsuji
-from ..strategies.fullreading import _FullReading_, _FullReading, FullReading_, FullReading
-from ..strategies.iterative import IterativeDeepning_, IterativeDeepning
-from ..strategies.randomopening import _RandomOpening_, RandomOpening
-from ..strategies.external import External
-from ..strategies.proto import MinMax2, NegaMax3, AlphaBeta4, AB_T4, AB_TI
-from ..strategies.custom import MonteCarlo30, MonteCarlo100, MonteCarlo1000, MinMax1_T, MinMax2_T, MinMax3_T, MinMax4_T, MinMax1_TP, MinMax2_TP, MinMax3_TP, MinMax4_TP, MinMax1_TPO, MinMax2_TPO, MinMax3_TPO, MinMax4_TPO, MinMax1_TPW, MinMax2_TPW, MinMax3_TPW, MinMax4_TPW, MinMax1_TPOW, MinMax2_TPOW, MinMax3_TPOW, MinMax4_TPOW, MinMax1_TPWE, MinMax2_TPWE, MinMax3_TPWE, MinMax4_TPWE, MinMax1_TPWEC, MinMax2_TPWEC, MinMax3_TPWEC, MinMax4_TPWEC, MinMax1_PWE, MinMax2_PWE, MinMax3_PWE, MinMax4_PWE, NegaMax1_TPW, NegaMax2_TPW, NegaMax3_TPW, NegaMax4_TPW, NegaMax1_TPOW, NegaMax2_TPOW, NegaMax3_TPOW, NegaMax4_TPOW, AlphaBeta_TPW, AlphaBeta_TPWE, AlphaBeta_TPWE_, AlphaBeta_TPWEC, AlphaBeta1_TPW, AlphaBeta2_TPW, AlphaBeta3_TPW, AlphaBeta4_TPW, AlphaBeta1_TPWE, AlphaBeta2_TPWE, AlphaBeta3_TPWE, AlphaBeta4_TPWE, NegaScout_TPW, NegaScout_TPWE, NegaScout_TPWEB, NegaScout1_TPW, NegaScout2_TPW, NegaScout3_TPW, NegaScout4_TPW, NegaScout1_TPOW, NegaScout2_TPOW, NegaScout3_TPOW, NegaScout4_TPOW, NegaScout1_TPWE, NegaScout2_TPWE, NegaScout3_TPWE, NegaScout4_TPWE, AbI_B_TPW, AbI_B_TPWE, AbI_PCB_TPWE, AbI_B_TPWE_, AbI_B_TPWEC, NsI_B_TPW, NsI_B_TPWE, NsI_B_TPWEB, SwitchAbI_B_TPWE, SwitchNsI_B_TPWE, SwitchNsI_B_TPWE_F, SwitchNsI_B_TPWEB, SwitchNsI_B_TPWE_Type2, Switch_Blank8_EndGame16, Switch_BlankI_EndGame16, Switch_Negascout8_TPWEB_EndGame16, MinMax2F9_TPWE, AlphaBeta4F9_TPW, AlphaBeta4F10_TPW, AbIF9_B_TPW, AbIF9_B_TPWE, AbIF9_PCB_TPWE, AbIF10_B_TPWE, AbIF10_PCB_TPWE, AbIF9_B_TPWE_, AbIF9_B_TPWEC, NsIF9_B_TPW, NsIF9_B_TPWE, NsIF10_B_TPWE, NsIF10_B_TPWEB, NsIF10_B_TPW, NsIF11_B_TPW, NsIF12_B_TPW, SwitchAbIF9_B_TPWE, SwitchNsIF9_B_TPWE, SwitchNsIF10_B_TPWE, SwitchNsIF10_B_TPWE_F, SwitchNsIF10_B_TPWEB, SwitchNsIF10_B_TPWE_Type2, RandomF11, AlphaBeta4J_TPW, AlphaBeta4F9J_TPW, AlphaBeta4F10J_TPW, AbIF9J_B_TPW, AbIF9J_B_TPWE, AbIF9J_B_TPWE_, AbIF9J_PCB_TPWE, AbIF10J_B_TPWE, AbIF10J_PCB_TPWE, AbIF9J_B_TPWEC, NsIF9J_B_TPW, NsIF9J_B_TPWE, NsIF10J_B_TPWE, NsIF10J_B_TPWEB, SwitchAbIF9J_B_TPWE, SwitchNsIF9J_B_TPWE, SwitchNsIF10J_B_TPWE, SwitchNsIF10J_B_TPWE_F, SwitchNsIF10J_B_TPWEB, SwitchNsIF10J_B_TPWE_Type2, SwitchJ_Blank8_EndGame16, SwitchJ_BlankI_EndGame16, SwitchJ_Negascout8_TPWEB_EndGame16, MonteCarlo_EndGame  # noqa: E501
+import importlib
+from ..strategies.common import CPU_TIME, Timer, Measure, TranspositionTable, ProbCut, get_selfplay_positions
+from ..strategies.common import AbstractStrategy, AbstractScorer, AbstractEvaluator, AbstractOrderer, AbstractSelector
+
+# 戦略モジュールと公開名(初回アクセス時に読み込む)
+_LAZY_MODULES = {
+    'user': ('ConsoleUserInput', 'WindowUserInput'),
+    'easy': ('Random', 'Greedy', 'Unselfish', 'SlowStarter'),
+    'table': ('Table',),
+    'montecarlo': ('MonteCarlo',),
+    'mcts': ('Mcts', 'Node'),
+    'minmax': ('_MinMax_', 'MinMax'),
+    'negamax': ('_NegaMax_', '_NegaMax', 'NegaMax_', 'NegaMax'),
+    'alphabeta': ('_AlphaBeta_', '_AlphaBeta', 'AlphaBeta_', 'AlphaBeta', '_AlphaBetaN_', '_AlphaBetaN', 'AlphaBetaN_', 'AlphaBetaN'),
+    'blank': ('_Blank_', '_Blank', 'Blank_', 'Blank'),
+    'endgame': ('_EndGame_', '_EndGame', 'EndGame_', 'EndGame'),
+    'negascout': ('_NegaScout_', '_NegaScout', 'NegaScout_', 'NegaScout'),
+    'switch': ('_Switch_', 'Switch'),
+    'joseki': ('_Joseki_', '_Usagi_', 'Usagi', '_Tora_', 'Tora', '_Ushi_', 'Ushi', '_Nezumi_', 'Nezumi', '_Neko_', 'Neko', '_Hitsuji_', 'Hitsuji'),
+    'fullreading': ('_FullReading_', '_FullReading', 'FullReading_', 'FullReading'),
+    'iterative': ('IterativeDeepning_', 'IterativeDeepning'),
+    'mtdf': ('MTDf_', 'MTDf'),
+    'lazysmp': ('LazySMP_', 'LazySMP'),
+    'proofnumber': ('ProofNumberSearch', 'DfPn_', 'DfPn'),
+    'randomopening': ('_RandomOpening_', 'RandomOpening'),
+    'external': ('External',),
+    'proto': ('MinMax2', 'NegaMax3', 'AlphaBeta4', 'AB_T4', 'AB_TI'),
+    'custom': ('MonteCarlo30', 'MonteCarlo100', 'MonteCarlo1000', 'MinMax1_T', 'MinMax2_T', 'MinMax3_T', 'MinMax4_T', 'MinMax1_TP', 'MinMax2_TP', 'MinMax3_TP', 'MinMax4_TP', 'MinMax1_TPO', 'MinMax2_TPO', 'MinMax3_TPO', 'MinMax4_TPO', 'MinMax1_TPW', 'MinMax2_TPW', 'MinMax3_TPW', 'MinMax4_TPW', 'MinMax1_TPOW', 'MinMax2_TPOW', 'MinMax3_TPOW', 'MinMax4_TPOW', 'MinMax1_TPWE', 'MinMax2_TPWE', 'MinMax3_TPWE', 'MinMax4_TPWE', 'MinMax1_TPWEC', 'MinMax2_TPWEC', 'MinMax3_TPWEC', 'MinMax4_TPWEC', 'MinMax1_PWE', 'MinMax2_PWE', 'MinMax3_PWE', 'MinMax4_PWE', 'NegaMax1_TPW', 'NegaMax2_TPW', 'NegaMax3_TPW', 'NegaMax4_TPW', 'NegaMax1_TPOW', 'NegaMax2_TPOW', 'NegaMax3_TPOW', 'NegaMax4_TPOW', 'AlphaBeta_TPW', 'AlphaBeta_TPWE', 'AlphaBeta_TPWE_', 'AlphaBeta_TPWEC', 'AlphaBeta1_TPW', 'AlphaBeta2_TPW', 'AlphaBeta3_TPW', 'AlphaBeta4_TPW', 'AlphaBeta1_TPWE', 'AlphaBeta2_TPWE', 'AlphaBeta3_TPWE', 'AlphaBeta4_TPWE', 'NegaScout_TPW', 'NegaScout_TPWE', 'NegaScout_TPWEB', 'NegaScout1_TPW', 'NegaScout2_TPW', 'NegaScout3_TPW', 'NegaScout4_TPW', 'NegaScout1_TPOW', 'NegaScout2_TPOW', 'NegaScout3_TPOW', 'NegaScout4_TPOW', 'NegaScout1_TPWE', 'NegaScout2_TPWE', 'NegaScout3_TPWE', 'NegaScout4_TPWE', 'AbI_B_TPW', 'AbI_B_TPWE', 'AbI_PCB_TPWE', 'AbI_B_TPWE_', 'AbI_B_TPWEC', 'NsI_B_TPW', 'NsI_B_TPWE', 'NsI_B_TPWEB', 'MtdfI_B_TPWE', 'SwitchAbI_B_TPWE', 'SwitchNsI_B_TPWE', 'SwitchNsI_B_TPWE_F', 'SwitchNsI_B_TPWEB', 'SwitchNsI_B_TPWE_Type2', 'Switch_Blank8_EndGame16', 'Switch_BlankI_EndGame16', 'Switch_Negascout8_TPWEB_EndGame16', 'MinMax2F9_TPWE', 'AlphaBeta4F9_TPW', 'AlphaBeta4F10_TPW', 'AbIF9_B_TPW', 'AbIF9_B_TPWE', 'AbIF9_PCB_TPWE', 'AbIF10_B_TPWE', 'AbIF10_PCB_TPWE', 'AbIF9_B_TPWE_', 'AbIF9_B_TPWEC', 'NsIF9_B_TPW', 'NsIF9_B_TPWE', 'NsIF10_B_TPWE', 'NsIF10_B_TPWEB', 'NsIF10_B_TPW', 'NsIF11_B_TPW', 'NsIF12_B_TPW', 'SwitchAbIF9_B_TPWE', 'SwitchNsIF9_B_TPWE', 'SwitchNsIF10_B_TPWE', 'SwitchNsIF10_B_TPWE_F', 'SwitchNsIF10_B_TPWEB', 'SwitchNsIF10_B_TPWE_Type2', 'RandomF11', 'AlphaBeta4J_TPW', 'AlphaBeta4F9J_TPW', 'AlphaBeta4F10J_TPW', 'AbIF9J_B_TPW', 'AbIF9J_B_TPWE', 'AbIF9J_B_TPWE_', 'AbIF9J_PCB_TPWE', 'AbIF10J_B_TPWE', 'AbIF10J_PCB_TPWE', 'AbIF9J_B_TPWEC', 'NsIF9J_B_TPW', 'NsIF9J_B_TPWE', 'NsIF10J_B_TPWE', 'NsIF10J_B_TPWEB', 'SwitchAbIF9J_B_TPWE', 'SwitchNsIF9J_B_TPWE', 'SwitchNsIF10J_B_TPWE', 'SwitchNsIF10J_B_TPWE_F', 'SwitchNsIF10J_B_TPWEB', 'SwitchNsIF10J_B_TPWE_Type2', 'SwitchJ_Blank8_EndGame16', 'SwitchJ_BlankI_EndGame16', 'SwitchJ_Negascout8_TPWEB_EndGame16', 'MonteCarlo_EndGame'),  # noqa: E501
+}
+_LAZY_ATTRS = {name: module for module, names in _LAZY_MODULES.items() for name in names}
+
+# 初回アクセス時に読み込むサブパッケージ
+_LAZY_SUBMODULES = (
+    'coordinator',
+    'AlphaBetaMethods',
+    'NegaScoutMethods',
+    'EndGameMethods',
+    'BlankMethods',
+    'MonteCarloMethods',
+    'TableMethods',
+)
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module('.' + _LAZY_ATTRS[name], __name__), name)
+        globals()[name] = value
+        return value
+    if name in _LAZY_MODULES or name in _LAZY_SUBMODULES:
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 
 __all__ = [
     'CPU_TIME',
     'Timer',
     'Measure',
+    'TranspositionTable',
+    'ProbCut',
+    'get_selfplay_positions',
     'AbstractStrategy',
     'AbstractScorer',
     'AbstractEvaluator',
@@ -131,6 +169,13 @@ __all__ = [
     'NegaScout4_TPWE',
     'IterativeDeepning_',
     'IterativeDeepning',
+    'MTDf_',
+    'MTDf',
+    'LazySMP_',
+    'LazySMP',
+    'ProofNumberSearch',
+    'DfPn_',
+    'DfPn',
     'AbI_B_TPW',
     'AbI_B_TPWE',
     'AbI_PCB_TPWE',
@@ -139,6 +184,7 @@ __all__ = [
     'NsI_B_TPW',
     'NsI_B_TPWE',
     'NsI_B_TPWEB',
+    'MtdfI_B_TPWE',
     'SwitchAbI_B_TPWE',
     'SwitchNsI_B_TPWE',
     'SwitchNsI_B_TPWE_F',
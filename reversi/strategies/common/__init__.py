@@ -1,6 +1,8 @@
 from ...strategies.common.cputime import CPU_TIME
 from ...strategies.common.timer import Timer
 from ...strategies.common.measure import Measure
+from ...strategies.common.transposition import TranspositionTable
+from ...strategies.common.probcut import ProbCut, get_selfplay_positions
 from ...strategies.common.abstract import AbstractStrategy, AbstractScorer, AbstractEvaluator, AbstractOrderer, AbstractSelector
 
 
@@ -8,6 +10,9 @@ __all__ = [
     'CPU_TIME',
     'Timer',
     'Measure',
+    'TranspositionTable',
+    'ProbCut',
+    'get_selfplay_positions',
     'AbstractStrategy',
     'AbstractScorer',
     'AbstractEvaluator',
@@ -0,0 +1,139 @@
+"""ProbCut
+"""
+
+import math
+
+from reversi.strategies.common.abstract import AbstractStrategy
+
+
+PROBCUT_MAX_STAGES = 8   # 進行度の分割数の上限
+PROBCUT_MAX_DEPTH = 20   # 枝刈りを試す残りの探索深さの上限
+PROBCUT_MAX_CHECKS = 2   # 1つの深さで試す浅い探索の数の上限
+PROBCUT_INFINITY = 10000000  # 探索窓の無限大(この値の側は枝刈りを試さない)
+
+
+class ProbCut:
+    """ProbCut
+
+           浅い探索の評価値vから深い探索の評価値を a * v + b (誤差の標準偏差sigma) で予測し、
+           予測がthreshold * sigmaずれても探索窓の外になる局面は深く読まずに枝刈りする(Multi-ProbCut)
+           パラメータは進行度(盤面の石数)と残りの探索深さごとに、浅い探索を複数持てる
+    """
+    def __init__(self, params=None, threshold=1.5, stages=4):
+        self.params = {} if params is None else params    # {(進行度, 深さ): [(浅い探索の深さ, a, b, sigma), ...]}
+        self.threshold = threshold                        # 予測の誤差を許す幅(sigmaの何倍か)
+        self.stages = min(max(stages, 1), PROBCUT_MAX_STAGES)  # 進行度の分割数
+
+    def get_stage(self, board):
+        """get_stage
+
+               盤面の石数から進行度を求める
+        """
+        squares = board.size * board.size - board.get_bit_count(board.get_bitboard_info()[2])
+        return (board._black_score + board._white_score) * self.stages // (squares + 1)
+
+    def get_checks(self, stage, depth):
+        """get_checks
+
+               進行度と深さに対する(浅い探索の深さ, a, b, threshold * sigma)のリストを返す
+        """
+        if depth > PROBCUT_MAX_DEPTH:
+            return []
+        checks = self.params.get((stage, depth), ())[:PROBCUT_MAX_CHECKS]
+        return [(shallow, a, b, self.threshold * sigma) for shallow, a, b, sigma in checks if a > 0 and 0 <= shallow < depth]
+
+    def get_windows(self, board, depth, alpha, beta):
+        """get_windows
+
+               (浅い探索の深さ, 下側の境界, 上側の境界)のリストを返す
+               浅い探索の評価値が上側の境界以上ならbeta cut、下側の境界以下ならalpha cutと予測できる(窓が無限大の側はNone)
+        """
+        windows = []
+        for shallow, a, b, margin in self.get_checks(self.get_stage(board), depth):
+            lower = (alpha - margin - b) / a if alpha > -PROBCUT_INFINITY else None
+            upper = (beta + margin - b) / a if beta < PROBCUT_INFINITY else None
+            windows.append((shallow, lower, upper))
+        return windows
+
+    @classmethod
+    def calibrate(cls, search, positions, pairs, threshold=1.5, stages=4, limit=None):
+        """calibrate
+
+               局面ごとに深い探索と浅い探索の評価値を求め、進行度と深さごとにa, b, sigmaを最小二乗法で求める
+               search : 評価値を求める探索(_AlphaBeta_や_NegaScout_、枝刈りは無効にして探索する)
+               positions : (手番, ボード)のリスト(get_selfplay_positionsで作れる)
+               pairs : {深い探索の深さ: [浅い探索の深さ, ...]}
+               limit : 評価値の絶対値がこれを超える組(勝敗が見えた局面など)は当てはめに使わない
+        """
+        probcut, samples = cls(threshold=threshold, stages=stages), {}
+        depths = sorted(set(pairs) | {shallow for shallows in pairs.values() for shallow in shallows})
+        saved, search.probcut = search.probcut, None
+        try:
+            for color, board in positions:
+                if not board.get_legal_moves(color):
+                    continue
+                scores = {depth: search._get_score(color, board, search._MIN, search._MAX, depth) for depth in depths}
+                stage = probcut.get_stage(board)
+                for depth, shallows in pairs.items():
+                    for shallow in shallows:
+                        if limit is None or max(abs(scores[shallow]), abs(scores[depth])) <= limit:
+                            samples.setdefault((stage, depth, shallow), []).append((scores[shallow], scores[depth]))
+        finally:
+            search.probcut = saved
+
+        for depth, shallows in pairs.items():
+            for stage in range(probcut.stages):
+                checks = [check for check in (_fit(samples.get((stage, depth, shallow), []), shallow) for shallow in shallows) if check is not None]
+                if checks:
+                    probcut.params[(stage, depth)] = checks
+        return probcut
+
+
+def _fit(samples, shallow):
+    """_fit
+
+           深い探索の評価値を浅い探索の評価値の1次式で近似する(求まらない場合はNone)
+    """
+    n = len(samples)
+    if n < 2:
+        return None
+    mean_v = sum(v for v, _ in samples) / n
+    mean_d = sum(d for _, d in samples) / n
+    var = sum((v - mean_v) ** 2 for v, _ in samples)
+    if not var:
+        return None
+    a = sum((v - mean_v) * (d - mean_d) for v, d in samples) / var
+    b = mean_d - a * mean_v
+    sigma = math.sqrt(sum((d - (a * v + b)) ** 2 for v, d in samples) / n)
+    return (shallow, a, b, sigma)
+
+
+class _PositionRecorder(AbstractStrategy):
+    """
+    打つ前の局面を記録する(手はbaseで決める)
+    """
+    def __init__(self, base, positions):
+        self.base = base
+        self.positions = positions
+
+    def next_move(self, color, board):
+        """
+        次の一手
+        """
+        self.positions.append((color, board.copy()))
+        return self.base.next_move(color, board)
+
+
+def get_selfplay_positions(strategy, matches=10, **kwargs):
+    """get_selfplay_positions
+
+           strategy同士をSimulatorで対戦させ、途中の局面を(手番, ボード)のリストで返す
+           kwargsはSimulatorの引数(random_openingで序盤をばらつかせる)
+    """
+    from reversi import Simulator
+
+    positions = []
+    recorder = _PositionRecorder(strategy, positions)
+    kwargs.update(matches=matches, processes=1, progress=False, swap=False)
+    Simulator({'Black': recorder, 'White': recorder}, **kwargs).start()
+    return positions
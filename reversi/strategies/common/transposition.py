@@ -0,0 +1,403 @@
+"""TranspositionTable
+"""
+
+import os
+import mmap
+import struct
+from array import array
+from multiprocessing import shared_memory, resource_tracker, parent_process, current_process
+
+from reversi.BitBoardMethods.GetHash import ZOBRIST_SIDE, get_hash
+
+
+# 評価値の種類
+TT_EMPTY = 0
+TT_LOWER = 1  # 下限値(beta cutした)
+TT_UPPER = 2  # 上限値(alphaを超える手がなかった)
+TT_EXACT = 3  # 確定値(TT_LOWER | TT_UPPER)
+
+# 統計情報の位置
+TT_PROBES = 0   # 参照回数
+TT_HITS = 1     # 同じ局面が見つかった回数
+TT_CUTOFFS = 2  # 探索を省略できた回数
+TT_STORES = 3   # 格納回数
+
+# 置換表ファイルの形式(ヘッダの後に各配列を続けて格納する)
+TT_FILE_MAGIC = b'RVTT0002'
+TT_FILE_HEADER = struct.Struct('<8sQQQQ')  # 識別子, エントリ数, 世代, 盤面のサイズ, 穴のハッシュ
+TT_FILE_HEADER_SIZE = 64
+TT_FILE_ARRAYS = (  # 名前, 型, 初期値(アラインメントを保つため要素の大きい順に並べる)
+    ('keys', 'Q', 0),     # 局面のハッシュ(手番を含む)とエントリの内容のXOR
+    ('values', 'd', 0),   # 評価値
+    ('depths', 'h', 0),   # 残りの探索深さ
+    ('moves', 'h', -1),   # 最善手のビット位置(-1はなし)
+    ('ages', 'H', 0),     # 格納した世代
+    ('bounds', 'B', 0),   # 評価値の種類
+)
+
+# 評価値とビット列の変換用
+_DOUBLE = struct.Struct('<d')
+_UINT64 = struct.Struct('<Q')
+
+
+def get_entry_check(value_bits, depth, bound, move):
+    """get_entry_check
+
+           エントリの内容から検査用の値を作る
+           キーとXORして格納するため、書き込み途中のエントリは別の局面として扱われる(ロックなしで共有できる)
+    """
+    return value_bits ^ (depth & 0xFFFF) << 48 ^ bound << 40 ^ (move & 0xFFFF) << 16
+
+
+def _attach_shared_memory(name, owner=None):
+    """_attach_shared_memory
+
+           作成したプロセス(owner)が解放する共有メモリを開く(開いたプロセスの終了時に解放されないようにする)
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13以降
+    except TypeError:
+        pass
+    # Python 3.12以前は開くとresource_trackerに登録される
+    # 作成したプロセスのresource_trackerを共有している場合(同じプロセスやmultiprocessingの子プロセス)は同じ名前の登録が重なるだけのため、
+    # 登録を取り消すと作成したプロセスでの解放時に二重の取り消しになる。それ以外(このプロセスで新たに起動した場合など)は取り消す
+    # (spawn/forkserverの子プロセスは起動時の引数の復元中のため、parent_processではなく_inheritingで判定する)
+    child = parent_process() is not None or getattr(current_process(), '_inheriting', False)
+    inherited = resource_tracker._resource_tracker._fd is not None and (owner == os.getpid() or child)
+    shm = shared_memory.SharedMemory(name=name)
+    if not inherited:
+        resource_tracker.unregister(shm._name, 'shared_memory')
+    return shm
+
+
+class TranspositionTable:
+    """TranspositionTable
+
+           固定サイズの置換表(局面のハッシュで引き、探索の深さと世代を優先して置き換える)
+           配列で持つためCythonの探索からも同じ表を参照できる
+           pathを指定した場合はファイルにメモリマップし、プロセスをまたいで結果を引き継ぐ
+           sharedを指定した場合は共有メモリに置き、複数のプロセスから同時に読み書きする
+    """
+    def __init__(self, size=0x10000, min_depth=2, path=None, shared=False):
+        self.size = 1 << max(size - 1, 1).bit_length()  # エントリ数(2のべき乗に切り上げ)
+        self.min_depth = min_depth                      # 置換表を使う残りの探索深さ
+        self.path = path                                # 置換表ファイルのパス(Noneの場合はメモリ上のみ)
+        self.shared = shared and path is None           # 共有メモリに置くかどうか
+        self._buffer = None
+        self._shm = None
+        self._owner = os.getpid() if self.shared else None  # 共有メモリを作成したプロセス(forkした子プロセスは解放しない)
+        if path is not None:
+            self._open(path)
+        elif self.shared:
+            self._shm = shared_memory.SharedMemory(create=True, size=self._get_buffer_size())
+            self._attach(self._shm.buf)
+        else:
+            self.clear()
+
+    def __getstate__(self):
+        # 共有メモリの置換表は名前だけを渡し、受け取ったプロセスで同じ領域を参照する
+        # 置換表ファイルはパスだけを渡し、受け取ったプロセスで開き直す
+        if self._shm is not None:
+            return {'size': self.size, 'min_depth': self.min_depth, 'shm_name': self._shm.name, 'owner': self._owner}
+        if self.path is not None:
+            self.flush()
+            return {'size': self.size, 'min_depth': self.min_depth, 'path': self.path}
+        state = self.__dict__.copy()
+        state['_value_bits'] = None
+        return state
+
+    def __setstate__(self, state):
+        if 'shm_name' in state:
+            self.size, self.min_depth, self.path, self.shared = state['size'], state['min_depth'], None, True
+            self._buffer, self._owner = None, None
+            self._shm = _attach_shared_memory(state['shm_name'], state.get('owner'))
+            self._attach(self._shm.buf)
+        elif 'path' in state and '_buffer' not in state:
+            self.size, self.min_depth, self.path, self.shared = state['size'], state['min_depth'], state['path'], False
+            self._buffer, self._shm, self._owner = None, None, None
+            self._open(self.path)
+        else:
+            self.__dict__.update(state)
+            self._value_bits = memoryview(self.values).cast('B').cast('Q')
+
+    def _get_buffer_size(self):
+        return TT_FILE_HEADER_SIZE + self.size * sum(array(typecode).itemsize for _, typecode, _ in TT_FILE_ARRAYS)
+
+    def _open(self, path):
+        """_open
+
+               置換表ファイルを開く(形式やエントリ数が異なる場合は作り直す)
+        """
+        file_size = self._get_buffer_size()
+        with open(path, 'a+b') as f:
+            if os.path.getsize(path) != file_size:
+                f.truncate(0)
+                f.truncate(file_size)
+            self._attach(mmap.mmap(f.fileno(), file_size))
+
+    def _attach(self, buffer):
+        """_attach
+
+               ファイルや共有メモリの領域に配列を割り当てる(形式やエントリ数が異なる場合は消去する)
+        """
+        self._buffer = buffer
+        offset, data = TT_FILE_HEADER_SIZE, memoryview(buffer)
+        for name, typecode, _ in TT_FILE_ARRAYS:
+            nbytes = self.size * array(typecode).itemsize
+            setattr(self, name, data[offset:offset+nbytes].cast(typecode))
+            offset += nbytes
+        self._value_bits = self.values.cast('B').cast('Q')  # 評価値のビット列
+        self.stats = array('Q', [0]) * 4
+        magic, size, age, board_size, hole_hash = TT_FILE_HEADER.unpack_from(buffer)
+        if magic != TT_FILE_MAGIC or size != self.size:
+            self.clear()
+        else:
+            self.age = age
+            self._board_key = (board_size, hole_hash) if board_size else None
+
+    def _write_header(self):
+        """_write_header
+        """
+        board_size, hole_hash = self._board_key if self._board_key is not None else (0, 0)
+        TT_FILE_HEADER.pack_into(self._buffer, 0, TT_FILE_MAGIC, self.size, self.age, board_size, hole_hash)
+
+    def clear(self):
+        """clear
+
+               全てのエントリと統計情報を消去する
+        """
+        size = self.size
+        for name, typecode, initial in TT_FILE_ARRAYS:
+            if self._buffer is None:
+                setattr(self, name, array(typecode, [initial]) * size)
+            else:
+                getattr(self, name)[:] = array(typecode, [initial]) * size
+        if self._buffer is None:
+            self._value_bits = memoryview(self.values).cast('B').cast('Q')  # 評価値のビット列
+        self.stats = array('Q', [0]) * 4
+        self.age = 0
+        self._board_key = None
+        if self._buffer is not None:
+            self._write_header()
+
+    def new_search(self, board=None):
+        """new_search
+
+               世代を進める(一手ごとに呼び、盤面のサイズや穴が変わった場合は消去する)
+        """
+        if board is not None:
+            board_key = (board.size, get_hash(board.get_bitboard_info()[2], 0))
+            if self._board_key is not None and self._board_key != board_key:
+                self.clear()
+            self._board_key = board_key
+        self.age = (self.age + 1) & 0xFFFF
+        if self._buffer is not None:
+            self._write_header()
+
+    def flush(self):
+        """flush
+
+               置換表ファイルへ書き出す
+        """
+        if self.path is not None:
+            self._buffer.flush()
+
+    def close(self):
+        """close
+
+               置換表ファイルや共有メモリを閉じる(以降はメモリ上の空の表として使える)
+               共有メモリは作成したプロセスで閉じた時に解放する
+        """
+        if self._buffer is None:
+            return
+        self.flush()
+        for name, _, _ in TT_FILE_ARRAYS:
+            getattr(self, name).release()
+        self._value_bits.release()
+        if self._shm is not None:
+            self._shm.close()
+            if self._owner == os.getpid():
+                self._shm.unlink()
+        else:
+            self._buffer.close()
+        self._buffer, self._shm, self.path, self.shared, self._owner = None, None, None, False, None
+        self.clear()
+
+    @staticmethod
+    def get_key(board, color):
+        """get_key
+
+               局面と手番のキーを返す
+        """
+        return board.hash ^ ZOBRIST_SIDE if color == 'white' else board.hash
+
+    def _read_entry(self, index):
+        """_read_entry
+
+               格納済みのエントリを(キー, 評価値, 深さ, 種類, 最善手)で返す
+        """
+        value_bits, depth, bound, move = self._value_bits[index], self.depths[index], self.bounds[index], self.moves[index]
+        key = self.keys[index] ^ get_entry_check(value_bits, depth, bound, move)
+        return key, _DOUBLE.unpack(_UINT64.pack(value_bits))[0], depth, bound, move
+
+    def lookup(self, key, depth, alpha, beta):
+        """lookup
+
+               置換表を参照し、(評価値, alpha, beta, 最善手のビット位置)を返す
+               探索を省略できない場合の評価値はNoneで、alpha/betaは格納済みの範囲で狭める
+        """
+        stats = self.stats
+        stats[TT_PROBES] += 1
+        index = key & (self.size - 1)
+        if not self.bounds[index]:
+            return None, alpha, beta, -1
+        entry_key, value, entry_depth, bound, move = self._read_entry(index)
+        if not bound or entry_key != key:
+            return None, alpha, beta, -1
+        stats[TT_HITS] += 1
+        if entry_depth < depth:
+            return None, alpha, beta, move
+        if bound == TT_EXACT or (bound == TT_LOWER and value >= beta) or (bound == TT_UPPER and value <= alpha):
+            stats[TT_CUTOFFS] += 1
+            return value, alpha, beta, move
+        if bound == TT_LOWER:
+            alpha = max(alpha, value)
+        else:
+            beta = min(beta, value)
+        return None, alpha, beta, move
+
+    def store(self, key, depth, value, alpha, beta, move=-1):
+        """store
+
+               探索窓(alpha, beta)で得た評価値を格納する
+               同じ世代のより深い結果は残す
+        """
+        index = key & (self.size - 1)
+        if self.bounds[index] and self.ages[index] == self.age and self.depths[index] > depth:
+            return
+        if move < 0 and self.bounds[index]:
+            entry_key, _, _, _, entry_move = self._read_entry(index)
+            if entry_key == key:
+                move = entry_move  # 最善手が分からない場合は前回のものを引き継ぐ
+        bound = TT_UPPER if value <= alpha else TT_LOWER if value >= beta else TT_EXACT
+        self.values[index] = value
+        self.depths[index] = depth
+        self.bounds[index] = bound
+        self.moves[index] = move
+        self.ages[index] = self.age
+        self.keys[index] = key ^ get_entry_check(self._value_bits[index], depth, bound, move)  # キーは最後に書き込む
+        self.stats[TT_STORES] += 1
+
+    def get_pv(self, color, board, move=None):
+        """get_pv
+
+               格納済みの最善手をたどった読み筋を(手番, 手)のリストで返す(moveを指定した場合はその手から始める)
+        """
+        size, pv = board.size, []
+        nbits = size * size
+        try:
+            for _ in range(nbits):
+                next_color = 'white' if color == 'black' else 'black'
+                if move is None:
+                    legal_moves_bits = board.get_legal_moves_bits(color)
+                    if not legal_moves_bits:
+                        if not board.get_legal_moves_bits(next_color):
+                            break  # 終局
+                        color = next_color  # パス
+                        continue
+                    key = self.get_key(board, color)
+                    index = key & (self.size - 1)
+                    if not self.bounds[index]:
+                        break
+                    entry_key, _, _, _, entry_move = self._read_entry(index)
+                    if entry_key != key or entry_move < 0 or not legal_moves_bits >> entry_move & 1:
+                        break
+                    move = ((nbits - 1 - entry_move) % size, (nbits - 1 - entry_move) // size)
+                board.put_disc(color, *move)
+                pv.append((color, move))
+                color, move = next_color, None
+        finally:
+            for _ in pv:
+                board.undo()
+        return pv
+
+    def store_pv(self, board, pv):
+        """store_pv
+
+               読み筋の各局面に手を格納し、次の探索で最初に調べるようにする
+               格納済みの評価値はそのまま残し、ない場合は枝刈りに使われない下限値(-inf)で格納する
+        """
+        size = board.size
+        nbits = size * size
+        for color, (x, y) in pv:
+            key, move = self.get_key(board, color), nbits - 1 - (y * size + x)
+            index = key & (self.size - 1)
+            entry_key = None
+            if self.bounds[index]:
+                entry_key, value, depth, bound, _ = self._read_entry(index)
+            if entry_key != key:
+                value, depth, bound = float('-inf'), 0, TT_LOWER
+            self.values[index] = value
+            self.depths[index] = depth
+            self.bounds[index] = bound
+            self.moves[index] = move
+            self.ages[index] = self.age
+            self.keys[index] = key ^ get_entry_check(self._value_bits[index], depth, bound, move)  # キーは最後に書き込む
+            board.put_disc(color, x, y)
+        for _ in pv:
+            board.undo()
+
+    @property
+    def probes(self):
+        """probes
+        """
+        return self.stats[TT_PROBES]
+
+    @property
+    def hits(self):
+        """hits
+        """
+        return self.stats[TT_HITS]
+
+    @property
+    def cutoffs(self):
+        """cutoffs
+        """
+        return self.stats[TT_CUTOFFS]
+
+    @property
+    def stores(self):
+        """stores
+        """
+        return self.stats[TT_STORES]
+
+    @property
+    def hit_rate(self):
+        """hit_rate
+
+               参照した局面が見つかった割合
+        """
+        return self.hits / self.probes if self.probes else 0.0
+
+    def reset_stats(self):
+        """reset_stats
+        """
+        for i in range(len(self.stats)):
+            self.stats[i] = 0
+
+
+def get_ordered_moves(legal_moves_bits, size, first=-1):
+    """get_ordered_moves
+
+           合法手を左上から順に(x, y)で返す(firstのビット位置の手があれば先頭にする)
+    """
+    nbits = size * size
+    moves = []
+    if first >= 0 and legal_moves_bits >> first & 1:
+        legal_moves_bits ^= 1 << first
+        moves.append(((nbits - 1 - first) % size, (nbits - 1 - first) // size))
+    while legal_moves_bits:
+        pos = legal_moves_bits.bit_length() - 1
+        moves.append(((nbits - 1 - pos) % size, (nbits - 1 - pos) // size))
+        legal_moves_bits ^= 1 << pos
+    return moves
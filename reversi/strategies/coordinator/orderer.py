@@ -1,9 +1,17 @@
 """Orderer
 """
 
+from array import array
+
 from reversi.strategies.common import AbstractOrderer
 
 
+ORDERER_MAX_DEPTH = 64            # キラー手を覚える残りの探索深さの上限
+ORDERER_MAX_SQUARES = 26 * 26     # 履歴を持つマスの数の上限(盤面の最大サイズ)
+ORDERER_KILLERS = 2               # 1つの深さで覚えるキラー手の数
+ORDERER_KILLER_PRIORITY = 1 << 62  # キラー手の優先度(履歴より常に優先する)
+
+
 class Orderer(AbstractOrderer):
     """Orderer
     """
@@ -123,3 +131,128 @@ class Orderer_PCB(AbstractOrderer):
         kwargs['moves'] = self.sorter_b.move_ordering(*args, **kwargs)
 
         return kwargs['moves']
+
+
+class Orderer_KH(Orderer):
+    """Orderer_KH
+
+           探索中にbeta cutを起こした手を優先的に(キラー手 → 履歴の大きい手)
+           探索クラス(AlphaBeta, NegaScout)のordererに渡すと途中の局面でも並び替え、同じ対局の間は手番をまたいで引き継ぐ
+    """
+    def __init__(self, killer=True, history=True):
+        self.killer = killer    # 同じ深さでbeta cutを起こした手(キラー手)を優先する
+        self.history = history  # beta cutを起こした回数を深さで重み付けした履歴の大きい手を優先する
+        self.killers = array('h', [-1]) * (ORDERER_MAX_DEPTH * ORDERER_KILLERS)  # [深さ][順位] = ビット位置
+        self.histories = array('Q', [0]) * (2 * ORDERER_MAX_SQUARES)            # [手番(白:0, 黒:1)][ビット位置] = 履歴
+        self._board_key = None
+
+    def clear(self):
+        """clear
+
+               キラー手と履歴を消去する
+        """
+        for i in range(len(self.killers)):
+            self.killers[i] = -1
+        for i in range(len(self.histories)):
+            self.histories[i] = 0
+
+    def new_search(self, board):
+        """new_search
+
+               一手ごとに呼び、履歴を半分に減らす(盤面のサイズが変わった場合や石が減った場合は新しい対局として消去する)
+        """
+        board_key = (board.size, board._black_score + board._white_score)
+        if self._board_key is not None and (self._board_key[0] != board_key[0] or self._board_key[1] > board_key[1]):
+            self.clear()
+        else:
+            for i in range(len(self.histories)):
+                self.histories[i] >>= 1
+        self._board_key = board_key
+
+    def get_priority(self, color, depth, pos):
+        """get_priority
+
+               手(ビット位置)の優先度を返す
+        """
+        priority = self.histories[(color == 'black') * ORDERER_MAX_SQUARES + pos] if self.history else 0
+        if self.killer and depth < ORDERER_MAX_DEPTH:
+            for i in range(ORDERER_KILLERS):
+                if self.killers[depth * ORDERER_KILLERS + i] == pos:
+                    priority |= ORDERER_KILLER_PRIORITY >> i
+                    break
+        return priority
+
+    def update(self, color, depth, pos):
+        """update
+
+               beta cutを起こした手(ビット位置)を覚える
+        """
+        if self.killer and depth < ORDERER_MAX_DEPTH:
+            index = depth * ORDERER_KILLERS
+            if self.killers[index] != pos:
+                for i in range(ORDERER_KILLERS - 1, 0, -1):
+                    self.killers[index + i] = self.killers[index + i - 1]
+                self.killers[index] = pos
+        if self.history:
+            self.histories[(color == 'black') * ORDERER_MAX_SQUARES + pos] += depth * depth
+
+    def sort_moves(self, color, depth, moves, size, first=-1):
+        """sort_moves
+
+               手の一覧を優先度の高い順に並べる(同じ優先度は元の順序を保ち、firstのビット位置の手は先頭に置く)
+        """
+        nbits = size * size
+        priorities = {move: self.get_priority(color, depth, nbits - 1 - (move[1] * size + move[0])) for move in moves}
+        moves = sorted(moves, key=lambda move: priorities[move], reverse=True)
+        if first >= 0:
+            move = ((nbits - 1 - first) % size, (nbits - 1 - first) // size)
+            if move in priorities:
+                moves.remove(move)
+                moves.insert(0, move)
+        return moves
+
+    def move_killers(self, depth, moves, size):
+        """move_killers
+
+               キラー手を先頭に移す(他の手の順序は保つ)
+        """
+        if self.killer and depth < ORDERER_MAX_DEPTH:
+            nbits, moves = size * size, list(moves)
+            for i in range(ORDERER_KILLERS - 1, -1, -1):
+                pos = self.killers[depth * ORDERER_KILLERS + i]
+                move = ((nbits - 1 - pos) % size, (nbits - 1 - pos) // size)
+                if pos >= 0 and move in moves:
+                    moves.remove(move)
+                    moves.insert(0, move)
+        return moves
+
+    def move_ordering(self, *args, **kwargs):
+        """move_ordering
+
+               履歴の大きい順に並べ、前回の最善手を先頭に
+        """
+        moves = super().move_ordering(*args, **kwargs)
+        board, color, best_move = kwargs['board'], kwargs['color'], kwargs.get('best_move')
+        moves = self.sort_moves(color, ORDERER_MAX_DEPTH, moves, board.size)
+        if best_move is not None and best_move in moves:
+            moves.remove(best_move)
+            moves.insert(0, best_move)
+        return moves
+
+
+class Orderer_K(Orderer_KH):
+    """Orderer_K
+
+           探索中に同じ深さでbeta cutを起こした手(キラー手)を優先的に
+    """
+    def __init__(self):
+        super().__init__(killer=True, history=False)
+
+
+class Orderer_H(Orderer_KH):
+    """Orderer_H
+
+           探索中にbeta cutを起こした手の履歴(history heuristic)が大きいものを優先的に
+    """
+    def __init__(self):
+        super().__init__(killer=False, history=True)
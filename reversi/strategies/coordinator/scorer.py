@@ -6,7 +6,7 @@ from reversi.strategies.table import Table
 import reversi.strategies.coordinator.ScorerMethods as ScorerMethods
 
 from reversi.board import PyBitBoard
-from reversi.cy.ReversiMethods import CythonBitBoard
+from reversi import cy
 
 
 class TableScorer(AbstractScorer):
@@ -60,7 +60,7 @@ class OpeningScorer(AbstractScorer):
         ]
 
         # 最後にひっくり返された石の場所を取得する
-        if isinstance(board, PyBitBoard) or isinstance(board, CythonBitBoard):
+        if isinstance(board, PyBitBoard) or (cy.IMPORTED and isinstance(board, cy.CythonBitBoard)) or cy.is_multiword_bitboard(board):
             flippable_discs = board._flippable_discs_num
             discs = []
             mask = 1 << ((size * size) - 1)
@@ -2,7 +2,7 @@
 """
 
 from reversi.strategies.common import Measure
-from reversi.strategies import Random, MonteCarlo, MinMax, NegaMax, AlphaBeta_, AlphaBeta, _NegaScout_, NegaScout, Switch, FullReading_, _FullReading, FullReading, IterativeDeepning_, IterativeDeepning, Usagi, Tora, _Ushi_, Ushi, Nezumi, Neko, Hitsuji, _EndGame_, _Blank_, Blank  # noqa: E501
+from reversi.strategies import Random, MonteCarlo, MinMax, NegaMax, AlphaBeta_, AlphaBeta, _NegaScout_, NegaScout, Switch, FullReading_, _FullReading, FullReading, IterativeDeepning_, IterativeDeepning, MTDf, Usagi, Tora, _Ushi_, Ushi, Nezumi, Neko, Hitsuji, _EndGame_, _Blank_, Blank  # noqa: E501
 from reversi.strategies.coordinator import Selector, Orderer_B, Orderer_PCB, Evaluator_T, Evaluator_TP, Evaluator_TPO, Evaluator_TPW, Evaluator_TPWE, Evaluator_TPWEB, Evaluator_TPWE_Fast, Evaluator_TPWEC, Evaluator_TPOW, Evaluator_PWE  # noqa: E501
 
 
@@ -648,6 +648,14 @@ class NsI_B_TPWEB(IterativeDeepning):
         super().__init__(depth, selector, orderer, search)
 
 
+class MtdfI_B_TPWE(IterativeDeepning):
+    """
+    MTD(f)に反復深化法を適用して次の手を決める(選択的探索:なし、並び替え:B、評価関数:TPWE)
+    """
+    def __init__(self, depth=2, selector=Selector(), orderer=Orderer_B(), search=None):
+        super().__init__(depth, selector, orderer, MTDf(NegaScout_TPWE()) if search is None else search)  # 置換表を共有しないよう戦略ごとに作る
+
+
 # ------ #
 # Switch #
 # ------ #
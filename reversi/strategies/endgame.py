@@ -16,23 +16,27 @@ class _EndGame_(AbstractStrategy):
     """
     石差読みで次の手を決める
     """
-    def __init__(self, depth=60, role='best_match'):
+    def __init__(self, depth=60, role='best_match', workers=1, tt=None):
         self._MIN = -10000000
         self._MAX = 10000000
         self.evaluator = Evaluator_N_Fast()
         self.depth = depth
-        self.alphabeta_n = _AlphaBeta_(depth=depth, evaluator=self.evaluator)
+        self.alphabeta_n = _AlphaBeta_(depth=depth, evaluator=self.evaluator, tt=tt)
         self.timer = False
         self.measure = False
         self.role = role.lower()
+        self.workers = workers  # 並列に探索するスレッド数(石差読みは長男の手の後に弟の手を分割、勝敗読み(wld)は逐次、それ以外はルート分割)
+        self.tt = tt            # 置換表(TranspositionTable、Noneの場合は使わない)
 
     def next_move(self, color, board):
         """
         次の一手
         """
         pid = Timer.get_pid(self)  # タイムアウト監視用のプロセスID
-        if board.size == 8 and sys.maxsize == MAXSIZE64 and hasattr(board, '_black_bitboard') and not EndGameMethods.ENDGAME_SIZE8_64BIT_ERROR:
-            return EndGameMethods.next_move(color, board, self.depth, pid, self.timer, self.measure, self.role)
+        if self.tt is not None:
+            self.tt.new_search(board)  # 置換表の世代を進める
+        if board.size <= 8 and sys.maxsize == MAXSIZE64 and hasattr(board, '_black_bitboard') and not EndGameMethods.ENDGAME_SIZE8_64BIT_ERROR:
+            return EndGameMethods.next_move(color, board, self.depth, pid, self.timer, self.measure, self.role, self.workers, self.tt)
         return self.alphabeta_n.next_move(color, board)
 
     def get_best_move(self, color, board, moves, depth=60, pid=None):
@@ -40,8 +44,8 @@ class _EndGame_(AbstractStrategy):
         最善手を選ぶ
         """
         alpha, beta = self._MIN, self._MAX
-        if board.size == 8 and sys.maxsize == MAXSIZE64 and hasattr(board, '_black_bitboard') and not EndGameMethods.ENDGAME_SIZE8_64BIT_ERROR:
-            return EndGameMethods.get_best_move(color, board, moves, alpha, beta, depth, pid, self.timer, self.measure, self.role, False)
+        if board.size <= 8 and sys.maxsize == MAXSIZE64 and hasattr(board, '_black_bitboard') and not EndGameMethods.ENDGAME_SIZE8_64BIT_ERROR:
+            return EndGameMethods.get_best_move(color, board, moves, alpha, beta, depth, pid, self.timer, self.measure, self.role, False, self.workers, self.tt)
         return self.alphabeta_n.get_best_move(color, board, moves, depth, pid)
 
     def get_best_record(self, color, board, moves, depth=60, pid=None):
@@ -49,7 +53,7 @@ class _EndGame_(AbstractStrategy):
         最善手+その時の棋譜
         """
         alpha, beta = self._MIN, self._MAX
-        if board.size == 8 and sys.maxsize == MAXSIZE64 and hasattr(board, '_black_bitboard') and not EndGameMethods.ENDGAME_SIZE8_64BIT_ERROR:
+        if board.size <= 8 and sys.maxsize == MAXSIZE64 and hasattr(board, '_black_bitboard') and not EndGameMethods.ENDGAME_SIZE8_64BIT_ERROR:
             return EndGameMethods.get_best_move(color, board, moves, alpha, beta, depth, pid, self.timer, self.measure, self.role, True)
         return None, None, None  # unsupported
 
@@ -57,9 +61,9 @@ class _EndGame_(AbstractStrategy):
 class _EndGame(_EndGame_):
     """EndGame + Measure
     """
-    def __init__(self, depth=60):
-        super().__init__(depth)
-        self.alphabeta_n = _AlphaBeta(depth=depth, evaluator=self.evaluator)
+    def __init__(self, depth=60, workers=1, tt=None):
+        super().__init__(depth, workers=workers, tt=tt)
+        self.alphabeta_n = _AlphaBeta(depth=depth, evaluator=self.evaluator, tt=tt)
         self.timer = False
         self.measure = True
 
@@ -73,9 +77,9 @@ class _EndGame(_EndGame_):
 class EndGame_(_EndGame_):
     """EndGame + Timer
     """
-    def __init__(self, depth=60):
-        super().__init__(depth)
-        self.alphabeta_n = AlphaBeta_(depth=depth, evaluator=self.evaluator)
+    def __init__(self, depth=60, workers=1, tt=None):
+        super().__init__(depth, workers=workers, tt=tt)
+        self.alphabeta_n = AlphaBeta_(depth=depth, evaluator=self.evaluator, tt=tt)
         self.timer = True
         self.measure = False
 
@@ -89,9 +93,9 @@ class EndGame_(_EndGame_):
 class EndGame(_EndGame_):
     """EndGame + Measure + Timer
     """
-    def __init__(self, depth=60):
-        super().__init__(depth)
-        self.alphabeta_n = AlphaBeta(depth=depth, evaluator=self.evaluator)
+    def __init__(self, depth=60, workers=1, tt=None):
+        super().__init__(depth, workers=workers, tt=tt)
+        self.alphabeta_n = AlphaBeta(depth=depth, evaluator=self.evaluator, tt=tt)
         self.timer = True
         self.measure = True
 
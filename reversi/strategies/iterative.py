@@ -1,37 +1,57 @@
 """IterativeDeepning strategy
 """
 
-from reversi.strategies.common import Timer, Measure, AbstractStrategy
+from reversi.strategies.common import Timer, Measure, AbstractStrategy, TranspositionTable
 
 
 class IterativeDeepning_(AbstractStrategy):
     """IterativeDeepning + Timer
     """
-    def __init__(self, depth=None, selector=None, orderer=None, search=None, limit=None):
+    def __init__(self, depth=None, selector=None, orderer=None, search=None, limit=None, aspiration=None, pv=False):
         self.depth = depth
         self.selector = selector
         self.orderer = orderer
         self.search = search
         self.max_depth = depth
         self.limit = limit
+        self.aspiration = aspiration  # 前回の評価値を中心にした探索窓の半分の幅(Noneの場合は窓を制限しない)
+        self.pv = []                  # 前回の深さの読み筋[(手番, 手), ...]
+
+        if pv and search is not None and hasattr(search, 'tt') and search.tt is None:
+            search.tt = TranspositionTable()  # 読み筋を次の深さの手の並びに使うため置換表を持たせる
+        self.use_pv = pv
 
     def next_move(self, color, board):
         """next_move
         """
-        depth, moves, best_move, scores, = self.depth, None, None, {}
+        depth, moves, best_move, scores, score = self.depth, None, None, {}, None
 
         pid = Timer.get_pid(self.search)           # タイムアウト監視用のプロセスID
         Timer.set_deadline(pid, self.search._MIN)  # 探索クラスのタイムアウトを設定
 
+        tt = getattr(self.search, 'tt', None)
+        if tt is not None:
+            tt.new_search(board)  # 置換表は深さを増やしても同じ世代のまま引き継ぐ
+        orderer = getattr(self.search, 'orderer', None)
+        if orderer is not None:
+            orderer.new_search(board)  # キラー手と履歴は深さを増やしても引き継ぐ
+        self.pv = []
+
         moves = board.get_legal_moves(color)
         while True:
             moves = self.selector.select_moves(color, board, moves, scores, depth)                          # 次の手の候補を選択
             moves = self.orderer.move_ordering(color=color, board=board, moves=moves, best_move=best_move)  # 次の手の候補を並び替え
-            best_move, scores = self.search.get_best_move(color, board, moves, depth, pid)                  # 最善手を取得
+            if self.use_pv and tt is not None and self.pv:
+                tt.store_pv(board, self.pv)                                                                 # 読み筋の手を各局面で最初に調べる
+            best_move, scores = self._get_best_move(color, board, moves, depth, pid, score)                 # 最善手を取得
 
             if Timer.is_timeout(pid):  # タイムアウト発生時、処理を抜ける
                 break
 
+            if self.use_pv and tt is not None:
+                self.pv = tt.get_pv(color, board, best_move)  # 読み筋を記録
+            score = scores.get(best_move)
+
             if self.limit and depth >= self.limit:  # 限界深さに到達時
                 break
 
@@ -41,6 +61,28 @@ class IterativeDeepning_(AbstractStrategy):
 
         return best_move
 
+    def _get_best_move(self, color, board, moves, depth, pid, score):
+        """_get_best_move
+
+               前回の評価値を中心にした探索窓で探索し、窓の外になった場合は窓を広げて探索し直す
+        """
+        if not self.aspiration or score is None:
+            return self.search.get_best_move(color, board, moves, depth, pid)
+
+        _min, _max = self.search._MIN, self.search._MAX
+        alpha, beta = max(score - self.aspiration, _min), min(score + self.aspiration, _max)
+        while True:
+            best_move, scores = self.search.get_best_move(color, board, moves, depth, pid, alpha=alpha, beta=beta)
+            if Timer.is_timeout(pid):
+                return best_move, scores
+
+            if best_move is None and alpha > _min:    # fail-low
+                alpha = _min
+            elif scores[best_move] >= beta and beta < _max:  # fail-high
+                beta = _max
+            else:
+                return best_move, scores
+
 
 class IterativeDeepning(IterativeDeepning_):
     """IterativeDeepning + Measure + Timer
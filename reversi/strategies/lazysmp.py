@@ -0,0 +1,88 @@
+"""LazySMP
+"""
+
+import multiprocessing
+
+from reversi.strategies.common import Measure, AbstractStrategy
+from reversi.strategies.iterative import IterativeDeepning_
+from reversi.strategies.endgame import _EndGame_
+
+
+class LazySMPTableError(Exception):
+    """
+    共有メモリの置換表がない
+    """
+    pass
+
+
+def _get_tt(search):
+    """_get_tt
+
+           探索が使う置換表を返す(IterativeDeepningは内部の探索のもの)
+    """
+    if isinstance(search, IterativeDeepning_):
+        search = search.search
+    return getattr(search, 'tt', None)
+
+
+def _search_helper(search, color, board, index):
+    """_search_helper
+
+           補助プロセスの探索(結果は共有の置換表を通じてメインの探索に渡す)
+    """
+    if isinstance(search, IterativeDeepning_):
+        search.depth += index % 2  # 反復を始める深さをずらす
+        search.next_move(color, board)
+        return
+
+    _get_tt(search).new_search(board)  # メインの探索と同じ世代にする
+    moves = board.get_legal_moves(color)
+    shift = index % len(moves)
+    moves = moves[shift:] + moves[:shift]  # ルートの手の順番をずらす
+    depth = search.depth if isinstance(search, _EndGame_) else search.depth + index % 2
+    search.get_best_move(color, board, moves, depth)
+
+
+class LazySMP_(AbstractStrategy):
+    """
+    複数プロセスで同じ局面を探索し、共有メモリの置換表を通じて結果を共有する
+    (メインの探索の結果を返す)
+    """
+    def __init__(self, search=None, workers=2):
+        tt = _get_tt(search)
+        if tt is None or not tt.shared:
+            raise LazySMPTableError
+
+        self.search = search
+        self.workers = workers  # 探索するプロセス数(メインを含む)
+
+    def next_move(self, color, board):
+        """
+        次の一手
+        """
+        helpers = []
+        if len(board.get_legal_moves(color)) > 1:
+            context = multiprocessing.get_context()
+            for index in range(1, self.workers):
+                helper = context.Process(target=_search_helper, args=(self.search, color, board, index), daemon=True)
+                helper.start()
+                helpers.append(helper)
+
+        try:
+            return self.search.next_move(color, board)
+        finally:
+            # 置換表の書き込み途中で止めても読み出し側で検出できるため、そのまま終了させる
+            for helper in helpers:
+                helper.terminate()
+            for helper in helpers:
+                helper.join()
+
+
+class LazySMP(LazySMP_):
+    """LazySMP + Measure
+    """
+    @Measure.time
+    def next_move(self, color, board):
+        """next_move
+        """
+        return super().next_move(color, board)
@@ -7,6 +7,7 @@ import gc
 from reversi import C as c
 from reversi.strategies.common import Timer, Measure, AbstractStrategy
 from reversi.strategies.MonteCarloMethods import playout
+from reversi.cy import is_cython_bitboard
 
 
 class Mcts(AbstractStrategy):
@@ -79,6 +80,10 @@ class Node:
     def copy_board(self, board):
         """盤面の複製
         """
+        # 探索用のボードであれば打った手の履歴を持たない複製で済ませる
+        if is_cython_bitboard(board):
+            return board.copy()
+
         from reversi import BitBoard
         size = board.size
         b, w, h = board.get_bitboard_info()
@@ -3,7 +3,6 @@
 
 import sys
 import random
-import copy
 
 from reversi.game import Game
 from reversi.player import Player
@@ -12,6 +11,7 @@ from reversi.display import NoneDisplay
 from reversi.strategies.common import Timer, Measure, AbstractStrategy
 from reversi.strategies.easy import Random
 import reversi.strategies.MonteCarloMethods as MonteCarloMethods
+from reversi.cy import is_multiword_bitboard
 
 
 MAXSIZE64 = 2**63 - 1
@@ -21,10 +21,11 @@ class MonteCarlo(AbstractStrategy):
     """
     MonteCarlo法で次の手を決める
     """
-    def __init__(self, count=100, remain=60, by_move=True):
+    def __init__(self, count=100, remain=60, by_move=True, workers=1):
         self.count = count
         self.remain = remain    # モンテカルロ法開始手数
         self.by_move = by_move  # 各手毎にcount回数プレイアウトするか
+        self.workers = workers  # 手を分割してプレイアウトするスレッド数
         self._black_player = Player('black', 'Random_B', Random())
         self._white_player = Player('white', 'Random_W', Random())
         self.timer = True
@@ -41,7 +42,10 @@ class MonteCarlo(AbstractStrategy):
         moves = board.get_legal_moves(color)  # 手の候補を取得
         count = self.count if self.by_move else self.count // len(moves)
 
-        if board.size == 8 and sys.maxsize == MAXSIZE64 and hasattr(board, '_black_bitboard') and not MonteCarloMethods.MONTECARLO_SIZE8_64BIT_ERROR:
+        if board.size <= 8 and sys.maxsize == MAXSIZE64 and hasattr(board, '_black_bitboard') and not MonteCarloMethods.MONTECARLO_SIZE8_64BIT_ERROR:
+            return MonteCarloMethods.next_move(color, board, count, pid, self.timer, self.measure, self.workers)
+
+        if is_multiword_bitboard(board) and board.size * board.size - (board._black_score + board._white_score) <= self.remain:
             return MonteCarloMethods.next_move(color, board, count, pid, self.timer, self.measure)
 
         scores = [0 for _ in range(len(moves))]  # スコアの初期化
@@ -71,8 +75,7 @@ class MonteCarlo(AbstractStrategy):
             if board.size == 8 and sys.maxsize == MAXSIZE64 and hasattr(board, '_black_bitboard') and not MonteCarloMethods.MONTECARLO_SIZE8_64BIT_ERROR:
                 return MonteCarloMethods.playout(color, board, move)
 
-            playout_board = copy.deepcopy(board)  # 現在の盤面をコピー
-            playout_board.put_disc(color, *move)  # 調べたい手を打つ
+            playout_board = board.child(color, move)  # 現在の盤面をコピーして調べたい手を打つ
 
             # 勝敗が決まるまでゲームを進める
             next_color = 'white' if color == 'black' else 'black'  # 相手の色を調べる
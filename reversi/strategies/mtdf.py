@@ -0,0 +1,98 @@
+"""MTD(f)
+"""
+
+from reversi.strategies.common import Timer, Measure, AbstractStrategy, TranspositionTable
+
+
+class MTDf_(AbstractStrategy):
+    """
+    幅0の探索窓による探索(null window search)を繰り返して評価値の範囲を狭め、次の手を決める(MTD(f))
+    (探索はsearchのget_best_moveで行い、同じ局面の繰り返しの探索は置換表で省く)
+    """
+    def __init__(self, search, step=1):
+        self.search = search  # 幅0の探索窓で探索する探索(_AlphaBeta_やNegaScoutなど)
+        self.step = step      # 評価値の刻み(探索窓の幅)
+        self.guesses = {}     # 手番と深さの偶奇ごとの前回の評価値(次の探索の最初の検証値)
+
+        if search.tt is None:
+            search.tt = TranspositionTable()  # 繰り返しの探索の結果を引き継ぐため置換表を持たせる
+        self.depth = search.depth
+        self.tt = search.tt
+        self.orderer = getattr(search, 'orderer', None)
+        self._MIN = search._MIN
+        self._MAX = search._MAX
+
+    def next_move(self, color, board):
+        """
+        次の一手
+        """
+        pid = Timer.get_pid(self)           # タイムアウト監視用のプロセスID
+        Timer.set_deadline(pid, self._MIN)  # 探索クラスのタイムアウトを設定
+        self.tt.new_search(board)           # 置換表の世代を進める
+        if self.orderer is not None:
+            self.orderer.new_search(board)  # 履歴を古くする
+
+        moves = board.get_legal_moves(color)  # 手の候補
+        best_move, _ = self.get_best_move(color, board, moves, self.depth, pid)
+
+        return best_move
+
+    def get_best_move(self, color, board, moves, depth, pid=None, alpha=None, beta=None):
+        """
+        最善手を選ぶ(alpha/betaを省略した場合は窓を制限しない)
+
+        検証値で探索して評価値の下限(lower)か上限(upper)を更新し、両者が一致するまで繰り返す
+        同じ向きに外れ続けた場合は検証値の動かし幅を倍にし、上限と下限が求まった後は間を二分する
+        評価値がalpha以下の場合は最善手をNone、beta以上の場合はbeta以上の評価値を返す
+        """
+        step, parity = self.step, depth % 2
+        lower = self._MIN if alpha is None else max(alpha, self._MIN)
+        upper = self._MAX if beta is None else min(beta, self._MAX)
+        guess = self.guesses.get((color, parity), self.guesses.get((color, 1 - parity), 0))  # 深さの偶奇が同じ前回の評価値を優先する
+        test = min(max(guess, lower + step), upper)
+        moves, best_move, scores, probe, delta, high = list(moves), None, {}, {}, step, None
+
+        while lower < upper:
+            move, probe = self.search.get_best_move(color, board, moves, depth, pid, alpha=test - step, beta=test)
+            if Timer.is_timeout(pid):
+                break
+
+            if move is None:  # fail-low(評価値の上限が求まった)
+                delta = delta * 2 if high is False else step
+                high, upper = False, max(probe.values())
+                test = upper - delta + step
+            else:             # fail-high(評価値の下限と最善手が求まった)
+                delta = delta * 2 if high else step
+                high, lower = True, probe[move]
+                if lower < test:
+                    upper = lower  # 探索窓の中の値は確定値
+                best_move, scores = move, probe
+                moves.remove(move)
+                moves.insert(0, move)  # 次の探索では最善手を先に調べる
+                test = lower + delta
+            if lower > self._MIN and upper < self._MAX:
+                test = (lower + upper + step) // 2
+            test = min(max(test, lower + step), upper)
+
+        if best_move is None:
+            if Timer.is_timeout(pid) or alpha is None:
+                best_move = moves[0]
+            else:
+                scores = probe  # 探索窓の下限を超える手がなかった
+        elif not Timer.is_timeout(pid):
+            scores[best_move] = lower
+            self.guesses[(color, parity)] = lower  # 次の探索の最初の検証値
+
+        return best_move, scores
+
+
+class MTDf(MTDf_):
+    """
+    MTD(f) + Measure
+    """
+    @Measure.time
+    def next_move(self, color, board):
+        """
+        次の一手
+        """
+        return super().next_move(color, board)
@@ -5,6 +5,7 @@ import sys
 
 from reversi.strategies.common import Timer, Measure, AbstractStrategy
 import reversi.strategies.NegaScoutMethods as NegaScoutMethods
+from reversi.cy import is_multiword_bitboard
 
 
 MAXSIZE64 = 2**63 - 1
@@ -14,12 +15,17 @@ class _NegaScout_(AbstractStrategy):
     """
     NegaScout法で次の手を決める
     """
-    def __init__(self, depth=3, evaluator=None):
+    def __init__(self, depth=3, evaluator=None, tt=None, probcut=None, orderer=None, iid=None):
         self._MIN = -10000000
         self._MAX = 10000000
 
         self.depth = depth
         self.evaluator = evaluator
+        self.tt = tt            # 置換表(TranspositionTable、Noneの場合は使わない)
+        self.probcut = probcut  # 選択的探索(ProbCut、Noneの場合は使わない)
+        self.orderer = orderer  # 途中の局面の手の並び替え(Orderer_KHなど、Noneの場合は使わない)
+        self.iid = iid          # 置換表の手がない局面で浅い探索の最善手を先に調べる残りの深さの下限(Noneの場合は使わない)
+        self._node_best = -1    # 直前に探索を終えた局面の最善手のビット位置
         self.timer = False
         self.measure = False
 
@@ -28,23 +34,29 @@ class _NegaScout_(AbstractStrategy):
         次の一手
         """
         pid = Timer.get_pid(self)  # タイムアウト監視用のプロセスID
+        if self.tt is not None:
+            self.tt.new_search(board)  # 置換表の世代を進める
+        if self.orderer is not None:
+            self.orderer.new_search(board)  # 履歴を古くする
 
-        if board.size == 8 and sys.maxsize == MAXSIZE64 and hasattr(board, '_black_bitboard') and not NegaScoutMethods.NEGASCOUT_SIZE8_64BIT_ERROR:
-            return NegaScoutMethods.next_move(color, board, self._MIN, self._MAX, self.depth, self.evaluator, pid, self.timer, self.measure)
+        if (board.size <= 8 and sys.maxsize == MAXSIZE64 and hasattr(board, '_black_bitboard') and not NegaScoutMethods.NEGASCOUT_SIZE8_64BIT_ERROR) or is_multiword_bitboard(board):  # noqa: E501
+            return NegaScoutMethods.next_move(color, board, self._MIN, self._MAX, self.depth, self.evaluator, pid, self.timer, self.measure, self.tt, self.probcut, self.orderer, self.iid)  # noqa: E501
 
         moves = board.get_legal_moves(color)  # 手の候補
         best_move, _ = self.get_best_move(color, board, moves, self.depth, pid)
 
         return best_move
 
-    def get_best_move(self, color, board, moves, depth, pid=None):
+    def get_best_move(self, color, board, moves, depth, pid=None, alpha=None, beta=None):
         """
-        最善手を選ぶ
+        最善手を選ぶ(alpha/betaを省略した場合は窓を制限しない)
         """
-        best_move, alpha, beta, scores = None, self._MIN, self._MAX, {}
+        alpha = self._MIN if alpha is None else alpha
+        beta = self._MAX if beta is None else beta
+        best_move, scores = None, {}
 
-        if board.size == 8 and sys.maxsize == MAXSIZE64 and hasattr(board, '_black_bitboard') and not NegaScoutMethods.NEGASCOUT_SIZE8_64BIT_ERROR:
-            return NegaScoutMethods.get_best_move(color, board, moves, alpha, beta, depth, self.evaluator, pid, self.timer, self.measure)
+        if (board.size <= 8 and sys.maxsize == MAXSIZE64 and hasattr(board, '_black_bitboard') and not NegaScoutMethods.NEGASCOUT_SIZE8_64BIT_ERROR) or is_multiword_bitboard(board):  # noqa: E501
+            return NegaScoutMethods.get_best_move(color, board, moves, alpha, beta, depth, self.evaluator, pid, self.timer, self.measure, self.tt, self.probcut, self.orderer, self.iid)  # noqa: E501
 
         # 打てる手の中から評価値の最も高い手を選ぶ
         for move in moves:
@@ -57,6 +69,8 @@ class _NegaScout_(AbstractStrategy):
                 if score > alpha:  # 最善手を更新
                     alpha = score
                     best_move = move
+                if alpha >= beta:  # 探索窓の上限を超えた
+                    break
 
         return best_move, scores
 
@@ -81,8 +95,8 @@ class _NegaScout_(AbstractStrategy):
 class _NegaScout(_NegaScout_):
     """NegaScout + Measure
     """
-    def __init__(self, depth=3, evaluator=None):
-        super().__init__(depth, evaluator)
+    def __init__(self, depth=3, evaluator=None, tt=None, probcut=None, orderer=None, iid=None):
+        super().__init__(depth, evaluator, tt, probcut, orderer, iid)
         self.timer = False
         self.measure = True
 
@@ -101,8 +115,8 @@ class _NegaScout(_NegaScout_):
 class NegaScout_(_NegaScout_):
     """NegaScout + Timer
     """
-    def __init__(self, depth=3, evaluator=None):
-        super().__init__(depth, evaluator)
+    def __init__(self, depth=3, evaluator=None, tt=None, probcut=None, orderer=None, iid=None):
+        super().__init__(depth, evaluator, tt, probcut, orderer, iid)
         self.timer = True
         self.measure = False
 
@@ -121,8 +135,8 @@ class NegaScout_(_NegaScout_):
 class NegaScout(_NegaScout_):
     """NegaScout + Measure + Timer
     """
-    def __init__(self, depth=3, evaluator=None):
-        super().__init__(depth, evaluator)
+    def __init__(self, depth=3, evaluator=None, tt=None, probcut=None, orderer=None, iid=None):
+        super().__init__(depth, evaluator, tt, probcut, orderer, iid)
         self.timer = True
         self.measure = True
 
@@ -0,0 +1,203 @@
+"""ProofNumber
+"""
+
+from itertools import islice
+
+from reversi.strategies.common import Measure, AbstractStrategy, TranspositionTable
+
+
+PN_INFINITY = 10000000  # 証明数/反証数の無限大
+DFPN_MAX_NODES = 20000  # DfPnの1回の証明で調べる局面数の上限の既定値(1手あたりCPU_TIME程度)
+
+
+class ProofNumberSearch:
+    """
+    df-pn(深さ優先の証明数探索)で攻め方の勝ち(終局時に石が多い)を証明/反証する
+    cooperativeの場合は両者とも攻め方の勝ちを目指す手順を探す(最短勝ちの手順)
+    局面表はエントリ数の上限を超えると古いものから捨てる
+    """
+    def __init__(self, table_size=0x100000, max_nodes=None):
+        self.table_size = table_size  # 局面表のエントリ数の上限
+        self.max_nodes = max_nodes    # 1回の証明で調べる局面数の上限(Noneの場合は無制限)
+        self.table = {}               # (局面のキー, 残り手数): (証明数, 反証数)
+        self.nodes = 0
+        self.attacker = None
+        self.cooperative = False
+        self._aborted = False
+
+    def clear(self):
+        """clear
+        """
+        self.table.clear()
+
+    def prove(self, color, board, attacker, depth=None, cooperative=False):
+        """prove
+
+               colorの手番の局面で攻め方の勝ちを証明した場合はTrue、反証した場合はFalse、調べる局面数の上限に達した場合はNoneを返す
+               depthを指定した場合はその手数以内(パスを除く)に終局する勝ちのみを探す
+        """
+        if attacker != self.attacker or cooperative != self.cooperative:
+            self.table.clear()  # 問題が変わった場合は結果を使い回さない
+        self.attacker, self.cooperative = attacker, cooperative
+        self.nodes, self._aborted = 0, False
+        pn, dn = self._mid(color, board, depth, PN_INFINITY, PN_INFINITY)
+        return True if pn == 0 else False if dn == 0 else None
+
+    def get_best_move(self, color, board, attacker, depth=None, cooperative=False):
+        """get_best_move
+
+               攻め方の勝ちを証明できる手を返す(ない場合はNone)
+        """
+        if not self.prove(color, board, attacker, depth, cooperative):
+            return None
+        next_color = 'white' if color == 'black' else 'black'
+        for move in board.get_legal_moves(color):
+            board.put_disc(color, *move)
+            proved = self.prove(next_color, board, attacker, None if depth is None else depth - 1, cooperative)
+            board.undo()
+            if proved:
+                return move
+        return None
+
+    def get_proof_moves(self, color, board, attacker, depth=None, cooperative=False):
+        """get_proof_moves
+
+               攻め方の勝ちを証明した手順を(手番, 手)のリストで返す(守り方は最初の合法手、証明できない場合はNone)
+        """
+        if not self.prove(color, board, attacker, depth, cooperative):
+            return None
+        moves = []
+        try:
+            while True:
+                next_color = 'white' if color == 'black' else 'black'
+                legal_moves = board.get_legal_moves(color)
+                if not legal_moves:
+                    if not board.get_legal_moves(next_color):
+                        return moves  # 終局
+                    color = next_color  # パス
+                    continue
+                move = legal_moves[0]
+                if cooperative or color == attacker:
+                    move = self.get_best_move(color, board, attacker, depth, cooperative)
+                    if move is None:
+                        return None  # 子局面を証明し直せなかった(局面数の上限や局面表から消えた場合)
+                board.put_disc(color, *move)
+                moves.append((color, move))
+                color = next_color
+                depth = None if depth is None else depth - 1
+        finally:
+            for _ in moves:
+                board.undo()
+
+    def get_shortest_win(self, color, board, attacker, limit, cooperative=False):
+        """get_shortest_win
+
+               limit手以内で攻め方が勝つ最短の手数と手順を返す(見つからない場合は(None, None))
+        """
+        for depth in range(1, limit + 1):
+            if self.prove(color, board, attacker, depth, cooperative):
+                return depth, self.get_proof_moves(color, board, attacker, depth, cooperative)
+        return None, None
+
+    def _store(self, key, pn, dn):
+        """_store
+        """
+        table = self.table
+        if table.pop(key, None) is None and len(table) >= self.table_size:
+            for old in list(islice(table, max(self.table_size // 4, 1))):  # 古いものから捨てる
+                del table[old]
+        table[key] = (pn, dn)
+
+    def _mid(self, color, board, depth, th_pn, th_dn):
+        """_mid
+
+               しきい値を超えるまで局面を展開し、(証明数, 反証数)を返す
+        """
+        self.nodes += 1
+        key = (TranspositionTable.get_key(board, color), depth)
+        pn, dn = self.table.get(key, (1, 1))
+        if pn >= th_pn or dn >= th_dn:
+            return pn, dn
+        if self.max_nodes is not None and self.nodes > self.max_nodes:
+            self._aborted = True
+            return pn, dn
+        # 終局
+        next_color = 'white' if color == 'black' else 'black'
+        moves = board.get_legal_moves(color)
+        if not moves and not board.get_legal_moves(next_color):
+            diff = board._black_score - board._white_score
+            win = diff > 0 if self.attacker == 'black' else diff < 0
+            pn, dn = (0, PN_INFINITY) if win else (PN_INFINITY, 0)
+            self._store(key, pn, dn)
+            return pn, dn
+        # 手数の上限
+        if depth is not None and depth <= 0:
+            self._store(key, PN_INFINITY, 0)
+            return PN_INFINITY, 0
+        # 子局面(打てない場合はパス)
+        children = []
+        for move in moves or [None]:
+            child_depth = depth
+            if move is not None:
+                board.put_disc(color, *move)
+                child_depth = None if depth is None else depth - 1
+            children.append((move, (TranspositionTable.get_key(board, next_color), child_depth)))
+            if move is not None:
+                board.undo()
+        is_or = self.cooperative or color == self.attacker
+        values = [self.table.get(child_key, (1, 1)) for _, child_key in children]
+        pns, dns = [value[0] for value in values], [value[1] for value in values]  # 局面表から消えても進捗を失わないよう手元に持つ
+        while True:
+            if is_or:
+                pn, dn = min(pns), min(sum(dns), PN_INFINITY)
+            else:
+                pn, dn = min(sum(pns), PN_INFINITY), min(dns)
+            if pn >= th_pn or dn >= th_dn or self._aborted:
+                break
+            # 最も有望な子局面を、2番目の子局面の値までのしきい値で調べる
+            numbers = pns if is_or else dns
+            best = numbers.index(min(numbers))
+            second = min(numbers[:best] + numbers[best+1:], default=PN_INFINITY)
+            if is_or:
+                child_th_pn, child_th_dn = min(th_pn, second + 1), th_dn - dn + dns[best]
+            else:
+                child_th_pn, child_th_dn = th_pn - pn + pns[best], min(th_dn, second + 1)
+            move, (_, child_depth) = children[best]
+            if move is not None:
+                board.put_disc(color, *move)
+            pns[best], dns[best] = self._mid(next_color, board, child_depth, child_th_pn, child_th_dn)
+            if move is not None:
+                board.undo()
+        self._store(key, pn, dn)
+        return pn, dn
+
+
+class DfPn_(AbstractStrategy):
+    """
+    df-pnで勝ちを証明できる手を打つ(証明できない場合はsearchの手、searchがない場合は最初の合法手)
+    """
+    def __init__(self, search=None, depth=None, table_size=0x100000, max_nodes=DFPN_MAX_NODES):
+        self.search = search  # 勝ちを証明できない場合の戦略
+        self.depth = depth    # 勝ちを探す手数の上限(Noneの場合は終局まで)
+        self.pns = ProofNumberSearch(table_size=table_size, max_nodes=max_nodes)
+
+    def next_move(self, color, board):
+        """
+        次の一手
+        """
+        move = self.pns.get_best_move(color, board, color, self.depth)
+        if move is not None:
+            return move
+        if self.search is not None:
+            return self.search.next_move(color, board)
+        return board.get_legal_moves(color)[0]
+
+
+class DfPn(DfPn_):
+    """DfPn + Measure
+    """
+    @Measure.time
+    def next_move(self, color, board):
+        """next_move
+        """
+        return super().next_move(color, board)
@@ -1,4 +1,34 @@
-from setuptools import setup
+import os
+import importlib.util
+
+from setuptools import setup, Extension
+from setuptools.command.build_ext import build_ext
+
+# Cythonモジュール(Cythonが無い場合やビルドに失敗した場合は、実行時にビルドする)
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        [Extension('reversi.cy.ReversiMethods', ['reversi/cy/ReversiMethods.pyx'], optional=True)],
+        quiet=True,
+    )
+except ImportError:
+    ext_modules = []
+
+
+class BuildExt(build_ext):
+    """Cythonモジュールのビルド後に元のpyxのハッシュを記録する(古いビルド済みモジュールと区別するため)
+    """
+    def run(self):
+        super().run()
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'reversi', 'cy', 'prebuilt.py')
+        spec = importlib.util.spec_from_file_location('prebuilt', path)
+        prebuilt = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(prebuilt)
+        for ext in self.extensions:
+            ext_path = self.get_ext_fullpath(ext.name)
+            if os.path.isfile(ext_path):
+                prebuilt.write_inplace_digest(os.path.dirname(ext_path))
+
 
 setup(
     name='reversi',
@@ -34,8 +64,10 @@ setup(
         'reversi.examples.extra.vbscript.randomcorner',
         'reversi.examples.extra.sample_input',
     ],
+    ext_modules=ext_modules,
+    cmdclass={'build_ext': BuildExt},
     package_data={
-        "": ["*.json", "*.pl", "*.py", "*.vbs", "*.txt", "*.pyx", "*.pyd", "*.bat", "*.ico"]
+        "": ["*.json", "*.pl", "*.py", "*.vbs", "*.txt", "*.pyx", "*.pyd", "*.digest", "*.bat", "*.sh", "*.ico"]
     },
     entry_points={
         "console_scripts": [
@@ -0,0 +1,90 @@
+"""Tests of probcut.py
+"""
+
+import unittest
+
+from reversi import BitBoard
+from reversi.strategies import ProbCut, get_selfplay_positions, Random, Measure, _AlphaBeta, _NegaScout
+from reversi.strategies.coordinator import Evaluator_TPW
+from reversi.strategies.common.probcut import PROBCUT_MAX_STAGES, PROBCUT_MAX_DEPTH, _fit
+
+
+class TestProbCut(unittest.TestCase):
+    """probcut
+    """
+    def test_init(self):
+        probcut = ProbCut()
+        self.assertEqual(probcut.params, {})
+        self.assertEqual(probcut.threshold, 1.5)
+        self.assertEqual(probcut.stages, 4)
+        self.assertEqual(ProbCut(stages=100).stages, PROBCUT_MAX_STAGES)
+        self.assertEqual(ProbCut(stages=0).stages, 1)
+
+    def test_get_stage(self):
+        board = BitBoard()
+        self.assertEqual(ProbCut(stages=4).get_stage(board), 0)
+        board._black_bitboard, board._white_bitboard = 0xFFFFFFFF00000000, 0x00000000FFFFFFFF
+        board.update_score()
+        self.assertEqual(ProbCut(stages=4).get_stage(board), 3)
+        board = BitBoard(4, hole=0x8001)  # 穴は数えない
+        board._black_bitboard, board._white_bitboard = 0x7F00, 0x00FE
+        board.update_score()
+        self.assertEqual(ProbCut(stages=2).get_stage(board), 1)
+
+    def test_get_checks(self):
+        params = {
+            (0, 4): [(2, 1.0, 0.5, 2.0), (3, -1.0, 0.0, 1.0), (1, 1.0, 0.0, 1.0)],  # aが負の組は使わない
+            (0, 5): [(5, 1.0, 0.0, 1.0)],                                        # 浅い探索が深い探索以上の組は使わない
+            (0, PROBCUT_MAX_DEPTH + 1): [(1, 1.0, 0.0, 1.0)],
+        }
+        probcut = ProbCut(params, threshold=2.0)
+        self.assertEqual(probcut.get_checks(0, 4), [(2, 1.0, 0.5, 4.0)])
+        self.assertEqual(probcut.get_checks(0, 5), [])
+        self.assertEqual(probcut.get_checks(1, 4), [])
+        self.assertEqual(probcut.get_checks(0, PROBCUT_MAX_DEPTH + 1), [])
+
+        board = BitBoard()
+        self.assertEqual(probcut.get_windows(board, 4, -10, 10), [(2, -14.5, 13.5)])
+        self.assertEqual(probcut.get_windows(board, 4, -10000000, 10000000), [(2, None, None)])
+
+    def test_calibrate(self):
+        self.assertEqual(_fit([(1, 3), (2, 5), (3, 7)], 2), (2, 2.0, 1.0, 0.0))
+        self.assertIsNone(_fit([(1, 3)], 2))
+        self.assertIsNone(_fit([(1, 3), (1, 5)], 2))
+
+        positions = get_selfplay_positions(Random(), matches=2, board_size=6, random_opening=0)
+        self.assertGreater(len(positions), 2 * 20)
+        self.assertEqual(positions[0][0], 'black')
+        self.assertEqual(positions[0][1].get_bitboard_info(), BitBoard(6).get_bitboard_info())
+
+        search = _NegaScout(evaluator=Evaluator_TPW())
+        probcut = ProbCut.calibrate(search, positions, {3: (1,), 4: (2, 1)}, stages=2, limit=5000)
+        self.assertIsNone(search.probcut)
+        self.assertEqual(sorted(probcut.params), [(0, 3), (0, 4), (1, 3), (1, 4)])
+        self.assertEqual([check[0] for check in probcut.params[(0, 4)]], [2, 1])
+        for checks in probcut.params.values():
+            for _, a, _, sigma in checks:
+                self.assertGreater(a, 0)
+                self.assertGreaterEqual(sigma, 0)
+
+    def test_search_with_probcut(self):
+        board = BitBoard()
+        for x, y, color in [(5, 4, 'black'), (3, 5, 'white'), (2, 3, 'black'), (5, 3, 'white')]:
+            board.put_disc(color, x, y)
+        moves = board.get_legal_moves('black')
+        loose = ProbCut({(0, depth): [(depth - 2, 1.0, 0.0, 10000.0)] for depth in range(3, 6)})
+        tight = ProbCut({(0, depth): [(depth - 2, 1.0, 0.0, 0.0)] for depth in range(3, 6)})
+
+        for search in [_AlphaBeta, _NegaScout]:
+            counts = []
+            for probcut in [None, loose, tight]:
+                pid = search.__name__ + '_probcut'
+                Measure.count[pid] = 0
+                best_move, scores = search(evaluator=Evaluator_TPW(), probcut=probcut).get_best_move('black', board, moves, 5, pid)
+                self.assertIn(best_move, moves)
+                counts.append(Measure.count[pid])
+                if probcut is None:
+                    expected = scores
+                elif probcut is loose:
+                    self.assertEqual(scores, expected)  # 予測の幅が広い場合は枝刈りしない
+            self.assertLess(counts[2], counts[0])
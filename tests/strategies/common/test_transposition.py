@@ -0,0 +1,202 @@
+"""Tests of transposition.py
+"""
+
+import unittest
+import os
+import pickle
+import sys
+import tempfile
+import subprocess
+
+from reversi import BitBoard
+from reversi.strategies import TranspositionTable, _AlphaBeta_, _NegaScout_, _EndGame_
+from reversi.strategies.coordinator import Evaluator_TPW
+from reversi.strategies.common.transposition import TT_EXACT, TT_LOWER, TT_UPPER, get_ordered_moves
+
+
+class TestTranspositionTable(unittest.TestCase):
+    """transposition
+    """
+    def test_init(self):
+        tt = TranspositionTable(size=1000, min_depth=3)
+        self.assertEqual(tt.size, 1024)
+        self.assertEqual(tt.min_depth, 3)
+        self.assertEqual(len(tt.keys), 1024)
+        self.assertEqual(tt.moves[0], -1)
+        self.assertEqual((tt.probes, tt.hits, tt.cutoffs, tt.stores), (0, 0, 0, 0))
+        self.assertEqual(tt.hit_rate, 0.0)
+
+    def test_get_key(self):
+        board = BitBoard()
+        self.assertEqual(TranspositionTable.get_key(board, 'black'), board.hash)
+        self.assertNotEqual(TranspositionTable.get_key(board, 'white'), board.hash)
+
+    def test_store_lookup(self):
+        tt = TranspositionTable(size=16)
+        tt.new_search()
+        key = 0x1234
+
+        # 未格納
+        self.assertEqual(tt.lookup(key, 3, -10, 10), (None, -10, 10, -1))
+
+        # 確定値
+        tt.store(key, 3, 5, -10, 10, 7)
+        self.assertEqual(tt.bounds[key & 15], TT_EXACT)
+        self.assertEqual(tt.lookup(key, 3, -10, 10), (5, -10, 10, 7))
+        self.assertEqual(tt.lookup(key, 4, -10, 10), (None, -10, 10, 7))
+
+        # 下限値
+        tt.store(key, 3, 20, -10, 10, 8)
+        self.assertEqual(tt.bounds[key & 15], TT_LOWER)
+        self.assertEqual(tt.lookup(key, 3, -10, 15), (20, -10, 15, 8))
+        self.assertEqual(tt.lookup(key, 3, -10, 30), (None, 20, 30, 8))
+
+        # 上限値(最善手なしは前回の手を引き継ぐ)
+        tt.store(key, 3, -20, -10, 10)
+        self.assertEqual(tt.bounds[key & 15], TT_UPPER)
+        self.assertEqual(tt.lookup(key, 3, -15, 10), (-20, -15, 10, 8))
+        self.assertEqual(tt.lookup(key, 3, -30, 10), (None, -30, -20, 8))
+
+        self.assertEqual((tt.probes, tt.hits, tt.cutoffs, tt.stores), (7, 6, 3, 3))
+        tt.reset_stats()
+        self.assertEqual((tt.probes, tt.hits, tt.cutoffs, tt.stores), (0, 0, 0, 0))
+
+    def test_replace(self):
+        tt = TranspositionTable(size=16)
+        tt.new_search()
+
+        # 同じ世代のより深い結果は残す
+        tt.store(0x01, 5, 1, -10, 10)
+        tt.store(0x11, 3, 2, -10, 10)
+        self.assertEqual(tt._read_entry(1)[0], 0x01)
+
+        # 世代が変わると置き換える
+        tt.new_search()
+        tt.store(0x11, 3, 2, -10, 10)
+        self.assertEqual(tt._read_entry(1)[0], 0x11)
+
+    def test_new_search(self):
+        tt = TranspositionTable(size=16)
+        tt.new_search(BitBoard(8))
+        tt.store(0x01, 5, 1, -10, 10)
+        tt.new_search(BitBoard(8))
+        self.assertEqual(tt.age, 2)
+        self.assertEqual(tt._read_entry(1)[0], 0x01)
+
+        # 盤面のサイズが変わると消去する
+        tt.new_search(BitBoard(6))
+        self.assertEqual(tt.bounds[1], 0)
+
+    def test_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'tt.bin')
+            tt = TranspositionTable(size=16, path=path)
+            self.assertEqual(tt.moves[0], -1)
+            tt.new_search(BitBoard(8))
+            tt.store(0x1234, 5, 3, -10, 10, 9)
+            tt.close()
+            self.assertIsNone(tt.path)
+            self.assertEqual(tt.bounds[4], 0)
+
+            # 閉じた後も引き継ぐ
+            tt = TranspositionTable(size=16, path=path)
+            self.assertEqual(tt.age, 1)
+            self.assertEqual(tt.lookup(0x1234, 5, -10, 10), (3, -10, 10, 9))
+            tt.new_search(BitBoard(8))
+            self.assertEqual(tt._read_entry(4)[0], 0x1234)
+
+            # 別のプロセスに渡すとファイルを開き直す
+            other = pickle.loads(pickle.dumps(tt))
+            self.assertEqual((other.path, other.age), (path, 2))
+            self.assertEqual(other.lookup(0x1234, 5, -10, 10), (3, -10, 10, 9))
+            other.close()
+
+            # 盤面の穴が変わると消去する
+            tt.new_search(BitBoard(8, hole=0x8100000000000081))
+            self.assertEqual(tt.bounds[4], 0)
+            tt.close()
+
+            # エントリ数が異なる場合は作り直す
+            tt = TranspositionTable(size=32, path=path)
+            self.assertEqual((tt.age, len(tt.keys)), (0, 32))
+            self.assertEqual(os.path.getsize(path), 64 + 32 * 23)
+            tt.close()
+
+    def test_shared(self):
+        tt = TranspositionTable(size=16, shared=True)
+        tt.new_search(BitBoard(8))
+        tt.store(0x1234, 5, 3, -10, 10, 9)
+
+        # 別のプロセスに渡すと同じ領域を参照する(解放は作成したプロセスに任せる)
+        other = pickle.loads(pickle.dumps(tt))
+        self.assertTrue(other.shared)
+        self.assertEqual((tt._owner, other._owner), (os.getpid(), None))
+        self.assertEqual(other.age, 1)
+        self.assertEqual(other.lookup(0x1234, 5, -10, 10), (3, -10, 10, 9))
+        other.store(0x5678, 5, 4, -10, 10, 2)
+        self.assertEqual(tt.lookup(0x5678, 5, -10, 10), (4, -10, 10, 2))
+        other.close()
+
+        # resource_trackerを共有しないプロセスで開いても、そのプロセスの終了時に解放されない
+        code = 'import pickle, sys; tt = pickle.loads(sys.stdin.buffer.read()); tt.store(0x9abc, 5, 5, -10, 10, 3); tt.close()'
+        result = subprocess.run([sys.executable, '-c', code], input=pickle.dumps(tt), capture_output=True)
+        self.assertEqual((result.returncode, result.stderr), (0, b''))
+        self.assertEqual(tt.lookup(0x9abc, 5, -10, 10), (5, -10, 10, 3))
+
+        # 書き込み途中のエントリは一致しない
+        tt.values[0x5678 & 15] = 7
+        self.assertEqual(tt.lookup(0x5678, 5, -10, 10), (None, -10, 10, -1))
+        tt.close()
+        self.assertFalse(tt.shared)
+
+    def test_get_ordered_moves(self):
+        board = BitBoard(4)
+        legal_moves_bits = board.get_legal_moves_bits('black')
+        self.assertEqual(get_ordered_moves(legal_moves_bits, 4), board.get_legal_moves('black'))
+        self.assertEqual(get_ordered_moves(legal_moves_bits, 4, 1), [(2, 3), (1, 0), (0, 1), (3, 2)])
+
+    def test_pv(self):
+        board = BitBoard()
+        tt = TranspositionTable(min_depth=1)
+        tt.new_search(board)
+        self.assertEqual(tt.get_pv('black', board), [])
+        self.assertEqual(tt.get_pv('black', board, (5, 4)), [('black', (5, 4))])
+
+        pv = [('black', (5, 4)), ('white', (5, 5)), ('black', (4, 5))]
+        tt.store_pv(board, pv)
+        self.assertEqual(tt.get_pv('black', board), pv)
+        self.assertEqual(board.get_bitboard_info(), BitBoard().get_bitboard_info())  # 盤面は元に戻る
+
+        key = TranspositionTable.get_key(board, 'black')
+        self.assertEqual(tt.lookup(key, 1, -10, 10), (None, -10, 10, 26))  # 枝刈りには使われない
+        tt.store(key, 3, 5, -10, 10, 0)
+        tt.store_pv(board, pv[:1])
+        self.assertEqual(tt.lookup(key, 3, -10, 10), (5, -10, 10, 26))  # 格納済みの評価値は残す
+
+        _, scores = _AlphaBeta_(evaluator=Evaluator_TPW(), tt=tt).get_best_move('black', board, board.get_legal_moves('black'), 4)
+        pv = tt.get_pv('black', board, max(scores, key=scores.get))
+        self.assertGreaterEqual(len(pv), 3)
+        self.assertEqual([color for color, _ in pv[:3]], ['black', 'white', 'black'])
+
+    def test_search_with_table(self):
+        board = BitBoard()
+        for x, y, color in [(5, 4, 'black'), (3, 5, 'white'), (2, 3, 'black'), (5, 3, 'white')]:
+            board.put_disc(color, x, y)
+        moves = board.get_legal_moves('black')
+
+        for search in [_AlphaBeta_, _NegaScout_]:
+            expected = search(evaluator=Evaluator_TPW()).get_best_move('black', board, moves, 4)[1]
+            tt = TranspositionTable(min_depth=1)
+            tt.new_search(board)
+            actual = search(evaluator=Evaluator_TPW(), tt=tt).get_best_move('black', board, moves, 4)[1]
+            self.assertEqual(expected, actual)
+            self.assertGreater(tt.stores, 0)
+
+    def test_endgame_with_table(self):
+        board = BitBoard(4)
+        color = 'black'
+        for x, y in [(1, 0), (0, 0), (0, 1), (3, 3)]:
+            board.put_disc(color, x, y)
+            color = 'white' if color == 'black' else 'black'
+        tt = TranspositionTable(min_depth=1)
+        self.assertEqual(_EndGame_().next_move(color, board), _EndGame_(tt=tt).next_move(color, board))
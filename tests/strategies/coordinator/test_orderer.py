@@ -3,8 +3,10 @@
 
 import unittest
 
-from reversi.board import BitBoard
-from reversi.strategies.coordinator import Orderer, Orderer_B, Orderer_C, Orderer_P, Orderer_BC, Orderer_CB, Orderer_PCB
+from reversi.board import Board, BitBoard
+from reversi.strategies import _AlphaBeta, _NegaScout, Measure
+from reversi.strategies.coordinator import Orderer, Orderer_B, Orderer_C, Orderer_P, Orderer_BC, Orderer_CB, Orderer_PCB, Orderer_K, Orderer_H, Orderer_KH, Evaluator_TPW  # noqa: E501
+from reversi.strategies.coordinator.orderer import ORDERER_MAX_DEPTH, ORDERER_KILLERS, ORDERER_KILLER_PRIORITY
 
 
 class TestOrderer(unittest.TestCase):
@@ -104,3 +106,69 @@ class TestOrderer(unittest.TestCase):
         moves = orderer.move_ordering(color='black', board=board, moves=board.get_legal_moves('black'), best_move=best_move)
 
         self.assertEqual(moves, [(2, 3), (0, 7), (5, 4), (4, 5), (5, 5), (0, 3), (0, 4), (0, 5), (0, 6), (2, 7)])
+
+    def test_orderer_kh(self):
+        orderer = Orderer_KH()
+        self.assertEqual((orderer.killer, orderer.history), (True, True))
+        self.assertEqual((Orderer_K().killer, Orderer_K().history), (True, False))
+        self.assertEqual((Orderer_H().killer, Orderer_H().history), (False, True))
+
+        # beta cutを起こした手を覚える
+        orderer.update('black', 3, 10)
+        orderer.update('black', 3, 20)
+        orderer.update('black', 3, 20)
+        orderer.update('white', 2, 30)
+        orderer.update('black', ORDERER_MAX_DEPTH, 40)  # キラー手は覚えない深さ
+        self.assertEqual(list(orderer.killers[6:8]), [20, 10])
+        self.assertEqual(orderer.get_priority('black', 3, 20), ORDERER_KILLER_PRIORITY | 18)
+        self.assertEqual(orderer.get_priority('black', 3, 10), (ORDERER_KILLER_PRIORITY >> 1) | 9)
+        self.assertEqual(orderer.get_priority('black', 2, 20), 18)
+        self.assertEqual(orderer.get_priority('white', 2, 20), 0)
+        self.assertEqual(orderer.get_priority('black', 1, 40), ORDERER_MAX_DEPTH * ORDERER_MAX_DEPTH)
+        self.assertEqual(Orderer_K().get_priority('black', 3, 20), 0)
+
+        # 優先度の高い順に並べる(ビット位置は左上が最上位)
+        moves = [(7, 7), (5, 6), (3, 5), (4, 4)]  # 0, 10, 20, 27
+        self.assertEqual(orderer.sort_moves('black', 3, moves, 8), [(3, 5), (5, 6), (7, 7), (4, 4)])
+        self.assertEqual(orderer.sort_moves('black', 3, moves, 8, first=27), [(4, 4), (3, 5), (5, 6), (7, 7)])
+        self.assertEqual(orderer.move_killers(3, moves, 8), [(3, 5), (5, 6), (7, 7), (4, 4)])
+        self.assertEqual(orderer.move_killers(2, moves, 8), moves)
+
+        board = BitBoard(8)
+        board.put_disc('black', 3, 2)
+        orderer.update('white', 4, 63 - (2 * 8 + 4))
+        moves = orderer.move_ordering(color='white', board=board, moves=board.get_legal_moves('white'), best_move=(2, 4))
+        self.assertEqual(moves, [(2, 4), (4, 2), (2, 2)])
+
+        # 一手ごとに履歴を減らし、新しい対局では消去する
+        orderer.new_search(board)
+        self.assertEqual(orderer.get_priority('black', 2, 20), 9)
+        board.put_disc('white', 2, 4)
+        orderer.new_search(board)
+        self.assertEqual(orderer.get_priority('black', 2, 20), 4)
+        orderer.new_search(BitBoard(8))
+        self.assertEqual(orderer.get_priority('black', 3, 20), 0)
+        self.assertEqual(list(orderer.killers[6:8]), [-1, -1])
+
+    def test_search_with_orderer_kh(self):
+        # 白の手に対する黒の応手が、兄弟の局面でも同じ深さでbeta cutを起こす局面
+        for board in [BitBoard(8), BitBoard(10), Board(8, kind='List')]:
+            offset = board.size // 2 - 4
+            for x, y, color in [(3, 2, 'black'), (2, 2, 'white'), (2, 3, 'black')]:
+                board.put_disc(color, x + offset, y + offset)
+            moves = board.get_legal_moves('white')
+            for search in [_AlphaBeta, _NegaScout]:
+                pid = search.__name__ + '_orderer'
+                Measure.count[pid] = 0
+                _, expected = search(evaluator=Evaluator_TPW()).get_best_move('white', board, moves, 3, pid)
+                count = Measure.count[pid]
+                for orderer in [Orderer_K(), Orderer_H(), Orderer_KH()]:
+                    Measure.count[pid] = 0
+                    _, scores = search(evaluator=Evaluator_TPW(), orderer=orderer).get_best_move('white', board, moves, 3, pid)
+                    self.assertEqual(scores, expected)  # 手の順序が変わっても評価値は同じ
+                    if orderer.killer:
+                        self.assertGreaterEqual(orderer.killers[ORDERER_KILLERS], 0)  # 残り深さ1でbeta cutを起こした手を覚える
+                        if search is _AlphaBeta:
+                            self.assertLess(Measure.count[pid], count)  # 兄弟の局面でキラー手を先に調べて枝刈りが早まる
+                    if orderer.history:
+                        self.assertTrue(any(orderer.histories))
@@ -5,9 +5,9 @@ import unittest
 import os
 import time
 
-from reversi.board import BitBoard
-from reversi.strategies.common import Timer, Measure, CPU_TIME
-from reversi.strategies import _AlphaBeta_, _AlphaBeta, AlphaBeta_, AlphaBeta
+from reversi.board import BitBoard, Board
+from reversi.strategies.common import Timer, Measure, CPU_TIME, TranspositionTable
+from reversi.strategies import _AlphaBeta_, _AlphaBeta, AlphaBeta_, AlphaBeta, _AlphaBetaN_, _AlphaBetaN, AlphaBetaN_, AlphaBetaN
 import reversi.strategies.coordinator as coord
 
 
@@ -28,6 +28,13 @@ class TestAlphaBeta(unittest.TestCase):
             self.assertEqual(alphabeta.depth, 4)
             self.assertTrue(isinstance(alphabeta.evaluator, coord.Evaluator_T))
 
+        for instance in [_AlphaBetaN_, _AlphaBetaN, AlphaBetaN_, AlphaBetaN]:
+            orderer = coord.Orderer_KH()
+            alphabeta = instance(depth=4, orderer=orderer, iid=3)
+            self.assertTrue(isinstance(alphabeta.evaluator, coord.Evaluator_N))
+            self.assertIs(alphabeta.orderer, orderer)
+            self.assertEqual(alphabeta.iid, 3)
+
     def test_alphabeta_get_score(self):
         for instance in [_AlphaBeta_, _AlphaBeta, AlphaBeta_, AlphaBeta]:
             board = BitBoard()
@@ -72,6 +79,32 @@ class TestAlphaBeta(unittest.TestCase):
             moves = board.get_legal_moves('black')
             self.assertEqual(alphabeta.get_best_move('black', board, moves, 5), ((2, 2), {(2, 2): 8, (2, 3): 8, (5, 3): 8, (1, 5): 8, (2, 5): 8, (3, 5): 8, (4, 5): 8, (6, 5): 8}))  # noqa: E501
 
+    def test_alphabeta_iid(self):
+        # 手順が異なり同じ局面になる2つの手順
+        lines = [
+            [(3, 2, 'black'), (2, 2, 'white'), (2, 3, 'black'), (2, 4, 'white')],
+            [(2, 3, 'black'), (2, 2, 'white'), (3, 2, 'black'), (2, 4, 'white')],
+        ]
+        for make_board in [lambda: BitBoard(8), lambda: Board(8, kind='List')]:
+            results = {}
+            for iid in [None, 3]:
+                pid = '_AlphaBeta_iid'
+                alphabeta = _AlphaBeta(evaluator=coord.Evaluator_TPW(), tt=TranspositionTable(), iid=iid)
+                self.assertEqual(alphabeta.iid, iid)
+                counts, best = [], []
+                for line in lines:
+                    board = make_board()
+                    for x, y, color in line:
+                        board.put_disc(color, x, y)
+                    Measure.count[pid] = 0
+                    best.append(alphabeta.get_best_move('black', board, board.get_legal_moves('black'), 5, pid))
+                    counts.append(Measure.count[pid])
+                self.assertEqual(best[0], best[1])
+                results[iid] = counts, best[0]
+            self.assertEqual(results[3][1], results[None][1])        # 浅い探索で手の順序が変わっても結果は同じ
+            self.assertLess(results[3][0][0], results[None][0][0])   # 置換表の手がない局面は浅い探索の最善手から調べる
+            self.assertEqual(results[3][0][1], results[None][0][1])  # 別の手順で置換表に手がある局面は浅い探索をしない
+
     def test_alphabeta_performance_of_get_score(self):
         board = BitBoard()
         board.put_disc('black', 3, 2)
@@ -26,6 +26,7 @@ class TestBlank(unittest.TestCase):
             self.assertTrue(isinstance(blank.negascout_tpweb, negascout_tpweb[index]))
             self.assertEqual(blank.timer, timer[index])
             self.assertEqual(blank.measure, measure[index])
+            self.assertEqual(blank.workers, 1)
         depth = 12
         for index, instance in enumerate([_Blank_, _Blank, Blank_, Blank]):
             blank = instance(depth)
@@ -22,7 +22,7 @@ from reversi.strategies import NegaScout_TPW, NegaScout_TPWE
 from reversi.strategies import NegaScout1_TPW, NegaScout2_TPW, NegaScout3_TPW, NegaScout4_TPW
 from reversi.strategies import NegaScout1_TPOW, NegaScout2_TPOW, NegaScout3_TPOW, NegaScout4_TPOW
 from reversi.strategies import NegaScout1_TPWE, NegaScout2_TPWE, NegaScout3_TPWE, NegaScout4_TPWE
-from reversi.strategies import AbI_B_TPW, AbI_B_TPWE, AbI_PCB_TPWE, AbI_B_TPWE_, AbI_B_TPWEC, NsI_B_TPW, NsI_B_TPWE
+from reversi.strategies import AbI_B_TPW, AbI_B_TPWE, AbI_PCB_TPWE, AbI_B_TPWE_, AbI_B_TPWEC, NsI_B_TPW, NsI_B_TPWE, MtdfI_B_TPWE, MTDf
 from reversi.strategies import IterativeDeepning
 from reversi.strategies import AlphaBeta, NegaScout
 from reversi.strategies import SwitchAbI_B_TPWE, SwitchNsI_B_TPWE, SwitchNsI_B_TPWE_F, SwitchNsI_B_TPWE_Type2
@@ -120,12 +120,15 @@ class TestCustom(unittest.TestCase):
             (AbI_B_TPWEC(),  2, Selector, Orderer_B,   AlphaBeta_TPWEC),
             (NsI_B_TPW(),    2, Selector, Orderer_B,   NegaScout_TPW),
             (NsI_B_TPWE(),   2, Selector, Orderer_B,   NegaScout_TPWE),
+            (MtdfI_B_TPWE(), 2, Selector, Orderer_B,   MTDf),
         ]
         for obj, depth, selector, orderer, search in patterns:
             self.assertEqual(obj.depth, depth)
             self.assertIsInstance(obj.selector, selector)
             self.assertIsInstance(obj.orderer, orderer)
             self.assertIsInstance(obj.search, search)
+        self.assertIsInstance(MtdfI_B_TPWE().search.search, NegaScout_TPWE)
+        self.assertIsNot(MtdfI_B_TPWE().search.tt, MtdfI_B_TPWE().search.tt)
 
     def test_custom_switch(self):
         patterns = [
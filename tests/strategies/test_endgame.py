@@ -26,6 +26,7 @@ class TestEndGame(unittest.TestCase):
             self.assertTrue(isinstance(endgame.alphabeta_n, alphabeta_n[index]))
             self.assertEqual(endgame.timer, timer[index])
             self.assertEqual(endgame.measure, measure[index])
+            self.assertEqual(endgame.workers, 1)
         depth = 12
         for index, instance in enumerate([_EndGame_, _EndGame, EndGame_, EndGame]):
             endgame = instance(depth)
@@ -216,6 +217,50 @@ class TestEndGame(unittest.TestCase):
         print(' ave :', Measure.elp_time[key]['ave'], '(s)')
         print('(5417116 / 0.68s)', Measure.count[key])
 
+    def test_endgame_workers(self):
+        # 並列探索(YBWC)は逐次探索と同じ手と評価値になる
+        for black_bitboard, white_bitboard in [(0xE07DBF650158381C, 0x0009A7EA6C4E0), (0xC07DBF650158381C, 0x0009A7CA6C4E0)]:
+            board = BitBoard()
+            board._black_bitboard = black_bitboard
+            board._white_bitboard = white_bitboard
+            board.update_score()
+            moves = board.get_legal_moves('black')
+            best_move, scores = _EndGame_().get_best_move('black', board, moves)
+            for workers in [2, 3]:
+                parallel_best_move, parallel_scores = _EndGame_(workers=workers).get_best_move('black', board, moves)
+                self.assertEqual(parallel_best_move, best_move)
+                self.assertEqual(parallel_scores[best_move], scores[best_move])
+
+    def test_endgame_last_n(self):
+        # 残り数マスの専用処理と確定石による枝刈りは全幅探索と同じ結果になる(サイズ違い、穴あり)
+        for size, hole, color, black_bitboard, white_bitboard, expected in [
+            (6, 0x0, 'white', 0x45870FF20, 0x828B008A, ((0, 0), -6)),
+            (6, 0x0, 'white', 0xF3BCB81, 0x87080101C, ((5, 2), 30)),
+            (8, 0x8100000000000081, 'white', 0x214983020C0FF7C, 0x5C6A664EDC3E0002, ((2, 0), -40)),
+            (8, 0x0000240000240000, 'black', 0x40EED2AAB99AF9F8, 0x3C10095446410000, ((6, 0), 2)),
+        ]:
+            board = BitBoard(size, hole=hole)
+            board._black_bitboard = black_bitboard
+            board._white_bitboard = white_bitboard
+            board.update_score()
+            best_move, scores = _EndGame_().get_best_move(color, board, board.get_legal_moves(color))
+            self.assertEqual((best_move, scores[best_move]), expected)
+
+    def test_endgame_wld(self):
+        # 勝敗のみの探索は石差読みの評価値の符号と同じになる
+        for black_bitboard, white_bitboard in [(0xE07DBF650158381C, 0x0009A7EA6C4E0), (0xC07DBF650158381C, 0x0009A7CA6C4E0)]:
+            board = BitBoard()
+            board._black_bitboard = black_bitboard
+            board._white_bitboard = white_bitboard
+            board.update_score()
+            moves = board.get_legal_moves('black')
+            best_move, scores = _EndGame_().get_best_move('black', board, moves)
+            wld_move, wld_scores = _EndGame_(role='wld').get_best_move('black', board, moves)
+            self.assertEqual(wld_scores[wld_move], (scores[best_move] > 0) - (scores[best_move] < 0))
+            self.assertTrue(set(wld_scores.values()) <= {-1, 0, 1})
+            _, move_scores = _EndGame_().get_best_move('black', board, [wld_move])
+            self.assertEqual((move_scores[wld_move] > 0) - (move_scores[wld_move] < 0), wld_scores[wld_move])
+
     def test_endgame_force_import_error(self):
         import os
         import importlib
@@ -8,7 +8,7 @@ from reversi.board import BitBoard
 from reversi.strategies.common import Measure
 from reversi.strategies import IterativeDeepning
 from reversi.strategies.alphabeta import _AlphaBeta, AlphaBeta
-from reversi.strategies.negascout import NegaScout
+from reversi.strategies.negascout import _NegaScout, NegaScout
 import reversi.strategies.coordinator as coord
 
 
@@ -188,3 +188,41 @@ class TestIterativeDeepning(unittest.TestCase):
         print('NegaScout-Evaluator_TPWEB : (26000)', Measure.count[key2])
         print('(max_depth=7)', iterative.max_depth)
         print(' max :', Measure.elp_time[key]['max'], '(s)')
+
+    def test_iterative_aspiration_pv(self):
+        board = BitBoard()
+        board.put_disc('black', 3, 2)
+        board.put_disc('white', 2, 4)
+        board.put_disc('black', 5, 5)
+        board.put_disc('white', 4, 2)
+        board.put_disc('black', 5, 2)
+        board.put_disc('white', 5, 4)
+
+        for search in [_AlphaBeta, _NegaScout]:
+            # 探索窓の指定
+            moves = board.get_legal_moves('black')
+            best_move, scores = search(evaluator=coord.Evaluator_TPW()).get_best_move('black', board, moves, 3)
+            score = scores[best_move]
+            self.assertEqual(search(evaluator=coord.Evaluator_TPW()).get_best_move('black', board, moves, 3, alpha=score-1, beta=score+1)[0], best_move)
+            self.assertIsNone(search(evaluator=coord.Evaluator_TPW()).get_best_move('black', board, moves, 3, alpha=score, beta=score+1)[0])  # fail-low
+            best_move, scores = search(evaluator=coord.Evaluator_TPW()).get_best_move('black', board, moves, 3, alpha=score-2, beta=score-1)
+            self.assertEqual(scores[best_move], score-1)  # fail-high
+
+            # 前回の評価値を中心にした探索窓と読み筋の再利用
+            counts = []
+            for kwargs in [{}, {'aspiration': 1}, {'aspiration': 20, 'pv': True}]:
+                iterative = IterativeDeepning(
+                    depth=2, selector=coord.Selector(), orderer=coord.Orderer_B(), search=search(evaluator=coord.Evaluator_TPW()), limit=5, **kwargs
+                )
+                pid = search.__name__ + str(os.getpid())
+                Measure.count[pid] = 0
+                move = iterative.next_move('black', board)
+                if not kwargs:
+                    expected = move
+                    self.assertEqual(iterative.pv, [])
+                self.assertEqual(move, expected)
+                counts.append(Measure.count[pid])
+            self.assertIsNotNone(iterative.search.tt)
+            self.assertEqual(iterative.pv[0], ('black', expected))
+            self.assertGreater(len(iterative.pv), 1)
+            self.assertLess(counts[2], counts[0])
@@ -0,0 +1,60 @@
+"""Tests of lazysmp.py
+"""
+
+import unittest
+
+from reversi.board import BitBoard
+from reversi.strategies import LazySMP_, LazySMP, TranspositionTable, IterativeDeepning_, _NegaScout_, _EndGame_
+from reversi.strategies.lazysmp import LazySMPTableError
+import reversi.strategies.coordinator as coord
+
+
+class TestLazySMP(unittest.TestCase):
+    """lazysmp
+    """
+    def setUp(self):
+        self.tt = TranspositionTable(size=0x1000, shared=True)
+
+    def tearDown(self):
+        self.tt.close()
+
+    def test_lazysmp_init(self):
+        search = _NegaScout_(depth=4, evaluator=coord.Evaluator_TPW(), tt=self.tt)
+        lazysmp = LazySMP(search=search, workers=4)
+        self.assertIs(lazysmp.search, search)
+        self.assertEqual(lazysmp.workers, 4)
+
+        with self.assertRaises(LazySMPTableError):
+            LazySMP_(search=_NegaScout_(depth=4, evaluator=coord.Evaluator_TPW()))
+
+        with self.assertRaises(LazySMPTableError):
+            LazySMP_(search=_NegaScout_(depth=4, evaluator=coord.Evaluator_TPW(), tt=TranspositionTable()))
+
+    def test_lazysmp_next_move(self):
+        board = BitBoard()
+        board.put_disc('black', 5, 4)
+        board.put_disc('white', 5, 5)
+        legal_moves = board.get_legal_moves('black')
+
+        # 補助プロセスの深い探索結果を使う場合があるため、合法手であることのみ確認する
+        lazysmp = LazySMP_(search=_NegaScout_(depth=4, evaluator=coord.Evaluator_TPW(), tt=self.tt), workers=2)
+        self.assertIn(lazysmp.next_move('black', board), legal_moves)
+
+        iterative = IterativeDeepning_(
+            depth=2,
+            selector=coord.Selector(),
+            orderer=coord.Orderer_B(),
+            search=_NegaScout_(evaluator=coord.Evaluator_TPW(), tt=self.tt),
+            limit=4,
+        )
+        self.assertIn(LazySMP_(search=iterative, workers=2).next_move('black', board), legal_moves)
+        self.assertEqual(iterative.max_depth, 4)
+
+    def test_lazysmp_endgame(self):
+        board = BitBoard(4)
+        color = 'black'
+        for x, y in [(1, 0), (0, 0), (0, 1), (3, 3)]:
+            board.put_disc(color, x, y)
+            color = 'white' if color == 'black' else 'black'
+        expected = _EndGame_().next_move(color, board)
+        self.assertEqual(LazySMP_(search=_EndGame_(tt=self.tt), workers=3).next_move(color, board), expected)
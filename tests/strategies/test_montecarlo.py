@@ -18,6 +18,7 @@ class TestMonteCarlo(unittest.TestCase):
         self.assertEqual(montecarlo.count, 100)
         self.assertEqual(montecarlo.remain, 60)
         self.assertTrue(montecarlo.by_move)
+        self.assertEqual(montecarlo.workers, 1)
         self.assertEqual(montecarlo._black_player.color, 'black')
         self.assertEqual(montecarlo._black_player.name, 'Random_B')
         self.assertIsInstance(montecarlo._black_player.strategy, Random)
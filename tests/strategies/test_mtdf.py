@@ -0,0 +1,105 @@
+"""Tests of mtdf.py
+"""
+
+import unittest
+import os
+
+from reversi.board import BitBoard, Board
+from reversi.strategies.common import Timer, Measure, TranspositionTable
+from reversi.strategies import MTDf_, MTDf, IterativeDeepning_, IterativeDeepning
+from reversi.strategies.alphabeta import _AlphaBeta, AlphaBeta
+from reversi.strategies.negascout import _NegaScout
+import reversi.strategies.coordinator as coord
+
+
+class TestMTDf(unittest.TestCase):
+    """mtdf
+    """
+    def test_mtdf_init(self):
+        search = _AlphaBeta(depth=4, evaluator=coord.Evaluator_TPW())
+        mtdf = MTDf_(search)
+        self.assertIs(mtdf.search, search)
+        self.assertEqual(mtdf.step, 1)
+        self.assertEqual(mtdf.guesses, {})
+        self.assertEqual(mtdf.depth, 4)
+        self.assertIsInstance(search.tt, TranspositionTable)  # 置換表がない場合は持たせる
+        self.assertIs(mtdf.tt, search.tt)
+        self.assertEqual((mtdf._MIN, mtdf._MAX), (search._MIN, search._MAX))
+
+        tt = TranspositionTable()
+        self.assertIs(MTDf(_AlphaBeta(tt=tt), step=2).tt, tt)
+
+    def test_mtdf_get_best_move(self):
+        for board in [BitBoard(8), BitBoard(10), Board(8, kind='List')]:
+            offset = board.size // 2 - 4
+            board.put_disc('black', 3 + offset, 2 + offset)
+            board.put_disc('white', 2 + offset, 4 + offset)
+            moves = board.get_legal_moves('black')
+            expected_move, expected = _AlphaBeta(evaluator=coord.Evaluator_TPW()).get_best_move('black', board, moves, 3)
+            value = expected[expected_move]
+
+            # 最初の検証値が評価値より大きくても小さくても、幅0の探索窓の再探索を繰り返して評価値に収束する
+            for search in [_AlphaBeta, _NegaScout]:
+                for step in [1, 2]:
+                    for guess in [value - 20, value + 20]:
+                        mtdf = MTDf_(search(evaluator=coord.Evaluator_TPW()), step=step)
+                        mtdf.guesses[('black', 1)] = guess
+                        best_move, scores = mtdf.get_best_move('black', board, moves, 3)
+                        self.assertEqual(scores[best_move], value)
+                        self.assertEqual(mtdf.guesses[('black', 1)], value)
+                        self.assertIn(best_move, [move for move in moves if expected[move] == value])
+                    self.assertEqual(board.get_legal_moves('black'), moves)  # 盤面は元に戻る
+
+    def test_mtdf_window(self):
+        board = BitBoard()
+        for x, y, color in [(5, 4, 'black'), (3, 5, 'white'), (2, 3, 'black'), (5, 3, 'white')]:
+            board.put_disc(color, x, y)
+        moves = board.get_legal_moves('black')
+        _, expected = _AlphaBeta(evaluator=coord.Evaluator_TPW()).get_best_move('black', board, moves, 4)
+        value = max(expected.values())
+
+        mtdf = MTDf_(_AlphaBeta(evaluator=coord.Evaluator_TPW()))
+        best_move, scores = mtdf.get_best_move('black', board, moves, 4, alpha=value, beta=value + 100)
+        self.assertIsNone(best_move)  # alpha以下
+        self.assertTrue(scores and max(scores.values()) <= value)
+        best_move, scores = mtdf.get_best_move('black', board, moves, 4, alpha=value - 100, beta=value)
+        self.assertGreaterEqual(scores[best_move], value)  # beta以上
+        best_move, scores = mtdf.get_best_move('black', board, moves, 4, alpha=value - 10, beta=value + 10)
+        self.assertEqual(scores[best_move], value)
+
+    def test_mtdf_next_move(self):
+        board = BitBoard()
+        board.put_disc('black', 3, 2)
+        mtdf = MTDf(AlphaBeta(depth=3, evaluator=coord.Evaluator_TPOW()))
+        pid = mtdf.__class__.__name__ + str(os.getpid())
+        Measure.count[pid] = 0
+        self.assertEqual(mtdf.next_move('white', board), AlphaBeta(depth=3, evaluator=coord.Evaluator_TPOW()).next_move('white', board))
+        self.assertGreater(Measure.count[pid], 0)
+        self.assertFalse(Timer.is_timeout(pid))
+        self.assertEqual(Measure.elp_time[pid]['cnt'], 1)
+
+    def test_mtdf_iterative(self):
+        board = BitBoard()
+        board.put_disc('black', 3, 2)
+        iterative = IterativeDeepning(
+            depth=2,
+            selector=coord.Selector(),
+            orderer=coord.Orderer_B(),
+            search=MTDf(AlphaBeta(evaluator=coord.Evaluator_TPWE())),
+            limit=4,
+        )
+        self.assertIn(iterative.next_move('white', board), board.get_legal_moves('white'))
+        self.assertEqual(iterative.max_depth, 4)
+        self.assertEqual(sorted(iterative.search.guesses), [('white', 0), ('white', 1)])
+
+        # 前回の評価値を中心にした探索窓でも探索できる
+        iterative = IterativeDeepning_(
+            depth=2,
+            selector=coord.Selector(),
+            orderer=coord.Orderer_B(),
+            search=MTDf_(AlphaBeta(evaluator=coord.Evaluator_TPWE())),
+            limit=4,
+            aspiration=5,
+        )
+        self.assertIn(iterative.next_move('white', board), board.get_legal_moves('white'))
+        self.assertEqual(iterative.max_depth, 4)
@@ -5,8 +5,8 @@ import unittest
 import os
 import time
 
-from reversi.board import BitBoard
-from reversi.strategies.common import Timer, Measure, CPU_TIME
+from reversi.board import BitBoard, Board
+from reversi.strategies.common import Timer, Measure, CPU_TIME, TranspositionTable
 from reversi.strategies import _NegaScout_, _NegaScout, NegaScout_, NegaScout
 import reversi.strategies.coordinator as coord
 
@@ -75,6 +75,25 @@ class TestNegaScout(unittest.TestCase):
             moves = board.get_legal_moves('black')
             self.assertEqual(negascout.get_best_move('black', board, moves, 5), ((2, 2), {(2, 2): 8, (2, 3): 8, (5, 3): 8, (1, 5): 8, (2, 5): 8, (3, 5): 8, (4, 5): 8, (6, 5): 8}))  # noqa: E501
 
+    def test_negascout_iid(self):
+        for board in [BitBoard(8), Board(8, kind='List')]:
+            board.put_disc('black', 4, 5)
+            board.put_disc('white', 5, 3)
+            moves = board.get_legal_moves('black')
+            counts = []
+            for iid in [None, 3]:
+                pid = '_NegaScout_iid'
+                Measure.count[pid] = 0
+                negascout = _NegaScout(evaluator=coord.Evaluator_TPW(), tt=TranspositionTable(), iid=iid)
+                self.assertEqual(negascout.iid, iid)
+                best_move, scores = negascout.get_best_move('black', board, moves, 5, pid)
+                counts.append(Measure.count[pid])
+                if iid is None:
+                    expected = best_move, scores
+                else:
+                    self.assertEqual((best_move, scores), expected)  # 幅0の探索窓の再探索を含めて結果は同じ
+            self.assertLess(counts[1], counts[0])
+
     def test_negascout_performance_of_get_score(self):
         board = BitBoard()
         board.put_disc('black', 3, 2)
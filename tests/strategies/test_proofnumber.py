@@ -0,0 +1,90 @@
+"""Tests of proofnumber.py
+"""
+
+import unittest
+
+from reversi.board import BitBoard
+from reversi.strategies import ProofNumberSearch, DfPn_, DfPn, _EndGame_
+from reversi.strategies.proofnumber import DFPN_MAX_NODES
+
+
+class TestProofNumber(unittest.TestCase):
+    """proofnumber
+    """
+    def test_proofnumber_init(self):
+        pns = ProofNumberSearch()
+        self.assertEqual(pns.table_size, 0x100000)
+        self.assertIsNone(pns.max_nodes)
+        self.assertEqual(pns.table, {})
+
+        self.assertEqual(DfPn().pns.max_nodes, DFPN_MAX_NODES)  # 終局まで証明し続けないよう上限を設ける
+
+        dfpn = DfPn(depth=10, table_size=0x1000, max_nodes=100)
+        self.assertIsNone(dfpn.search)
+        self.assertEqual(dfpn.depth, 10)
+        self.assertEqual(dfpn.pns.table_size, 0x1000)
+        self.assertEqual(dfpn.pns.max_nodes, 100)
+
+    def test_proofnumber_prove(self):
+        # 4x4は白の勝ち(石差読みの結果と同じ)
+        board = BitBoard(4)
+        _, scores = _EndGame_(role='wld').get_best_move('black', board, board.get_legal_moves('black'))
+        self.assertEqual(max(scores.values()), -1)
+
+        pns = ProofNumberSearch()
+        self.assertTrue(pns.prove('black', board, 'white'))
+        self.assertFalse(pns.prove('black', board, 'black'))
+        self.assertEqual(pns.get_best_move('black', board, 'black'), None)
+
+        # 局面表が小さくても同じ結果になる
+        pns = ProofNumberSearch(table_size=16)
+        self.assertTrue(pns.prove('black', board, 'white'))
+        self.assertLessEqual(len(pns.table), 16)
+
+        # 調べる局面数の上限に達した場合は分からない
+        self.assertIsNone(ProofNumberSearch(max_nodes=5).prove('black', board, 'white'))
+
+    def test_proofnumber_solver_wld_winner(self):
+        from reversi import Solver
+        self.assertEqual(Solver(board=BitBoard(4), first='black', backend='dfpn').get_wld_winner(), 'white')
+        self.assertEqual(Solver(board=BitBoard(4), first='black', backend='dfpn', pn_nodes=5).get_wld_winner(), 'unknown')  # 証明できない場合は引き分けにしない
+
+    def test_proofnumber_get_best_move(self):
+        board = BitBoard(4)
+        board.put_disc('black', 1, 0)
+        pns = ProofNumberSearch()
+        move = pns.get_best_move('white', board, 'white')
+        self.assertIn(move, board.get_legal_moves('white'))
+        board.put_disc('white', *move)
+        self.assertTrue(pns.prove('black', board, 'white'))
+        self.assertEqual(DfPn_().next_move('white', board), board.get_legal_moves('white')[0])
+
+        # 序盤の局面は局面数の上限で打ち切って最初の合法手を打つ
+        board = BitBoard(8)
+        self.assertEqual(DfPn_().next_move('black', board), board.get_legal_moves('black')[0])
+
+    def test_proofnumber_get_proof_moves(self):
+        board = BitBoard(4)
+        pns = ProofNumberSearch()
+        moves = pns.get_proof_moves('black', board, 'white')
+        self.assertEqual(moves[0], ('black', board.get_legal_moves('black')[0]))
+        self.assertEqual(moves[1][0], 'white')
+
+        # 子局面を証明し直せない場合(局面数の上限や局面表から消えた場合)は手順なし
+        pns.get_best_move = lambda *args: None
+        self.assertIsNone(pns.get_proof_moves('black', board, 'white'))
+        self.assertEqual(board.get_bitboard_info(), BitBoard(4).get_bitboard_info())  # 盤面は元に戻る
+
+    def test_proofnumber_get_shortest_win(self):
+        board = BitBoard(4)
+        pns = ProofNumberSearch()
+        # 両者が協力する場合(Solverの最短勝ち)
+        self.assertEqual(pns.get_shortest_win('black', board, 'black', 12, cooperative=True), (6, [('black', (1, 0)), ('white', (2, 0)), ('black', (3, 0)), ('white', (0, 0)), ('black', (0, 2)), ('black', (3, 3))]))  # noqa: E501
+        self.assertEqual(pns.get_shortest_win('black', board, 'black', 5, cooperative=True), (None, None))
+        # 強制勝ち
+        depth, moves = pns.get_shortest_win('black', board, 'white', 12)
+        self.assertEqual(depth, 11)
+        for color, move in moves:
+            board.put_disc(color, *move)
+        self.assertFalse(board.get_legal_moves('black') or board.get_legal_moves('white'))
+        self.assertLess(board._black_score, board._white_score)
@@ -4,6 +4,7 @@
 import unittest
 
 from reversi.board import AbstractBoard, BoardSizeError, Board, BitBoard, PyListBoard, PyBitBoard
+import reversi.BitBoardMethods as BitBoardMethods
 from reversi.color import C as c
 from reversi.disc import D as d
 from reversi.move import Move as m
@@ -1097,6 +1098,42 @@ class TestBoard(unittest.TestCase):
             legal_moves_bits = board.get_legal_moves_bits(c.black)
             self.assertEqual(board.get_bit_count(legal_moves_bits), 4)
 
+    def test_board_get_bit_count_all_sizes(self):
+        self.assertEqual(BitBoardMethods.popcount(0), 0)
+        self.assertEqual(BitBoardMethods.popcount(0xF0F0), 8)
+        self.assertEqual(BitBoardMethods.popcount((1 << 676) - 1), 676)
+        for size in range(4, 27, 2):
+            full = (1 << size * size) - 1
+            bits = int('10' * (size * size // 2), 2)
+            self.assertEqual(BitBoardMethods.get_bit_count(size, full), size * size)
+            self.assertEqual(BitBoardMethods.get_bit_count(size, bits | (full + 1)), size * size // 2)  # 盤面外は数えない
+            for board_class in [PyListBoard, BitBoard, PyBitBoard]:
+                self.assertEqual(board_class(size).get_bit_count(bits), size * size // 2)
+
+    def test_board_incremental_score(self):
+        for board_class in [PyListBoard, BitBoard, PyBitBoard]:
+            for size in [4, 8, 10]:
+                board = board_class(size)
+                scores = []
+                color = c.black
+                while True:
+                    moves = board.get_legal_moves(color)
+                    if not moves:
+                        color = c.next_color(color)
+                        moves = board.get_legal_moves(color)
+                        if not moves:
+                            break
+                    scores.append((board._black_score, board._white_score))
+                    board.put_disc(color, *moves[len(moves) // 2])
+                    black, white = board._black_score, board._white_score
+                    board.update_score()
+                    self.assertEqual((black, white), (board._black_score, board._white_score))
+                    color = c.next_color(color)
+                while scores:
+                    board.undo()
+                    self.assertEqual((board._black_score, board._white_score), scores.pop())
+                self.assertEqual((board._black_score, board._white_score), (2, 2))
+
     def test_board_get_bitboard_info(self):
         size = 4
         for board_class in self.board_classes:
@@ -1688,9 +1725,6 @@ class TestBoard(unittest.TestCase):
 
         self.assertEqual(board.get_board_info(), board_info_ret)
 
-        # illegal pattern of reversi.BitBoardMethods.GetFlippableDiscs.get_next_put
-        self.assertEqual(reversi.BitBoardMethods.GetFlippableDiscs.get_next_put(0, 0, 0, 0), 0)
-
         # get_legal_moves
         board = BitBoard(8)
         legal_moves = board.get_legal_moves(c.black)
@@ -1717,6 +1751,121 @@ class TestBoard(unittest.TestCase):
         self.assertTrue(reversi.cy.IMPORTED)
         # -------------------------------
 
+    def test_bitboard_kogge_stone(self):
+        import random
+        import reversi.BitBoardMethods.GetLegalMoves as GetLegalMoves
+        legal_moves_min_size = GetLegalMoves.KOGGE_STONE_MIN_SIZE
+
+        def switch(kogge_stone):
+            GetLegalMoves.KOGGE_STONE_MIN_SIZE = 0 if kogge_stone else 100
+
+        random.seed(0)
+        try:
+            for size in [4, 8, 10, 20]:
+                board = PyBitBoard(size)
+                color = 'black'
+                for _ in range(size):
+                    result = []
+                    for kogge_stone in [False, True]:
+                        switch(kogge_stone)
+                        flippable_discs = [board.get_flippable_discs(color, x, y) for y in range(size) for x in range(size)]
+                        result += [(board.get_legal_moves_bits(color), board.get_legal_moves(color), flippable_discs)]
+                    self.assertEqual(result[0], result[1])
+                    legal_moves = result[0][1]
+                    if legal_moves:
+                        board.put_disc(color, *random.choice(legal_moves))
+                    color = c.white if color == c.black else c.black
+        finally:
+            GetLegalMoves.KOGGE_STONE_MIN_SIZE = legal_moves_min_size
+
+    def test_board_put_disc_bits(self):
+        import random
+        random.seed(0)
+        for size in [4, 6, 8, 10, 26]:
+            boards1 = [PyListBoard(size), PyBitBoard(size), BitBoard(size)]
+            boards2 = [PyListBoard(size), PyBitBoard(size), BitBoard(size)]
+            color = c.black
+            for _ in range(size * 2):
+                legal_moves = boards1[0].get_legal_moves(color)
+                if legal_moves:
+                    x, y = random.choice(legal_moves)
+                    move_bit = 1 << ((size*size-1)-(y*size+x))
+                    for board1, board2 in zip(boards1, boards2):
+                        self.assertEqual(board1.put_disc_bits(color, move_bit), board2.put_disc(color, x, y))
+                        self.assertEqual(board1.get_bitboard_info(), board2.get_bitboard_info())
+                        self.assertEqual((board1._black_score, board1._white_score), (board2._black_score, board2._white_score))
+                color = c.white if color == c.black else c.black
+            for board1, board2 in zip(boards1, boards2):
+                board1.undo()
+                board2.undo()
+                self.assertEqual(board1.get_bitboard_info(), board2.get_bitboard_info())
+                self.assertEqual(board1.put_disc_bits(color, 0), 0)
+                self.assertEqual(board1.get_bitboard_info(), board2.get_bitboard_info())
+                self.assertEqual((board1._black_score, board1._white_score), (board2._black_score, board2._white_score))
+
+    def test_board_hash(self):
+        import random
+        random.seed(1)
+        for size in [4, 6, 8, 10, 26]:
+            boards = [PyListBoard(size), PyBitBoard(size), BitBoard(size)]
+            for board in boards:
+                self.assertEqual(board.hash, BitBoardMethods.get_hash(*board.get_bitboard_info()[:2]))
+            hashes = [boards[0].hash]
+            color = c.black
+            for _ in range(size * 2):
+                legal_moves = boards[0].get_legal_moves(color)
+                if legal_moves:
+                    move = random.choice(legal_moves)
+                    for board in boards:
+                        board.put_disc(color, *move)
+                    hashes.append(boards[0].hash)
+                    for board in boards:
+                        self.assertEqual(board.hash, hashes[-1])
+                        self.assertEqual(board.hash, BitBoardMethods.get_hash(*board.get_bitboard_info()[:2]))
+                color = c.next_color(color)
+            self.assertEqual(len(set(hashes)), len(hashes))
+
+            # 取り消すと元のハッシュに戻る
+            while len(hashes) > 1:
+                hashes.pop()
+                for board in boards:
+                    board.undo()
+                    self.assertEqual(board.hash, hashes[-1])
+
+            # 直接ビットボードを変更した場合はupdate_scoreで再計算する
+            for board in boards[1:]:
+                board._black_bitboard |= 1
+                board.update_score()
+                self.assertEqual(board.hash, BitBoardMethods.get_hash(*board.get_bitboard_info()[:2]))
+
+    def test_board_copy_and_child(self):
+        for size in [4, 6, 8, 10]:
+            for board in [PyListBoard(size), PyBitBoard(size), BitBoard(size)]:
+                board.put_disc(c.black, *board.get_legal_moves(c.black)[0])
+                info, score = board.get_bitboard_info(), (board._black_score, board._white_score)
+
+                # 同じ局面で、打った手の履歴は持たない
+                copied = board.copy()
+                self.assertIs(type(copied), type(board))
+                self.assertIs(copied._geometry, board._geometry)
+                self.assertEqual(copied.get_bitboard_info(), info)
+                self.assertEqual((copied._black_score, copied._white_score), score)
+                self.assertEqual(copied.prev, [])
+                self.assertEqual(len(board.prev), 1)
+
+                # 複製への着手は元のボードに影響しない
+                move = copied.get_legal_moves(c.white)[0]
+                child = board.child(c.white, move)
+                copied.put_disc(c.white, *move)
+                self.assertEqual(child.get_bitboard_info(), copied.get_bitboard_info())
+                self.assertEqual((child._black_score, child._white_score), (copied._black_score, copied._white_score))
+                self.assertEqual(str(child), str(copied))
+                self.assertEqual(board.get_bitboard_info(), info)
+                self.assertEqual((board._black_score, board._white_score), score)
+
+                child.undo()
+                self.assertEqual(child.get_bitboard_info(), info)
+
     def test_cyboard_force_import_error(self):
         import os
         import importlib
@@ -1738,6 +1887,6 @@ class TestBoard(unittest.TestCase):
         importlib.reload(reversi.cy)
         self.assertTrue(reversi.cy.IMPORTED)
         # -------------------------------
-        self.assertIsInstance(BitBoard(4), PyBitBoard)
+        self.assertIsInstance(BitBoard(4), reversi.cy.ReversiMethods.CythonBitBoard)
         self.assertIsInstance(BitBoard(), reversi.cy.ReversiMethods.CythonBitBoard)
-        self.assertIsInstance(BitBoard(26), PyBitBoard)
+        self.assertIsInstance(BitBoard(26), reversi.cy.ReversiMethods.CythonMultiBitBoard)
@@ -0,0 +1,287 @@
+"""Tests of cy
+"""
+
+import unittest
+import os
+import sys
+import importlib
+import tempfile
+import threading
+
+import reversi.cy as cy
+from reversi.cy import prebuilt
+from reversi.board import BitBoard
+import reversi.strategies.coordinator as coord
+
+
+class TestCy(unittest.TestCase):
+    """cy
+    """
+    def test_cy_get_status(self):
+        status = cy.get_status()
+        self.assertEqual(status['imported'], cy.IMPORTED)
+        self.assertEqual(status['python'], sys.implementation.cache_tag)
+        if cy.IMPORTED:
+            self.assertEqual(status['bitboard'], {'4-8': 'CythonBitBoard', '10-26': 'CythonMultiBitBoard'})
+            self.assertIn(status['source'], ['inplace', 'cache', 'pyximport'])
+            if not prebuilt.is_inplace_current():
+                self.assertNotEqual(status['source'], 'inplace')  # pyxより古いビルド済みモジュールは使わない
+            self.assertTrue(os.path.isfile(status['path']))
+        else:
+            self.assertEqual(status['bitboard'], {'4-26': 'PyBitBoard'})
+            self.assertIsNone(status['source'])
+
+        # サイズの範囲ごとに実際に使用されるボードの実装を返す
+        for sizes, name in status['bitboard'].items():
+            start, end = map(int, sizes.split('-'))
+            for size in range(start, end + 1, 2):
+                self.assertEqual(type(BitBoard(size)).__name__, name)
+
+    def test_cy_get_status_force_import_error(self):
+        imported, force = cy.IMPORTED, os.environ.get('FORCE_CYTHONMETHODS_IMPORT_ERROR')
+        os.environ['FORCE_CYTHONMETHODS_IMPORT_ERROR'] = 'RAISE'
+        try:
+            importlib.reload(cy)
+            status = cy.get_status()
+            self.assertFalse(status['imported'])
+            self.assertIsNone(status['source'])
+            self.assertEqual(status['bitboard'], {'4-26': 'PyBitBoard'})
+            self.assertEqual(status['error'], 'FORCE_CYTHONMETHODS_IMPORT_ERROR')
+        finally:
+            # 元の環境に戻す(以降のテストに影響させない)
+            if force is None:
+                del os.environ['FORCE_CYTHONMETHODS_IMPORT_ERROR']
+            else:
+                os.environ['FORCE_CYTHONMETHODS_IMPORT_ERROR'] = force
+            importlib.reload(cy)
+        self.assertEqual(cy.get_status()['imported'], imported)
+
+    def test_prebuilt_cache_dir(self):
+        cache_dir = os.environ.get('REVERSI_CY_CACHE_DIR')
+        os.environ['REVERSI_CY_CACHE_DIR'] = os.path.join('tmp', 'reversi')
+        try:
+            path = prebuilt.get_cached_path()
+        finally:
+            if cache_dir is None:
+                del os.environ['REVERSI_CY_CACHE_DIR']
+            else:
+                os.environ['REVERSI_CY_CACHE_DIR'] = cache_dir
+
+        key = os.path.basename(os.path.dirname(path))
+        self.assertEqual(os.path.dirname(os.path.dirname(path)), os.path.join('tmp', 'reversi'))
+        self.assertTrue(key.startswith(sys.implementation.cache_tag + '-'))
+        self.assertTrue(key.endswith('-' + prebuilt.get_source_digest()))
+        self.assertTrue(os.path.basename(path).startswith('ReversiMethods.'))
+
+    def test_prebuilt_inplace_digest(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertFalse(prebuilt.is_inplace_current(directory))  # 記録がない場合は古いものとみなす
+            path = prebuilt.write_inplace_digest(directory)
+            self.assertEqual(path, os.path.join(directory, prebuilt.DIGEST_NAME))
+            self.assertTrue(prebuilt.is_inplace_current(directory))
+            with open(path, 'w') as f:
+                f.write('0' * 16)
+            self.assertFalse(prebuilt.is_inplace_current(directory))
+
+    def test_prebuilt_prune_cache(self):
+        with tempfile.TemporaryDirectory() as base:
+            key = os.path.basename(prebuilt.get_cache_dir())
+            prefix = key[:-len(prebuilt.get_source_digest())]
+            names = [key, prefix + '0' * 16, prefix + '1' * 16, 'cpython-00-other-' + '0' * 16, prefix + 'other']
+            for name in names:
+                os.makedirs(os.path.join(base, name))
+            prebuilt.prune_cache(os.path.join(base, key))
+            self.assertEqual(sorted(os.listdir(base)), sorted([key, 'cpython-00-other-' + '0' * 16, prefix + 'other']))  # pyxの内容が異なるものだけ削除
+
+    def test_prebuilt_load_cached_no_file(self):
+        cache_dir = os.environ.get('REVERSI_CY_CACHE_DIR')
+        os.environ['REVERSI_CY_CACHE_DIR'] = os.path.join('tmp', 'not_exist')
+        try:
+            with self.assertRaises(ImportError):
+                prebuilt.load_cached()
+        finally:
+            if cache_dir is None:
+                del os.environ['REVERSI_CY_CACHE_DIR']
+            else:
+                os.environ['REVERSI_CY_CACHE_DIR'] = cache_dir
+
+    def test_search_context(self):
+        from reversi.cy.ReversiMethods import SearchContext
+        ctx = SearchContext()
+        self.assertEqual(ctx.measure_count, 0)
+        self.assertEqual(ctx.timer_timeout, 0)
+
+    def test_search_context_concurrent(self):
+        from reversi.cy.ReversiMethods import alphabeta_next_move, negascout_next_move
+        boards = []
+        for moves in [[(5, 4), (3, 5), (2, 3)], [(4, 5), (5, 3), (4, 2), (5, 5)]]:
+            board = BitBoard()
+            color = 'black'
+            for move in moves:
+                board.put_disc(color, *move)
+                color = 'white' if color == 'black' else 'black'
+            boards.append((color, board))
+
+        def search(func, color, board):
+            return func(color, board, -10000000, 10000000, 4, coord.Evaluator_TPWE(), None, False, False)
+
+        expected = [search(func, color, board) for func in [alphabeta_next_move, negascout_next_move] for color, board in boards]
+
+        results = {}
+
+        def run(i, func, color, board):
+            for _ in range(3):
+                results.setdefault(i, []).append(search(func, color, board))
+
+        threads = []
+        for i, (func, color, board) in enumerate([(func, color, board) for func in [alphabeta_next_move, negascout_next_move] for color, board in boards]):
+            threads.append(threading.Thread(target=run, args=(i, func, color, board)))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for i, best_move in enumerate(expected):
+            self.assertEqual(results[i], [best_move] * 3)
+
+    def test_root_split(self):
+        from reversi.cy.ReversiMethods import endgame_next_move, blank_next_move, montecarlo_next_move
+        board = BitBoard()
+        board._black_bitboard = 0x00100A2646283C20
+        board._white_bitboard = 0x7169F5D9B9D78315
+        board.update_score()
+        params = [50, -20, 0, -1, -1, -1, -1, -25, -5, -5, 5, 10000, 100, -5, -20, -10]
+
+        for color in ['black', 'white']:
+            expected = (
+                endgame_next_move(color, board, 60, None, False, False, 'best_match'),
+                blank_next_move(color, board, params, 4, None, False, False),
+                montecarlo_next_move(color, board, 30, None, False, False, 1, 123),
+            )
+            for workers in [2, 4]:
+                self.assertEqual(endgame_next_move(color, board, 60, None, False, False, 'best_match', workers), expected[0])
+                self.assertEqual(blank_next_move(color, board, params, 4, None, False, False, workers), expected[1])
+                self.assertEqual(montecarlo_next_move(color, board, 30, None, False, False, workers, 123), expected[2])
+
+    def test_multiword_bitboard(self):
+        import random
+        import pickle
+        from reversi.board import PyBitBoard
+        random.seed(0)
+        for size in [10, 12, 26]:
+            board1, board2 = BitBoard(size), PyBitBoard(size)
+            self.assertIsInstance(board1, cy.CythonMultiBitBoard)
+            self.assertTrue(cy.is_multiword_bitboard(board1))
+            self.assertFalse(cy.is_multiword_bitboard(board2))
+            self.assertEqual(str(board1), str(board2))
+            color, passed = 'black', 0
+            while passed < 2:
+                legal_moves = board1.get_legal_moves(color)
+                self.assertEqual(legal_moves, board2.get_legal_moves(color))
+                self.assertEqual(board1.get_legal_moves_bits(color), board2.get_legal_moves_bits(color))
+                passed = passed + 1 if not legal_moves else 0
+                if legal_moves:
+                    move = random.choice(legal_moves)
+                    self.assertEqual(board1.get_flippable_discs(color, *move), board2.get_flippable_discs(color, *move))
+                    self.assertEqual(board1.put_disc(color, *move), board2.put_disc(color, *move))
+                    self.assertEqual(board1.get_bitboard_info(), board2.get_bitboard_info())
+                    self.assertEqual((board1._black_score, board1._white_score), (board2._black_score, board2._white_score))
+                    self.assertEqual(board1.get_remain(), board2.get_remain())
+                color = 'white' if color == 'black' else 'black'
+            self.assertEqual(str(board1), str(board2))
+            board3 = pickle.loads(pickle.dumps(board1))
+            self.assertEqual(board3.get_board_info(), board1.get_board_info())
+            for _ in range(10):
+                board3.undo()
+                board2.undo()
+            self.assertEqual(board3.get_bitboard_info(), board2.get_bitboard_info())
+            self.assertEqual((board3._black_score, board3._white_score), (board2._black_score, board2._white_score))
+
+        with self.assertRaises(ValueError):
+            cy.CythonMultiBitBoard(8)
+
+    def test_sized_bitboard(self):
+        import random
+        import copy
+        from reversi.board import PyBitBoard
+        random.seed(0)
+        for size in [4, 6]:
+            board1, board2 = BitBoard(size), PyBitBoard(size)
+            self.assertIsInstance(board1, cy.CythonBitBoard)
+            self.assertEqual(str(board1), str(board2))
+            color, passed = 'black', 0
+            while passed < 2:
+                legal_moves = board1.get_legal_moves(color)
+                self.assertEqual(legal_moves, board2.get_legal_moves(color))
+                self.assertEqual(board1.get_legal_moves_bits(color), board2.get_legal_moves_bits(color))
+                passed = passed + 1 if not legal_moves else 0
+                if legal_moves:
+                    move = random.choice(legal_moves)
+                    self.assertEqual(board1.get_flippable_discs(color, *move), board2.get_flippable_discs(color, *move))
+                    self.assertEqual(board1.put_disc(color, *move), board2.put_disc(color, *move))
+                    self.assertEqual(board1.get_bitboard_info(), board2.get_bitboard_info())
+                    self.assertEqual((board1._black_score, board1._white_score), (board2._black_score, board2._white_score))
+                    self.assertEqual(board1.get_board_info(), board2.get_board_info())
+                color = 'white' if color == 'black' else 'black'
+            self.assertEqual(str(board1), str(board2))
+            board3 = copy.deepcopy(board1)
+            for _ in range(5):
+                board3.undo()
+                board2.undo()
+            self.assertEqual(board3.get_bitboard_info(), board2.get_bitboard_info())
+
+        with self.assertRaises(ValueError):
+            cy.CythonBitBoard(10)
+
+    def test_sized_search(self):
+        import random
+        from reversi.board import PyListBoard
+        from reversi.strategies import _EndGame_, _AlphaBeta_, _NegaScout_
+        random.seed(1)
+        board1, board2 = BitBoard(6), PyListBoard(6)
+        color = 'black'
+        while board2._black_score + board2._white_score < 29:
+            legal_moves = board2.get_legal_moves(color)
+            if legal_moves:
+                move = random.choice(legal_moves)
+                board1.put_disc(color, *move)
+                board2.put_disc(color, *move)
+            color = 'white' if color == 'black' else 'black'
+        if not board2.get_legal_moves(color):
+            color = 'white' if color == 'black' else 'black'
+
+        moves = board2.get_legal_moves(color)
+        expected = _EndGame_().get_best_move(color, board2, moves)
+        best_move, scores = _EndGame_().get_best_move(color, board1, moves)
+        self.assertEqual(best_move, expected[0])
+        self.assertEqual(max(scores.values()), max(expected[1].values()))
+        self.assertEqual(_EndGame_().next_move(color, board1), expected[0])
+        for strategy in [_AlphaBeta_, _NegaScout_]:
+            expected, _ = strategy(evaluator=coord.Evaluator_TPW()).get_best_move(color, board2, moves, 3)
+            best_move, _ = strategy(evaluator=coord.Evaluator_TPW()).get_best_move(color, board1, moves, 3)
+            self.assertEqual(best_move, expected)
+            self.assertEqual(strategy(depth=3, evaluator=coord.Evaluator_TPW()).next_move(color, board1), expected)
+        self.assertEqual(board1.get_board_info(), board2.get_board_info())
+
+    def test_multiword_search(self):
+        from reversi.board import PyBitBoard
+        from reversi.strategies import _AlphaBeta_, _NegaScout_
+        board1, board2 = BitBoard(10), PyBitBoard(10)
+        color = 'black'
+        for move in [(4, 3), (3, 3), (2, 2), (5, 3), (6, 4), (3, 5)]:
+            board1.put_disc(color, *move)
+            board2.put_disc(color, *move)
+            color = 'white' if color == 'black' else 'black'
+
+        for strategy in [_AlphaBeta_, _NegaScout_]:
+            for color in ['black', 'white']:
+                moves = board2.get_legal_moves(color)
+                expected, _ = strategy(evaluator=coord.Evaluator_TPW()).get_best_move(color, board2, moves, 3)
+                best_move, _ = strategy(evaluator=coord.Evaluator_TPW()).get_best_move(color, board1, moves, 3)
+                self.assertEqual(best_move, expected)
+                self.assertEqual(strategy(evaluator=coord.Evaluator_TPW()).next_move(color, board1), expected)
+                self.assertEqual(board1.get_bitboard_info(), board2.get_bitboard_info())
+
+
+if __name__ == '__main__':
+    unittest.main()
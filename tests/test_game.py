@@ -5,7 +5,7 @@ import unittest
 from test.support import captured_stdout
 
 from reversi.game import Game
-from reversi.board import Board, PyListBoard, PyBitBoard
+from reversi.board import Board, PyListBoard
 from reversi.cy.ReversiMethods import CythonBitBoard
 from reversi.player import Player
 from reversi.display import NoneDisplay
@@ -84,7 +84,7 @@ class TestGame(unittest.TestCase):
 
         # init
         game1 = Game(p1, p2, Board(4), TestDisplay())
-        self.assertIsInstance(game1.board, PyBitBoard)
+        self.assertIsInstance(game1.board, CythonBitBoard)
         self.assertIsInstance(game1.black_player.strategy, TopLeft)
         self.assertIsInstance(game1.white_player.strategy, BottomRight)
         self.assertEqual(game1.black_player, game1.players[0])
@@ -93,7 +93,7 @@ class TestGame(unittest.TestCase):
         self.assertEqual(game1.result, [])
 
         game2 = Game(p1, p3, Board(4), TestDisplay())
-        self.assertIsInstance(game2.board, PyBitBoard)
+        self.assertIsInstance(game2.board, CythonBitBoard)
         self.assertIsInstance(game2.black_player.strategy, TopLeft)
         self.assertIsInstance(game2.white_player.strategy, TopLeft)
         self.assertEqual(game2.black_player, game2.players[0])
@@ -102,7 +102,7 @@ class TestGame(unittest.TestCase):
         self.assertEqual(game2.result, [])
 
         game3 = Game(p1, p2, Board(4), TestDisplay(), 'white', TestCancel())
-        self.assertIsInstance(game3.board, PyBitBoard)
+        self.assertIsInstance(game3.board, CythonBitBoard)
         self.assertIsInstance(game3.black_player.strategy, TopLeft)
         self.assertIsInstance(game3.white_player.strategy, BottomRight)
         self.assertEqual(game3.black_player, game3.players[1])
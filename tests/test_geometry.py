@@ -0,0 +1,52 @@
+"""Tests of geometry.py
+"""
+
+import copy
+import pickle
+import unittest
+
+from reversi.geometry import Geometry, get_geometry
+from reversi.board import BitBoard, PyBitBoard, PyListBoard
+
+
+class TestGeometry(unittest.TestCase):
+    """geometry
+    """
+    def test_init(self):
+        geometry = Geometry(4, hole=0x8001)
+        self.assertEqual(geometry.size, 4)
+        self.assertEqual(geometry.all, 0xFFFF)
+        self.assertEqual(geometry.playable, 0x7FFE)
+        self.assertEqual(geometry.mask.h, 0x6666)
+        self.assertEqual(geometry.mask.v, 0x0FF0)
+        self.assertEqual(geometry.mask.d, 0x0660)
+        self.assertEqual(geometry.bits[0][0], 0x8000)
+        self.assertEqual(geometry.bits[1][2], 0x0200)
+        self.assertEqual(geometry.coordinates[15], (0, 0))
+        self.assertEqual(geometry.coordinates[9], (2, 1))
+        self.assertEqual(geometry.corner, 0x9009)
+        self.assertEqual(geometry.edge, 0xF99F)
+        self.assertEqual(geometry.labels, ('a', 'b', 'c', 'd'))
+        self.assertEqual(geometry.header, '   a b c d\n')
+
+    def test_get_geometry(self):
+        self.assertIs(get_geometry(8), get_geometry(8))
+        self.assertIs(get_geometry(8).mask, get_geometry(8, 0x1).mask)
+        self.assertIsNot(get_geometry(8), get_geometry(8, 0x1))
+        self.assertIsNot(get_geometry(8), get_geometry(10))
+
+        # 複製や復元でも共有のものを参照する
+        geometry = get_geometry(6)
+        self.assertIs(copy.copy(geometry), geometry)
+        self.assertIs(copy.deepcopy(geometry), geometry)
+        self.assertIs(pickle.loads(pickle.dumps(geometry)), geometry)
+
+    def test_shared_by_boards(self):
+        for size in range(4, 27, 2):
+            geometry = get_geometry(size)
+            for board_class in [PyListBoard, PyBitBoard, BitBoard]:
+                board = board_class(size)
+                self.assertIs(board._geometry, geometry)
+                self.assertIs(copy.deepcopy(board)._geometry, geometry)
+            for board_class in [PyBitBoard, BitBoard]:
+                self.assertIs(board_class(size)._mask, geometry.mask)
@@ -0,0 +1,48 @@
+"""Tests of headless.py
+"""
+
+import unittest
+import sys
+import subprocess
+
+import reversi
+import reversi.strategies
+from reversi.headless import C, BitBoard, PyListBoard, Game, get_strategy, play
+
+
+class TestHeadless(unittest.TestCase):
+    """headless
+    """
+    def test_headless_no_tkinter(self):
+        code = "import sys, reversi.headless; print('tkinter' in sys.modules, 'reversi.window' in sys.modules)"
+        out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(out.split(), ['False', 'False'])
+
+    def test_headless_lazy_package(self):
+        code = "import sys, reversi; print('reversi.board' in sys.modules, 'reversi.strategies' in sys.modules)"
+        out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(out.split(), ['False', 'False'])
+
+    def test_headless_lazy_attrs(self):
+        self.assertIs(reversi.BitBoard, BitBoard)
+        self.assertIs(reversi.C, C)
+        self.assertIs(reversi.strategies.Random, get_strategy('Random'))
+        self.assertIs(reversi.strategies.AlphaBetaMethods, sys.modules['reversi.strategies.AlphaBetaMethods'])
+        for name in reversi.__all__:
+            self.assertIn(name, dir(reversi))
+        for name in reversi.strategies.__all__:
+            self.assertIn(name, dir(reversi.strategies))
+
+        with self.assertRaises(AttributeError):
+            reversi.NotExist
+        with self.assertRaises(AttributeError):
+            reversi.strategies.NotExist
+
+    def test_headless_play(self):
+        result = play(get_strategy('Greedy')(), get_strategy('Unselfish')(), PyListBoard())
+        self.assertIn(result.winlose, [Game.BLACK_WIN, Game.WHITE_WIN, Game.DRAW])
+        self.assertLessEqual(result.black_num + result.white_num, 64)
+
+
+if __name__ == '__main__':
+    unittest.main()
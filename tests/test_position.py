@@ -0,0 +1,95 @@
+"""Tests of position.py
+"""
+
+import copy
+import pickle
+import random
+import unittest
+
+from reversi.position import Position, TRANSFORMS, transform_bits, transform_move
+from reversi.board import BitBoard, PyBitBoard, PyListBoard
+from reversi.color import C as c
+
+
+class TestPosition(unittest.TestCase):
+    """position
+    """
+    def test_init(self):
+        position = Position(0x0000000810000000, 0x0000001008000000)
+        self.assertEqual(position.black, 0x0000000810000000)
+        self.assertEqual(position.white, 0x0000001008000000)
+        self.assertEqual(position.hole, 0)
+        self.assertEqual(position.color, c.black)
+        self.assertEqual(position.size, 8)
+        self.assertEqual(repr(position), "Position(black=0x810000000, white=0x1008000000, hole=0x0, color='black', size=8)")
+
+        with self.assertRaises(AttributeError):
+            position.black = 0
+        with self.assertRaises(AttributeError):
+            del position.white
+        with self.assertRaises(AttributeError):
+            position.other = 0
+
+    def test_hash_and_eq(self):
+        position1 = Position(0x240, 0x420, color=c.white, size=4)
+        position2 = Position(0x240, 0x420, color=c.white, size=4)
+        self.assertEqual(position1, position2)
+        self.assertEqual(hash(position1), hash(position2))
+        self.assertNotEqual(position1, Position(0x240, 0x420, color=c.black, size=4))
+        self.assertNotEqual(position1, Position(0x240, 0x420, color=c.white, size=6))
+        self.assertNotEqual(position1, (c.white, 0x240, 0x420))
+
+        table = {position1: (1, 0)}
+        self.assertEqual(table[position2], (1, 0))
+
+    def test_pickle_and_copy(self):
+        position = Position(0x240, 0x420, 0x8001, c.white, 4)
+        self.assertEqual(pickle.loads(pickle.dumps(position)), position)
+        self.assertIs(copy.copy(position).__class__, Position)
+        self.assertEqual(copy.deepcopy(position), position)
+
+    def test_board_conversion(self):
+        for size in [4, 6, 8, 10]:
+            for board_class in [PyListBoard, PyBitBoard, BitBoard]:
+                board = board_class(size)
+                board.put_disc(c.black, *board.get_legal_moves(c.black)[0])
+                position = Position.from_board(board, c.white)
+                self.assertEqual(position, Position(*board.get_bitboard_info(), c.white, size))
+
+                for to_class in [PyListBoard, PyBitBoard, BitBoard, None]:
+                    to_board = position.to_board(to_class)
+                    self.assertEqual(to_board.get_bitboard_info(), board.get_bitboard_info())
+                    self.assertEqual((to_board._black_score, to_board._white_score), (board._black_score, board._white_score))
+                    self.assertEqual(to_board.get_legal_moves(c.white), board.get_legal_moves(c.white))
+
+    def test_transform(self):
+        random.seed(0)
+        for size in [4, 8, 10]:
+            bits = random.getrandbits(size * size)
+            for name in TRANSFORMS:
+                # 座標の変換とビットの変換が一致する
+                expected = 0
+                for y in range(size):
+                    for x in range(size):
+                        if bits & (1 << (size*size-1-(y*size+x))):
+                            tx, ty = transform_move(x, y, size, name)
+                            expected |= 1 << (size*size-1-(ty*size+tx))
+                self.assertEqual(transform_bits(bits, size, name), expected, name)
+
+        position = Position(0x0000000810000000, 0x0000001008000000)
+        self.assertEqual(position.transform('identity'), position)
+        self.assertEqual(position.transform('rotate90'), Position(0x0000001008000000, 0x0000000810000000))
+        self.assertEqual(position.transform('rotate90').transform('rotate270'), position)
+        self.assertEqual(position.transform('flip_horizontal').transform('flip_vertical'), position.transform('rotate180'))
+
+    def test_canonical(self):
+        # 4種類の初手はすべて同じ代表局面になる
+        canonicals = set()
+        for move in BitBoard().get_legal_moves(c.black):
+            board = BitBoard()
+            board.put_disc(c.black, *move)
+            position, name = Position.from_board(board, c.white).canonical()
+            self.assertEqual(position, Position.from_board(board, c.white).transform(name))
+            canonicals.add(position)
+        self.assertEqual(len(canonicals), 1)
+        self.assertEqual(len(Position(0x0000000810000000, 0x0000001008000000).symmetries()), 8)